@@ -0,0 +1,47 @@
+"""add_query_embedding_cache
+
+Revision ID: a1c4e7f2b9d3
+Revises: f5a3b6c2d9e8
+Create Date: 2026-10-16
+
+Adds query_embedding_cache, a persistent cache of embeddings for raw skill
+text keyed by (model_name, text_hash). The employee import checks it before
+calling the embedding API, so re-importing an unchanged workbook makes no
+embedding calls. last_used_at is indexed for LRU eviction.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7f2b9d3'
+down_revision: Union[str, None] = 'f5a3b6c2d9e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('query_embedding_cache',
+    sa.Column('model_name', sa.Text(), nullable=False),
+    sa.Column('text_hash', sa.String(length=64), nullable=False),
+    sa.Column('query_text', sa.Text(), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.Vector(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('model_name', 'text_hash')
+    )
+    op.create_index(
+        op.f('ix_query_embedding_cache_last_used_at'),
+        'query_embedding_cache',
+        ['last_used_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_query_embedding_cache_last_used_at'), table_name='query_embedding_cache')
+    op.drop_table('query_embedding_cache')
@@ -0,0 +1,50 @@
+"""add_import_job_queue_columns
+
+Revision ID: a3d8e5f1c7b9
+Revises: f7c3a9e2b8d4
+Create Date: 2026-10-16
+
+Turns import_jobs into the import job queue: job type, priority, handler
+parameters, the claiming worker with its heartbeat, and an attempt count.
+Jobs left pending/processing by the old in-process executors cannot be
+picked up by the queue (their upload files were not kept), so they are
+marked failed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d8e5f1c7b9'
+down_revision: Union[str, None] = 'f7c3a9e2b8d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('import_jobs', sa.Column('job_type', sa.String(length=50), server_default='employee_import', nullable=False))
+    op.add_column('import_jobs', sa.Column('priority', sa.Integer(), server_default='50', nullable=False))
+    op.add_column('import_jobs', sa.Column('params', sa.JSON(), nullable=True))
+    op.add_column('import_jobs', sa.Column('worker_id', sa.String(length=100), nullable=True))
+    op.add_column('import_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('import_jobs', sa.Column('started_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('import_jobs', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_import_jobs_queue', 'import_jobs', ['status', 'priority', 'created_at'], unique=False)
+
+    op.execute(
+        "UPDATE import_jobs SET status = 'failed', error = 'Interrupted (job started before the import job queue)', "
+        "completed_at = now() WHERE status IN ('pending', 'processing')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_import_jobs_queue', table_name='import_jobs')
+    op.drop_column('import_jobs', 'attempts')
+    op.drop_column('import_jobs', 'started_at')
+    op.drop_column('import_jobs', 'heartbeat_at')
+    op.drop_column('import_jobs', 'worker_id')
+    op.drop_column('import_jobs', 'params')
+    op.drop_column('import_jobs', 'priority')
+    op.drop_column('import_jobs', 'job_type')
@@ -0,0 +1,43 @@
+"""add_skill_embeddings_hnsw_index
+
+Revision ID: b7d2e9a4c6f1
+Revises: a1c4e7f2b9d3
+Create Date: 2026-10-16
+
+Adds an HNSW approximate nearest-neighbour index on skill_embeddings.embedding
+(cosine distance) for the default embedding model. Without it every
+ORDER BY embedding <=> :query_vector is a full table scan.
+
+The index is partial on model_name so other models (possibly with other
+dimensions) can get their own index via scripts/manage_vector_indexes.py.
+Requires pgvector >= 0.5.0.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e9a4c6f1'
+down_revision: Union[str, None] = 'a1c4e7f2b9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same name/definition ANNIndexManager generates for ("text-embedding-3-small", "hnsw")
+INDEX_NAME = 'ix_skill_embeddings_hnsw_text_embedding_3_small'
+MODEL_NAME = 'text-embedding-3-small'
+
+
+def upgrade() -> None:
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        f"ON skill_embeddings USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = 16, ef_construction = 64) "
+        f"WHERE model_name = '{MODEL_NAME}'"
+    )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
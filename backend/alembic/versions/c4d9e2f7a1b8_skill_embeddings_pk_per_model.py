@@ -0,0 +1,45 @@
+"""skill_embeddings_pk_per_model
+
+Revision ID: c4d9e2f7a1b8
+Revises: b7d2e9a4c6f1
+Create Date: 2026-10-16
+
+Changes the skill_embeddings primary key from (skill_id) to
+(skill_id, model_name) so a skill can hold embeddings from several models at
+once, e.g. OpenAI text-embedding-3-small alongside the offline
+local-char-ngram provider, without one overwriting the other.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9e2f7a1b8'
+down_revision: Union[str, None] = 'b7d2e9a4c6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEFAULT_MODEL_NAME = 'text-embedding-3-small'
+
+
+def upgrade() -> None:
+    op.drop_constraint('skill_embeddings_pkey', 'skill_embeddings', type_='primary')
+    op.create_primary_key('skill_embeddings_pkey', 'skill_embeddings', ['skill_id', 'model_name'])
+
+
+def downgrade() -> None:
+    # Keep one embedding per skill: prefer the default model, drop the others
+    op.execute(f"""
+        DELETE FROM skill_embeddings e
+        WHERE e.model_name <> '{DEFAULT_MODEL_NAME}'
+          AND EXISTS (
+              SELECT 1 FROM skill_embeddings o
+              WHERE o.skill_id = e.skill_id AND o.model_name <> e.model_name
+                AND (o.model_name = '{DEFAULT_MODEL_NAME}' OR o.model_name < e.model_name)
+          )
+    """)
+    op.drop_constraint('skill_embeddings_pkey', 'skill_embeddings', type_='primary')
+    op.create_primary_key('skill_embeddings_pkey', 'skill_embeddings', ['skill_id'])
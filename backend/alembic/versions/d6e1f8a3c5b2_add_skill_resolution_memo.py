@@ -0,0 +1,59 @@
+"""add_skill_resolution_memo
+
+Revision ID: d6e1f8a3c5b2
+Revises: c4d9e2f7a1b8
+Create Date: 2026-10-16
+
+Adds taxonomy_version, a single-row counter bumped whenever skills or
+aliases change, and skill_resolution_memo, a durable normalized text →
+(skill_id, method, confidence, taxonomy_version) table consulted before any
+resolution layer. Memo rows recorded against an older taxonomy_version are
+ignored and purged on the next bump.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e1f8a3c5b2'
+down_revision: Union[str, None] = 'c4d9e2f7a1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('taxonomy_version',
+    sa.Column('version_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('version_id')
+    )
+    op.execute("INSERT INTO taxonomy_version (version_id, version) VALUES (1, 0)")
+
+    op.create_table('skill_resolution_memo',
+    sa.Column('resolver_key', sa.Text(), nullable=False),
+    sa.Column('normalized_text', sa.Text(), nullable=False),
+    sa.Column('resolved_skill_id', sa.Integer(), nullable=True),
+    sa.Column('resolution_method', sa.Text(), nullable=False),
+    sa.Column('resolution_confidence', sa.Float(), nullable=True),
+    sa.Column('taxonomy_version', sa.BigInteger(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['resolved_skill_id'], ['skills.skill_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('resolver_key', 'normalized_text')
+    )
+    op.create_index(
+        op.f('ix_skill_resolution_memo_taxonomy_version'),
+        'skill_resolution_memo',
+        ['taxonomy_version'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_skill_resolution_memo_taxonomy_version'), table_name='skill_resolution_memo')
+    op.drop_table('skill_resolution_memo')
+    op.drop_table('taxonomy_version')
@@ -0,0 +1,45 @@
+"""add_import_fingerprints
+
+Revision ID: e2b7c4d9f1a6
+Revises: d6e1f8a3c5b2
+Create Date: 2026-10-16
+
+Adds employee_import_fingerprints (content hash of the workbook rows each
+employee was last imported from) and import_file_fingerprints (hash of the
+last file imported without errors, per import kind), used by the employee
+import to skip unchanged employees and unchanged files.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4d9f1a6'
+down_revision: Union[str, None] = 'd6e1f8a3c5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('employee_import_fingerprints',
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.employee_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('employee_id')
+    )
+
+    op.create_table('import_file_fingerprints',
+    sa.Column('import_kind', sa.String(length=50), nullable=False),
+    sa.Column('file_hash', sa.String(length=64), nullable=False),
+    sa.Column('job_id', sa.String(length=36), nullable=True),
+    sa.Column('imported_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('import_kind')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_file_fingerprints')
+    op.drop_table('employee_import_fingerprints')
@@ -0,0 +1,34 @@
+"""add_import_job_checkpoints
+
+Revision ID: f7c3a9e2b8d4
+Revises: e2b7c4d9f1a6
+Create Date: 2026-10-16
+
+Adds the uploaded file (path + SHA-256) and a JSON checkpoint (phase,
+skill-sheet row offset, cumulative stats) to import_jobs, so an employee
+import interrupted by a worker restart can be resumed from its last
+committed chunk.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3a9e2b8d4'
+down_revision: Union[str, None] = 'e2b7c4d9f1a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('import_jobs', sa.Column('file_path', sa.String(length=1024), nullable=True))
+    op.add_column('import_jobs', sa.Column('file_hash', sa.String(length=64), nullable=True))
+    op.add_column('import_jobs', sa.Column('checkpoint', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('import_jobs', 'checkpoint')
+    op.drop_column('import_jobs', 'file_hash')
+    op.drop_column('import_jobs', 'file_path')
@@ -2,19 +2,19 @@
 FastAPI routes for Excel import functionality.
 """
 import logging
-import tempfile
 import os
-from pathlib import Path
-from typing import Dict, Any
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from app.services.import_service import ImportService, ImportServiceError
-from app.services.import_job_service import ImportJobService, JobStatusDBError
+from app.services.imports.employee_import import IMPORT_ENGINE_ROWS, IMPORT_ENGINES
+from app.services.imports.employee_import.import_fingerprint import file_sha256
+from app.services.import_job_service import ImportJobService, JobStatusDBError, JOB_TYPE_EMPLOYEE_IMPORT
+from app.services.job_runner import notify_job_enqueued
+from app.utils.upload_storage import MAX_UPLOAD_BYTES, SavedUpload, UploadTooLargeError, save_upload_stream
 from app.db.session import get_db
 
 logger = logging.getLogger(__name__)
@@ -22,19 +22,21 @@ logger = logging.getLogger(__name__)
 # Create the router
 router = APIRouter(prefix="/import", tags=["import"])
 
-# Thread pool for background import processing
-executor = ThreadPoolExecutor(max_workers=2)
-
 
 @router.post("/excel", response_model=Dict[str, Any])
 async def import_excel_file(
     file: UploadFile = File(..., description="Excel file containing employee and skills data"),
+    engine: str = Query(
+        IMPORT_ENGINE_ROWS,
+        description="Import engine: 'rows' (row/chunk writes) or 'staging' (COPY + set-based merge)"
+    ),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
     Import employee and skills data from Excel file with progress tracking.
     
-    Returns immediately with a job_id. Use GET /import/status/{job_id} to poll progress.
+    Returns immediately with a job_id; the job is queued and run by an import
+    job worker. Use GET /import/status/{job_id} to poll progress.
     
     Expected Excel format:
     - Sheet 1: employees (employee_id, first_name, last_name, sub_segment, project, team, role)
@@ -62,41 +64,41 @@ async def import_excel_file(
             detail="File must be an Excel file (.xlsx or .xls)"
         )
     
-    # Validate file size (limit to 50MB)
-    MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
-    if file.size and file.size > MAX_FILE_SIZE:
+    if engine not in IMPORT_ENGINES:
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size ({file.size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown import engine '{engine}' (expected one of: {', '.join(IMPORT_ENGINES)})"
         )
-      # Save uploaded file to temporary location
-    try:
-        temp_file_path = await _save_upload_file(file)
-        logger.info(f"Saved uploaded file to: {temp_file_path}")
-    except Exception as e:
-        logger.error(f"Failed to save file: {str(e)}")
+    
+    # Reject early when the client sent a size (the limit is enforced while streaming)
+    if file.size and file.size > MAX_UPLOAD_BYTES:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to save uploaded file: {str(e)}"
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size ({file.size} bytes) exceeds maximum allowed size ({MAX_UPLOAD_BYTES} bytes)"
         )
     
-    # Create import job in database
+    upload = await _save_upload(file)
+    
+    # Queue import job in database (the file is kept with the job so it can be resumed)
     try:
         job_service = ImportJobService(db)
         job_id = job_service.create_job(
-            job_type="employee_import",
-            message="Import starting..."
+            job_type=JOB_TYPE_EMPLOYEE_IMPORT,
+            message="Queued",
+            file_path=upload.path,
+            file_hash=upload.sha256,
+            params={"engine": engine}
         )
         logger.info(f"✅ Created DB-backed import job {job_id} for file: {file.filename}")
     except Exception as e:
         logger.error(f"❌ Failed to create import job: {str(e)}")
+        os.unlink(upload.path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create import job: {str(e)}"
         )
     
-    # Start async import in background
-    asyncio.create_task(_process_import_async(job_id, temp_file_path))
+    notify_job_enqueued()
     
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
@@ -108,111 +110,107 @@ async def import_excel_file(
     )
 
 
-async def _process_import_async(job_id: str, file_path: str):
-    """Process import in background thread with DB-backed progress tracking."""
-    def _run_import():
-        db = None
-        import_service = None
-        job_service = None
-        try:
-            logger.info(f"🔵 Starting background import for job {job_id}")
-            logger.info(f"🔵 Creating new database session for background thread...")
-            
-            # Create NEW database session for background thread
-            from app.db.session import SessionLocal
-            db = SessionLocal()
-            
-            logger.info(f"🔵 Database session created successfully")
-            
-            # Create job service for progress updates
-            job_service = ImportJobService(db)
-            
-            # Create import service with job_id
-            logger.info(f"🔵 Creating ImportService for file: {file_path}")
-            import_service = ImportService(db_session=db, job_id=job_id)
-            
-            logger.info(f"🔵 Starting Excel import...")
-            result = import_service.import_excel(file_path)
-            
-            logger.info(f"🔵 Import completed, updating job status...")
-            
-            # Mark job as complete in database
-            job_service.complete_job(job_id, result)
-            
-            logger.info(f"✅ Import job {job_id} completed successfully")
-            
-        except Exception as e:
-            # Mark job as failed in database
-            logger.error(f"❌ Import job {job_id} failed: {type(e).__name__}", exc_info=True)
-            
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            
-            if job_service:
-                job_service.fail_job(job_id, error_msg)
-            else:
-                # Fallback: create new session to update job status
-                try:
-                    from app.db.session import SessionLocal
-                    fallback_db = SessionLocal()
-                    fallback_service = ImportJobService(fallback_db)
-                    fallback_service.fail_job(job_id, error_msg)
-                    fallback_db.close()
-                except Exception as fallback_err:
-                    logger.error(f"❌ Failed to update job status on error: {fallback_err}")
-            
-            logger.error(f"❌ Job {job_id} marked as failed with error: {error_msg}")
-            
-        finally:
-            # Close database session
-            if db:
-                try:
-                    db.close()
-                    logger.info(f"🔵 Database session closed for job {job_id}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to close database session: {str(e)}")
-            
-            # Clean up temporary file
-            if file_path and os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                    logger.info(f"🧹 Cleaned up temporary file: {file_path}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to clean up temporary file {file_path}: {str(e)}")
-      # Run in thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(executor, _run_import)
-
-
-async def _save_upload_file(upload_file: UploadFile) -> str:
+@router.post("/resume/{job_id}", response_model=Dict[str, Any])
+async def resume_import(
+    job_id: str,
+    file: Optional[UploadFile] = File(
+        None, description="The same Excel file again (only needed if the server no longer has it)"
+    ),
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
     """
-    Save uploaded file to a temporary location.
+    Resume an interrupted employee import job from its last checkpoint.
+    
+    The job must have failed, or still be pending/processing without any
+    update for a while (its worker stopped). The file stored with the job is
+    reused if it is still present and unchanged; otherwise the same file
+    (same SHA-256) must be uploaded again.
     
-    Args:
-        upload_file: The uploaded file
-        
     Returns:
-        str: Path to the saved temporary file
-        
+        Dict with job_id for polling status
+    
     Raises:
-        Exception: If file saving fails
+        HTTPException: 404 if the job does not exist, 409 if it is not an employee
+            import, has no recorded file hash, or cannot be resumed
     """
+    job_service = ImportJobService(db)
+    job = job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job {job_id} not found"
+        )
+    if job.job_type != JOB_TYPE_EMPLOYEE_IMPORT:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} is not an employee import and cannot be resumed here"
+        )
+    if not job.file_hash:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Import job {job_id} has no recorded file hash and cannot be resumed"
+        )
+    if job.status == 'completed':
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Import job {job_id} already completed"
+        )
+    
+    file_path = None
+    if file is not None and file.filename:
+        upload = await _save_upload(file)
+        if upload.sha256 != job.file_hash:
+            os.unlink(upload.path)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Uploaded file differs from the file this job was started with"
+            )
+        file_path = upload.path
+    elif (job.file_path and os.path.exists(job.file_path)
+          and await run_in_threadpool(file_sha256, job.file_path) == job.file_hash):
+        file_path = job.file_path
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The file of this job is no longer available; upload the same file to resume"
+        )
+    
+    if not job_service.reopen_for_resume(job_id, file_path=file_path):
+        if file_path != job.file_path:
+            os.unlink(file_path)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Import job {job_id} is still running"
+        )
+    logger.info(f"🔁 Resuming import job {job_id} (checkpoint phase: {(job.checkpoint or {}).get('phase')})")
+    
+    notify_job_enqueued()
+    
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "job_id": job_id,
+            "status": "pending",
+            "message": "Import job resumed. Poll /import/status/{job_id} for progress."
+        }
+    )
+
+
+async def _save_upload(file: UploadFile) -> SavedUpload:
+    """Stream the upload to a temporary file, mapping failures to HTTP errors."""
     try:
-        # Create temporary file
-        suffix = Path(upload_file.filename).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-            temp_file_path = temp_file.name
-            
-            # Read and write file contents
-            content = await upload_file.read()
-            temp_file.write(content)
-            temp_file.flush()
-            
-        logger.info(f"Saved {len(content)} bytes to temporary file: {temp_file_path}")
-        return temp_file_path
-        
+        return await save_upload_stream(file)
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds maximum allowed size ({e.max_bytes} bytes)"
+        )
     except Exception as e:
-        logger.error(f"Failed to save uploaded file: {str(e)}")
-        raise Exception(f"Failed to save uploaded file: {str(e)}")
+        logger.error(f"Failed to save file: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to save uploaded file: {str(e)}"
+        )
 
 
 @router.get("/status/{job_id}")
@@ -1,6 +1,7 @@
 """
 FastAPI application for the Competency Tracking System.
 """
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -29,6 +30,7 @@ from app.api.routes.rbac_admin import router as rbac_admin_router
 from app.api.routes.roles import router as roles_router
 from app.api.routes.master_data import router as master_data_router
 from app.api.routes.org_hierarchy import router as org_hierarchy_router
+from app.services.job_runner import start_embedded_worker, stop_embedded_worker
 
 # Configure logging
 logging.basicConfig(
@@ -110,11 +112,18 @@ async def startup_event():
         # NOTE: Database schema is managed via Alembic migrations
         # Run 'alembic upgrade head' to apply migrations before starting the app
         logger.info("Database migrations should be applied via 'alembic upgrade head'")
+        start_embedded_worker()
         logger.info("Application ready")
     except Exception as e:
         logger.error(f"Failed to initialize application: {str(e)}")
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the embedded import job worker (running jobs finish first, still heartbeating)."""
+    # Draining blocks until running imports finish; keep it off the event loop
+    await asyncio.get_running_loop().run_in_executor(None, stop_embedded_worker)
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -36,9 +36,15 @@ from app.models.skill_alias import SkillAlias
 
 # Skill embeddings for semantic search
 from app.models.skill_embedding import SkillEmbedding
+from app.models.query_embedding_cache import QueryEmbeddingCache
+
+# Skill resolution memo + taxonomy version
+from app.models.taxonomy_version import TaxonomyVersion
+from app.models.skill_resolution_memo import SkillResolutionMemo
 
 # Import job tracking
 from app.models.import_job import ImportJob
+from app.models.import_fingerprint import EmployeeImportFingerprint, ImportFileFingerprint
 
 # RBAC (Role-Based Access Control) - Authentication and Authorization
 from app.models.auth import (
@@ -82,9 +88,16 @@ __all__ = [
     
     # Skill embeddings
     "SkillEmbedding",
+    "QueryEmbeddingCache",
+    
+    # Skill resolution memo
+    "TaxonomyVersion",
+    "SkillResolutionMemo",
     
     # Import job tracking
     "ImportJob",
+    "EmployeeImportFingerprint",
+    "ImportFileFingerprint",
     
     # RBAC (Role-Based Access Control)
     "User",
@@ -0,0 +1,49 @@
+"""
+Import fingerprint models - content hashes of previously imported data.
+
+Re-uploads of the master workbook mostly repeat what is already stored. The
+employee import records a fingerprint per employee (its Employee rows plus
+its Employee_Skills rows) and the hash of the last file imported without
+errors, so unchanged employees - or an unchanged file - can be skipped.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class EmployeeImportFingerprint(Base):
+    """
+    Fingerprint of the workbook rows an employee was last imported from.
+    
+    Only written when the employee and all of its skill rows imported
+    without errors, so failed rows are retried by the next import.
+    """
+    
+    __tablename__ = "employee_import_fingerprints"
+    
+    employee_id = Column(
+        Integer,
+        ForeignKey("employees.employee_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    fingerprint = Column(String(64), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    
+    def __repr__(self):
+        return f"<EmployeeImportFingerprint(employee_id={self.employee_id}, fingerprint='{self.fingerprint[:12]}')>"
+
+
+class ImportFileFingerprint(Base):
+    """
+    SHA-256 of the last file imported without errors, one row per import kind.
+    """
+    
+    __tablename__ = "import_file_fingerprints"
+    
+    import_kind = Column(String(50), primary_key=True)
+    file_hash = Column(String(64), nullable=False)
+    job_id = Column(String(36), nullable=True)
+    imported_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    
+    def __repr__(self):
+        return f"<ImportFileFingerprint(kind='{self.import_kind}', file_hash='{self.file_hash[:12]}')>"
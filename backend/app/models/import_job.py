@@ -1,7 +1,7 @@
 """
 Import Job model - tracks progress and status of bulk import operations.
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -15,6 +15,9 @@ class ImportJob(Base):
     """
     
     __tablename__ = "import_jobs"
+    __table_args__ = (
+        Index('ix_import_jobs_queue', 'status', 'priority', 'created_at'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -25,6 +28,17 @@ class ImportJob(Base):
     # Job status: 'pending', 'processing', 'completed', 'failed'
     status = Column(String(20), nullable=False, index=True, default='pending')
     
+    # Queue: handler to run and claim order (lower priority value runs first)
+    job_type = Column(String(50), nullable=False, default='employee_import', server_default='employee_import')
+    priority = Column(Integer, nullable=False, default=50, server_default='50')
+    params = Column(JSON, nullable=True)  # Handler options, e.g. {"engine": "rows"}
+    
+    # Worker currently running the job; a stale heartbeat means the worker died
+    worker_id = Column(String(100), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default='0')
+    
     # Progress tracking
     message = Column(String(500), nullable=True)
     total_rows = Column(Integer, nullable=False, default=0)
@@ -44,6 +58,14 @@ class ImportJob(Base):
     # Error information (if status='failed')
     error = Column(Text, nullable=True)
     
+    # Uploaded file kept for resume (temp file path + SHA-256 of its content)
+    file_path = Column(String(1024), nullable=True)
+    file_hash = Column(String(64), nullable=True)
+    
+    # Last committed progress, written after each committed chunk
+    # Example: {"phase": "skills", "skill_rows_done": 15000, "last_zid": "Z123", "stats": {...}}
+    checkpoint = Column(JSON, nullable=True)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now(), default=func.now())
@@ -57,6 +79,8 @@ class ImportJob(Base):
         return {
             'job_id': self.job_id,
             'status': self.status,
+            'job_type': self.job_type,
+            'attempts': self.attempts,
             'message': self.message,
             'total_rows': self.total_rows,
             'processed_rows': self.processed_rows,
@@ -67,6 +91,7 @@ class ImportJob(Base):
             'skills_processed': self.skills_processed,
             'result': self.result,
             'error': self.error,
+            'checkpoint_phase': (self.checkpoint or {}).get('phase'),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
@@ -0,0 +1,45 @@
+"""
+Query Embedding Cache model - persists embeddings of raw skill text.
+
+Raw skill strings from employee workbooks ("reactjs", "ms excel", "k8s")
+repeat across imports; caching their embeddings avoids re-calling the
+embedding API for text that was already embedded.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from pgvector.sqlalchemy import Vector
+from app.db.base import Base
+
+
+class QueryEmbeddingCache(Base):
+    """
+    Cached embedding for a normalized query text.
+    
+    Keyed by (model_name, text_hash) so embeddings from different models
+    never mix. last_used_at drives LRU eviction.
+    """
+    
+    __tablename__ = "query_embedding_cache"
+    
+    # Composite primary key: model + SHA-256 of normalized text
+    model_name = Column(Text, primary_key=True)
+    text_hash = Column(String(64), primary_key=True)
+    
+    # Normalized text (kept for debugging/inspection)
+    query_text = Column(Text, nullable=False)
+    
+    # Vector embedding (dimension depends on model, so not fixed here)
+    embedding = Column(Vector(), nullable=False)
+    
+    # Usage tracking for LRU eviction
+    hit_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_used_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        index=True
+    )
+    
+    def __repr__(self):
+        return f"<QueryEmbeddingCache(model='{self.model_name}', text='{self.query_text}', hits={self.hit_count})>"
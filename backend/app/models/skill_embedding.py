@@ -20,7 +20,7 @@ class SkillEmbedding(Base):
     
     __tablename__ = "skill_embeddings"
     
-    # Primary key and foreign key
+    # Primary key (skill_id, model_name): one embedding per skill per model
     skill_id = Column(
         Integer, 
         ForeignKey("skills.skill_id", ondelete="CASCADE"), 
@@ -29,7 +29,7 @@ class SkillEmbedding(Base):
     )
     
     # Model metadata
-    model_name = Column(Text, nullable=False)
+    model_name = Column(Text, primary_key=True, nullable=False)
     
     # Vector embedding (1536 dimensions for OpenAI text-embedding-ada-002)
     embedding = Column(Vector(1536), nullable=False)
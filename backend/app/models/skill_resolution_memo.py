@@ -0,0 +1,48 @@
+"""
+Skill Resolution Memo model - durable raw text → skill resolution outcomes.
+
+Employee workbooks repeat the same skill strings on every import. Memoizing
+the outcome of exact/alias/embedding resolution lets repeat imports skip
+resolution entirely. Each entry records the taxonomy_version it was computed
+against and is ignored once the taxonomy changes.
+"""
+from sqlalchemy import Column, Integer, BigInteger, Float, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class SkillResolutionMemo(Base):
+    """
+    Memoized resolution outcome for a normalized skill text.
+    
+    Keyed by (resolver_key, normalized_text): resolver_key names the layers
+    that produced the outcome (embedding model, pre-filter), so outcomes of
+    an exact/alias-only resolver never answer for an embedding-enabled one.
+    """
+    
+    __tablename__ = "skill_resolution_memo"
+    
+    resolver_key = Column(Text, primary_key=True)
+    normalized_text = Column(Text, primary_key=True)
+    
+    # Outcome (resolved_skill_id is NULL for review/unresolved)
+    resolved_skill_id = Column(
+        Integer,
+        ForeignKey("skills.skill_id", ondelete="CASCADE"),
+        nullable=True
+    )
+    resolution_method = Column(Text, nullable=False)
+    resolution_confidence = Column(Float, nullable=True)
+    
+    # taxonomy_version.version at the time the outcome was computed
+    taxonomy_version = Column(BigInteger, nullable=False, index=True)
+    
+    hit_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    
+    def __repr__(self):
+        return (
+            f"<SkillResolutionMemo(text='{self.normalized_text}', skill_id={self.resolved_skill_id}, "
+            f"method='{self.resolution_method}', version={self.taxonomy_version})>"
+        )
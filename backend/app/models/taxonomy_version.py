@@ -0,0 +1,30 @@
+"""
+Taxonomy Version model - monotonically increasing skill taxonomy revision.
+
+Bumped in the same transaction as any change to skills or aliases (taxonomy
+update APIs, master import). Caches derived from the taxonomy, such as the
+skill resolution memo, compare against it to detect stale entries.
+"""
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class TaxonomyVersion(Base):
+    """
+    Single-row counter (version_id = 1) holding the current taxonomy version.
+    """
+    
+    __tablename__ = "taxonomy_version"
+    
+    version_id = Column(Integer, primary_key=True, default=1)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+    
+    def __repr__(self):
+        return f"<TaxonomyVersion(version={self.version})>"
@@ -5,9 +5,11 @@ Single Responsibility: Persist import job progress to database for reliable trac
 Replaces in-memory job tracker to support Azure App Service multi-worker deployments.
 """
 import logging
+import os
 import uuid
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -15,6 +17,17 @@ from app.models.import_job import ImportJob
 
 logger = logging.getLogger(__name__)
 
+# Job types (import_jobs.job_type) - each has a handler in app.services.job_runner
+JOB_TYPE_EMPLOYEE_IMPORT = "employee_import"
+JOB_TYPE_MASTER_SKILLS_IMPORT = "master_skills_import"
+
+# Claim order: lower runs first (master skills first - employee imports resolve against them)
+JOB_PRIORITIES = {
+    JOB_TYPE_MASTER_SKILLS_IMPORT: 10,
+    JOB_TYPE_EMPLOYEE_IMPORT: 20,
+}
+DEFAULT_JOB_PRIORITY = 50
+
 
 class JobStatusDBError(Exception):
     """Raised when a transient database error occurs fetching job status.
@@ -41,6 +54,9 @@ class ImportJobService:
       # Progress boundaries for forced updates (even if throttle not reached)
     PROGRESS_BOUNDARIES = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
     
+    # A 'processing' job not updated for this long is treated as abandoned (resumable)
+    RESUME_STALE_AFTER_SECONDS = 600
+    
     def __init__(self, db_session: Session):
         """
         Initialize import job service.
@@ -53,13 +69,21 @@ class ImportJobService:
         self._last_percent = {}  # job_id -> last percent reported (for boundary detection)
         self._last_status = {}  # job_id -> last status reported (for status change detection)
     
-    def create_job(self, job_type: str = "employee_import", message: str = "Import starting...") -> str:
+    def create_job(self, job_type: str = JOB_TYPE_EMPLOYEE_IMPORT, message: str = "Import starting...",
+                   file_path: Optional[str] = None, file_hash: Optional[str] = None,
+                   params: Optional[Dict[str, Any]] = None) -> str:
         """
         Create a new import job in database.
         
+        The job is queued as 'pending'; a job runner worker claims it by
+        priority (JOB_PRIORITIES) and age.
+        
         Args:
-            job_type: Type of import (for logging/debugging)
+            job_type: Type of import (selects the job runner handler)
             message: Initial progress message
+            file_path: Uploaded file the handler reads (kept for resume)
+            file_hash: SHA-256 of the uploaded file (optional)
+            params: Handler options (optional, JSON)
             
         Returns:
             job_id: UUID string for this import job
@@ -77,7 +101,13 @@ class ImportJobService:
                 employees_total=0,
                 employees_processed=0,
                 skills_total=0,
-                skills_processed=0
+                skills_processed=0,
+                file_path=file_path,
+                file_hash=file_hash,
+                job_type=job_type,
+                priority=JOB_PRIORITIES.get(job_type, DEFAULT_JOB_PRIORITY),
+                params=params,
+                attempts=0
             )
             
             self.db.add(job)
@@ -88,7 +118,7 @@ class ImportJobService:
             self._last_percent[job_id] = 0
             self._last_status[job_id] = 'pending'
             
-            logger.info(f"✅ Created import job {job_id} with status 'pending'")
+            logger.info(f"✅ Created {job_type} job {job_id} with status 'pending'")
             return job_id
             
         except SQLAlchemyError as e:
@@ -257,6 +287,94 @@ class ImportJobService:
             logger.error(f"❌ Failed to mark job {job_id} as failed: {str(e)}")
             return False
     
+    def save_checkpoint(self, job_id: str, checkpoint: Dict[str, Any]) -> bool:
+        """
+        Persist the job's checkpoint (not throttled).
+        
+        Call only after the work it describes is committed: this commits the
+        session.
+        
+        Args:
+            job_id: Job identifier
+            checkpoint: JSON-serializable checkpoint (phase, offsets, stats)
+            
+        Returns:
+            True if updated successfully
+        """
+        try:
+            job = self.db.query(ImportJob).filter_by(job_id=job_id).first()
+            if not job:
+                logger.warning(f"⚠️ Job {job_id} not found")
+                return False
+            
+            job.checkpoint = checkpoint
+            job.updated_at = datetime.now(timezone.utc)
+            self.db.commit()
+            self._last_update_time[job_id] = job.updated_at
+            
+            logger.debug(f"💾 Checkpoint for job {job_id}: phase={checkpoint.get('phase')}")
+            return True
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"❌ Failed to save checkpoint for job {job_id}: {str(e)}")
+            return False
+    
+    def get_job(self, job_id: str) -> Optional[ImportJob]:
+        """Get the job row (None if it does not exist)."""
+        return self.db.query(ImportJob).filter_by(job_id=job_id).first()
+    
+    def reopen_for_resume(self, job_id: str, file_path: Optional[str] = None) -> bool:
+        """
+        Atomically move a failed or abandoned job back to 'pending' for resume.
+        
+        A job qualifies if it failed, or is still 'pending'/'processing' but
+        has had no heartbeat (or, before its first heartbeat, no update) for
+        RESUME_STALE_AFTER_SECONDS. The checkpoint is kept and the attempt
+        count reset; a job runner picks the job up again. Two concurrent
+        resume calls cannot both win.
+        
+        Args:
+            job_id: Job identifier
+            file_path: New location of the uploaded file (re-uploaded for resume)
+            
+        Returns:
+            True if the job was reopened, False if it is not resumable
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=self.RESUME_STALE_AFTER_SECONDS)
+        values = {
+            ImportJob.status: 'pending',
+            ImportJob.message: 'Resuming import...',
+            ImportJob.error: None,
+            ImportJob.completed_at: None,
+            ImportJob.updated_at: now,
+            ImportJob.worker_id: None,
+            ImportJob.attempts: 0
+        }
+        if file_path:
+            values[ImportJob.file_path] = file_path
+        try:
+            reopened = self.db.query(ImportJob).filter(
+                ImportJob.job_id == job_id,
+                or_(
+                    ImportJob.status == 'failed',
+                    ImportJob.status.in_(['pending', 'processing'])
+                    & (func.coalesce(ImportJob.heartbeat_at, ImportJob.updated_at) < stale_before)
+                )
+            ).update(values, synchronize_session=False)
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"❌ Failed to reopen job {job_id}: {str(e)}")
+            return False
+        
+        if reopened:
+            self._last_status[job_id] = 'pending'
+            self._last_update_time[job_id] = now
+            logger.info(f"🔁 Reopened job {job_id} for resume")
+        return bool(reopened)
+    
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get current job status from database.
@@ -324,7 +442,7 @@ class ImportJobService:
     
     def cleanup_old_jobs(self, days_old: int = 7) -> int:
         """
-        Delete completed/failed jobs older than specified days.
+        Delete completed/failed jobs older than specified days (and their kept upload files).
         
         Args:
             days_old: Delete jobs older than this many days
@@ -334,11 +452,19 @@ class ImportJobService:
         """
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
-            
-            deleted = self.db.query(ImportJob).filter(
+            old_jobs = self.db.query(ImportJob).filter(
                 ImportJob.completed_at < cutoff_date,
                 ImportJob.status.in_(['completed', 'failed'])
-            ).delete()
+            )
+            
+            for (file_path,) in old_jobs.with_entities(ImportJob.file_path).filter(ImportJob.file_path.isnot(None)):
+                try:
+                    if os.path.exists(file_path):
+                        os.unlink(file_path)
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not remove import file {file_path}: {str(e)}")
+            
+            deleted = old_jobs.delete()
             
             self.db.commit()
             
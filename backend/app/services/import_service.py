@@ -33,8 +33,9 @@ class ImportService:
     BACKWARD COMPATIBILITY WRAPPER - delegates to refactored implementation.
     """
     
-    def __init__(self, db_session: Optional[Session] = None, job_id: Optional[str] = None):
-        self._orchestrator = EmployeeImportOrchestrator(db_session, job_id=job_id)
+    def __init__(self, db_session: Optional[Session] = None, job_id: Optional[str] = None,
+                 import_engine: Optional[str] = None):
+        self._orchestrator = EmployeeImportOrchestrator(db_session, job_id=job_id, import_engine=import_engine)
     
     @property
     def db(self):
@@ -46,12 +47,13 @@ class ImportService:
         """Expose import stats from orchestrator."""
         return self._orchestrator.import_stats
     
-    def import_excel(self, file_path: str) -> Dict[str, Any]:
+    def import_excel(self, file_path: str, resume_checkpoint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Import Excel file data.
         
         Args:
             file_path (str): Path to the Excel file
+            resume_checkpoint: Checkpoint of an interrupted run of the same job (optional)
 
         Returns:
             Dict with import statistics
@@ -59,7 +61,7 @@ class ImportService:
         Raises:
             ImportServiceError: If import fails
         """
-        return self._orchestrator.import_excel(file_path)
+        return self._orchestrator.import_excel(file_path, resume_checkpoint=resume_checkpoint)
     
     # Expose individual methods for backward compatibility (if needed)
     def _parse_date_safely(self, date_str: str, field_name: str, record_id: str = ""):
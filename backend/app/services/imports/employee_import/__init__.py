@@ -1,5 +1,11 @@
 """Employee Import Module"""
 
-from .employee_import_orchestrator import EmployeeImportOrchestrator, ImportServiceError
+from .employee_import_orchestrator import (
+    EmployeeImportOrchestrator, ImportServiceError,
+    IMPORT_ENGINE_ROWS, IMPORT_ENGINE_STAGING, IMPORT_ENGINES
+)
 
-__all__ = ['EmployeeImportOrchestrator', 'ImportServiceError']
+__all__ = [
+    'EmployeeImportOrchestrator', 'ImportServiceError',
+    'IMPORT_ENGINE_ROWS', 'IMPORT_ENGINE_STAGING', 'IMPORT_ENGINES'
+]
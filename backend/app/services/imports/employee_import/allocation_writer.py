@@ -5,10 +5,10 @@ Single Responsibility: Parse allocation data and upsert into employee_project_al
 """
 import logging
 import re
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, func, insert, update
 
 from app.models.employee_project_allocation import EmployeeProjectAllocation
 
@@ -157,3 +157,91 @@ def upsert_active_project_allocation(
     except Exception as e:
         logger.error(f"Failed to upsert allocation for employee_id={employee_id}, project_id={project_id}: {e}")
         raise
+
+
+def upsert_active_project_allocations(db: Session, allocations: List[Dict]) -> int:
+    """
+    Set-based variant of upsert_active_project_allocation for a chunk of employees.
+
+    Same idempotency rules, with one SELECT for the active allocations of the
+    whole chunk, one executemany UPDATE and one multi-row INSERT. Does not
+    commit; raises on failure so the caller can isolate the chunk.
+
+    Args:
+        db: SQLAlchemy session
+        allocations: Dicts with employee_id, project_id, allocation_pct and
+            optional start_date / allocation_type
+
+    Returns:
+        Number of allocations inserted or updated
+    """
+    requested = {}
+    for allocation in allocations:
+        if allocation.get('allocation_pct') is None:
+            continue
+        key = (allocation['employee_id'], allocation['project_id'])
+        requested[key] = allocation  # Last row for an employee+project wins
+    if not requested:
+        return 0
+
+    employee_ids = {employee_id for employee_id, _ in requested}
+    project_ids = {project_id for _, project_id in requested}
+    active_rows = db.query(
+        EmployeeProjectAllocation.allocation_id,
+        EmployeeProjectAllocation.employee_id,
+        EmployeeProjectAllocation.project_id
+    ).filter(
+        EmployeeProjectAllocation.employee_id.in_(employee_ids),
+        EmployeeProjectAllocation.project_id.in_(project_ids),
+        EmployeeProjectAllocation.end_date.is_(None)
+    ).order_by(EmployeeProjectAllocation.created_at.desc()).all()
+
+    active_by_key: Dict = {}
+    for allocation_id, employee_id, project_id in active_rows:
+        key = (employee_id, project_id)
+        if key not in requested:
+            continue
+        if key in active_by_key:
+            logger.warning(
+                f"Found multiple active allocations for employee_id={employee_id}, "
+                f"project_id={project_id}. Updating most recent."
+            )
+            continue
+        active_by_key[key] = allocation_id
+
+    updates, inserts = [], []
+    for key, allocation in requested.items():
+        allocation_type = allocation.get('allocation_type') or 'BILLABLE'
+        if key in active_by_key:
+            updates.append({
+                'b_allocation_id': active_by_key[key],
+                'b_allocation_pct': allocation['allocation_pct'],
+                'b_allocation_type': allocation_type
+            })
+        else:
+            inserts.append({
+                'employee_id': key[0],
+                'project_id': key[1],
+                'allocation_pct': allocation['allocation_pct'],
+                'allocation_type': allocation_type,
+                'start_date': allocation.get('start_date') or date.today(),
+                'end_date': None  # Active allocation
+            })
+
+    table = EmployeeProjectAllocation.__table__
+    if updates:
+        db.execute(
+            update(table)
+            .where(table.c.allocation_id == bindparam('b_allocation_id'))
+            .values(
+                allocation_pct=bindparam('b_allocation_pct'),
+                allocation_type=bindparam('b_allocation_type'),
+                updated_at=func.now()
+            ),
+            updates
+        )
+    if inserts:
+        db.execute(insert(table), inserts)
+
+    logger.debug(f"Upserted {len(requested)} allocations (updated: {len(updates)}, created: {len(inserts)})")
+    return len(requested)
@@ -0,0 +1,120 @@
+"""
+Column-wise date/integer parsing pre-pass for employee import.
+
+Parses every date and integer field of a sheet once, column by column, before
+the persisters walk the rows. Each parsed field is stored next to the raw one
+as "<field>__parsed" (object column of date/int/None), and PARSE_ERROR_COLUMN
+marks rows with at least one value that could not be parsed. Persisters read
+values through parsed_value(), which falls back to per-cell parsing when the
+pre-pass did not run.
+
+Warnings use the same messages and record IDs as
+DateParser.parse_date_safely / FieldSanitizer.sanitize_integer_field.
+
+Single Responsibility: Pre-parse typed columns of the import DataFrames.
+"""
+import logging
+from typing import Any, Callable, Dict, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PARSED_SUFFIX = '__parsed'
+PARSE_ERROR_COLUMN = '__parse_error'
+
+EMPLOYEE_DATE_FIELDS: Tuple[str, ...] = ('start_date_of_working',)
+SKILL_DATE_FIELDS: Tuple[str, ...] = ('last_used', 'started_learning_from')
+SKILL_INTEGER_FIELDS: Tuple[str, ...] = ('years_experience', 'interest_level')
+
+
+def parse_employee_columns(employees_df: pd.DataFrame, date_parser, stats: Dict = None) -> pd.DataFrame:
+    """
+    Pre-parse Employee sheet date columns.
+
+    Args:
+        employees_df: Employee sheet DataFrame
+        date_parser: DateParser
+        stats: Optional import stats; per-field invalid counts are added to stats['parse_errors']
+
+    Returns:
+        Copy of employees_df with parsed columns and PARSE_ERROR_COLUMN
+    """
+    zids = employees_df['zid'].astype(str) if 'zid' in employees_df.columns else _blank_ids(employees_df)
+    return _parse_columns(
+        employees_df,
+        {field: lambda values, field: date_parser.parse_date_column(values, field, zids)
+         for field in EMPLOYEE_DATE_FIELDS},
+        stats
+    )
+
+
+def parse_skill_columns(skills_df: pd.DataFrame, date_parser, field_sanitizer, stats: Dict = None) -> pd.DataFrame:
+    """
+    Pre-parse Employee_Skills sheet date and integer columns.
+
+    Args:
+        skills_df: Employee_Skills sheet DataFrame (after skill expansion)
+        date_parser: DateParser
+        field_sanitizer: FieldSanitizer
+        stats: Optional import stats; per-field invalid counts are added to stats['parse_errors']
+            (accumulates across chunks of a streamed sheet)
+
+    Returns:
+        Copy of skills_df with parsed columns and PARSE_ERROR_COLUMN
+    """
+    zids = skills_df['zid'].astype(str) if 'zid' in skills_df.columns else _blank_ids(skills_df)
+    record_ids = "employee " + zids
+    parsers: Dict[str, Callable] = {}
+    for field in SKILL_DATE_FIELDS:
+        parsers[field] = lambda values, field: date_parser.parse_date_column(values, field, record_ids)
+    for field in SKILL_INTEGER_FIELDS:
+        parsers[field] = lambda values, field: field_sanitizer.sanitize_integer_column(values, field, zids)
+    return _parse_columns(skills_df, parsers, stats)
+
+
+def parsed_value(row, field: str, parse_cell: Callable[[], Any]) -> Any:
+    """
+    Value of field from the pre-pass, or parse_cell() if the row was not pre-parsed.
+
+    Args:
+        row: DataFrame row (Series) or record dict
+        field: Raw field name, e.g. 'last_used'
+        parse_cell: Per-cell parser used as fallback
+
+    Returns:
+        Parsed value (None if empty/invalid)
+    """
+    key = field + PARSED_SUFFIX
+    if key not in row:
+        return parse_cell()
+    value = row[key]
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    return value
+
+
+def _parse_columns(df: pd.DataFrame, parsers: Dict[str, Callable], stats: Dict = None) -> pd.DataFrame:
+    parsed_df = df.copy()
+    row_errors = pd.Series(False, index=df.index)
+    error_counts = {}
+    for field, parse in parsers.items():
+        if field not in df.columns:
+            continue
+        parsed, invalid = parse(df[field], field)
+        parsed_df[field + PARSED_SUFFIX] = pd.Series(parsed.to_numpy(dtype=object), index=df.index, dtype=object)
+        row_errors |= invalid.to_numpy()
+        error_counts[field] = int(invalid.sum())
+    parsed_df[PARSE_ERROR_COLUMN] = row_errors.to_numpy()
+
+    if stats is not None:
+        parse_errors = stats.setdefault('parse_errors', {})
+        for field, count in error_counts.items():
+            parse_errors[field] = parse_errors.get(field, 0) + count
+    logger.info(f"Pre-parsed {len(error_counts)} columns for {len(df)} rows "
+                f"({int(row_errors.sum())} rows with unparseable values)")
+    return parsed_df
+
+
+def _blank_ids(df: pd.DataFrame) -> pd.Series:
+    return pd.Series('', index=df.index, dtype=object)
@@ -4,8 +4,9 @@ Date parsing utilities for employee import.
 Single Responsibility: Parse and validate date strings.
 """
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime, date
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,66 @@ class DateParser:
             logger.warning(f"Date conversion error for {field_name} '{date_str}' in record {record_id}: {e}")
             return None
     
+    def parse_date_column(self, values: pd.Series, field_name: str,
+                          record_ids: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Column-wise parse_date_safely(): same results and warnings, one pass per format.
+        
+        Each distinct cleaned string is parsed once: pd.to_datetime(format=...,
+        errors='coerce') per DATE_FORMATS entry in order, then the scalar
+        formats (dates outside pandas' nanosecond range) and the year-only rule
+        for whatever is left.
+        
+        Args:
+            values: Raw column values
+            field_name: Name of the field for logging
+            record_ids: Record ID per row for logging (aligned with values)
+            
+        Returns:
+            (parsed, invalid): object Series of date/None, and a bool Series that
+            is True where a non-empty value could not be parsed
+        """
+        raw = pd.Series(values.to_numpy(dtype=object), dtype=object)
+        as_text = raw.astype(str)
+        empty = as_text.str.lower().isin(['nan', 'none', '']) | ~raw.astype(bool)
+        cleaned = as_text.str.strip()
+        
+        distinct = pd.Series(cleaned[~empty].unique(), dtype=object)
+        parsed_ts = pd.Series(pd.NaT, index=distinct.index, dtype='datetime64[ns]')
+        for date_format in self.DATE_FORMATS:
+            remaining = parsed_ts.isna()
+            if not remaining.any():
+                break
+            parsed_ts[remaining] = pd.to_datetime(distinct[remaining], format=date_format, errors='coerce')
+        
+        results: Dict[str, Optional[date]] = {}
+        failures: Dict[str, str] = {}
+        for text, timestamp in zip(distinct, parsed_ts):
+            if not pd.isna(timestamp):
+                results[text] = timestamp.date()
+                continue
+            parsed_date = self._try_parse_formats(text)
+            if parsed_date and not self._is_valid_postgres_date(parsed_date):
+                results[text] = None
+                failures[text] = "Date year out of PostgreSQL range for {field} '{text}' in record {record}"
+            elif parsed_date:
+                results[text] = parsed_date
+            else:
+                results[text] = self._try_parse_year_only(text)
+                if results[text] is None:
+                    failures[text] = "Could not parse {field} '{text}' for record {record}"
+        
+        parsed = cleaned.map(results).astype(object).where(~empty, None)
+        parsed = parsed.where(parsed.notna(), None)
+        invalid = ~empty & cleaned.isin(list(failures))
+        for position in invalid.to_numpy().nonzero()[0]:
+            text = cleaned.iat[position]
+            logger.warning(failures[text].format(field=field_name, text=text, record=record_ids.iat[position]))
+        
+        parsed.index = values.index
+        invalid.index = values.index
+        return parsed, invalid
+    
     def _try_parse_formats(self, date_str: str) -> Optional[date]:
         """Try parsing date string with all known formats."""
         for date_format in self.DATE_FORMATS:
@@ -3,8 +3,10 @@ Employee Import Orchestrator - Main service for employee Excel imports.
 
 Single Responsibility: Coordinate the employee import process.
 """
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, Iterator, Optional, Set, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,7 +14,11 @@ from sqlalchemy import text
 
 from app.db.session import SessionLocal
 from app.models import Employee, EmployeeSkill
-from app.utils.excel_reader import read_excel, get_master_data_for_scanning
+from app.utils.excel_reader import (
+    read_excel, get_master_data_for_scanning,
+    read_employee_sheet, iter_skill_chunks, count_sheet_rows, EXCEL_READ_CHUNK_SIZE
+)
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
 
 from .date_parser import DateParser
 from .name_normalizer import NameNormalizer
@@ -23,6 +29,11 @@ from .unresolved_skill_logger import UnresolvedSkillLogger
 from .employee_persister import EmployeePersister
 from .skill_expander import SkillExpander
 from .skill_persister import SkillPersister
+from .reference_data_cache import ReferenceDataCache
+from .column_parser import parse_employee_columns, parse_skill_columns
+from .skill_resolution_pipeline import SkillResolutionPipeline, RESOLUTION_WORKERS
+from .staging_import_engine import StagingImportEngine
+from .import_fingerprint import EmployeeFingerprinter, ImportFingerprintStore, file_sha256
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,19 @@ logger = logging.getLogger(__name__)
 from app.services.import_job_service import ImportJobService
 
 
+# Import engines (selectable per job)
+IMPORT_ENGINE_ROWS = 'rows'        # EmployeePersister/SkillPersister, committed per chunk/employee
+IMPORT_ENGINE_STAGING = 'staging'  # COPY into staging tables + set-based merge, one transaction
+IMPORT_ENGINES = (IMPORT_ENGINE_ROWS, IMPORT_ENGINE_STAGING)
+
+# ZIDs per query when re-reading employee IDs on resume
+RESUME_LOOKUP_CHUNK_SIZE = 1000
+
+# Checkpoint phases (import_jobs.checkpoint['phase'])
+PHASE_EMPLOYEES = 'employees'  # nothing committed yet that a resume could skip
+PHASE_SKILLS = 'skills'        # employees committed; skill rows before skill_rows_done committed
+
+
 class ImportServiceError(Exception):
     """Custom exception for import service errors."""
     pass
@@ -38,14 +62,20 @@ class ImportServiceError(Exception):
 class EmployeeImportOrchestrator:
     """Orchestrates the employee import process."""
     
-    def __init__(self, db_session: Optional[Session] = None, job_id: Optional[str] = None):
+    def __init__(self, db_session: Optional[Session] = None, job_id: Optional[str] = None,
+                 import_engine: Optional[str] = None):
         self.db: Optional[Session] = db_session
         self.job_id = job_id  # Optional job_id for DB-backed progress tracking
         # Use DB-backed job service for progress tracking (not in-memory tracker)
         self.job_service = ImportJobService(db_session) if job_id and db_session else None
         self.import_stats = {
             'employees_imported': 0,
+            'employees_created': 0,
+            'employees_updated': 0,
+            'employees_unchanged': 0,
             'skills_imported': 0,
+            'skills_updated': 0,
+            'skills_unchanged': 0,
             'new_sub_segments': [],
             'new_projects': [],
             'new_teams': [],
@@ -62,8 +92,28 @@ class EmployeeImportOrchestrator:
         self.date_parser = DateParser()
         self.name_normalizer = NameNormalizer()
         self.field_sanitizer = FieldSanitizer()
+        
+        # Set-based employee/skill writes; EMPLOYEE_IMPORT_BULK_UPSERT=false restores per-row writes
+        self.bulk_writes = os.getenv("EMPLOYEE_IMPORT_BULK_UPSERT", "true").lower() != "false"
+        
+        # Rows per streamed Excel chunk; 0 restores the full in-memory read_excel()
+        self.read_chunk_rows = int(os.getenv("EMPLOYEE_IMPORT_READ_CHUNK_ROWS", str(EXCEL_READ_CHUNK_SIZE)))
+        
+        # Threads resolving skill chunks ahead of the persister; 0 resolves in the persister (sequential)
+        self.resolution_workers = int(os.getenv("EMPLOYEE_IMPORT_RESOLUTION_WORKERS", str(RESOLUTION_WORKERS)))
+        
+        # Skip unchanged employees (and unchanged files) by content fingerprint;
+        # EMPLOYEE_IMPORT_DELTA=false re-imports every row
+        self.delta_import = os.getenv("EMPLOYEE_IMPORT_DELTA", "true").lower() != "false"
+        
+        # Persistence engine for this job; EMPLOYEE_IMPORT_ENGINE sets the default
+        self.import_engine = (import_engine or os.getenv("EMPLOYEE_IMPORT_ENGINE", IMPORT_ENGINE_ROWS)).lower()
+        if self.import_engine not in IMPORT_ENGINES:
+            raise ImportServiceError(
+                f"Unknown import engine: {self.import_engine} (expected one of: {', '.join(IMPORT_ENGINES)})"
+            )
     
-    def import_excel(self, file_path: str) -> Dict[str, Any]:
+    def import_excel(self, file_path: str, resume_checkpoint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Import Excel file data with NEW FORMAT.
 
@@ -74,14 +124,33 @@ class EmployeeImportOrchestrator:
         - Org master data (SubSegment/Project/Team) still scanned and created from Employee sheet
 
         Import Flow:
-            1. Read & normalize Excel (employees_df, skills_df)
+            1. Read & normalize Excel (employees_df; skills streamed in chunks)
             2. Scan & seed org master data (SubSegment/Project/Team/Role)
             3. Import employees → build zid_to_employee_id mapping
-            4. Import skills with resolution (exact/alias/unresolved)
+            4. Import skills with resolution (exact/alias/unresolved), chunk by chunk;
+               the next chunks are resolved on worker threads while one is persisted
             5. Commit transaction
 
+        With import_engine='staging', steps 3-4 go through StagingImportEngine
+        (COPY + set-based merge) and are committed once, at step 5.
+
+        Checkpoints (job imports): with the 'rows' engine the job's checkpoint
+        is saved after step 3 and after each committed skill chunk. Resuming
+        from a 'skills' checkpoint restores the cumulative stats, skips steps
+        2-3 (the employee mapping is re-read from the DB) and skips the skill
+        rows already committed; the rest is written in delta mode, since skills
+        of the interrupted chunk may already be committed. Anything else
+        restarts from the beginning.
+
+        Delta import (EMPLOYEE_IMPORT_DELTA, on by default): a file identical to
+        the last one imported without errors is not processed at all, employees
+        whose content fingerprint is unchanged are skipped in steps 3-4, and
+        skills an employee already has are only updated (with history) when a
+        value changed.
+
         Args:
             file_path (str): Path to the Excel file
+            resume_checkpoint: Checkpoint of an interrupted run of this job (same file)
 
         Returns:
             Dict with import statistics including resolution metrics
@@ -95,6 +164,7 @@ class EmployeeImportOrchestrator:
             should_close_session = True
         else:
             should_close_session = False
+        skill_reader = skill_chunks = progress_session = None
 
         # Validate PostgreSQL connection before starting
         try:
@@ -107,7 +177,30 @@ class EmployeeImportOrchestrator:
                 self.db.close()
             raise ImportServiceError(error_msg)
 
+        if self.import_engine == IMPORT_ENGINE_STAGING and self.job_service:
+            # Progress commits must not end the single staging transaction
+            progress_session = SessionLocal()
+            self.job_service = ImportJobService(progress_session)
+
+        resume_phase = (resume_checkpoint or {}).get('phase')
+        if resume_phase == PHASE_SKILLS and self.import_engine == IMPORT_ENGINE_ROWS:
+            self.import_stats.update(resume_checkpoint.get('stats') or {})
+            logger.info(f"🔁 Resuming job {self.job_id} at skill row {resume_checkpoint.get('skill_rows_done', 0)}")
+        else:
+            resume_checkpoint = resume_phase = None
+
         try:
+            fingerprint_store = ImportFingerprintStore(self.db) if self.delta_import else None
+            file_hash = file_sha256(file_path) if fingerprint_store else None
+            if file_hash and file_hash == fingerprint_store.last_file_hash():
+                return self._skip_unchanged_file(file_path)
+            
+            if resume_phase is None:
+                self._save_checkpoint(PHASE_EMPLOYEES)
+            
+            # Step 0: Load reference data once (proficiency/role/org lookups served from memory)
+            reference_cache = ReferenceDataCache(self.db).load()
+            
             # Step 1: Read Excel data
             logger.info("Reading Excel data")
             if self.job_service and self.job_id:
@@ -115,17 +208,27 @@ class EmployeeImportOrchestrator:
                     self.job_id, status='processing', percent=5, message="Reading Excel file..."
                 )
             
-            employees_df, skills_df = read_excel(file_path)
-            logger.info(f"Read {len(employees_df)} employees, {len(skills_df)} skills")
+            employees_df, skill_reader, skill_row_count = self._read_input(file_path)
+            logger.info(f"Read {len(employees_df)} employees, ~{skill_row_count} skill rows")
             logger.info(f"Employee columns: {list(employees_df.columns)}")
-            logger.info(f"Skills columns: {list(skills_df.columns)}")
+            
+            employee_fingerprints: Dict[str, str] = {}
+            unchanged_zids: Set[str] = set()
+            if fingerprint_store:
+                employee_fingerprints = self._fingerprint_employees(file_path, employees_df)
+                stored_fingerprints = fingerprint_store.employee_fingerprints()
+                unchanged_zids = {
+                    zid for zid, fingerprint in employee_fingerprints.items()
+                    if stored_fingerprints.get(zid) == fingerprint
+                }
+            total_employee_rows = len(employees_df)
             
             # Calculate total rows for progress tracking
-            total_rows = len(employees_df) + len(skills_df)
+            total_rows = len(employees_df) + skill_row_count
             if self.job_service and self.job_id:
                 self.job_service.update_job(
                     self.job_id, percent=10,
-                    message=f"Processing {len(employees_df)} employees and {len(skills_df)} skills...",
+                    message=f"Processing {len(employees_df)} employees and {skill_row_count} skills...",
                     total_count=total_rows
                 )
 
@@ -133,37 +236,61 @@ class EmployeeImportOrchestrator:
             import_timestamp = datetime.now(timezone.utc)
             logger.info(f"Import timestamp: {import_timestamp.isoformat()}")
 
-            # Step 3: Scan org master data from Employee sheet ONLY
-            if self.job_service and self.job_id:
-                self.job_service.update_job(
-                    self.job_id, percent=15, message="Scanning organization master data..."
-                )
-            master_data = get_master_data_for_scanning(employees_df, skills_df)
+            if resume_phase is None:
+                # Step 3: Scan org master data from Employee sheet ONLY
+                if self.job_service and self.job_id:
+                    self.job_service.update_job(
+                        self.job_id, percent=15, message="Scanning organization master data..."
+                    )
+                master_data = get_master_data_for_scanning(employees_df)
 
-            # Step 4: Clear fact tables (employees and employee_skills)
-            # NOTE: Skipped for upsert logic - we now update existing records
-            # self._clear_fact_tables()
+                # Step 4: Clear fact tables (employees and employee_skills)
+                # NOTE: Skipped for upsert logic - we now update existing records
+                # self._clear_fact_tables()
 
-            # Step 5: Process org master data (SubSegment/Project/Team/Role only)
-            if self.job_service and self.job_id:
-                self.job_service.update_job(
-                    self.job_id, percent=20, message="Processing organization structure..."
-                )
-            org_processor = OrgMasterDataProcessor(self.db, self.import_stats)
-            org_processor.process_all(master_data)
+                # Step 5: Process org master data (SubSegment/Project/Team/Role only)
+                if self.job_service and self.job_id:
+                    self.job_service.update_job(
+                        self.job_id, percent=20, message="Processing organization structure..."
+                    )
+                org_processor = OrgMasterDataProcessor(self.db, self.import_stats, reference_cache=reference_cache)
+                org_processor.process_all(master_data)
 
-            # Step 6: Import employees FIRST
-            if self.job_service and self.job_id:
-                self.job_service.update_job(
-                    self.job_id, percent=30, message="Importing employees (upsert mode)..."
+            # Step 6: Import employees FIRST (dates pre-parsed column-wise); unchanged ones are skipped
+            if unchanged_zids:
+                employees_df = employees_df[~employees_df['zid'].astype(str).isin(unchanged_zids)]
+                self.import_stats['employees_unchanged'] = total_employee_rows - len(employees_df)
+                logger.info(f"Skipping {self.import_stats['employees_unchanged']} unchanged employee rows "
+                            f"({len(unchanged_zids)} employees)")
+            skill_lookup_index = SkillLookupIndex(self.db)
+            skill_resolver = SkillResolver(self.db, self.import_stats, lookup_index=skill_lookup_index)
+            skill_resolver.set_name_normalizer(self.name_normalizer.normalize_name)
+            if resume_phase == PHASE_SKILLS:
+                # Employees were committed before the interruption
+                zid_to_employee_id_mapping = self._resume_employee_mapping(employees_df)
+            else:
+                employees_df = parse_employee_columns(employees_df, self.date_parser, self.import_stats)
+                if self.job_service and self.job_id:
+                    self.job_service.update_job(
+                        self.job_id, percent=30, message="Importing employees (upsert mode)..."
+                    )
+                if self.import_engine == IMPORT_ENGINE_STAGING:
+                    employee_persister = skill_persister = StagingImportEngine(
+                        self.db, self.import_stats,
+                        self.date_parser, self.field_sanitizer,
+                        skill_resolver, name_normalizer=self.name_normalizer.normalize_name,
+                        delta_mode=self.delta_import
+                    )
+                else:
+                    employee_persister = EmployeePersister(
+                        self.db, self.import_stats, 
+                        self.date_parser, self.field_sanitizer,
+                        bulk_mode=self.bulk_writes, reference_cache=reference_cache
+                    )
+                zid_to_employee_id_mapping = employee_persister.import_employees(
+                    employees_df, import_timestamp
                 )
-            employee_persister = EmployeePersister(
-                self.db, self.import_stats, 
-                self.date_parser, self.field_sanitizer
-            )
-            zid_to_employee_id_mapping = employee_persister.import_employees(
-                employees_df, import_timestamp
-            )
+                self._save_checkpoint(PHASE_SKILLS)
             
             # Update progress after employees imported
             if self.job_service and self.job_id:
@@ -174,34 +301,55 @@ class EmployeeImportOrchestrator:
                     employees_processed=employees_processed
                 )
 
-            # Step 7: Expand comma-separated skills
-            if self.job_service and self.job_id:
-                self.job_service.update_job(
-                    self.job_id, percent=55, message="Expanding comma-separated skills..."
-                )
-            skill_expander = SkillExpander()
-            skills_df = skill_expander.expand_skills(skills_df)
-
-            # Step 8: Import employee skills with resolution
+            # Step 7/8: Expand comma-separated skills and import them with resolution, chunk by chunk
             if self.job_service and self.job_id:
                 self.job_service.update_job(
                     self.job_id, percent=60,
-                    message=f"Importing {len(skills_df)} skills with resolution..."
+                    message=f"Importing {skill_row_count} skills with resolution..."
                 )
-            skill_resolver = SkillResolver(self.db, self.import_stats)
-            skill_resolver.set_name_normalizer(self.name_normalizer.normalize_name)
-            
-            unresolved_logger = UnresolvedSkillLogger(self.db)
-            unresolved_logger.set_name_normalizer(self.name_normalizer.normalize_name)
+            skill_expander = SkillExpander()
+            # Load skill names + aliases once; exact/alias resolution is then in-memory
+            skill_lookup_index.load()
             
-            skill_persister = SkillPersister(
-                self.db, self.import_stats,
-                self.date_parser, self.field_sanitizer,
-                skill_resolver, unresolved_logger
-            )
-            expanded_skill_count = skill_persister.import_employee_skills(
-                skills_df, zid_to_employee_id_mapping, import_timestamp
+            if self.import_engine == IMPORT_ENGINE_ROWS:
+                skill_persister = self._create_skill_persister(
+                    skill_resolver, reference_cache, resuming=resume_phase == PHASE_SKILLS
+                )
+            skill_rows_done = (resume_checkpoint or {}).get('skill_rows_done', 0)
+            skill_chunks = (
+                parse_skill_columns(
+                    skill_expander.expand_skills(_without_zids(skills_df, unchanged_zids)),
+                    self.date_parser, self.field_sanitizer, self.import_stats
+                )
+                for skills_df in _rows_from(skill_reader, skill_rows_done)
             )
+            if self.resolution_workers > 0:
+                skill_chunks = SkillResolutionPipeline(
+                    skill_resolver, SessionLocal, skill_lookup_index,
+                    name_normalizer=self.name_normalizer.normalize_name,
+                    workers=self.resolution_workers
+                ).run(skill_chunks)
+            
+            expanded_skill_count = (resume_checkpoint or {}).get('skill_rows_expanded', 0)
+            skill_rows_read = skill_rows_done
+            for skills_df in skill_chunks:
+                if not skills_df.empty:
+                    # Index = sheet row position, so this only grows
+                    skill_rows_read = max(skill_rows_read, int(skills_df.index.max()) + 1)
+                expanded_skill_count += skill_persister.import_employee_skills(
+                    skills_df, zid_to_employee_id_mapping, import_timestamp
+                )
+                # The persister has committed this chunk
+                self._save_checkpoint(
+                    PHASE_SKILLS, skill_rows_done=skill_rows_read, skill_rows_expanded=expanded_skill_count,
+                    last_zid=str(skills_df['zid'].iloc[-1]) if not skills_df.empty and 'zid' in skills_df else None
+                )
+                if self.job_service and self.job_id and skill_row_count:
+                    self.job_service.update_job(
+                        self.job_id, percent=60 + int(29 * min(1.0, skill_rows_read / skill_row_count)),
+                        message=f"Importing skills... ({skill_rows_read}/{skill_row_count})",
+                        skills_processed=self.import_stats.get('skills_imported', 0)
+                    )
             
             # Update progress after skills imported
             if self.job_service and self.job_id:
@@ -217,6 +365,10 @@ class EmployeeImportOrchestrator:
                 self.job_service.update_job(
                     self.job_id, percent=95, message="Committing changes to database..."
                 )
+            if fingerprint_store:
+                self._save_fingerprints(
+                    fingerprint_store, employee_fingerprints, zid_to_employee_id_mapping, file_hash
+                )
             self.db.flush()
             self.db.commit()
 
@@ -225,8 +377,12 @@ class EmployeeImportOrchestrator:
                         f"alias={self.import_stats['skills_resolved_alias']}, "
                         f"unresolved={self.import_stats['skills_unresolved']}")
 
+            self.import_stats['reference_cache'] = reference_cache.summary()
+            logger.info(f"Reference cache: {self.import_stats['reference_cache']['hits']} hits, "
+                        f"{self.import_stats['reference_cache']['misses']} misses")
+
             # Build response
-            response = self._build_response(employees_df, expanded_skill_count)
+            response = self._build_response(total_employee_rows, expanded_skill_count)
             
             # Mark job as completed in DB
             if self.job_service and self.job_id:
@@ -250,10 +406,151 @@ class EmployeeImportOrchestrator:
             raise ImportServiceError(error_msg)
         
         finally:
+            # Stop resolution workers / close the workbook if the import stopped early
+            for generator in (skill_chunks, skill_reader):
+                if generator is not None:
+                    generator.close()
             # Only close session if we created it
+            if progress_session is not None:
+                progress_session.close()
             if self.db and should_close_session:
                 self.db.close
     
+    def _read_input(self, file_path: str) -> Tuple[Any, Iterator, int]:
+        """
+        Read the Employee sheet and open the Employee_Skills sheet.
+        
+        The Employee sheet is read whole (org scanning and the employee upsert
+        need every row); skill rows are streamed in chunks of read_chunk_rows.
+        The first skill chunk is read up front so a malformed skills sheet
+        fails before anything is written.
+        
+        Returns:
+            Tuple of (employees_df, skill chunk iterator, skill row count for progress)
+        """
+        if self.read_chunk_rows <= 0:
+            employees_df, skills_df = read_excel(file_path)
+            return employees_df, (chunk for chunk in [skills_df]), len(skills_df)
+        
+        employees_df = read_employee_sheet(file_path, self.read_chunk_rows)
+        _, skill_row_count = count_sheet_rows(file_path)
+        skill_chunks = iter_skill_chunks(file_path, self.read_chunk_rows)
+        first_chunk = next(skill_chunks)
+        return employees_df, _prepend_chunk(first_chunk, skill_chunks), skill_row_count
+    
+    def _create_skill_persister(self, skill_resolver, reference_cache: ReferenceDataCache,
+                                resuming: bool = False) -> SkillPersister:
+        """
+        SkillPersister for the 'rows' engine.
+        
+        The checkpoint is saved per read chunk, but the persister commits
+        sub-chunks of it, so a resume may re-read skills that are already
+        committed. A resume therefore always writes in bulk delta mode, which
+        diffs against the stored skills instead of inserting them again.
+        """
+        unresolved_logger = UnresolvedSkillLogger(self.db)
+        unresolved_logger.set_name_normalizer(self.name_normalizer.normalize_name)
+        
+        return SkillPersister(
+            self.db, self.import_stats,
+            self.date_parser, self.field_sanitizer,
+            skill_resolver, unresolved_logger,
+            bulk_mode=self.bulk_writes or resuming, reference_cache=reference_cache,
+            delta_mode=self.delta_import or resuming
+        )
+    
+    def _save_checkpoint(self, phase: str, **progress):
+        """
+        Save the job's checkpoint after committed work (job imports only).
+        
+        The staging engine commits once, so it only records the initial
+        checkpoint (a resume restarts it from the beginning).
+        """
+        if not (self.job_service and self.job_id):
+            return
+        if self.import_engine != IMPORT_ENGINE_ROWS:
+            if phase != PHASE_EMPLOYEES:
+                return
+        else:
+            self.db.commit()
+        self.job_service.save_checkpoint(self.job_id, {
+            'phase': phase,
+            'engine': self.import_engine,
+            **progress,
+            'stats': _json_safe(self.import_stats) if phase == PHASE_SKILLS else {}
+        })
+    
+    def _resume_employee_mapping(self, employees_df) -> Dict[str, int]:
+        """
+        ZID → employee_id of the employees committed before the interruption.
+        
+        ZIDs whose Employee rows all failed (per the restored failed_rows) stay
+        unmapped, so their skills fail with EMPLOYEE_NOT_IMPORTED as before.
+        """
+        row_counts = employees_df['zid'].astype(str).value_counts()
+        failed_counts: Dict[str, int] = {}
+        for row in self.import_stats['failed_rows']:
+            if row.get('sheet') == 'Employee':
+                failed_counts[str(row.get('zid'))] = failed_counts.get(str(row.get('zid')), 0) + 1
+        zids = [zid for zid, count in row_counts.items() if failed_counts.get(zid, 0) < count]
+        
+        mapping: Dict[str, int] = {}
+        for start in range(0, len(zids), RESUME_LOOKUP_CHUNK_SIZE):
+            mapping.update(self.db.query(Employee.zid, Employee.employee_id).filter(
+                Employee.zid.in_(zids[start:start + RESUME_LOOKUP_CHUNK_SIZE])
+            ).all())
+        logger.info(f"🔁 Restored {len(mapping)} employee IDs for resume")
+        return mapping
+    
+    def _fingerprint_employees(self, file_path: str, employees_df) -> Dict[str, str]:
+        """
+        Content fingerprint per ZID (Employee rows + sorted skill rows).
+        
+        Skill rows come from a separate streamed pass over the skills sheet,
+        so the import's own skill stream is left untouched.
+        """
+        fingerprinter = EmployeeFingerprinter()
+        fingerprinter.add_employees(employees_df)
+        for skills_df in iter_skill_chunks(file_path, self.read_chunk_rows or EXCEL_READ_CHUNK_SIZE):
+            fingerprinter.add_skills(skills_df)
+        return fingerprinter.fingerprints()
+    
+    def _save_fingerprints(self, fingerprint_store: ImportFingerprintStore, employee_fingerprints: Dict[str, str],
+                           zid_to_employee_id_mapping: Dict[str, int], file_hash: Optional[str]):
+        """
+        Store fingerprints of employees imported without any failed row.
+        
+        Employees with failed rows (e.g. unresolved skills) keep their old
+        fingerprint so the next import retries them; the file hash is only
+        stored when nothing failed. Best-effort: a failure here does not fail
+        the import, it only makes the next one less incremental.
+        """
+        failed_zids = {str(row.get('zid')) for row in self.import_stats['failed_rows']}
+        fingerprints = {
+            employee_id: employee_fingerprints[zid]
+            for zid, employee_id in zid_to_employee_id_mapping.items()
+            if zid in employee_fingerprints and zid not in failed_zids
+        }
+        try:
+            with self.db.begin_nested():
+                saved = fingerprint_store.save_employee_fingerprints(fingerprints)
+                if file_hash and not self.import_stats['failed_rows']:
+                    fingerprint_store.save_file_hash(file_hash, job_id=self.job_id)
+            logger.info(f"Saved {saved} employee fingerprints")
+        except SQLAlchemyError as e:
+            logger.warning(f"⚠️ Could not save import fingerprints: {type(e).__name__}: {str(e)}")
+    
+    def _skip_unchanged_file(self, file_path: str) -> Dict[str, Any]:
+        """Result for a file identical to the last one imported without errors."""
+        employee_rows, skill_rows = count_sheet_rows(file_path)
+        logger.info(f"File unchanged since the last successful import; skipping {employee_rows} employees")
+        self.import_stats['employees_unchanged'] = employee_rows
+        self.import_stats['file_unchanged'] = True
+        response = self._build_response(employee_rows, skill_rows)
+        if self.job_service and self.job_id:
+            self.job_service.complete_job(self.job_id, result=response)
+        return response
+    
     def _clear_fact_tables(self):
         """Clear volatile fact tables (employees and employee_skills)."""
         logger.info("Clearing fact tables (employees, employee_skills)")
@@ -268,10 +565,9 @@ class EmployeeImportOrchestrator:
         except SQLAlchemyError as e:
             raise ImportServiceError(f"Failed to clear fact tables: {str(e)}")
     
-    def _build_response(self, employees_df, expanded_skill_count: int) -> Dict[str, Any]:
+    def _build_response(self, total_employee_rows: int, expanded_skill_count: int) -> Dict[str, Any]:
         """Build the import response dictionary."""
         # Determine status based on failures
-        total_employee_rows = len(employees_df)
         total_skill_rows_expanded = expanded_skill_count
 
         employee_imported = self.import_stats['employees_imported']
@@ -319,3 +615,44 @@ class EmployeeImportOrchestrator:
             error_msg += " (PostgreSQL connection issue - check database availability)"
         
         return error_msg
+
+
+def _without_zids(skills_df, zids: Set[str]):
+    """Skill rows of employees not in zids (the unchanged employees of a delta import)."""
+    if not zids or 'zid' not in skills_df.columns:
+        return skills_df
+    return skills_df[~skills_df['zid'].astype(str).isin(zids)]
+
+
+def _rows_from(chunks: Iterator, first_row: int) -> Iterator:
+    """Skill chunks without the sheet rows before first_row (committed before a resume)."""
+    for chunk in chunks:
+        if first_row and not chunk.empty:
+            if int(chunk.index.max()) < first_row:
+                continue
+            chunk = chunk[chunk.index >= first_row]
+        yield chunk
+
+
+def _json_safe(value):
+    """Copy of value that the JSON column can store (numpy scalars, dates, sets converted)."""
+    return json.loads(json.dumps(value, default=_json_default))
+
+
+def _json_default(value):
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _prepend_chunk(first, rest: Iterator):
+    """Yield first, then the rest of a chunk generator (closing it, and its workbook, when done)."""
+    try:
+        yield first
+        yield from rest
+    finally:
+        rest.close()
@@ -1,29 +1,56 @@
 """
 Employee database persistence for employee import.
 
+Two write paths share the same rules and error reporting:
+- Per-row (default): one SELECT/INSERT-or-UPDATE/COMMIT per employee.
+- Bulk (bulk_mode=True): org foreign keys come from maps loaded once, and
+  employees are written per chunk with INSERT ... ON CONFLICT (zid) DO UPDATE
+  ... RETURNING, together with their active project allocations, in one
+  transaction per chunk. A chunk that fails is rolled back and replayed
+  through the per-row path, so failed rows are reported exactly as before.
+
 Single Responsibility: Insert employee records to database.
 """
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models import Employee, SubSegment, Project, Team, Role
-from .allocation_writer import parse_allocation_pct, upsert_active_project_allocation
+from app.models import Employee
+from .allocation_writer import (
+    parse_allocation_pct,
+    upsert_active_project_allocation,
+    upsert_active_project_allocations
+)
+from .reference_data_cache import ReferenceDataCache
+from .column_parser import parsed_value
 
 logger = logging.getLogger(__name__)
 
+# Employees per INSERT ... ON CONFLICT statement (and per commit) in bulk mode
+EMPLOYEE_UPSERT_CHUNK_SIZE = 500
+
 
 class EmployeePersister:
     """Handles employee database operations."""
     
-    def __init__(self, db: Session, stats: Dict, date_parser, field_sanitizer, progress_callback=None):
+    def __init__(self, db: Session, stats: Dict, date_parser, field_sanitizer, progress_callback=None,
+                 bulk_mode: bool = False, chunk_size: int = EMPLOYEE_UPSERT_CHUNK_SIZE,
+                 reference_cache: Optional[ReferenceDataCache] = None):
         self.db = db
         self.stats = stats
         self.date_parser = date_parser
         self.field_sanitizer = field_sanitizer
         self.progress_callback = progress_callback  # Optional callback for progress reporting
+        self.bulk_mode = bulk_mode
+        self.chunk_size = max(1, chunk_size)
+        # Org lookups (SubSegment/Project/Team/Role by name) for both write paths
+        self.reference_cache = reference_cache or ReferenceDataCache(db)
+        
+        self._run: Dict[str, Any] = {}
     
     @staticmethod
     def _is_empty(value) -> bool:
@@ -49,13 +76,16 @@ class EmployeePersister:
     def import_employees(self, employees_df: pd.DataFrame, import_timestamp: datetime) -> Dict[str, int]:
         """
         Import employees with upsert logic (update if exists, insert if new).
-        Each employee is committed independently so failures don't affect others.
         
         UPSERT LOGIC:
         - Query Employee by zid
         - If NOT found: Create new Employee
         - If FOUND: Update only non-empty fields from Excel
         
+        Per-row mode commits each employee independently so failures don't
+        affect others. Bulk mode commits per chunk and replays a failing chunk
+        row-by-row, which gives the same per-row failure reporting.
+        
         Args:
             employees_df: DataFrame with employee data
             import_timestamp: Import timestamp
@@ -63,89 +93,33 @@ class EmployeePersister:
         Returns:
             Dict mapping ZID to employee_id
         """
-        logger.info(f"Upserting {len(employees_df)} employees (per-employee transactions)")
-
-        zid_to_employee_id_mapping = {}
-        successful_imports = 0
-        employees_created = 0
-        employees_updated = 0
-        failed_employees = []
-          # Threshold-based progress tracking for employees (20% → 50% range)
         total_employees = len(employees_df)
-        progress_step = max(1, total_employees // 10)  # Update every ~10% of employees
-        next_threshold = progress_step
+        if self.bulk_mode:
+            logger.info(f"Upserting {total_employees} employees (bulk, chunks of {self.chunk_size})")
+        else:
+            logger.info(f"Upserting {total_employees} employees (per-employee transactions)")
 
-        for row_idx, row in employees_df.iterrows():
-            row_number = row_idx + 2  # Excel row number (accounting for header)
-            zid = str(row.get('zid', ''))
-            full_name = str(row.get('full_name', ''))
+        # Threshold-based progress tracking for employees (20% → 50% range)
+        progress_step = max(1, total_employees // 10)  # Update every ~10% of employees
+        self._run = {
+            'mapping': {},
+            'successful': 0,
+            'created': 0,
+            'updated': 0,
+            'failed': [],
+            'total': total_employees,
+            'progress_step': progress_step,
+            'next_threshold': progress_step
+        }
 
-            try:
-                # Check if employee exists
-                existing_employee = self.db.query(Employee).filter(Employee.zid == zid).first()
-                
-                if existing_employee:
-                    # UPDATE: Update existing employee with non-empty fields only
-                    employee_id = self._update_existing_employee(existing_employee, row, zid, import_timestamp)
-                    employees_updated += 1
-                    logger.debug(f"Updated employee {zid} (ID: {employee_id})")
-                else:
-                    # INSERT: Create new employee
-                    employee_id = self._import_single_employee(row, zid, full_name, import_timestamp)
-                    employees_created += 1
-                    logger.debug(f"Created employee {zid} (ID: {employee_id})")
-                
-                # Handle project allocation if provided
-                self._handle_project_allocation(row, employee_id, zid)
-                
-                # Commit this employee immediately (per-employee transaction)
-                self.db.commit()
-                
-                zid_to_employee_id_mapping[zid] = employee_id
-                successful_imports += 1
-                
-                # Report progress when crossing threshold
-                if self.progress_callback and successful_imports >= next_threshold:
-                    # Map employee progress to 20% → 50% range (30% total)
-                    employee_progress_percent = (successful_imports / total_employees) * 30
-                    overall_progress = 20 + employee_progress_percent
-                    
-                    self.progress_callback(
-                        message=f"Importing employees... ({successful_imports}/{total_employees})",
-                        percent=int(overall_progress),
-                        total_rows=100,
-                        employees_processed=successful_imports
-                    )
-                    
-                    # Advance to next threshold
-                    next_threshold += progress_step
+        if self.bulk_mode:
+            self._import_employees_bulk(employees_df, import_timestamp)
+        else:
+            for row_idx, row in employees_df.iterrows():
+                self._import_employee_row(row_idx, row, import_timestamp)
 
-            except Exception as e:
-                # Log the error and continue with next row
-                error_message = str(e)
-                logger.warning(f"Failed to import employee at row {row_number} (ZID: {zid}, Name: {full_name}): {error_message}")
-                
-                # Determine error code
-                error_code = self._determine_error_code(error_message)
-
-                # Track failed employee
-                failed_employee = {
-                    'sheet': 'Employee',
-                    'excel_row_number': row_number,
-                    'row_number': row_number,  # Legacy field
-                    'zid': zid if zid else None,
-                    'full_name': full_name if full_name else None,
-                    'employee_name': full_name if full_name else None,  # For consistency
-                    'skill_name': None,  # Not applicable for employee rows
-                    'error_code': error_code,
-                    'message': error_message
-                }
-                failed_employees.append(failed_employee)
-                self.stats['failed_rows'].append(failed_employee)
-
-                # Rollback ONLY this employee (won't affect previous commits)
-                self.db.rollback()
-                continue
+        successful_imports = self._run['successful']
+        failed_employees = self._run['failed']
         
         # Always send final employee progress update
         if self.progress_callback and successful_imports > 0:
@@ -157,13 +131,325 @@ class EmployeePersister:
             )
 
         self.stats['employees_imported'] = successful_imports
-        self.stats['employees_created'] = employees_created
-        self.stats['employees_updated'] = employees_updated
+        self.stats['employees_created'] = self._run['created']
+        self.stats['employees_updated'] = self._run['updated']
         self.stats['failed_employees'] = failed_employees
-        logger.info(f"Upserted {successful_imports} of {len(employees_df)} employees "
-                   f"(created: {employees_created}, updated: {employees_updated}, failed: {len(failed_employees)})")
+        logger.info(f"Upserted {successful_imports} of {total_employees} employees "
+                   f"(created: {self._run['created']}, updated: {self._run['updated']}, "
+                   f"failed: {len(failed_employees)})")
 
-        return zid_to_employee_id_mapping
+        return self._run['mapping']
+    
+    def _import_employee_row(self, row_idx, row, import_timestamp: datetime) -> Optional[int]:
+        """
+        Upsert one employee (and its allocation) in its own transaction.
+        
+        Failures are recorded in failed_rows and rolled back; the import continues.
+        
+        Returns:
+            employee_id, or None if the row failed
+        """
+        row_number = row_idx + 2  # Excel row number (accounting for header)
+        zid = str(row.get('zid', ''))
+        full_name = str(row.get('full_name', ''))
+
+        try:
+            # Check if employee exists
+            existing_employee = self.db.query(Employee).filter(Employee.zid == zid).first()
+            
+            if existing_employee:
+                # UPDATE: Update existing employee with non-empty fields only
+                employee_id = self._update_existing_employee(existing_employee, row, zid, import_timestamp)
+                created = False
+                logger.debug(f"Updated employee {zid} (ID: {employee_id})")
+            else:
+                # INSERT: Create new employee
+                employee_id = self._import_single_employee(row, zid, full_name, import_timestamp)
+                created = True
+                logger.debug(f"Created employee {zid} (ID: {employee_id})")
+            
+            # Handle project allocation if provided
+            self._handle_project_allocation(row, employee_id, zid)
+            
+            # Commit this employee immediately (per-employee transaction)
+            self.db.commit()
+
+        except Exception as e:
+            # Log the error and continue with next row
+            self._record_failed_employee(row_number, zid, full_name, str(e))
+
+            # Rollback ONLY this employee (won't affect previous commits)
+            self.db.rollback()
+            return None
+
+        self._record_imported_employee(zid, employee_id, created)
+        return employee_id
+
+    def _record_imported_employee(self, zid: str, employee_id: int, created: bool):
+        """Count a committed employee and report progress when crossing a threshold."""
+        run = self._run
+        run['mapping'][zid] = employee_id
+        run['successful'] += 1
+        run['created' if created else 'updated'] += 1
+        
+        # Report progress when crossing threshold
+        if self.progress_callback and run['successful'] >= run['next_threshold']:
+            # Map employee progress to 20% → 50% range (30% total)
+            employee_progress_percent = (run['successful'] / run['total']) * 30
+            overall_progress = 20 + employee_progress_percent
+            
+            self.progress_callback(
+                message=f"Importing employees... ({run['successful']}/{run['total']})",
+                percent=int(overall_progress),
+                total_rows=100,
+                employees_processed=run['successful']
+            )
+            
+            # Advance to next threshold
+            while run['next_threshold'] <= run['successful']:
+                run['next_threshold'] += run['progress_step']
+
+    def _record_failed_employee(self, row_number: int, zid: str, full_name: str, error_message: str):
+        """Track a failed employee row in stats['failed_rows']."""
+        logger.warning(f"Failed to import employee at row {row_number} (ZID: {zid}, Name: {full_name}): {error_message}")
+        
+        # Determine error code
+        error_code = self._determine_error_code(error_message)
+
+        # Track failed employee
+        failed_employee = {
+            'sheet': 'Employee',
+            'excel_row_number': row_number,
+            'row_number': row_number,  # Legacy field
+            'zid': zid if zid else None,
+            'full_name': full_name if full_name else None,
+            'employee_name': full_name if full_name else None,  # For consistency
+            'skill_name': None,  # Not applicable for employee rows
+            'error_code': error_code,
+            'message': error_message
+        }
+        self._run['failed'].append(failed_employee)
+        self.stats['failed_rows'].append(failed_employee)
+
+    # ========================================================================
+    # BULK MODE
+    # ========================================================================
+
+    def _import_employees_bulk(self, employees_df: pd.DataFrame, import_timestamp: datetime):
+        """Upsert employees chunk by chunk, resolving org foreign keys from the reference cache."""
+        if not self.reference_cache.loaded:
+            self.reference_cache.load()
+
+        for start in range(0, len(employees_df), self.chunk_size):
+            chunk_df = employees_df.iloc[start:start + self.chunk_size]
+            rows = list(zip(chunk_df.index, chunk_df.to_dict('records')))
+            self._import_chunk(rows, import_timestamp)
+
+    def _import_chunk(self, rows: List[Tuple[Any, Dict]], import_timestamp: datetime):
+        """
+        Upsert one chunk in a single transaction; replay it row-by-row on failure.
+        
+        A ZID repeated within the chunk cannot be upserted twice by one
+        statement, so repeats are deferred to the per-row path after the
+        chunk commits (the last row still wins, as in per-row mode).
+        """
+        pending, deferred, seen_zids = [], [], set()
+        for row_idx, row in rows:
+            zid = str(row.get('zid', ''))
+            if zid in seen_zids:
+                deferred.append((row_idx, row))
+            else:
+                seen_zids.add(zid)
+                pending.append((row_idx, row))
+
+        try:
+            written, invalid = self._upsert_chunk(pending, import_timestamp)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(
+                f"Bulk upsert of {len(pending)} employees failed ({type(e).__name__}: {str(e)}); "
+                f"retrying chunk row-by-row"
+            )
+            self.stats['employee_chunks_retried'] = self.stats.get('employee_chunks_retried', 0) + 1
+            deferred = pending + deferred
+        else:
+            for row_number, zid, full_name, error_message in invalid:
+                self._record_failed_employee(row_number, zid, full_name, error_message)
+            for zid, employee_id, created in written:
+                self._record_imported_employee(zid, employee_id, created)
+
+        for row_idx, row in deferred:
+            self._import_employee_row(row_idx, row, import_timestamp)
+
+    def _upsert_chunk(self, rows: List[Tuple[Any, Dict]], import_timestamp: datetime):
+        """
+        Write a chunk of employees and their active allocations. Does not commit.
+        
+        Returns:
+            (written, invalid): written is a list of (zid, employee_id, created);
+            invalid is a list of (row_number, zid, full_name, error_message) for
+            rows rejected before writing (same messages as the per-row path)
+        """
+        zids = [str(row.get('zid', '')) for _, row in rows]
+        existing = {
+            zid: (team_id, full_name)
+            for zid, team_id, full_name in self.db.query(
+                Employee.zid, Employee.team_id, Employee.full_name
+            ).filter(Employee.zid.in_(zids)).all()
+        }
+
+        values, allocation_pcts, invalid = [], {}, []
+        for row_idx, row in rows:
+            zid = str(row.get('zid', ''))
+            try:
+                values.append(self._build_employee_values(row, zid, existing.get(zid), import_timestamp))
+            except Exception as e:
+                invalid.append((row_idx + 2, zid, str(row.get('full_name', '')), str(e)))
+                continue
+            allocation_pct = parse_allocation_pct(row.get('project_allocation_pct'))
+            if allocation_pct is not None:
+                allocation_pcts[zid] = allocation_pct
+
+        if not values:
+            return [], invalid
+
+        returned = self.db.execute(self._build_upsert_statement(values)).all()
+
+        written, allocations = [], []
+        for employee_id, zid, team_id, start_date in returned:
+            written.append((zid, employee_id, zid not in existing))
+            if zid not in allocation_pcts:
+                continue
+            project_id = self.reference_cache.team_project_id(team_id)
+            if not project_id:
+                logger.warning(
+                    f"Allocation% provided for employee {zid} but project not resolved; "
+                    f"skipping allocation row"
+                )
+                continue
+            allocations.append({
+                'employee_id': employee_id,
+                'project_id': project_id,
+                'allocation_pct': allocation_pcts[zid],
+                'start_date': start_date,
+                'allocation_type': 'BILLABLE'
+            })
+
+        self._upsert_chunk_allocations(allocations)
+        return written, invalid
+
+    def _build_employee_values(self, row, zid: str, existing: Optional[Tuple[int, str]],
+                               import_timestamp: datetime) -> Dict[str, Any]:
+        """
+        Column values for one employee, mirroring the per-row insert/update rules.
+        
+        For an existing employee, empty Excel values are sent as NULL (role,
+        start date, email: kept by COALESCE in the upsert) or as the stored
+        value (team, full name: NOT NULL columns).
+        
+        Raises:
+            ImportServiceError: New employee whose sub-segment/project/team is not found
+        """
+        if existing:
+            existing_team_id, existing_full_name = existing
+            full_name = existing_full_name if self._is_empty(row.get('full_name')) else str(row['full_name'])
+            team_id = self._lookup_team_id(row) or existing_team_id
+            role_id = None if self._is_empty(row.get('role')) else self.reference_cache.role_id(row['role'])
+            start_date = None
+            if not self._is_empty(row.get('start_date_of_working')):
+                start_date = self._parse_start_date(row, zid)
+        else:
+            full_name = str(row.get('full_name', ''))
+            team_id = self._require_team_id(row)
+            role_id = self.reference_cache.role_id(row['role']) if row.get('role') else None
+            start_date = self._parse_start_date(row, zid)
+
+        email = None
+        email_raw = row.get('email') or row.get('Email')
+        if email_raw and not pd.isna(email_raw):
+            email = str(email_raw).strip() or None
+
+        return {
+            'zid': zid,
+            'full_name': full_name,
+            'team_id': team_id,
+            'role_id': role_id,
+            'start_date_of_working': start_date,
+            'email': email,
+            'created_at': import_timestamp
+        }
+
+    def _lookup_team_id(self, row) -> Optional[int]:
+        """Team ID for an update: only when team, project and sub-segment are all given and known."""
+        if self._is_empty(row.get('team')) or self._is_empty(row.get('project')) \
+                or self._is_empty(row.get('sub_segment')):
+            return None
+        sub_segment_id = self.reference_cache.sub_segment_id(row['sub_segment'])
+        project_id = self.reference_cache.project_id(row['project'], sub_segment_id)
+        return self.reference_cache.team_id(row['team'], project_id)
+
+    def _require_team_id(self, row) -> int:
+        """Team ID for an insert, raising the per-row path's errors when not found."""
+        from app.services.import_service import ImportServiceError
+
+        sub_segment_id = self.reference_cache.sub_segment_id(row['sub_segment'])
+        if not sub_segment_id:
+            raise ImportServiceError(f"Sub-segment not found: {row['sub_segment']}")
+
+        project_id = self.reference_cache.project_id(row['project'], sub_segment_id)
+        if not project_id:
+            raise ImportServiceError(f"Project not found: {row['project']} under sub-segment: {row['sub_segment']}")
+
+        team_id = self.reference_cache.team_id(row['team'], project_id)
+        if not team_id:
+            raise ImportServiceError(f"Team not found: {row['team']} under project: {row['project']}")
+        return team_id
+
+    @staticmethod
+    def _build_upsert_statement(values: List[Dict[str, Any]]):
+        """INSERT ... ON CONFLICT (zid) DO UPDATE that never overwrites with NULL."""
+        stmt = pg_insert(Employee).values(values)
+        return stmt.on_conflict_do_update(
+            index_elements=['zid'],
+            set_={
+                'full_name': stmt.excluded.full_name,
+                'team_id': stmt.excluded.team_id,
+                'role_id': func.coalesce(stmt.excluded.role_id, Employee.role_id),
+                'start_date_of_working': func.coalesce(
+                    stmt.excluded.start_date_of_working, Employee.start_date_of_working
+                ),
+                'email': func.coalesce(stmt.excluded.email, Employee.email),
+                'updated_at': func.now()
+            }
+        ).returning(Employee.employee_id, Employee.zid, Employee.team_id, Employee.start_date_of_working)
+
+    def _upsert_chunk_allocations(self, allocations: List[Dict]):
+        """
+        Upsert the chunk's allocations inside a savepoint.
+        
+        As in per-row mode, allocation errors never fail an employee: a failed
+        set-based write is retried per allocation, skipping the bad ones.
+        """
+        if not allocations:
+            return
+        try:
+            with self.db.begin_nested():
+                upsert_active_project_allocations(self.db, allocations)
+            return
+        except Exception as e:
+            logger.warning(f"Bulk allocation upsert failed ({e}); retrying per allocation")
+
+        for allocation in allocations:
+            try:
+                with self.db.begin_nested():
+                    upsert_active_project_allocation(db=self.db, **allocation)
+            except Exception as e:
+                logger.warning(f"Failed to upsert allocation for employee_id={allocation['employee_id']}: {e}")
+
+    # ========================================================================
+    # PER-ROW MODE
+    # ========================================================================
     
     def _update_existing_employee(self, existing_employee: Employee, row, zid: str, import_timestamp: datetime) -> int:
         """
@@ -188,36 +474,19 @@ class EmployeePersister:
         # If team changes, project/sub_segment are derived via team relationships
         if not self._is_empty(row.get('team')):
             # Need project context for team lookup
-            if not self._is_empty(row.get('project')) and not self._is_empty(row.get('sub_segment')):
-                sub_segment = self.db.query(SubSegment).filter(
-                    SubSegment.sub_segment_name == row['sub_segment']
-                ).first()
-                if sub_segment:
-                    project = self.db.query(Project).filter(
-                        Project.project_name == row['project'],
-                        Project.sub_segment_id == sub_segment.sub_segment_id
-                    ).first()
-                    if project:
-                        team = self.db.query(Team).filter(
-                            Team.team_name == row['team'],
-                            Team.project_id == project.project_id
-                        ).first()
-                        if team:
-                            existing_employee.team_id = team.team_id
+            team_id = self._lookup_team_id(row)
+            if team_id:
+                existing_employee.team_id = team_id
         
         # Update role if provided
         if not self._is_empty(row.get('role')):
-            role = self.db.query(Role).filter(Role.role_name == row['role']).first()
-            if role:
-                existing_employee.role_id = role.role_id
+            role_id = self.reference_cache.role_id(row['role'])
+            if role_id:
+                existing_employee.role_id = role_id
         
         # Update start_date_of_working if provided
         if not self._is_empty(row.get('start_date_of_working')):
-            start_date = self.date_parser.parse_date_safely(
-                row.get('start_date_of_working'), 
-                'start_date_of_working', 
-                zid
-            )
+            start_date = self._parse_start_date(row, zid)
             if start_date:
                 existing_employee.start_date_of_working = start_date
         
@@ -242,43 +511,13 @@ class EmployeePersister:
         project/sub_segment are derived via team -> project -> sub_segment.
         """
         # Get foreign key IDs - master data should exist from hierarchical processing
-        sub_segment = self.db.query(SubSegment).filter(
-            SubSegment.sub_segment_name == row['sub_segment']
-        ).first()
-
-        if not sub_segment:
-            from app.services.import_service import ImportServiceError
-            raise ImportServiceError(f"Sub-segment not found: {row['sub_segment']}")
-
-        project = self.db.query(Project).filter(
-            Project.project_name == row['project'],
-            Project.sub_segment_id == sub_segment.sub_segment_id
-        ).first()
-
-        if not project:
-            from app.services.import_service import ImportServiceError
-            raise ImportServiceError(f"Project not found: {row['project']} under sub-segment: {row['sub_segment']}")
-
-        team = self.db.query(Team).filter(
-            Team.team_name == row['team'],
-            Team.project_id == project.project_id
-        ).first()
-
-        if not team:
-            from app.services.import_service import ImportServiceError
-            raise ImportServiceError(f"Team not found: {row['team']} under project: {row['project']}")
+        team_id = self._require_team_id(row)
 
         # Lookup role by name (optional)
-        role = None
-        if row.get('role'):
-            role = self.db.query(Role).filter(Role.role_name == row['role']).first()
+        role_id = self.reference_cache.role_id(row['role']) if row.get('role') else None
 
         # Convert start_date_of_working using safe parsing
-        start_date = self.date_parser.parse_date_safely(
-            row.get('start_date_of_working'), 
-            'start_date_of_working', 
-            zid
-        )
+        start_date = self._parse_start_date(row, zid)
 
         # Parse email column (case-insensitive, optional)
         email = None
@@ -292,8 +531,8 @@ class EmployeePersister:
         employee = Employee(
             zid=zid,
             full_name=full_name,
-            team_id=team.team_id,
-            role_id=role.role_id if role else None,
+            team_id=team_id,
+            role_id=role_id,
             start_date_of_working=start_date,
             email=email,
             created_at=import_timestamp
@@ -304,6 +543,14 @@ class EmployeePersister:
         
         return employee.employee_id
     
+    def _parse_start_date(self, row, zid: str):
+        """start_date_of_working from the column pre-pass, or parsed from the cell."""
+        return parsed_value(row, 'start_date_of_working', lambda: self.date_parser.parse_date_safely(
+            row.get('start_date_of_working'),
+            'start_date_of_working',
+            zid
+        ))
+    
     def _determine_error_code(self, error_message: str) -> str:
         """Determine error code based on error message."""
         error_message_lower = error_message.lower()
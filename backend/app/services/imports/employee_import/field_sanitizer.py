@@ -4,11 +4,17 @@ Field sanitization utilities for employee import.
 Single Responsibility: Sanitize and validate field values.
 """
 import logging
-from typing import Any, Optional
+import numbers
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL INTEGER range (column-wise sanitization rejects values the INSERT would)
+PG_INTEGER_MIN = -2 ** 31
+PG_INTEGER_MAX = 2 ** 31 - 1
+
 
 class FieldSanitizer:
     """Handles field sanitization and validation."""
@@ -32,3 +38,53 @@ class FieldSanitizer:
         except (ValueError, TypeError):
             logger.warning(f"Invalid {field_name} value '{value}' for employee {zid}, setting to None")
             return None
+    
+    def sanitize_integer_column(self, values: pd.Series, field_name: str,
+                                zids: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Column-wise sanitize_integer_field() with a PostgreSQL INTEGER range check.
+        
+        Numeric cells go through pd.to_numeric and truncation; text cells keep
+        int() semantics ("5" → 5, "5.0" → invalid), parsed once per distinct
+        string. Values outside INTEGER range or non-finite are invalid.
+        
+        Args:
+            values: Raw column values
+            field_name: Name of the field for logging
+            zids: Employee ZID per row for logging (aligned with values)
+            
+        Returns:
+            (sanitized, invalid): object Series of int/None, and a bool Series
+            that is True where a non-empty value was rejected
+        """
+        raw = pd.Series(values.to_numpy(dtype=object), dtype=object)
+        missing = raw.isna()
+        is_number = raw.map(lambda value: isinstance(value, numbers.Number))
+        
+        numeric = pd.to_numeric(raw.where(is_number & ~missing), errors='coerce').astype(float)
+        in_range = np.isfinite(numeric) & (numeric >= PG_INTEGER_MIN) & (numeric <= PG_INTEGER_MAX)
+        result = np.full(len(raw), None, dtype=object)
+        numeric_ok = (is_number & ~missing & in_range).to_numpy()
+        result[numeric_ok] = [int(number) for number in np.trunc(numeric.to_numpy()[numeric_ok])]
+        
+        other = ~is_number & ~missing
+        converted: Dict[Any, Optional[int]] = {}
+        for value in raw[other].unique():
+            try:
+                number = int(value)
+            except (ValueError, TypeError):
+                number = None
+            converted[value] = number if number is not None and PG_INTEGER_MIN <= number <= PG_INTEGER_MAX else None
+        if converted:
+            result[other.to_numpy()] = [converted[value] for value in raw[other]]
+        
+        sanitized = pd.Series(result, index=raw.index, dtype=object)
+        invalid = ~missing & sanitized.isna()
+        for position in invalid.to_numpy().nonzero()[0]:
+            logger.warning(
+                f"Invalid {field_name} value '{raw.iat[position]}' for employee {zids.iat[position]}, setting to None"
+            )
+        
+        sanitized.index = values.index
+        invalid.index = values.index
+        return sanitized, invalid
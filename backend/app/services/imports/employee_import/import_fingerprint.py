@@ -0,0 +1,168 @@
+"""
+Content fingerprints for delta employee imports.
+
+An employee's fingerprint is a SHA-256 over its normalized Employee rows (in
+sheet order, since the last row wins) and its Employee_Skills rows (sorted,
+so reordering the sheet does not count as a change). Employees whose
+fingerprint equals the stored one are skipped by the import; a file whose
+SHA-256 equals the last file imported without errors is skipped entirely.
+
+Cells are normalized before hashing (empty/NaN → '', integral floats → int,
+surrounding whitespace removed), so the same workbook hashes the same
+whether it was read whole or streamed.
+
+Single Responsibility: Compute and store import content fingerprints.
+"""
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import Employee, EmployeeImportFingerprint, ImportFileFingerprint
+from app.utils.excel_reader import EMPLOYEE_COLUMN_MAPPING, EMPLOYEE_SKILLS_COLUMN_MAPPING
+
+logger = logging.getLogger(__name__)
+
+# Import kind of the employee workbook in import_file_fingerprints
+EMPLOYEE_IMPORT_KIND = 'employee_import'
+
+# Bump when the normalization changes, so stored fingerprints stop matching
+FINGERPRINT_VERSION = 1
+
+EMPLOYEE_FINGERPRINT_FIELDS = tuple(EMPLOYEE_COLUMN_MAPPING.values()) + ('email',)
+SKILL_FINGERPRINT_FIELDS = tuple(
+    field for field in EMPLOYEE_SKILLS_COLUMN_MAPPING.values() if field != 'zid'
+)
+
+# Rows per INSERT ... ON CONFLICT when saving fingerprints
+FINGERPRINT_WRITE_CHUNK_SIZE = 1000
+
+_FIELD_SEPARATOR = '\x1f'
+_FILE_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 hex digest of a file, read in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(_FILE_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class EmployeeFingerprinter:
+    """Accumulates Employee and Employee_Skills rows and hashes them per ZID."""
+
+    def __init__(self):
+        self._employee_rows: Dict[str, List[str]] = {}
+        self._skill_rows: Dict[str, List[bytes]] = {}
+
+    def add_employees(self, employees_df: pd.DataFrame):
+        """Add Employee sheet rows (sheet order is kept)."""
+        for zid, row in zip(employees_df['zid'].astype(str), _normalized_rows(employees_df, EMPLOYEE_FINGERPRINT_FIELDS)):
+            self._employee_rows.setdefault(zid, []).append(row)
+
+    def add_skills(self, skills_df: pd.DataFrame):
+        """Add Employee_Skills rows (a chunk of the sheet; only per-row digests are kept)."""
+        if 'zid' not in skills_df.columns:
+            return
+        for zid, row in zip(skills_df['zid'].astype(str), _normalized_rows(skills_df, SKILL_FINGERPRINT_FIELDS)):
+            self._skill_rows.setdefault(zid, []).append(hashlib.sha256(row.encode('utf-8')).digest())
+
+    def fingerprints(self) -> Dict[str, str]:
+        """
+        Fingerprint per ZID of the Employee sheet.
+
+        Returns:
+            Dict of ZID → SHA-256 hex digest
+        """
+        result = {}
+        for zid, employee_rows in self._employee_rows.items():
+            digest = hashlib.sha256(f"v{FINGERPRINT_VERSION}".encode('utf-8'))
+            for row in employee_rows:
+                digest.update(b'E' + row.encode('utf-8'))
+            for skill_digest in sorted(self._skill_rows.get(zid, ())):
+                digest.update(b'S' + skill_digest)
+            result[zid] = digest.hexdigest()
+        return result
+
+
+class ImportFingerprintStore:
+    """Reads and writes stored employee and file fingerprints."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def employee_fingerprints(self) -> Dict[str, str]:
+        """Stored fingerprint per employee ZID (one query)."""
+        return dict(
+            self.db.query(Employee.zid, EmployeeImportFingerprint.fingerprint).join(
+                EmployeeImportFingerprint, EmployeeImportFingerprint.employee_id == Employee.employee_id
+            ).all()
+        )
+
+    def save_employee_fingerprints(self, fingerprints: Dict[int, str]) -> int:
+        """
+        Upsert fingerprints by employee_id. Does not commit.
+
+        Args:
+            fingerprints: employee_id → fingerprint
+
+        Returns:
+            Number of fingerprints written
+        """
+        rows = [{'employee_id': employee_id, 'fingerprint': fingerprint}
+                for employee_id, fingerprint in fingerprints.items()]
+        for start in range(0, len(rows), FINGERPRINT_WRITE_CHUNK_SIZE):
+            stmt = pg_insert(EmployeeImportFingerprint).values(rows[start:start + FINGERPRINT_WRITE_CHUNK_SIZE])
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=['employee_id'],
+                set_={'fingerprint': stmt.excluded.fingerprint, 'updated_at': func.now()}
+            ))
+        return len(rows)
+
+    def last_file_hash(self, import_kind: str = EMPLOYEE_IMPORT_KIND) -> Optional[str]:
+        """Hash of the last file of this kind imported without errors."""
+        row = self.db.query(ImportFileFingerprint.file_hash).filter(
+            ImportFileFingerprint.import_kind == import_kind
+        ).first()
+        return row[0] if row else None
+
+    def save_file_hash(self, file_hash: str, job_id: Optional[str] = None,
+                       import_kind: str = EMPLOYEE_IMPORT_KIND):
+        """Record the hash of a file imported without errors. Does not commit."""
+        stmt = pg_insert(ImportFileFingerprint).values(
+            import_kind=import_kind, file_hash=file_hash, job_id=job_id
+        )
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=['import_kind'],
+            set_={'file_hash': stmt.excluded.file_hash, 'job_id': stmt.excluded.job_id, 'imported_at': func.now()}
+        ))
+
+
+def _normalized_rows(df: pd.DataFrame, fields: Iterable[str]) -> List[str]:
+    """One string per row: the normalized cells of fields, separator-joined (missing columns are '')."""
+    columns = [
+        df[field].map(_normalize_cell) if field in df.columns else pd.Series('', index=df.index)
+        for field in fields
+    ]
+    if not columns:
+        return [''] * len(df)
+    return [_FIELD_SEPARATOR.join(values) for values in zip(*columns)]
+
+
+def _normalize_cell(value) -> str:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if isinstance(value, datetime) and value == datetime(value.year, value.month, value.day):
+        value = value.date()
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
@@ -1,24 +1,37 @@
 """
 Organizational master data processing for employee import.
 
+The existing Segment → SubSegment → Project → Team tree and the Role table
+come from the import's (loaded) reference cache. Missing entities are the
+set difference between the sheet and the cache; they are inserted level by
+level with one multi-row INSERT ... RETURNING per level, and the returned
+IDs go straight into the cache for the next level and the persisters.
+
 Single Responsibility: Process SubSegment, Project, Team, and Role master data.
 """
 import logging
-from typing import Set, Dict, Tuple
+from typing import Set, Dict, List, Tuple, Optional
+from sqlalchemy import bindparam, insert, update
 from sqlalchemy.orm import Session
 import pandas as pd
 
 from app.models import Segment, SubSegment, Project, Team, Role
+from .reference_data_cache import ReferenceDataCache, SEGMENT, SUB_SEGMENT, PROJECT, TEAM, ROLE
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT ... RETURNING (keeps bind parameters well under driver limits)
+ORG_INSERT_CHUNK_SIZE = 1000
+
 
 class OrgMasterDataProcessor:
     """Processes organizational master data from Employee sheet."""
     
-    def __init__(self, db: Session, stats: Dict):
+    def __init__(self, db: Session, stats: Dict, reference_cache: Optional[ReferenceDataCache] = None):
         self.db = db
         self.stats = stats
+        # Existence checks go through the import's reference cache; created entities are added to it
+        self.reference_cache = reference_cache or ReferenceDataCache(db)
     
     def process_all(self, master_data: Dict[str, Set]):
         """
@@ -30,6 +43,8 @@ class OrgMasterDataProcessor:
         CRITICAL: Must commit org master data BEFORE employee import starts.
         """
         logger.info("Processing org master data (Segment/SubSegment/Project/Team/Role)...")
+        if not self.reference_cache.loaded:
+            self.reference_cache.load()
         
         # Log summary
         self._log_master_data_summary(master_data)
@@ -72,25 +87,25 @@ class OrgMasterDataProcessor:
     
     def _process_segments(self, segments: Set[str]):
         """Process Segment master data (top-level org units)."""
-        
+        names = []
         for segment_name in segments:
             if not segment_name or pd.isna(segment_name):
                 continue
             
             # Clean segment name (remove whitespace)
             segment_name_clean = str(segment_name).strip()
-            if not segment_name_clean:
-                continue
-
-            existing = self.db.query(Segment).filter(
-                Segment.segment_name == segment_name_clean
-            ).first()
-            
-            if not existing:
-                new_segment = Segment(segment_name=segment_name_clean, created_by="employee_import")
-                self.db.add(new_segment)
-                self.stats.setdefault('new_segments', []).append(segment_name_clean)
-                logger.info(f"Added new segment: {segment_name_clean}")
+            if segment_name_clean:
+                names.append(segment_name_clean)
+        
+        missing = self.reference_cache.missing(SEGMENT, names)
+        for segment_name in missing:
+            self.stats.setdefault('new_segments', []).append(segment_name)
+            logger.info(f"Added new segment: {segment_name}")
+        
+        self._insert_returning(
+            Segment, [{'segment_name': name, 'created_by': "employee_import"} for name in missing],
+            (Segment.segment_id, Segment.segment_name), self.reference_cache.add_segment
+        )
     
     def _process_sub_segments_with_segment_mapping(
         self, 
@@ -108,106 +123,113 @@ class OrgMasterDataProcessor:
         for segment_name, subseg_name in segment_subsegment_mappings:
             subseg_to_segment[subseg_name] = segment_name
         
-        for sub_segment_name in sub_segments:
-            if not sub_segment_name or pd.isna(sub_segment_name):
-                continue
-
-            existing = self.db.query(SubSegment).filter(
-                SubSegment.sub_segment_name == sub_segment_name
-            ).first()
-            
+        names = [name for name in sub_segments if name and not pd.isna(name)]
+        missing = set(self.reference_cache.missing(SUB_SEGMENT, names))
+        new_rows = []
+        links = []
+        for sub_segment_name in names:
             # Determine which segment to link to (only if explicitly mapped in Excel)
-            segment = None
+            segment_id = None
+            segment_name_clean = None
             segment_name = subseg_to_segment.get(sub_segment_name)
             if segment_name:
                 # Find the segment
                 segment_name_clean = str(segment_name).strip()
-                segment = self.db.query(Segment).filter(
-                    Segment.segment_name == segment_name_clean
-                ).first()
+                segment_id = self.reference_cache.segment_id(segment_name_clean)
                 
-                if not segment:
+                if segment_id is None:
                     logger.warning(
                         f"Segment '{segment_name_clean}' not found for sub-segment '{sub_segment_name}'. "
                         f"Sub-segment will be created without segment link."
                     )
             
-            if not existing:
+            if sub_segment_name in missing:
                 # Create new sub_segment with segment link (or NULL if no mapping)
-                new_sub_segment = SubSegment(
-                    sub_segment_name=sub_segment_name,
-                    segment_id=segment.segment_id if segment else None,
-                    created_by="employee_import"
-                )
-                self.db.add(new_sub_segment)
+                new_rows.append({
+                    'sub_segment_name': sub_segment_name,
+                    'segment_id': segment_id,
+                    'created_by': "employee_import"
+                })
                 self.stats.setdefault('new_sub_segments', []).append(sub_segment_name)
-                if segment:
+                if segment_id is not None:
                     logger.info(
                         f"Added new sub-segment: {sub_segment_name} "
-                        f"(linked to segment: {segment.segment_name})"
+                        f"(linked to segment: {segment_name_clean})"
                     )
                 else:
                     logger.info(f"Added new sub-segment: {sub_segment_name} (no segment link)")
-            else:
+            elif segment_id is not None:
                 # Update existing sub_segment to link to segment if mapping exists
-                if segment and existing.segment_id is None:
-                    existing.segment_id = segment.segment_id
+                existing_id = self.reference_cache.sub_segment_id(sub_segment_name)
+                current_segment_id = self.reference_cache.sub_segment_segment_id(existing_id)
+                if current_segment_id is None:
+                    links.append({'b_sub_segment_id': existing_id, 'b_segment_id': segment_id})
+                    self.reference_cache.set_sub_segment_segment(existing_id, segment_id)
                     logger.info(
                         f"Updated existing sub-segment '{sub_segment_name}' "
-                        f"to link to segment: {segment.segment_name}"
+                        f"to link to segment: {segment_name_clean}"
                     )
-                elif segment and existing.segment_id != segment.segment_id:
+                elif current_segment_id != segment_id:
                     # Sub-segment already linked to different segment
                     # Keep existing link (don't override)
                     logger.debug(
-                        f"Sub-segment '{sub_segment_name}' already linked to segment_id={existing.segment_id}, "
-                        f"skipping re-link to {segment.segment_name}"
+                        f"Sub-segment '{sub_segment_name}' already linked to segment_id={current_segment_id}, "
+                        f"skipping re-link to {segment_name_clean}"
                     )
+        
+        if links:
+            self.db.execute(
+                update(SubSegment.__table__)
+                .where(SubSegment.__table__.c.sub_segment_id == bindparam('b_sub_segment_id'))
+                .values(segment_id=bindparam('b_segment_id')),
+                links
+            )
+        self._insert_returning(
+            SubSegment, new_rows,
+            (SubSegment.sub_segment_id, SubSegment.sub_segment_name, SubSegment.segment_id),
+            self.reference_cache.add_sub_segment
+        )
 
     def _process_roles(self, roles: Set[str]):
         """Process Role master data."""
+        missing = self.reference_cache.missing(
+            ROLE, [role_name for role_name in roles if role_name and not pd.isna(role_name)]
+        )
+        for role_name in missing:
+            self.stats.setdefault('new_roles', []).append(role_name)
+            logger.info(f"Added new role: {role_name}")
         
-        for role_name in roles:
-            if not role_name or pd.isna(role_name):
-                continue
-
-            existing = self.db.query(Role).filter(
-                Role.role_name == role_name
-            ).first()
-            
-            if not existing:
-                new_role = Role(role_name=role_name, created_by="employee_import")
-                self.db.add(new_role)
-                self.stats.setdefault('new_roles', []).append(role_name)
-                logger.info(f"Added new role: {role_name}")
+        self._insert_returning(
+            Role, [{'role_name': name, 'created_by': "employee_import"} for name in missing],
+            (Role.role_id, Role.role_name), self.reference_cache.add_role
+        )
 
     def _process_projects_with_validation(self, projects: Set[str], mappings: Set[Tuple[str, str]]):
         """Process Projects with Sub-Segment validation."""
         logger.info("Processing projects with sub-segment validation...")
+        keys = {}
 
         for sub_segment_name, project_name in mappings:
-            sub_segment = self.db.query(SubSegment).filter(
-                SubSegment.sub_segment_name == sub_segment_name
-            ).first()
+            sub_segment_id = self.reference_cache.sub_segment_id(sub_segment_name)
             
-            if not sub_segment:
+            if not sub_segment_id:
                 from app.services.import_service import ImportServiceError
                 raise ImportServiceError(f"Sub-Segment '{sub_segment_name}' not found for project '{project_name}'")
 
-            existing_project = self.db.query(Project).filter(
-                Project.project_name == project_name,
-                Project.sub_segment_id == sub_segment.sub_segment_id
-            ).first()
-            
-            if not existing_project:
-                new_project = Project(
-                    project_name=project_name,
-                    sub_segment_id=sub_segment.sub_segment_id,
-                    created_by="employee_import"
-                )
-                self.db.add(new_project)
-                self.stats.setdefault('new_projects', []).append(project_name)
-                logger.info(f"Added new project: {project_name} under sub-segment: {sub_segment_name}")
+            keys.setdefault((project_name, sub_segment_id), sub_segment_name)
+        
+        missing = self.reference_cache.missing(PROJECT, keys)
+        for project_name, sub_segment_id in missing:
+            self.stats.setdefault('new_projects', []).append(project_name)
+            logger.info(f"Added new project: {project_name} under sub-segment: {keys[(project_name, sub_segment_id)]}")
+        
+        self._insert_returning(
+            Project,
+            [{'project_name': name, 'sub_segment_id': sub_segment_id, 'created_by': "employee_import"}
+             for name, sub_segment_id in missing],
+            (Project.project_id, Project.project_name, Project.sub_segment_id),
+            self.reference_cache.add_project
+        )
 
     def _process_teams_with_validation(self, teams: Set[str], mappings: Set[Tuple[str, str, str]]):
         """
@@ -216,38 +238,48 @@ class OrgMasterDataProcessor:
         FIX: mappings now contains (sub_segment, project, team) triples to handle duplicate project names.
         """
         logger.info("Processing teams with project validation...")
+        keys = {}
 
         for sub_segment_name, project_name, team_name in mappings:
             # FIX: Lookup sub_segment first to resolve project correctly
-            sub_segment = self.db.query(SubSegment).filter(
-                SubSegment.sub_segment_name == sub_segment_name
-            ).first()
+            sub_segment_id = self.reference_cache.sub_segment_id(sub_segment_name)
             
-            if not sub_segment:
+            if not sub_segment_id:
                 from app.services.import_service import ImportServiceError
                 raise ImportServiceError(f"Sub-Segment '{sub_segment_name}' not found for team '{team_name}'")
             
             # FIX: Lookup project using BOTH project_name AND sub_segment_id
-            project = self.db.query(Project).filter(
-                Project.project_name == project_name,
-                Project.sub_segment_id == sub_segment.sub_segment_id
-            ).first()
+            project_id = self.reference_cache.project_id(project_name, sub_segment_id)
 
-            if not project:
+            if not project_id:
                 from app.services.import_service import ImportServiceError
                 raise ImportServiceError(f"Project '{project_name}' not found under sub-segment '{sub_segment_name}' for team '{team_name}'")
 
-            existing_team = self.db.query(Team).filter(
-                Team.team_name == team_name,
-                Team.project_id == project.project_id
-            ).first()
-
-            if not existing_team:
-                new_team = Team(
-                    team_name=team_name,
-                    project_id=project.project_id,
-                    created_by="employee_import"
-                )
-                self.db.add(new_team)
-                self.stats.setdefault('new_teams', []).append(team_name)
-                logger.info(f"Added new team: {team_name} under project: {project_name} (sub-segment: {sub_segment_name}, project_id: {project.project_id})")
+            keys.setdefault((team_name, project_id), (sub_segment_name, project_name))
+        
+        missing = self.reference_cache.missing(TEAM, keys)
+        for team_name, project_id in missing:
+            sub_segment_name, project_name = keys[(team_name, project_id)]
+            self.stats.setdefault('new_teams', []).append(team_name)
+            logger.info(f"Added new team: {team_name} under project: {project_name} (sub-segment: {sub_segment_name}, project_id: {project_id})")
+        
+        self._insert_returning(
+            Team,
+            [{'team_name': name, 'project_id': project_id, 'created_by': "employee_import"}
+             for name, project_id in missing],
+            (Team.team_id, Team.team_name, Team.project_id),
+            self.reference_cache.add_team
+        )
+
+    def _insert_returning(self, model, rows: List[Dict], returning, add_to_cache):
+        """
+        Insert one org level with multi-row INSERT ... RETURNING and add the rows to the reference cache.
+        
+        Returned rows carry their own name/parent columns, so RETURNING order does not matter.
+        """
+        for start in range(0, len(rows), ORG_INSERT_CHUNK_SIZE):
+            result = self.db.execute(
+                insert(model.__table__).values(rows[start:start + ORG_INSERT_CHUNK_SIZE]).returning(*returning)
+            )
+            for row in result.all():
+                add_to_cache(row)
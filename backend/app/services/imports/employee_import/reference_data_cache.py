@@ -0,0 +1,254 @@
+"""
+Import-scoped cache of org and proficiency reference data.
+
+Loaded once at the start of an employee import, then serves every
+Segment/SubSegment/Project/Team/Role/ProficiencyLevel lookup by name from
+dictionaries. OrgMasterDataProcessor registers the entities it creates, so the
+cache stays current for the rest of the import.
+
+Lookups are read-through: a key that was not loaded (or a cache that was never
+loaded) is fetched from the DB once, and the result — including "not found" —
+is remembered. Hit/miss counts show how many lookups still reached the DB.
+
+Single Responsibility: Serve reference-data lookups for one import from memory.
+"""
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from app.models import Segment, SubSegment, Project, Team, Role, ProficiencyLevel
+
+logger = logging.getLogger(__name__)
+
+# Lookup kinds (also the keys of summary()['by_kind'])
+SEGMENT = 'segment'
+SUB_SEGMENT = 'sub_segment'
+SUB_SEGMENT_SEGMENT = 'sub_segment_segment'
+PROJECT = 'project'
+TEAM = 'team'
+TEAM_PROJECT = 'team_project'
+ROLE = 'role'
+PROFICIENCY = 'proficiency'
+
+LOOKUP_KINDS = (SEGMENT, SUB_SEGMENT, SUB_SEGMENT_SEGMENT, PROJECT, TEAM, TEAM_PROJECT, ROLE, PROFICIENCY)
+
+
+class ReferenceDataCache:
+    """Name → ID lookups for org and proficiency master data, scoped to one import."""
+
+    def __init__(self, db: Session):
+        """
+        Initialize reference data cache.
+
+        Args:
+            db: SQLAlchemy database session (used by load() and read-through misses)
+        """
+        self.db = db
+        self.loaded = False
+        self._entries: Dict[str, Dict[Any, Optional[int]]] = {kind: {} for kind in LOOKUP_KINDS}
+        self._counts: Dict[str, Dict[str, int]] = {kind: {'hits': 0, 'misses': 0} for kind in LOOKUP_KINDS}
+
+    @classmethod
+    def from_entries(cls, db: Session = None, **entries: Dict) -> 'ReferenceDataCache':
+        """
+        Build a loaded cache from explicit entries (tests, benchmarks).
+
+        Args:
+            db: Session for read-through misses (None: unknown keys are simply not found)
+            **entries: Lookup kind → {key: id}, e.g. role={'Developer': 5},
+                team={('Backend', 10): 100}
+        """
+        cache = cls(db)
+        for kind, values in entries.items():
+            cache._entries[kind].update(values)
+        cache.loaded = True
+        return cache
+
+    def load(self) -> 'ReferenceDataCache':
+        """Load all reference tables (one query per table)."""
+        for segment_id, name in self.db.query(Segment.segment_id, Segment.segment_name).order_by(
+            Segment.segment_id
+        ).all():
+            self._entries[SEGMENT].setdefault(name, segment_id)
+
+        for sub_segment_id, name, segment_id in self.db.query(
+            SubSegment.sub_segment_id, SubSegment.sub_segment_name, SubSegment.segment_id
+        ).order_by(SubSegment.sub_segment_id).all():
+            self._entries[SUB_SEGMENT].setdefault(name, sub_segment_id)
+            self._entries[SUB_SEGMENT_SEGMENT][sub_segment_id] = segment_id
+
+        for project_id, name, sub_segment_id in self.db.query(
+            Project.project_id, Project.project_name, Project.sub_segment_id
+        ).order_by(Project.project_id).all():
+            self._entries[PROJECT].setdefault((name, sub_segment_id), project_id)
+
+        for team_id, name, project_id in self.db.query(
+            Team.team_id, Team.team_name, Team.project_id
+        ).order_by(Team.team_id).all():
+            self._entries[TEAM].setdefault((name, project_id), team_id)
+            self._entries[TEAM_PROJECT][team_id] = project_id
+
+        for role_id, name in self.db.query(Role.role_id, Role.role_name).order_by(Role.role_id).all():
+            self._entries[ROLE].setdefault(name, role_id)
+
+        for level_id, name in self.db.query(
+            ProficiencyLevel.proficiency_level_id, ProficiencyLevel.level_name
+        ).order_by(ProficiencyLevel.proficiency_level_id).all():
+            self._entries[PROFICIENCY].setdefault(name, level_id)
+
+        self.loaded = True
+        logger.info(
+            f"📚 Loaded reference data: {len(self._entries[SEGMENT])} segments, "
+            f"{len(self._entries[SUB_SEGMENT])} sub-segments, {len(self._entries[PROJECT])} projects, "
+            f"{len(self._entries[TEAM])} teams, {len(self._entries[ROLE])} roles, "
+            f"{len(self._entries[PROFICIENCY])} proficiency levels"
+        )
+        return self
+
+    # ========================================================================
+    # LOOKUPS
+    # ========================================================================
+
+    def segment_id(self, name) -> Optional[int]:
+        return self._lookup(SEGMENT, name, name, lambda: self.db.query(Segment.segment_id).filter(
+            Segment.segment_name == name
+        ).first())
+
+    def sub_segment_id(self, name) -> Optional[int]:
+        return self._lookup(SUB_SEGMENT, name, name, lambda: self.db.query(SubSegment.sub_segment_id).filter(
+            SubSegment.sub_segment_name == name
+        ).first())
+
+    def sub_segment_segment_id(self, sub_segment_id: Optional[int]) -> Optional[int]:
+        """Segment currently linked to a sub-segment (None if unlinked)."""
+        return self._lookup(
+            SUB_SEGMENT_SEGMENT, sub_segment_id, sub_segment_id,
+            lambda: self.db.query(SubSegment.segment_id).filter(
+                SubSegment.sub_segment_id == sub_segment_id
+            ).first()
+        )
+
+    def project_id(self, name, sub_segment_id: Optional[int]) -> Optional[int]:
+        if not sub_segment_id:
+            return None
+        return self._lookup(PROJECT, (name, sub_segment_id), name, lambda: self.db.query(Project.project_id).filter(
+            Project.project_name == name,
+            Project.sub_segment_id == sub_segment_id
+        ).first())
+
+    def team_id(self, name, project_id: Optional[int]) -> Optional[int]:
+        if not project_id:
+            return None
+        return self._lookup(TEAM, (name, project_id), name, lambda: self.db.query(Team.team_id).filter(
+            Team.team_name == name,
+            Team.project_id == project_id
+        ).first())
+
+    def team_project_id(self, team_id: Optional[int]) -> Optional[int]:
+        """Project a team belongs to."""
+        return self._lookup(TEAM_PROJECT, team_id, team_id, lambda: self.db.query(Team.project_id).filter(
+            Team.team_id == team_id
+        ).first())
+
+    def role_id(self, name) -> Optional[int]:
+        return self._lookup(ROLE, name, name, lambda: self.db.query(Role.role_id).filter(
+            Role.role_name == name
+        ).first())
+
+    def proficiency_level_id(self, name) -> Optional[int]:
+        return self._lookup(
+            PROFICIENCY, name, name,
+            lambda: self.db.query(ProficiencyLevel.proficiency_level_id).filter(
+                ProficiencyLevel.level_name == name
+            ).first()
+        )
+
+    def missing(self, kind: str, keys: Iterable) -> List:
+        """
+        Keys of a lookup kind with no ID in the cache, without DB access.
+        
+        Only meaningful on a loaded cache, where absence means the row does
+        not exist. Keys keep their first-seen order and are deduplicated.
+        
+        Args:
+            kind: Lookup kind (SEGMENT, SUB_SEGMENT, PROJECT, TEAM, ROLE, ...)
+            keys: Keys as used by the lookup, e.g. (team_name, project_id) for TEAM
+        """
+        entries = self._entries[kind]
+        return [key for key in dict.fromkeys(keys) if entries.get(key) is None]
+    
+    # ========================================================================
+    # IN-PLACE UPDATES (entities created during the import)
+    # ========================================================================
+
+    # add_* accept model instances or RETURNING rows with the same attribute names
+    
+    def add_segment(self, segment: Segment):
+        self._entries[SEGMENT][segment.segment_name] = segment.segment_id
+
+    def add_sub_segment(self, sub_segment: SubSegment):
+        self._entries[SUB_SEGMENT][sub_segment.sub_segment_name] = sub_segment.sub_segment_id
+        self._entries[SUB_SEGMENT_SEGMENT][sub_segment.sub_segment_id] = sub_segment.segment_id
+
+    def set_sub_segment_segment(self, sub_segment_id: int, segment_id: Optional[int]):
+        self._entries[SUB_SEGMENT_SEGMENT][sub_segment_id] = segment_id
+
+    def add_project(self, project: Project):
+        self._entries[PROJECT][(project.project_name, project.sub_segment_id)] = project.project_id
+
+    def add_team(self, team: Team):
+        self._entries[TEAM][(team.team_name, team.project_id)] = team.team_id
+        self._entries[TEAM_PROJECT][team.team_id] = team.project_id
+
+    def add_role(self, role: Role):
+        self._entries[ROLE][role.role_name] = role.role_id
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Hit/miss counts for the import result.
+
+        Returns:
+            Dict with total hits, misses (lookups that reached the DB),
+            hit_rate and per-kind counts
+        """
+        hits = sum(counts['hits'] for counts in self._counts.values())
+        misses = sum(counts['misses'] for counts in self._counts.values())
+        return {
+            'loaded': self.loaded,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'by_kind': {
+                kind: dict(counts) for kind, counts in self._counts.items()
+                if counts['hits'] or counts['misses']
+            }
+        }
+
+    def _lookup(self, kind: str, key, name, fetch: Callable) -> Optional[int]:
+        """Serve key from memory, falling back to one DB fetch whose result is remembered."""
+        if _is_blank(name):
+            return None
+        entries = self._entries[kind]
+        if key in entries:
+            self._counts[kind]['hits'] += 1
+            return entries[key]
+
+        self._counts[kind]['misses'] += 1
+        row = fetch() if self.db is not None else None
+        value = row[0] if row else None
+        entries[key] = value
+        return value
+
+
+def _is_blank(value) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and pd.isna(value):
+        return True
+    return isinstance(value, str) and value == ''
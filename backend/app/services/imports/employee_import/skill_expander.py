@@ -4,7 +4,6 @@ Skill expansion logic for employee import.
 Single Responsibility: Expand comma-separated skills into individual rows.
 """
 import logging
-from typing import List
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -18,34 +17,39 @@ class SkillExpander:
         Expand comma-separated skills into individual rows.
         Excel can have "PostgreSQL, SQL Server" → split into 2 rows.
         
+        Column-wise (str.replace/str.split + explode). Expanded rows keep the
+        index label of their source row, so Excel row numbers derived from the
+        index still point at the original row. Rows without a separator are
+        returned unchanged; a row whose tokens are all empty is dropped.
+        
         Args:
             skills_df: Original skills DataFrame
             
         Returns:
             Expanded skills DataFrame
         """
-        expanded_rows = []
+        if 'skill_name' not in skills_df.columns or skills_df.empty:
+            return skills_df
         
-        for idx, row in skills_df.iterrows():
-            skill_name_raw = str(row.get('skill_name', '')).strip()
-            
-            # Split on comma or semicolon
-            if ',' in skill_name_raw or ';' in skill_name_raw:
-                # Split and clean each skill
-                skill_names = [s.strip() for s in skill_name_raw.replace(';', ',').split(',')]
-                skill_names = [s for s in skill_names if s]  # Remove empty
-                
-                # Create a row for each skill (copy all other columns)
-                for skill_name in skill_names:
-                    row_copy = row.copy()
-                    row_copy['skill_name'] = skill_name
-                    expanded_rows.append(row_copy)
-            else:
-                expanded_rows.append(row)
+        # Positional index so duplicate labels cannot fan out on lookup
+        raw_names = pd.Series(skills_df['skill_name'].to_numpy(dtype=object), dtype=object)
+        names = raw_names.astype(str).str.strip()
+        has_separator = names.str.contains(',', regex=False) | names.str.contains(';', regex=False)
+        if not has_separator.any():
+            return skills_df
+        
+        # Split on comma or semicolon, clean each skill, drop empty tokens
+        tokens = names[has_separator].str.replace(';', ',', regex=False).str.split(',').explode().str.strip()
+        tokens = tokens[tokens != '']
+        
+        # Single-skill rows keep their original value; order rows by source position
+        expanded_names = pd.concat([raw_names[~has_separator], tokens]).sort_index(kind='stable')
         
         # Replace original dataframe with expanded one
-        if len(expanded_rows) > len(skills_df):
-            logger.info(f"📊 Expanded {len(expanded_rows) - len(skills_df)} comma-separated skills → total {len(expanded_rows)} skill rows")
-            return pd.DataFrame(expanded_rows)
+        if len(expanded_names) > len(skills_df):
+            logger.info(f"📊 Expanded {len(expanded_names) - len(skills_df)} comma-separated skills → total {len(expanded_names)} skill rows")
+            expanded_df = skills_df.iloc[expanded_names.index.to_numpy()].copy()
+            expanded_df['skill_name'] = expanded_names.to_numpy()
+            return expanded_df
         
         return skills_df
@@ -1,27 +1,67 @@
 """
 Employee skill database persistence for employee import.
 
+In bulk mode the skills of several employees are written together: one
+multi-row INSERT ... RETURNING emp_skill_id for employee_skills and one
+multi-row INSERT for their history rows, committed per chunk. A chunk that
+fails is replayed one employee at a time, so a bad batch still only fails
+that employee's skills.
+
+In delta mode (bulk only) skills the employee already has are compared with
+the stored row: unchanged ones are skipped, changed ones are updated in place
+with an UPDATE history row, and only new ones are inserted.
+
 Single Responsibility: Insert employee skill records to database.
 """
 import logging
+import time
 import uuid
-from typing import Dict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 import pandas as pd
+from sqlalchemy import bindparam, func, insert, update
 from sqlalchemy.orm import Session
 
-from app.models import Employee, EmployeeSkill, ProficiencyLevel
+from app.models import Employee, EmployeeSkill
 from app.services.skill_history_service import SkillHistoryService
 from app.models.skill_history import ChangeSource
+from .reference_data_cache import ReferenceDataCache
+from .column_parser import parsed_value
 
 logger = logging.getLogger(__name__)
 
+# Skill rows per multi-row INSERT (and per commit) in bulk mode
+SKILL_INSERT_CHUNK_SIZE = 1000
+
+# employee_skills columns written by the import
+SKILL_INSERT_COLUMNS = (
+    'employee_id', 'skill_id', 'proficiency_level_id', 'years_experience', 'last_used',
+    'started_learning_from', 'certification', 'comment', 'interest_level', 'created_at'
+)
+
+# Values compared in delta mode (a difference in any of them is a change)
+SKILL_DIFF_COLUMNS = (
+    'proficiency_level_id', 'years_experience', 'last_used', 'started_learning_from',
+    'certification', 'comment', 'interest_level'
+)
+
+class EmployeeSkillBatch(NamedTuple):
+    """Prepared skills of one employee (bulk mode)."""
+    zid: str
+    employee_name: Optional[str]
+    records: List[EmployeeSkill]
+    # record_unresolved_skill() kwargs, written in the same transaction as the
+    # records so a rolled-back chunk replays them with its per-employee retry
+    unresolved: List[Dict[str, Any]] = []
+
 
 class SkillPersister:
     """Handles employee skill database operations."""
     
     def __init__(self, db: Session, stats: Dict, date_parser, field_sanitizer, 
-                 skill_resolver, unresolved_logger, progress_callback=None):
+                 skill_resolver, unresolved_logger, progress_callback=None,
+                 bulk_mode: bool = False, chunk_size: int = SKILL_INSERT_CHUNK_SIZE,
+                 reference_cache: Optional[ReferenceDataCache] = None, delta_mode: bool = False):
         self.db = db
         self.stats = stats
         self.date_parser = date_parser
@@ -29,6 +69,14 @@ class SkillPersister:
         self.skill_resolver = skill_resolver
         self.unresolved_logger = unresolved_logger
         self.progress_callback = progress_callback  # Optional callback for progress reporting
+        self.bulk_mode = bulk_mode
+        self.chunk_size = max(1, chunk_size)
+        # Update existing skills only when changed instead of inserting them again (bulk mode)
+        self.delta_mode = delta_mode
+        # Proficiency level lookups by name
+        self.reference_cache = reference_cache or ReferenceDataCache(db)
+        # ZID → (full_name, sub_segment_id), kept across calls for chunked imports
+        self._employee_details: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
     
     def import_employee_skills(self, skills_df: pd.DataFrame, 
                               zid_to_employee_id_mapping: Dict[str, int],
@@ -46,6 +94,9 @@ class SkillPersister:
             - Each employee's skills committed as a batch
             - Failures don't affect other employees
         
+        May be called once per chunk of a streamed sheet; stats['skills_imported']
+        accumulates across calls.
+        
         Args:
             skills_df: DataFrame with skill data
             zid_to_employee_id_mapping: Map of ZID → employee_id
@@ -57,10 +108,16 @@ class SkillPersister:
         logger.info(f"Importing {len(skills_df)} employee skill records (with resolution)")
         
         # Create ZID to employee name/subsegment mapping for error reporting
-        zid_to_name_mapping, zid_to_subsegment_mapping = self._create_employee_mappings(zid_to_employee_id_mapping)
+        zid_to_name_mapping, zid_to_subsegment_mapping = self._create_employee_mappings(
+            zid_to_employee_id_mapping, zids=skills_df['zid'].astype(str).unique() if 'zid' in skills_df.columns else ()
+        )
         
         # Initialize history service
         history_service = SkillHistoryService(self.db)
+        
+        # Resolve every distinct skill name up front (one batched embedding pass)
+        self._pre_resolve_skills(skills_df)
+        
         successful_skill_imports = 0        # Group skills by ZID for per-employee processing
         skills_by_zid = self._group_skills_by_zid(skills_df)
         
@@ -74,13 +131,29 @@ class SkillPersister:
         
         # Process each employee's skills as a batch
         processed_count = 0
+        pending_batches: List[EmployeeSkillBatch] = []
+        pending_records = 0
         for zid, skill_rows in skills_by_zid.items():
-            employee_skill_count = self._process_employee_skills(
-                zid, skill_rows, zid_to_employee_id_mapping,
-                zid_to_name_mapping, zid_to_subsegment_mapping,
-                history_service, import_timestamp
-            )
-            successful_skill_imports += employee_skill_count
+            if self.bulk_mode:
+                batch = self._prepare_employee_skills(
+                    zid, skill_rows, zid_to_employee_id_mapping,
+                    zid_to_name_mapping, zid_to_subsegment_mapping, import_timestamp
+                )
+                if batch.records or batch.unresolved:
+                    pending_batches.append(batch)
+                    pending_records += len(batch.records)
+                if pending_records >= self.chunk_size:
+                    successful_skill_imports += self._commit_skill_chunk(
+                        pending_batches, history_service, import_timestamp
+                    )
+                    pending_batches, pending_records = [], 0
+            else:
+                employee_skill_count = self._process_employee_skills(
+                    zid, skill_rows, zid_to_employee_id_mapping,
+                    zid_to_name_mapping, zid_to_subsegment_mapping,
+                    history_service, import_timestamp
+                )
+                successful_skill_imports += employee_skill_count
             processed_count += len(skill_rows)
             
             # Report progress when crossing threshold (NOT modulo!)
@@ -103,6 +176,11 @@ class SkillPersister:
                     # Advance to next threshold
                     next_report_at += progress_interval
         
+        if pending_batches:
+            successful_skill_imports += self._commit_skill_chunk(
+                pending_batches, history_service, import_timestamp
+            )
+        
         # CRITICAL: Always send final progress update at 85%
         # This prevents the last visible update being stuck around ~81%
         if self.progress_callback and processed_count > 0:
@@ -114,7 +192,7 @@ class SkillPersister:
                 skills_processed=successful_skill_imports
             )
         
-        self.stats['skills_imported'] = successful_skill_imports
+        self.stats['skills_imported'] = self.stats.get('skills_imported', 0) + successful_skill_imports
         
         # Log resolution stats
         logger.info(f"Imported {successful_skill_imports} of {len(skills_df)} employee skill records")
@@ -124,16 +202,51 @@ class SkillPersister:
         
         return len(skills_df)  # Return total rows processed
     
-    def _create_employee_mappings(self, zid_to_employee_id_mapping: Dict[str, int]) -> tuple:
-        """Create ZID to employee name and subsegment mappings."""
+    def _pre_resolve_skills(self, skills_df: pd.DataFrame) -> None:
+        """
+        Bulk-resolve the distinct skill names of the sheet.
+        
+        Per-row resolve_skill() calls are then served from memory. On failure
+        rows fall back to one-at-a-time resolution.
+        """
+        if 'skill_name' not in skills_df.columns:
+            return
+        skill_names = [
+            name for name in (str(value).strip() for value in skills_df['skill_name'].dropna())
+            if name
+        ]
+        try:
+            start = time.perf_counter()
+            outcomes = self.skill_resolver.resolve_many(skill_names)
+            logger.info(
+                f"Pre-resolved {len(outcomes)} distinct skill names "
+                f"({len(skill_names)} rows) in {time.perf_counter() - start:.2f}s"
+            )
+        except Exception as e:
+            logger.warning(f"Bulk skill resolution failed, resolving per row: {type(e).__name__}: {str(e)}")
+    
+    def _create_employee_mappings(self, zid_to_employee_id_mapping: Dict[str, int], zids=None) -> tuple:
+        """
+        Create ZID to employee name and subsegment mappings.
+        
+        Args:
+            zid_to_employee_id_mapping: Map of ZID → employee_id
+            zids: Only map these ZIDs (None: all); employees already looked up
+                by an earlier call are not queried again
+        """
         zid_to_name_mapping = {}
         zid_to_subsegment_mapping = {}
         
-        for zid, emp_id in zid_to_employee_id_mapping.items():
-            employee = self.db.query(Employee).filter(Employee.employee_id == emp_id).first()
-            if employee:
-                zid_to_name_mapping[zid] = employee.full_name
-                zid_to_subsegment_mapping[zid] = employee.sub_segment_id
+        wanted = zid_to_employee_id_mapping if zids is None else {
+            zid: zid_to_employee_id_mapping[zid] for zid in zids if zid in zid_to_employee_id_mapping
+        }
+        for zid, emp_id in wanted.items():
+            if zid not in self._employee_details:
+                employee = self.db.query(Employee).filter(Employee.employee_id == emp_id).first()
+                self._employee_details[zid] = (employee.full_name, employee.sub_segment_id) if employee else None
+            details = self._employee_details[zid]
+            if details:
+                zid_to_name_mapping[zid], zid_to_subsegment_mapping[zid] = details
         
         return zid_to_name_mapping, zid_to_subsegment_mapping
     
@@ -155,6 +268,23 @@ class SkillPersister:
                                  history_service,
                                  import_timestamp: datetime) -> int:
         """Process all skills for a single employee."""
+        _, employee_name, employee_skill_records, _ = self._prepare_employee_skills(
+            zid, skill_rows, zid_to_employee_id_mapping,
+            zid_to_name_mapping, zid_to_subsegment_mapping, import_timestamp
+        )
+        
+        # Commit all skills for this employee as a batch
+        return self._commit_employee_skills(
+            employee_skill_records, zid, employee_name,
+            history_service, import_timestamp
+        )
+    
+    def _prepare_employee_skills(self, zid: str, skill_rows: list,
+                                 zid_to_employee_id_mapping: Dict,
+                                 zid_to_name_mapping: Dict,
+                                 zid_to_subsegment_mapping: Dict,
+                                 import_timestamp: datetime) -> EmployeeSkillBatch:
+        """Resolve and validate all skills of one employee (flushed only in per-row mode)."""
         db_employee_id = zid_to_employee_id_mapping.get(zid)
         employee_name = zid_to_name_mapping.get(zid, None)
         sub_segment_id = zid_to_subsegment_mapping.get(zid, None)
@@ -163,29 +293,32 @@ class SkillPersister:
             # Employee was not imported (failed earlier), skip all their skills
             logger.warning(f"Skipping {len(skill_rows)} skills for ZID {zid}: Employee was not imported")
             self._mark_skills_as_failed(skill_rows, zid, employee_name, "EMPLOYEE_NOT_IMPORTED")
-            return 0
+            return EmployeeSkillBatch(zid, employee_name, [])
         
         # Process all skills for this employee in one batch
         employee_skill_records = []
+        # Bulk mode defers raw_skill_inputs rows to the chunk commit
+        unresolved = [] if self.bulk_mode else None
         
         for excel_row, row in skill_rows:
             skill_record = self._process_single_skill(
                 row, excel_row, zid, employee_name, 
-                db_employee_id, sub_segment_id, import_timestamp
+                db_employee_id, sub_segment_id, import_timestamp, unresolved
             )
             if skill_record:
                 employee_skill_records.append(skill_record)
         
-        # Commit all skills for this employee as a batch
-        return self._commit_employee_skills(
-            employee_skill_records, zid, employee_name,
-            history_service, import_timestamp
-        )
+        return EmployeeSkillBatch(zid, employee_name, employee_skill_records, unresolved or [])
     
     def _process_single_skill(self, row, excel_row: int, zid: str, employee_name: str,
                              db_employee_id: int, sub_segment_id: int, 
-                             import_timestamp: datetime):
-        """Process a single skill record."""
+                             import_timestamp: datetime, unresolved: Optional[list] = None):
+        """
+        Process a single skill record.
+        
+        Unresolved skills are logged to raw_skill_inputs right away, or
+        appended to `unresolved` when given (written by the chunk commit).
+        """
         # DEFENSIVE: Ensure skill_name is a clean string
         skill_name_raw = row.get('skill_name', '')
         
@@ -206,23 +339,23 @@ class SkillPersister:
                 # Check if it's a "needs review" case
                 if resolution_method == "needs_review" and resolution_confidence:
                     # Log to raw_skill_inputs with resolution info for manual review
-                    self.unresolved_logger.record_unresolved_skill(
+                    self._record_unresolved(unresolved, dict(
                         skill_name=skill_name,
                         employee_id=db_employee_id,
                         sub_segment_id=sub_segment_id,
                         timestamp=import_timestamp,
                         resolution_method=resolution_method,
                         resolution_confidence=resolution_confidence
-                    )
+                    ))
                     logger.warning(f"Skill '{skill_name}' needs review (similarity={resolution_confidence:.4f}) for ZID {zid} - logged to raw_skill_inputs")
                 else:
                     # Truly unresolved skill - log to raw_skill_inputs
-                    self.unresolved_logger.record_unresolved_skill(
+                    self._record_unresolved(unresolved, dict(
                         skill_name=skill_name,
                         employee_id=db_employee_id,
                         sub_segment_id=sub_segment_id,
                         timestamp=import_timestamp
-                    )
+                    ))
                     logger.warning(f"Skill '{skill_name}' unresolved for ZID {zid} - logged to raw_skill_inputs")
                 
                 # Track as failed row for reporting
@@ -240,36 +373,38 @@ class SkillPersister:
             
             # Get proficiency level ID
             proficiency_name = str(row.get('proficiency', '')).strip()
-            proficiency = self.db.query(ProficiencyLevel).filter(
-                ProficiencyLevel.level_name == proficiency_name
-            ).first()
+            proficiency_level_id = self.reference_cache.proficiency_level_id(proficiency_name)
             
-            if not proficiency:
+            if not proficiency_level_id:
                 from app.services.import_service import ImportServiceError
                 raise ImportServiceError(f"Proficiency level not found: {proficiency_name}")
             
-            # Process date fields using safe parsing
-            last_used = self.date_parser.parse_date_safely(
+            # Process date fields using safe parsing (pre-parsed column-wise when available)
+            last_used = parsed_value(row, 'last_used', lambda: self.date_parser.parse_date_safely(
                 row.get('last_used'),
                 'last_used',
                 f"employee {zid}"
-            )
+            ))
             
-            started_learning_from = self.date_parser.parse_date_safely(
+            started_learning_from = parsed_value(row, 'started_learning_from', lambda: self.date_parser.parse_date_safely(
                 row.get('started_learning_from'),
                 'started_learning_from',
                 f"employee {zid}"
-            )
+            ))
             
             # Sanitize numeric fields
-            years_experience = self.field_sanitizer.sanitize_integer_field(row.get('years_experience'), 'years_experience', zid)
-            interest_level = self.field_sanitizer.sanitize_integer_field(row.get('interest_level'), 'interest_level', zid)
+            years_experience = parsed_value(row, 'years_experience', lambda: self.field_sanitizer.sanitize_integer_field(
+                row.get('years_experience'), 'years_experience', zid
+            ))
+            interest_level = parsed_value(row, 'interest_level', lambda: self.field_sanitizer.sanitize_integer_field(
+                row.get('interest_level'), 'interest_level', zid
+            ))
             
             # Create employee skill
             employee_skill = EmployeeSkill(
                 employee_id=db_employee_id,
                 skill_id=skill_id,
-                proficiency_level_id=proficiency.proficiency_level_id,
+                proficiency_level_id=proficiency_level_id,
                 years_experience=years_experience,
                 last_used=last_used,
                 started_learning_from=started_learning_from,
@@ -279,8 +414,9 @@ class SkillPersister:
                 created_at=import_timestamp
             )
             
-            self.db.add(employee_skill)
-            self.db.flush()  # Get emp_skill_id
+            if not self.bulk_mode:
+                self.db.add(employee_skill)
+                self.db.flush()  # Get emp_skill_id
             
             return employee_skill
             
@@ -305,6 +441,13 @@ class SkillPersister:
             })
             return None
     
+    def _record_unresolved(self, unresolved: Optional[list], entry: Dict[str, Any]) -> None:
+        """Log an unresolved skill now, or defer it to the chunk commit (bulk mode)."""
+        if unresolved is None:
+            self.unresolved_logger.record_unresolved_skill(**entry)
+        else:
+            unresolved.append(entry)
+    
     def _commit_employee_skills(self, employee_skill_records: list, zid: str, 
                                employee_name: str, history_service, 
                                import_timestamp: datetime) -> int:
@@ -334,23 +477,189 @@ class SkillPersister:
             
         except Exception as e:
             # If commit fails, rollback this employee's skills only
-            error_message = str(e)
-            logger.error(f"Failed to commit skills for employee ZID {zid}: {error_message}")
             self.db.rollback()
             
             # Mark all this employee's skills as failed
-            for skill_record in employee_skill_records:
-                self.stats['failed_rows'].append({
-                    'sheet': 'Employee_Skills',
-                    'excel_row_number': None,
-                    'row_number': None,
-                    'zid': zid,
-                    'employee_name': employee_name,
-                    'skill_name': None,
-                    'error_code': 'BATCH_COMMIT_FAILED',
-                    'message': f'Failed to commit skill batch for ZID {zid}: {error_message}'
-                })
+            self._mark_batch_commit_failed(employee_skill_records, zid, employee_name, str(e))
+            return 0
+    
+    def _commit_skill_chunk(self, batches: List[EmployeeSkillBatch], history_service,
+                            import_timestamp: datetime) -> int:
+        """
+        Write several employees' skills + history in one transaction (bulk mode).
+        
+        If the chunk fails it is rolled back and each employee is retried on
+        its own, so failures are reported per employee as in per-row mode.
+        The employees' raw_skill_inputs rows are added in the same transaction
+        (and again by the retry), so a rollback never loses them.
+        
+        Returns:
+            Number of skills committed
+        """
+        batches = [EmployeeSkillBatch(*batch) for batch in batches]
+        # Delta counters of a rolled-back chunk are recounted by the retry
+        delta_counts = {key: self.stats.get(key, 0) for key in ('skills_updated', 'skills_unchanged')}
+        try:
+            self._add_unresolved(batches)
+            written = self._insert_skill_records(
+                [record for batch in batches for record in batch.records], history_service
+            )
+            self.db.commit()
+            logger.debug(f"Committed {written} skills for {len(batches)} employees")
+            return written
+        except Exception as e:
+            self.db.rollback()
+            if self.delta_mode:
+                self.stats.update(delta_counts)
+            if len(batches) == 1:
+                zid, employee_name, records, _ = batches[0]
+                self._mark_batch_commit_failed(records, zid, employee_name, str(e))
+                self._commit_unresolved_only(batches[0])
+                return 0
+            logger.warning(
+                f"Bulk skill insert for {len(batches)} employees failed ({type(e).__name__}: {str(e)}); "
+                f"retrying per employee"
+            )
+            self.stats['skill_chunks_retried'] = self.stats.get('skill_chunks_retried', 0) + 1
+            return sum(
+                self._commit_skill_chunk([batch], history_service, import_timestamp)
+                for batch in batches
+            )
+    
+    def _add_unresolved(self, batches: List[EmployeeSkillBatch]) -> None:
+        """Add the batches' deferred raw_skill_inputs rows to the session."""
+        for batch in batches:
+            for entry in batch.unresolved:
+                self.unresolved_logger.record_unresolved_skill(**entry)
+    
+    def _commit_unresolved_only(self, batch: EmployeeSkillBatch) -> None:
+        """Keep an employee's raw_skill_inputs rows when their skills could not be written."""
+        if not batch.unresolved:
+            return
+        try:
+            self._add_unresolved([batch])
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to log {len(batch.unresolved)} unresolved skills for ZID {batch.zid}: {e}")
+    
+    def _insert_skill_records(self, employee_skill_records: List[EmployeeSkill], history_service) -> int:
+        """
+        INSERT employee_skills ... RETURNING emp_skill_id, then their history rows. Does not commit.
+        
+        In delta mode, records of skills the employee already has are diffed
+        first: changed ones are updated (UPDATE history), unchanged ones skipped.
+        
+        Returns:
+            Number of skills inserted or updated
+        """
+        if not employee_skill_records:
             return 0
+        
+        updated = 0
+        if self.delta_mode:
+            employee_skill_records, updated = self._apply_skill_changes(employee_skill_records, history_service)
+            if not employee_skill_records:
+                return updated
+        
+        skill_ids = self.db.execute(
+            insert(EmployeeSkill.__table__).returning(
+                EmployeeSkill.__table__.c.emp_skill_id, sort_by_parameter_order=True
+            ),
+            [
+                {column: getattr(record, column) for column in SKILL_INSERT_COLUMNS}
+                for record in employee_skill_records
+            ]
+        ).scalars().all()
+        for record, emp_skill_id in zip(employee_skill_records, skill_ids):
+            record.emp_skill_id = emp_skill_id
+        
+        history_service.record_skill_changes_bulk(
+            employee_skill_records,
+            change_source=ChangeSource.IMPORT,
+            changed_by="system",
+            change_reason="Excel bulk import (NEW FORMAT)",
+            batch_id=str(uuid.uuid4())[:8]
+        )
+        return len(employee_skill_records) + updated
+    
+    def _apply_skill_changes(self, employee_skill_records: List[EmployeeSkill],
+                             history_service) -> Tuple[List[EmployeeSkill], int]:
+        """
+        Diff records against the employees' current skills (delta mode). Does not commit.
+        
+        Changed skills are updated with one executemany UPDATE and recorded as
+        UPDATE history rows; unchanged ones are counted in stats['skills_unchanged'].
+        
+        Returns:
+            Tuple of (records of skills the employees do not have yet, number updated)
+        """
+        current = self._current_skills({record.employee_id for record in employee_skill_records})
+        new_records, changed, previous = [], [], []
+        for record in employee_skill_records:
+            old = current.get((record.employee_id, record.skill_id))
+            if old is None:
+                new_records.append(record)
+            elif all(_same_value(getattr(record, c), getattr(old, c)) for c in SKILL_DIFF_COLUMNS):
+                self.stats['skills_unchanged'] = self.stats.get('skills_unchanged', 0) + 1
+            else:
+                record.emp_skill_id = old.emp_skill_id
+                changed.append(record)
+                previous.append(old)
+                # A repeated skill row is diffed against the row before it
+                current[(record.employee_id, record.skill_id)] = record
+        
+        if changed:
+            table = EmployeeSkill.__table__
+            self.db.execute(
+                update(table).where(table.c.emp_skill_id == bindparam('b_emp_skill_id')).values(
+                    last_updated=func.now(),
+                    **{column: bindparam(f'b_{column}') for column in SKILL_DIFF_COLUMNS}
+                ),
+                [
+                    {'b_emp_skill_id': record.emp_skill_id,
+                     **{f'b_{column}': getattr(record, column) for column in SKILL_DIFF_COLUMNS}}
+                    for record in changed
+                ]
+            )
+            history_service.record_skill_changes_bulk(
+                changed,
+                old_skill_records=previous,
+                change_source=ChangeSource.IMPORT,
+                changed_by="system",
+                change_reason="Excel bulk import (NEW FORMAT)",
+                batch_id=str(uuid.uuid4())[:8]
+            )
+            self.stats['skills_updated'] = self.stats.get('skills_updated', 0) + len(changed)
+        return new_records, len(changed)
+    
+    def _current_skills(self, employee_ids) -> Dict[Tuple[int, int], EmployeeSkill]:
+        """Latest non-deleted skill row per (employee_id, skill_id), as detached records."""
+        columns = ('emp_skill_id', 'employee_id', 'skill_id') + SKILL_DIFF_COLUMNS
+        rows = self.db.query(*(getattr(EmployeeSkill, column) for column in columns)).filter(
+            EmployeeSkill.employee_id.in_(employee_ids),
+            EmployeeSkill.deleted_at.is_(None)
+        ).order_by(EmployeeSkill.emp_skill_id).all()
+        return {
+            (row.employee_id, row.skill_id): EmployeeSkill(**dict(zip(columns, row)))
+            for row in rows
+        }
+    
+    def _mark_batch_commit_failed(self, employee_skill_records: list, zid: str,
+                                  employee_name: str, error_message: str):
+        """Mark all skills of an employee whose batch could not be committed as failed."""
+        logger.error(f"Failed to commit skills for employee ZID {zid}: {error_message}")
+        for skill_record in employee_skill_records:
+            self.stats['failed_rows'].append({
+                'sheet': 'Employee_Skills',
+                'excel_row_number': None,
+                'row_number': None,
+                'zid': zid,
+                'employee_name': employee_name,
+                'skill_name': None,
+                'error_code': 'BATCH_COMMIT_FAILED',
+                'message': f'Failed to commit skill batch for ZID {zid}: {error_message}'
+            })
     
     def _mark_skills_as_failed(self, skill_rows: list, zid: str, employee_name: str, error_code: str):
         """Mark all skills for an employee as failed."""
@@ -368,15 +677,28 @@ class SkillPersister:
     
     def _determine_skill_error_code(self, error_message: str) -> str:
         """Determine error code based on error message."""
-        error_message_lower = error_message.lower()
-        
-        if "not found" in error_message_lower:
-            return "MISSING_REFERENCE"
-        elif "proficiency" in error_message_lower:
-            return "INVALID_PROFICIENCY"
-        elif "duplicate" in error_message_lower:
-            return "DUPLICATE_SKILL"
-        elif "constraint" in error_message_lower:
-            return "CONSTRAINT_VIOLATION"
-        else:
-            return "SKILL_IMPORT_ERROR"
+        return skill_error_code(error_message)
+
+
+def skill_error_code(error_message: str) -> str:
+    """Error code for a failure raised while preparing a skill row (shared with the staging engine)."""
+    error_message_lower = error_message.lower()
+    
+    if "not found" in error_message_lower:
+        return "MISSING_REFERENCE"
+    elif "proficiency" in error_message_lower:
+        return "INVALID_PROFICIENCY"
+    elif "duplicate" in error_message_lower:
+        return "DUPLICATE_SKILL"
+    elif "constraint" in error_message_lower:
+        return "CONSTRAINT_VIOLATION"
+    else:
+        return "SKILL_IMPORT_ERROR"
+
+def _same_value(new, old) -> bool:
+    """Compare an imported value with the stored one (NaN/blank read as NULL)."""
+    if new is None or (isinstance(new, float) and pd.isna(new)) or (isinstance(new, str) and not new.strip()):
+        new = None
+    if isinstance(new, str):
+        new = new.strip()
+    return new == old
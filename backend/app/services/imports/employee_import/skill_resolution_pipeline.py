@@ -0,0 +1,163 @@
+"""
+Pipelined skill resolution for employee import.
+
+Skill chunks are resolved ahead of the persister: while the persister writes
+chunk N, worker threads resolve the distinct skill names of the next chunks
+(exact/alias lookups plus the batched embedding HTTP calls). At most `depth`
+chunks are resolved ahead, which bounds memory and applies backpressure to
+the reader.
+
+Each name is handed to exactly one worker, in chunk order, and the outcomes
+of a chunk are added to the persister's SkillResolver just before that chunk
+is persisted, so per-row resolve_skill() calls and the final statistics are
+the same as in the sequential flow. Workers use their own DB session (memo
+and query-embedding cache reads/writes); a chunk whose resolution fails is
+resolved by the persister itself, as before.
+
+Single Responsibility: Resolve skill chunks ahead of the persister.
+"""
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
+
+from .skill_resolver import SkillResolver
+
+logger = logging.getLogger(__name__)
+
+# Resolution worker threads
+RESOLUTION_WORKERS = 2
+
+# Chunks resolved ahead of the persister
+PIPELINE_DEPTH = 2
+
+Outcome = Tuple[Optional[int], Optional[str], Optional[float]]
+
+
+class SkillResolutionPipeline:
+    """Resolves skill chunks on worker threads ahead of the persister."""
+
+    def __init__(self, target_resolver: SkillResolver, session_factory: Callable[[], Session],
+                 lookup_index: SkillLookupIndex, name_normalizer: Optional[Callable[[str], str]] = None,
+                 workers: int = RESOLUTION_WORKERS, depth: int = PIPELINE_DEPTH):
+        """
+        Initialize resolution pipeline.
+
+        Args:
+            target_resolver: Resolver used by the SkillPersister (receives the outcomes)
+            session_factory: Creates one DB session per worker thread (e.g. SessionLocal)
+            lookup_index: Loaded exact/alias index, shared read-only with the workers
+            name_normalizer: Name normalization function (as set on target_resolver)
+            workers: Number of resolution threads
+            depth: Chunks resolved ahead of the one being persisted
+        """
+        self.target_resolver = target_resolver
+        self.session_factory = session_factory
+        self.lookup_index = lookup_index
+        self.name_normalizer = name_normalizer
+        self.workers = max(1, workers)
+        self.depth = max(1, depth)
+        self.stats = {'chunks': 0, 'names_resolved': 0, 'chunks_failed': 0}
+
+        self._claimed: Set[str] = set()
+        self._local = threading.local()
+        self._sessions: List[Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def run(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Yield the chunks in order, each one after its skill names were resolved.
+
+        Args:
+            chunks: Skill DataFrames (expanded), read lazily
+
+        Yields:
+            The same DataFrames, ready for SkillPersister.import_employee_skills()
+        """
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="skill-resolution")
+        try:
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(self._resolve, self._claim_names(chunk))))
+                if len(pending) > self.depth:
+                    yield self._collect(*pending.popleft())
+            while pending:
+                yield self._collect(*pending.popleft())
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self._close_sessions()
+            logger.info(
+                f"Skill resolution pipeline: {self.stats['chunks']} chunks, "
+                f"{self.stats['names_resolved']} names resolved ahead, {self.stats['chunks_failed']} failed"
+            )
+
+    def _claim_names(self, chunk: pd.DataFrame) -> List[str]:
+        """Distinct skill names of the chunk not handed to a worker yet (called in chunk order)."""
+        if 'skill_name' not in chunk.columns:
+            return []
+        names = [
+            name for name in dict.fromkeys(str(value).strip() for value in chunk['skill_name'].dropna())
+            if name and name not in self._claimed
+        ]
+        self._claimed.update(names)
+        return names
+
+    def _collect(self, chunk: pd.DataFrame, future: Future) -> pd.DataFrame:
+        """Wait for a chunk's resolution and hand the outcomes to the persister's resolver."""
+        self.stats['chunks'] += 1
+        try:
+            outcomes, memo_hits = future.result()
+        except Exception as e:
+            self.stats['chunks_failed'] += 1
+            logger.warning(f"Pipelined skill resolution failed, persister resolves chunk itself: "
+                           f"{type(e).__name__}: {str(e)}")
+            return chunk
+        self.target_resolver.add_prepared(outcomes, memo_hits)
+        self.stats['names_resolved'] += len(outcomes)
+        return chunk
+
+    def _resolve(self, skill_names: List[str]) -> Tuple[Dict[str, Outcome], int]:
+        """Resolve names on the calling worker thread (its own resolver and session)."""
+        if not skill_names:
+            return {}, 0
+        resolver = self._worker_resolver()
+        memo_hits_before = resolver.stats.get('resolution_memo_hits', 0)
+        try:
+            resolver.resolve_many(skill_names)
+            resolver.db.commit()  # memo / query embedding cache entries
+        except Exception:
+            resolver.db.rollback()
+            raise
+        outcomes = {name: resolver.prepared_outcome(name) for name in skill_names}
+        return (
+            {name: outcome for name, outcome in outcomes.items() if outcome is not None},
+            resolver.stats.get('resolution_memo_hits', 0) - memo_hits_before
+        )
+
+    def _worker_resolver(self) -> SkillResolver:
+        resolver = getattr(self._local, 'resolver', None)
+        if resolver is None:
+            session = self.session_factory()
+            with self._sessions_lock:
+                self._sessions.append(session)
+            resolver = SkillResolver(session, {}, lookup_index=self.lookup_index)
+            resolver.set_name_normalizer(self.name_normalizer)
+            self._local.resolver = resolver
+        return resolver
+
+    def _close_sessions(self):
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                logger.warning(f"Failed to close resolution worker session: {type(e).__name__}: {str(e)}")
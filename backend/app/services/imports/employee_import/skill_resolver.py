@@ -5,21 +5,23 @@ Single Responsibility: Resolve skill names to skill IDs using DB master data.
 
 Resolution Strategy:
     1. Token validation (reject garbage tokens like ")", "4", "6")
-    2. Exact match on skills.skill_name (case-insensitive)
-    3. Alias match on skill_aliases.alias_text (case-insensitive)
+    2. Exact match on skills.skill_name (normalized, in-memory index)
+    3. Alias match on skill_aliases.alias_text (normalized, in-memory index)
     4. Embedding match (with confidence thresholds):
        - Auto-accept: similarity ≥ 0.88
        - Review: 0.80 ≤ similarity < 0.88 (logged for manual review)
        - Reject: similarity < 0.80 (unresolved)
 """
 import logging
-from typing import Optional, Dict, Tuple
+from typing import Iterable, Optional, Dict, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from app.models.skill import Skill
-from app.models.skill_alias import SkillAlias
 from app.services.imports.employee_import.skill_token_validator import SkillTokenValidator
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
+from app.services.skill_resolution.skill_embedding_repository import SkillEmbeddingRepository
+from app.services.skill_resolution.skill_resolver_service import SkillResolverService, ResolutionResult
+from app.services.skill_resolution.skill_vector_index import get_shared_vector_index
+from app.services.skill_resolution.embedding_provider import DEFAULT_EMBEDDING_MODEL, resolve_storage_model_name
 
 logger = logging.getLogger(__name__)
 
@@ -32,34 +34,47 @@ class SkillResolver:
     EMBEDDING_REVIEW_THRESHOLD = 0.80       # ≥ 0.80, < 0.88: Needs review
     # < 0.80: Rejected (unresolved)
     
-    def __init__(self, db: Session, stats: Dict):
+    def __init__(self, db: Session, stats: Dict, lookup_index: Optional[SkillLookupIndex] = None):
         self.db = db
         self.stats = stats
         self.normalize_name = None  # Will be injected
         self.token_validator = SkillTokenValidator()
+        # Import-scoped exact/alias index (loaded lazily on first lookup)
+        self.lookup_index = lookup_index or SkillLookupIndex(db)
+        
+        self._embedding_repo: Optional[SkillEmbeddingRepository] = None
+        self._bulk_resolver: Optional[SkillResolverService] = None
+        # Raw skill name → outcome tuple, filled by resolve_many()
+        self._prepared: Dict[str, Tuple[Optional[int], Optional[str], Optional[float]]] = {}
         
         # Initialize embedding provider (optional - graceful degradation)
         self.embedding_provider = None
         self.embedding_enabled = False
+        self.embedding_model_name = DEFAULT_EMBEDDING_MODEL
         try:
-            from app.services.skill_resolution.embedding_provider import create_embedding_provider
-            self.embedding_provider = create_embedding_provider()
+            from app.services.skill_resolution.embedding_worker_pool import create_concurrent_embedding_provider
+            from app.services.skill_resolution.query_embedding_cache import CachedEmbeddingProvider
+            # Repeated raw skill text is served from the query embedding cache; misses go
+            # through the rate-limited, retrying layer (circuit open → exact/alias only)
+            self.embedding_provider = CachedEmbeddingProvider(create_concurrent_embedding_provider(), db)
+            self.embedding_model_name = resolve_storage_model_name(self.embedding_provider)
             self.embedding_enabled = True
-            logger.info("Skill resolution: Embedding-based matching enabled")
+            logger.info(f"Skill resolution: Embedding-based matching enabled (model={self.embedding_model_name})")
         except Exception as e:
             logger.warning(f"Skill resolution: Embedding matching disabled: {type(e).__name__}: {str(e)}")
     
     def set_name_normalizer(self, normalizer_func):
         """Inject name normalization function."""
-        self.normalize_name = normalizer_func    
+        self.normalize_name = normalizer_func
+    
     def resolve_skill(self, skill_name: str) -> Tuple[Optional[int], Optional[str], Optional[float]]:
         """
         Resolve skill name to skill_id using DB master data.
         
         Resolution strategy:
             1. Token validation (reject garbage like ")", "4", "6")
-            2. Exact match on skills.skill_name (case-insensitive)
-            3. Alias match on skill_aliases.alias_text (case-insensitive)
+            2. Exact match on skills.skill_name (normalized, in-memory index)
+            3. Alias match on skill_aliases.alias_text (normalized, in-memory index)
             4. Embedding match with thresholds:
                - ≥ 0.88: Auto-accept (set resolved_skill_id)
                - 0.80-0.88: Review needed (NO resolved_skill_id, mark for review)
@@ -81,6 +96,11 @@ class SkillResolver:
             (None, "needs_review", 0.85) - embedding match needs review (not auto-accepted)
             (None, None, None) - unresolved
         """
+        # Pre-resolved in bulk by resolve_many(): only the stats bookkeeping is left
+        prepared = self._prepared.get(skill_name)
+        if prepared is not None:
+            return self._record_prepared(skill_name, prepared)
+        
         # Step 1: Token validation
         cleaned_token = self.token_validator.clean_and_validate(skill_name)
         if cleaned_token is None:
@@ -94,24 +114,20 @@ class SkillResolver:
         skill_name_normalized = self.normalize_name(cleaned_token) if self.normalize_name else cleaned_token.lower().strip()
         
         # Step 2: Exact match on skills.skill_name
-        skill = self.db.query(Skill).filter(
-            func.lower(func.trim(Skill.skill_name)) == skill_name_normalized
-        ).first()
+        skill_id = self.lookup_index.find_exact(skill_name_normalized)
         
-        if skill:
-            logger.debug(f"✓ Resolved '{skill_name}' via exact match → skill_id={skill.skill_id}")
+        if skill_id is not None:
+            logger.debug(f"✓ Resolved '{skill_name}' via exact match → skill_id={skill_id}")
             self.stats['skills_resolved_exact'] += 1
-            return skill.skill_id, "exact", None
+            return skill_id, "exact", None
         
         # Step 3: Alias match on skill_aliases.alias_text
-        alias = self.db.query(SkillAlias).filter(
-            func.lower(func.trim(SkillAlias.alias_text)) == skill_name_normalized
-        ).first()
+        skill_id = self.lookup_index.find_alias(skill_name_normalized)
         
-        if alias:
-            logger.debug(f"✓ Resolved '{skill_name}' via alias match → skill_id={alias.skill_id}")
+        if skill_id is not None:
+            logger.debug(f"✓ Resolved '{skill_name}' via alias match → skill_id={skill_id}")
             self.stats['skills_resolved_alias'] += 1
-            return alias.skill_id, "alias", None
+            return skill_id, "alias", None
         
         # Step 4: Embedding match (if enabled)
         if self.embedding_enabled and self.embedding_provider:
@@ -140,6 +156,127 @@ class SkillResolver:
             self.stats['unresolved_skill_names'].append(skill_name)
         return None, None, None
     
+    def resolve_many(self, skill_names: Iterable[str]) -> Dict[str, Tuple[Optional[int], Optional[str], Optional[float]]]:
+        """
+        Resolve many raw skill names in bulk via SkillResolverService.resolve_many().
+        
+        Distinct names are validated and normalized, then resolved with one
+        exact/alias pass and one batched embedding call for the leftovers.
+        Outcomes are remembered, so later resolve_skill() calls for these names
+        only update stats (counted per call, exactly as before). Names resolved
+        by an earlier import against the same taxonomy version come straight
+        from the durable resolution memo.
+        
+        Args:
+            skill_names: Raw skill names from Excel (duplicates allowed)
+            
+        Returns:
+            Dict of distinct raw name → (skill_id, resolution_method, confidence),
+            same tuple format as resolve_skill()
+        """
+        distinct = list(dict.fromkeys(skill_names))
+        pending: Dict[str, str] = {}
+        for skill_name in distinct:
+            if skill_name in self._prepared:
+                continue
+            cleaned_token = self.token_validator.clean_and_validate(skill_name)
+            if cleaned_token is None:
+                continue  # resolve_skill() rejects these without any lookup
+            pending[skill_name] = self.normalize_name(cleaned_token) if self.normalize_name else cleaned_token.lower().strip()
+        
+        if pending:
+            bulk_resolver = self._get_bulk_resolver()
+            memo_hits_before = bulk_resolver.resolve_stats['memo']
+            results = bulk_resolver.resolve_many(pending.values())
+            for skill_name, normalized in pending.items():
+                self._prepared[skill_name] = self._to_outcome(results[normalized])
+            self.stats.setdefault('resolution_memo_hits', 0)
+            self.stats['resolution_memo_hits'] += bulk_resolver.resolve_stats['memo'] - memo_hits_before
+        
+        return {name: self._prepared.get(name, (None, None, None)) for name in distinct}
+    
+    def prepared_outcome(self, skill_name: str) -> Optional[Tuple[Optional[int], Optional[str], Optional[float]]]:
+        """Outcome remembered by resolve_many() for a raw name (None if not pre-resolved)."""
+        return self._prepared.get(skill_name)
+    
+    def add_prepared(self, outcomes: Dict[str, Tuple[Optional[int], Optional[str], Optional[float]]],
+                     memo_hits: int = 0) -> None:
+        """
+        Adopt outcomes resolved by another resolver (e.g. a pipeline worker).
+        
+        Equivalent to a resolve_many() call for these names: later
+        resolve_skill() calls only update stats. Names already prepared keep
+        their outcome.
+        
+        Args:
+            outcomes: Raw skill name → outcome tuple, as stored by resolve_many()
+            memo_hits: Resolution memo hits of the resolve_many() that produced them
+        """
+        if not outcomes:
+            return
+        for skill_name, outcome in outcomes.items():
+            self._prepared.setdefault(skill_name, outcome)
+        self.stats.setdefault('resolution_memo_hits', 0)
+        self.stats['resolution_memo_hits'] += memo_hits
+    
+    def _get_bulk_resolver(self) -> SkillResolverService:
+        """SkillResolverService sharing this resolver's index, provider and model (created once)."""
+        if self._bulk_resolver is None:
+            self._bulk_resolver = SkillResolverService(
+                self.db,
+                embedding_provider=self.embedding_provider,
+                enable_embedding=self.embedding_enabled,
+                lookup_index=self.lookup_index,
+                cache_query_embeddings=False,  # provider is already cached
+                embedding_model_name=self.embedding_model_name,
+                use_resolution_memo=True
+            )
+        return self._bulk_resolver
+    
+    @staticmethod
+    def _to_outcome(result: ResolutionResult) -> Tuple[Optional[int], Optional[str], Optional[float]]:
+        """Convert a SkillResolverService result to the resolve_skill() tuple format."""
+        method = result.resolution_method
+        if method in ("exact", "alias"):
+            return result.resolved_skill_id, method, None
+        if method == "embedding":
+            return result.resolved_skill_id, "embedding", result.resolution_confidence
+        if method == "review":
+            return None, "needs_review", result.resolution_confidence
+        return None, None, None
+    
+    def _record_prepared(
+        self,
+        skill_name: str,
+        outcome: Tuple[Optional[int], Optional[str], Optional[float]]
+    ) -> Tuple[Optional[int], Optional[str], Optional[float]]:
+        """Update stats for a pre-resolved outcome, as resolve_skill() would have."""
+        skill_id, method, confidence = outcome
+        if method == "exact":
+            self.stats['skills_resolved_exact'] += 1
+        elif method == "alias":
+            self.stats['skills_resolved_alias'] += 1
+        elif method == "embedding":
+            self.stats.setdefault('skills_resolved_embedding', 0)
+            self.stats['skills_resolved_embedding'] += 1
+        elif method == "needs_review":
+            self.stats.setdefault('skills_needs_review', 0)
+            self.stats['skills_needs_review'] += 1
+        else:
+            logger.warning(f"✗ Could not resolve skill: '{skill_name}'")
+            self.stats['skills_unresolved'] += 1
+            if skill_name not in self.stats['unresolved_skill_names']:
+                self.stats['unresolved_skill_names'].append(skill_name)
+        return outcome
+    
+    def _get_embedding_repo(self) -> SkillEmbeddingRepository:
+        """Embedding repository backed by the shared in-process vector index (created once)."""
+        if self._embedding_repo is None:
+            self._embedding_repo = SkillEmbeddingRepository(
+                self.db, vector_index=get_shared_vector_index(self.embedding_model_name)
+            )
+        return self._embedding_repo
+    
     def _try_embedding_match(self, skill_name_normalized: str) -> Tuple[Optional[int], Optional[float]]:
         """
         Try to match skill using embedding similarity.
@@ -151,16 +288,13 @@ class SkillResolver:
             Tuple of (skill_id, confidence) or (None, None) if no match
         """
         try:
-            from app.services.skill_resolution.skill_embedding_repository import SkillEmbeddingRepository
-            
             # Generate embedding for input skill
             input_embedding = self.embedding_provider.embed(skill_name_normalized)
             
-            # Find best match using cosine similarity
-            embedding_repo = SkillEmbeddingRepository(self.db)
-            best_match = embedding_repo.find_most_similar(
+            # Find best match using cosine similarity (in-process vector index)
+            best_match = self._get_embedding_repo().find_most_similar(
                 embedding=input_embedding,
-                model_name="text-embedding-3-small",
+                model_name=self.embedding_model_name,
                 limit=1,
                 min_similarity=self.EMBEDDING_REVIEW_THRESHOLD  # Only consider ≥ 0.80
             )
@@ -0,0 +1,690 @@
+"""
+Staging-table import engine for employee import (PostgreSQL).
+
+Alternative to EmployeePersister/SkillPersister for very large loads. Rows
+are normalized in Python (typed columns from the column pre-pass, skill
+names resolved by SkillResolver), COPYed into temporary staging tables, and
+then resolved, validated and merged with a handful of set-based statements:
+
+- Employees: org/role IDs by joins on names, validation in one UPDATE, one
+  INSERT ... SELECT ... ON CONFLICT (zid) DO UPDATE for all employees, then
+  active project allocations.
+- Skills (per streamed chunk): proficiency join, failed rows from one
+  SELECT, raw_skill_inputs by INSERT ... SELECT, and employee_skills plus
+  their employee_skill_history rows by one INSERT ... RETURNING chain. In
+  delta mode skills the employee already has are updated instead, and only
+  when a value changed (with an UPDATE history row).
+
+Nothing is committed here: the orchestrator commits the whole import as a
+single transaction, and the staging tables are dropped on commit. Failed
+rows carry the Excel row numbers, error codes and messages of the row-by-row
+path. A ZID repeated in the Employee sheet ends with the last non-empty value
+of each column, as successive row-by-row upserts would.
+
+Single Responsibility: Persist employees and skills through staging tables.
+"""
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.skill_history import ChangeAction, ChangeSource, EmployeeSkillHistory
+from .allocation_writer import (
+    parse_allocation_pct,
+    upsert_active_project_allocation,
+    upsert_active_project_allocations
+)
+from .column_parser import parsed_value
+from .skill_persister import skill_error_code
+
+logger = logging.getLogger(__name__)
+
+# Staging tables live until the import transaction commits
+STAGING_DDL = (
+    """
+    CREATE TEMPORARY TABLE stg_employees (
+        excel_row integer NOT NULL,
+        zid text NOT NULL,
+        full_name text,
+        sub_segment text,
+        project text,
+        team text,
+        role text,
+        start_date_of_working date,
+        email text,
+        allocation_pct integer,
+        sub_segment_id integer,
+        project_id integer,
+        team_id integer,
+        role_id integer,
+        existing_employee_id integer,
+        error text
+    ) ON COMMIT DROP
+    """,
+    "CREATE INDEX ON stg_employees (zid)",
+    """
+    CREATE TEMPORARY TABLE stg_imported (
+        zid text PRIMARY KEY,
+        employee_id integer NOT NULL,
+        full_name text,
+        sub_segment_id integer,
+        project_id integer,
+        start_date_of_working date,
+        created boolean NOT NULL
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMPORARY TABLE stg_skills (
+        excel_row integer NOT NULL,
+        zid text NOT NULL,
+        employee_full_name text,
+        skill_name text,
+        normalized_name text,
+        skill_id integer,
+        resolution_method text,
+        review_confidence double precision,
+        proficiency text,
+        years_experience integer,
+        last_used date,
+        started_learning_from date,
+        certification text,
+        comment text,
+        interest_level integer,
+        error_code text,
+        error text,
+        proficiency_level_id integer
+    ) ON COMMIT DROP
+    """
+)
+
+# Columns filled by COPY (the rest are set by the resolution joins)
+EMPLOYEE_COPY_COLUMNS = (
+    'excel_row', 'zid', 'full_name', 'sub_segment', 'project', 'team', 'role',
+    'start_date_of_working', 'email', 'allocation_pct'
+)
+SKILL_COPY_COLUMNS = (
+    'excel_row', 'zid', 'employee_full_name', 'skill_name', 'normalized_name', 'skill_id',
+    'resolution_method', 'review_confidence', 'proficiency', 'years_experience', 'last_used',
+    'started_learning_from', 'certification', 'comment', 'interest_level', 'error_code', 'error'
+)
+
+# Name → ID joins; duplicate names resolve to the lowest ID, as in ReferenceDataCache
+RESOLVE_EMPLOYEE_STATEMENTS = (
+    """
+    UPDATE stg_employees s SET sub_segment_id = ss.sub_segment_id
+    FROM sub_segments ss WHERE ss.sub_segment_name = s.sub_segment
+    """,
+    """
+    UPDATE stg_employees s SET project_id = p.project_id
+    FROM (
+        SELECT project_name, sub_segment_id, min(project_id) AS project_id
+        FROM projects GROUP BY project_name, sub_segment_id
+    ) p
+    WHERE p.project_name = s.project AND p.sub_segment_id = s.sub_segment_id
+    """,
+    """
+    UPDATE stg_employees s SET team_id = t.team_id
+    FROM (
+        SELECT team_name, project_id, min(team_id) AS team_id
+        FROM teams GROUP BY team_name, project_id
+    ) t
+    WHERE t.team_name = s.team AND t.project_id = s.project_id
+    """,
+    """
+    UPDATE stg_employees s SET role_id = r.role_id
+    FROM roles r WHERE r.role_name = s.role
+    """,
+    """
+    UPDATE stg_employees s SET existing_employee_id = e.employee_id
+    FROM employees e WHERE e.zid = s.zid
+    """
+)
+
+# A new employee needs a known team, unless an earlier row of the same ZID created it
+VALIDATE_EMPLOYEES = """
+    UPDATE stg_employees s SET error = CASE
+        WHEN s.sub_segment_id IS NULL THEN 'Sub-segment not found: ' || coalesce(s.sub_segment, '')
+        WHEN s.project_id IS NULL THEN 'Project not found: ' || coalesce(s.project, '')
+            || ' under sub-segment: ' || coalesce(s.sub_segment, '')
+        ELSE 'Team not found: ' || coalesce(s.team, '') || ' under project: ' || coalesce(s.project, '')
+    END
+    WHERE s.team_id IS NULL AND s.existing_employee_id IS NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM stg_employees earlier
+          WHERE earlier.zid = s.zid AND earlier.excel_row < s.excel_row AND earlier.team_id IS NOT NULL
+      )
+"""
+
+SELECT_EMPLOYEE_ERRORS = """
+    SELECT excel_row, zid, full_name, error FROM stg_employees
+    WHERE error IS NOT NULL ORDER BY excel_row
+"""
+
+COUNT_VALID_EMPLOYEE_ROWS = "SELECT count(*) FROM stg_employees WHERE error IS NULL"
+
+# Per ZID: last non-empty value of each column; the stored value is kept otherwise
+MERGE_EMPLOYEES = """
+    WITH source AS (
+        SELECT s.zid,
+            (array_agg(s.full_name ORDER BY s.excel_row DESC) FILTER (WHERE s.full_name IS NOT NULL))[1] AS full_name,
+            (array_agg(s.team_id ORDER BY s.excel_row DESC) FILTER (WHERE s.team_id IS NOT NULL))[1] AS team_id,
+            (array_agg(s.role_id ORDER BY s.excel_row DESC) FILTER (WHERE s.role_id IS NOT NULL))[1] AS role_id,
+            (array_agg(s.start_date_of_working ORDER BY s.excel_row DESC)
+                FILTER (WHERE s.start_date_of_working IS NOT NULL))[1] AS start_date_of_working,
+            (array_agg(s.email ORDER BY s.excel_row DESC) FILTER (WHERE s.email IS NOT NULL))[1] AS email
+        FROM stg_employees s
+        WHERE s.error IS NULL
+        GROUP BY s.zid
+    ), resolved AS (
+        SELECT src.zid, coalesce(src.full_name, cur.full_name, '') AS full_name,
+               coalesce(src.team_id, cur.team_id) AS team_id,
+               src.role_id, src.start_date_of_working, src.email
+        FROM source src LEFT JOIN employees cur ON cur.zid = src.zid
+    ), merged AS (
+        INSERT INTO employees AS e (zid, full_name, team_id, role_id, start_date_of_working, email, created_at)
+        SELECT zid, full_name, team_id, role_id, start_date_of_working, email, :import_timestamp
+        FROM resolved
+        ON CONFLICT (zid) DO UPDATE SET
+            full_name = EXCLUDED.full_name,
+            team_id = EXCLUDED.team_id,
+            role_id = coalesce(EXCLUDED.role_id, e.role_id),
+            start_date_of_working = coalesce(EXCLUDED.start_date_of_working, e.start_date_of_working),
+            email = coalesce(EXCLUDED.email, e.email),
+            updated_at = now()
+        RETURNING e.employee_id, e.zid, e.full_name, e.team_id, e.start_date_of_working, (e.xmax = 0) AS created
+    )
+    INSERT INTO stg_imported (zid, employee_id, full_name, sub_segment_id, project_id, start_date_of_working, created)
+    SELECT m.zid, m.employee_id, m.full_name, p.sub_segment_id, t.project_id, m.start_date_of_working, m.created
+    FROM merged m
+    LEFT JOIN teams t ON t.team_id = m.team_id
+    LEFT JOIN projects p ON p.project_id = t.project_id
+    RETURNING zid, employee_id, created
+"""
+
+# Allocation of the last row of each ZID that has one
+SELECT_ALLOCATIONS = """
+    SELECT i.zid, i.employee_id, i.project_id, a.allocation_pct, i.start_date_of_working
+    FROM stg_imported i
+    JOIN (
+        SELECT DISTINCT ON (zid) zid, allocation_pct FROM stg_employees
+        WHERE error IS NULL AND allocation_pct IS NOT NULL
+        ORDER BY zid, excel_row DESC
+    ) a ON a.zid = i.zid
+    ORDER BY i.zid
+"""
+
+RESOLVE_PROFICIENCY = """
+    UPDATE stg_skills s SET proficiency_level_id = pl.proficiency_level_id
+    FROM proficiency_levels pl WHERE pl.level_name = s.proficiency
+"""
+
+# Same codes and messages as SkillPersister; empty skill names are skipped, not failed
+SELECT_SKILL_ERRORS = """
+    SELECT s.excel_row, s.zid, coalesce(i.full_name, s.employee_full_name) AS employee_name,
+        CASE WHEN i.employee_id IS NULL THEN coalesce(s.skill_name, '') ELSE s.skill_name END AS skill_name,
+        CASE
+            WHEN i.employee_id IS NULL THEN 'EMPLOYEE_NOT_IMPORTED'
+            WHEN s.error IS NOT NULL THEN s.error_code
+            WHEN s.skill_id IS NULL AND s.resolution_method = 'needs_review' THEN 'SKILL_NEEDS_REVIEW'
+            WHEN s.skill_id IS NULL THEN 'SKILL_NOT_RESOLVED'
+            ELSE 'MISSING_REFERENCE'
+        END AS error_code,
+        CASE
+            WHEN i.employee_id IS NULL THEN 'Employee ZID ' || s.zid || ' was not successfully imported'
+            WHEN s.error IS NOT NULL THEN s.error
+            WHEN s.skill_id IS NULL AND s.resolution_method = 'needs_review'
+                THEN 'Skill "' || s.skill_name || '" needs manual review (logged to raw_skill_inputs)'
+            WHEN s.skill_id IS NULL
+                THEN 'Skill "' || s.skill_name || '" not found in master data (logged to raw_skill_inputs)'
+            ELSE 'Proficiency level not found: ' || s.proficiency
+        END AS message
+    FROM stg_skills s
+    LEFT JOIN stg_imported i ON i.zid = s.zid
+    WHERE i.employee_id IS NULL
+       OR (s.skill_name IS NOT NULL AND (s.error IS NOT NULL OR s.skill_id IS NULL OR s.proficiency_level_id IS NULL))
+    ORDER BY s.excel_row
+"""
+
+INSERT_RAW_SKILL_INPUTS = """
+    INSERT INTO raw_skill_inputs (
+        raw_text, normalized_text, sub_segment_id, source_type, employee_id,
+        resolved_skill_id, resolution_method, resolution_confidence, created_at
+    )
+    SELECT s.skill_name, s.normalized_name, i.sub_segment_id, 'excel_import', i.employee_id,
+        NULL, CASE WHEN s.review_confidence IS NOT NULL THEN s.resolution_method END,
+        s.review_confidence, :import_timestamp
+    FROM stg_skills s
+    JOIN stg_imported i ON i.zid = s.zid
+    WHERE s.skill_name IS NOT NULL AND s.error IS NULL AND s.skill_id IS NULL
+      AND i.sub_segment_id IS NOT NULL
+    ORDER BY s.excel_row
+"""
+
+_INSERT_SKILLS_SQL = """
+    WITH inserted AS (
+        INSERT INTO employee_skills (
+            employee_id, skill_id, proficiency_level_id, years_experience, last_used,
+            started_learning_from, certification, comment, interest_level, last_updated, created_at
+        )
+        SELECT i.employee_id, s.skill_id, s.proficiency_level_id, s.years_experience, s.last_used,
+            s.started_learning_from, s.certification, s.comment, s.interest_level, now(), :import_timestamp
+        FROM stg_skills s
+        JOIN stg_imported i ON i.zid = s.zid
+        WHERE s.skill_name IS NOT NULL AND s.error IS NULL
+          AND s.skill_id IS NOT NULL AND s.proficiency_level_id IS NOT NULL
+          {existing_filter}
+        ORDER BY s.excel_row
+        RETURNING emp_skill_id, employee_id, skill_id, proficiency_level_id, years_experience, last_used, certification
+    )
+    INSERT INTO employee_skill_history (
+        employee_id, skill_id, emp_skill_id, action, changed_at, change_source, changed_by,
+        change_reason, batch_id, new_proficiency_level_id, new_years_experience, new_last_used, new_certification
+    )
+    SELECT employee_id, skill_id, emp_skill_id, CAST(:action AS {action_type}), now(),
+        CAST(:change_source AS {source_type}), :changed_by, :change_reason, :batch_id,
+        proficiency_level_id, years_experience, last_used, certification
+    FROM inserted
+"""
+
+# Delta mode: skills the employee already has are updated (above), not inserted again
+EXISTING_SKILL_FILTER = """
+          AND NOT EXISTS (
+              SELECT 1 FROM employee_skills es
+              WHERE es.employee_id = i.employee_id AND es.skill_id = s.skill_id AND es.deleted_at IS NULL
+          )
+"""
+
+# Delta mode: the latest row per (employee, skill) is updated only when a value changed;
+# the last sheet row of a repeated skill wins
+_UPDATE_CHANGED_SKILLS_SQL = """
+    WITH incoming AS (
+        SELECT DISTINCT ON (i.employee_id, s.skill_id)
+            i.employee_id, s.skill_id, s.proficiency_level_id, s.years_experience, s.last_used,
+            s.started_learning_from, s.certification, s.comment, s.interest_level
+        FROM stg_skills s
+        JOIN stg_imported i ON i.zid = s.zid
+        WHERE s.skill_name IS NOT NULL AND s.error IS NULL
+          AND s.skill_id IS NOT NULL AND s.proficiency_level_id IS NOT NULL
+        ORDER BY i.employee_id, s.skill_id, s.excel_row DESC
+    ), current AS (
+        SELECT DISTINCT ON (es.employee_id, es.skill_id)
+            es.emp_skill_id, es.employee_id, es.skill_id, es.proficiency_level_id, es.years_experience,
+            es.last_used, es.started_learning_from, es.certification, es.comment, es.interest_level
+        FROM employee_skills es
+        JOIN incoming n ON n.employee_id = es.employee_id AND n.skill_id = es.skill_id
+        WHERE es.deleted_at IS NULL
+        ORDER BY es.employee_id, es.skill_id, es.emp_skill_id DESC
+    ), changed AS (
+        SELECT c.emp_skill_id, n.*,
+            c.proficiency_level_id AS old_proficiency_level_id, c.years_experience AS old_years_experience,
+            c.last_used AS old_last_used, c.certification AS old_certification
+        FROM current c
+        JOIN incoming n ON n.employee_id = c.employee_id AND n.skill_id = c.skill_id
+        WHERE (n.proficiency_level_id, n.years_experience, n.last_used, n.started_learning_from,
+               n.certification, n.comment, n.interest_level)
+            IS DISTINCT FROM
+              (c.proficiency_level_id, c.years_experience, c.last_used, c.started_learning_from,
+               c.certification, c.comment, c.interest_level)
+    ), updated AS (
+        UPDATE employee_skills es SET
+            proficiency_level_id = ch.proficiency_level_id,
+            years_experience = ch.years_experience,
+            last_used = ch.last_used,
+            started_learning_from = ch.started_learning_from,
+            certification = ch.certification,
+            comment = ch.comment,
+            interest_level = ch.interest_level,
+            last_updated = now()
+        FROM changed ch
+        WHERE es.emp_skill_id = ch.emp_skill_id
+        RETURNING es.emp_skill_id, es.employee_id, es.skill_id,
+            ch.old_proficiency_level_id, ch.old_years_experience, ch.old_last_used, ch.old_certification,
+            es.proficiency_level_id, es.years_experience, es.last_used, es.certification
+    )
+    INSERT INTO employee_skill_history (
+        employee_id, skill_id, emp_skill_id, action, changed_at, change_source, changed_by,
+        change_reason, batch_id, old_proficiency_level_id, old_years_experience, old_last_used,
+        old_certification, new_proficiency_level_id, new_years_experience, new_last_used, new_certification
+    )
+    SELECT employee_id, skill_id, emp_skill_id, CAST(:action AS {action_type}), now(),
+        CAST(:change_source AS {source_type}), :changed_by, :change_reason, :batch_id,
+        old_proficiency_level_id, old_years_experience, old_last_used, old_certification,
+        proficiency_level_id, years_experience, last_used, certification
+    FROM updated
+"""
+
+COUNT_VALID_SKILL_ROWS = """
+    SELECT count(*) FROM stg_skills s
+    JOIN stg_imported i ON i.zid = s.zid
+    WHERE s.skill_name IS NOT NULL AND s.error IS NULL
+      AND s.skill_id IS NOT NULL AND s.proficiency_level_id IS NOT NULL
+"""
+
+_ENUM_TYPES = {
+    'action_type': EmployeeSkillHistory.__table__.c.action.type.name,
+    'source_type': EmployeeSkillHistory.__table__.c.change_source.type.name
+}
+UPDATE_CHANGED_SKILLS_WITH_HISTORY = _UPDATE_CHANGED_SKILLS_SQL.format(**_ENUM_TYPES)
+INSERT_NEW_SKILLS_WITH_HISTORY = _INSERT_SKILLS_SQL.format(existing_filter=EXISTING_SKILL_FILTER, **_ENUM_TYPES)
+INSERT_SKILLS_WITH_HISTORY = _INSERT_SKILLS_SQL.format(existing_filter='', **_ENUM_TYPES)
+
+
+class StagingImportEngine:
+    """Writes employees and skills via COPY into staging tables and set-based merges."""
+
+    def __init__(self, db: Session, stats: Dict, date_parser, field_sanitizer, skill_resolver,
+                 name_normalizer: Optional[Callable[[str], str]] = None, delta_mode: bool = False):
+        """
+        Initialize staging engine.
+
+        Args:
+            db: SQLAlchemy session on PostgreSQL (psycopg); not committed here
+            stats: Import stats, updated like the persisters update them
+            date_parser: DateParser (fallback when the column pre-pass did not run)
+            field_sanitizer: FieldSanitizer (same fallback)
+            skill_resolver: SkillResolver; resolve_skill() is called per imported row
+            name_normalizer: Normalization for raw_skill_inputs.normalized_text
+            delta_mode: Update skills the employee already has (history only for
+                changed values) instead of inserting them again
+        """
+        self.db = db
+        self.stats = stats
+        self.date_parser = date_parser
+        self.field_sanitizer = field_sanitizer
+        self.skill_resolver = skill_resolver
+        self.name_normalizer = name_normalizer
+        self.delta_mode = delta_mode
+        self._staging_ready = False
+
+    def import_employees(self, employees_df: pd.DataFrame, import_timestamp: datetime) -> Dict[str, int]:
+        """
+        Stage and merge all employees (and their active allocations).
+
+        Args:
+            employees_df: Employee sheet DataFrame (column pre-pass applied)
+            import_timestamp: Import timestamp
+
+        Returns:
+            Dict mapping ZID to employee_id
+        """
+        self._ensure_staging_tables()
+        staged = self._copy_rows('stg_employees', EMPLOYEE_COPY_COLUMNS, self.employee_staging_rows(employees_df))
+        for statement in RESOLVE_EMPLOYEE_STATEMENTS:
+            self.db.execute(text(statement))
+        self.db.execute(text(VALIDATE_EMPLOYEES))
+
+        failed = self._record_failed_employees(self.db.execute(text(SELECT_EMPLOYEE_ERRORS)).all())
+        imported_rows = self.db.execute(text(COUNT_VALID_EMPLOYEE_ROWS)).scalar()
+        merged = self.db.execute(
+            text(MERGE_EMPLOYEES), {'import_timestamp': import_timestamp}
+        ).all()
+        created = sum(1 for _, _, was_created in merged if was_created)
+        self._write_allocations()
+
+        # Repeated ZIDs count once per row, as with successive row-by-row upserts
+        self.stats['employees_imported'] = imported_rows
+        self.stats['employees_created'] = created
+        self.stats['employees_updated'] = imported_rows - created
+        self.stats['failed_employees'] = failed
+        logger.info(f"Staged {staged} employee rows; upserted {imported_rows} "
+                    f"(created: {created}, updated: {imported_rows - created}, failed: {len(failed)})")
+        return {zid: employee_id for zid, employee_id, _ in merged}
+
+    def import_employee_skills(self, skills_df: pd.DataFrame, zid_to_employee_id_mapping: Dict[str, int],
+                               import_timestamp: datetime) -> int:
+        """
+        Stage and merge one chunk of skill rows.
+
+        May be called once per chunk of a streamed sheet; stats['skills_imported']
+        accumulates across calls.
+
+        Args:
+            skills_df: Skill DataFrame (expanded, column pre-pass applied)
+            zid_to_employee_id_mapping: Map of ZID → employee_id from import_employees()
+            import_timestamp: Import timestamp
+
+        Returns:
+            Number of skill rows processed
+        """
+        self._ensure_staging_tables()
+        self._pre_resolve_skills(skills_df)
+        self.db.execute(text("TRUNCATE stg_skills"))
+        self._copy_rows(
+            'stg_skills', SKILL_COPY_COLUMNS, self.skill_staging_rows(skills_df, zid_to_employee_id_mapping)
+        )
+        self.db.execute(text(RESOLVE_PROFICIENCY))
+
+        failed = self._record_failed_skills(self.db.execute(text(SELECT_SKILL_ERRORS)).all())
+        self.db.execute(text(INSERT_RAW_SKILL_INPUTS), {'import_timestamp': import_timestamp})
+        history_params = {
+            'change_source': ChangeSource.IMPORT.value,
+            'changed_by': "system",
+            'change_reason': "Excel bulk import (NEW FORMAT)",
+            'batch_id': str(uuid.uuid4())[:8]
+        }
+        updated = unchanged = 0
+        if self.delta_mode:
+            valid = self.db.execute(text(COUNT_VALID_SKILL_ROWS)).scalar()
+            updated = self.db.execute(
+                text(UPDATE_CHANGED_SKILLS_WITH_HISTORY), {'action': ChangeAction.UPDATE.value, **history_params}
+            ).rowcount
+        inserted = self.db.execute(
+            text(INSERT_NEW_SKILLS_WITH_HISTORY if self.delta_mode else INSERT_SKILLS_WITH_HISTORY),
+            {'import_timestamp': import_timestamp, 'action': ChangeAction.INSERT.value, **history_params}
+        ).rowcount
+        if self.delta_mode:
+            unchanged = max(0, valid - inserted - updated)
+            self.stats['skills_updated'] = self.stats.get('skills_updated', 0) + updated
+            self.stats['skills_unchanged'] = self.stats.get('skills_unchanged', 0) + unchanged
+
+        self.stats['skills_imported'] = self.stats.get('skills_imported', 0) + inserted + updated
+        logger.info(f"Imported {inserted + updated} of {len(skills_df)} employee skill records via staging "
+                    f"(updated: {updated}, unchanged: {unchanged}, failed: {failed})")
+        return len(skills_df)
+
+    # ========================================================================
+    # ROW NORMALIZATION (Python side, before COPY)
+    # ========================================================================
+
+    def employee_staging_rows(self, employees_df: pd.DataFrame) -> Iterable[Tuple]:
+        """Rows for stg_employees, in EMPLOYEE_COPY_COLUMNS order."""
+        for row_idx, row in zip(employees_df.index, employees_df.to_dict('records')):
+            zid = str(row.get('zid', ''))
+            email_raw = row.get('email') or row.get('Email')
+            yield (
+                int(row_idx) + 2,  # Excel row number (1-based + header)
+                zid,
+                _text(row.get('full_name')),
+                _text(row.get('sub_segment')),
+                _text(row.get('project')),
+                _text(row.get('team')),
+                _text(row.get('role')),
+                parsed_value(row, 'start_date_of_working', lambda: self.date_parser.parse_date_safely(
+                    row.get('start_date_of_working'), 'start_date_of_working', zid
+                )),
+                _text(email_raw, strip=True),
+                parse_allocation_pct(row.get('project_allocation_pct'))
+            )
+
+    def skill_staging_rows(self, skills_df: pd.DataFrame,
+                           zid_to_employee_id_mapping: Dict[str, int]) -> Iterable[Tuple]:
+        """
+        Rows for stg_skills, in SKILL_COPY_COLUMNS order.
+
+        Skill names are resolved only for rows of imported employees, so the
+        resolution stats match the row-by-row path.
+        """
+        for row_idx, row in zip(skills_df.index, skills_df.to_dict('records')):
+            excel_row = int(row_idx) + 2
+            zid = str(row.get('zid', ''))
+            skill_name = str(row.get('skill_name', '')).strip() or None
+            employee_imported = zid in zid_to_employee_id_mapping
+            if employee_imported and skill_name is None:
+                logger.warning(f"Skipping empty skill name at Excel row {excel_row}")
+
+            skill_id = resolution_method = review_confidence = normalized_name = None
+            error_code = error = None
+            if employee_imported and skill_name is not None:
+                try:
+                    skill_id, resolution_method, confidence = self.skill_resolver.resolve_skill(skill_name)
+                    if not skill_id:
+                        skill_id = None
+                        normalized_name = self._normalize(skill_name)
+                        if resolution_method == "needs_review" and confidence:
+                            review_confidence = confidence
+                except Exception as e:
+                    error = str(e)
+                    error_code = skill_error_code(error)
+
+            yield (
+                excel_row,
+                zid,
+                str(row.get('employee_full_name', '')),
+                skill_name,
+                normalized_name,
+                skill_id,
+                resolution_method,
+                review_confidence,
+                str(row.get('proficiency', '')).strip(),
+                parsed_value(row, 'years_experience', lambda: self.field_sanitizer.sanitize_integer_field(
+                    row.get('years_experience'), 'years_experience', zid
+                )),
+                parsed_value(row, 'last_used', lambda: self.date_parser.parse_date_safely(
+                    row.get('last_used'), 'last_used', f"employee {zid}"
+                )),
+                parsed_value(row, 'started_learning_from', lambda: self.date_parser.parse_date_safely(
+                    row.get('started_learning_from'), 'started_learning_from', f"employee {zid}"
+                )),
+                _text(row.get('certification')),
+                _text(row.get('comment')),
+                parsed_value(row, 'interest_level', lambda: self.field_sanitizer.sanitize_integer_field(
+                    row.get('interest_level'), 'interest_level', zid
+                )),
+                error_code,
+                error
+            )
+
+    def _pre_resolve_skills(self, skills_df: pd.DataFrame) -> None:
+        """Bulk-resolve the chunk's distinct skill names (names prepared by the pipeline are skipped)."""
+        if 'skill_name' not in skills_df.columns:
+            return
+        skill_names = [
+            name for name in (str(value).strip() for value in skills_df['skill_name'].dropna())
+            if name
+        ]
+        try:
+            self.skill_resolver.resolve_many(skill_names)
+        except Exception as e:
+            logger.warning(f"Bulk skill resolution failed, resolving per row: {type(e).__name__}: {str(e)}")
+
+    # ========================================================================
+    # SQL HELPERS
+    # ========================================================================
+
+    def _ensure_staging_tables(self):
+        if self._staging_ready:
+            return
+        for statement in STAGING_DDL:
+            self.db.execute(text(statement))
+        self._staging_ready = True
+
+    def _copy_rows(self, table: str, columns: Sequence[str], rows: Iterable[Tuple]) -> int:
+        """COPY rows into a staging table on the session's connection (same transaction)."""
+        dbapi_connection = self.db.connection().connection
+        copied = 0
+        with dbapi_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    copied += 1
+        return copied
+
+    def _write_allocations(self):
+        """Upsert the active allocations of merged employees (errors never fail an employee)."""
+        allocations = []
+        for zid, employee_id, project_id, allocation_pct, start_date in self.db.execute(
+            text(SELECT_ALLOCATIONS)
+        ).all():
+            if not project_id:
+                logger.warning(
+                    f"Allocation% provided for employee {zid} but project not resolved; "
+                    f"skipping allocation row"
+                )
+                continue
+            allocations.append({
+                'employee_id': employee_id,
+                'project_id': project_id,
+                'allocation_pct': allocation_pct,
+                'start_date': start_date,
+                'allocation_type': 'BILLABLE'
+            })
+        if not allocations:
+            return
+        try:
+            with self.db.begin_nested():
+                upsert_active_project_allocations(self.db, allocations)
+            return
+        except Exception as e:
+            logger.warning(f"Bulk allocation upsert failed ({e}); retrying per allocation")
+
+        for allocation in allocations:
+            try:
+                with self.db.begin_nested():
+                    upsert_active_project_allocation(db=self.db, **allocation)
+            except Exception as e:
+                logger.warning(f"Failed to upsert allocation for employee_id={allocation['employee_id']}: {e}")
+
+    def _record_failed_employees(self, rows: Sequence[Tuple]) -> List[Dict[str, Any]]:
+        """Add stg_employees validation errors to stats['failed_rows']."""
+        failed = []
+        for excel_row, zid, full_name, message in rows:
+            logger.warning(f"Failed to import employee at row {excel_row} (ZID: {zid}, Name: {full_name}): {message}")
+            failed.append({
+                'sheet': 'Employee',
+                'excel_row_number': excel_row,
+                'row_number': excel_row,
+                'zid': zid or None,
+                'full_name': full_name or None,
+                'employee_name': full_name or None,
+                'skill_name': None,
+                'error_code': 'MISSING_REFERENCE',
+                'message': message
+            })
+        self.stats['failed_rows'].extend(failed)
+        return failed
+
+    def _record_failed_skills(self, rows: Sequence[Tuple]) -> int:
+        """Add stg_skills failures to stats['failed_rows']."""
+        for excel_row, zid, employee_name, skill_name, error_code, message in rows:
+            self.stats['failed_rows'].append({
+                'sheet': 'Employee_Skills',
+                'excel_row_number': excel_row,
+                'row_number': excel_row,
+                'zid': zid,
+                'employee_name': employee_name,
+                'skill_name': skill_name,
+                'error_code': error_code,
+                'message': message
+            })
+        return len(rows)
+
+    def _normalize(self, skill_name: str) -> str:
+        return self.name_normalizer(skill_name) if self.name_normalizer else skill_name.lower().strip()
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and pd.isna(value))
+
+
+def _text(value, strip: bool = False) -> Optional[str]:
+    """Cell as text for staging; None for empty/whitespace-only cells."""
+    if _is_missing(value):
+        return None
+    value = str(value)
+    if not value.strip():
+        return None
+    return value.strip() if strip else value
@@ -5,7 +5,7 @@ Parses Excel files with columns: Category | SubCategory | Skill Name | Alias
 Single Responsibility: Excel file parsing and validation
 """
 import logging
-from typing import List, Dict
+from typing import List, Dict, Union
 from dataclasses import dataclass
 import pandas as pd
 from io import BytesIO
@@ -41,12 +41,12 @@ class ExcelParser:
     def __init__(self):
         self.errors: List[Dict] = []
     
-    def parse_excel(self, file_content: bytes) -> List[MasterSkillRow]:
+    def parse_excel(self, file_content: Union[bytes, str]) -> List[MasterSkillRow]:
         """
         Parse Excel file and return list of MasterSkillRow objects.
         
         Args:
-            file_content: Bytes content of the Excel file
+            file_content: Bytes content of the Excel file, or the path of the file
             
         Returns:
             List of MasterSkillRow objects
@@ -70,10 +70,11 @@ class ExcelParser:
         logger.info(f"Parsing complete: {len(rows)} valid rows, {len(self.errors)} errors")
         return rows
     
-    def _read_excel_file(self, file_content: bytes) -> pd.DataFrame:
-        """Read Excel file into DataFrame."""
+    def _read_excel_file(self, file_content: Union[bytes, str]) -> pd.DataFrame:
+        """Read Excel file (bytes or path) into DataFrame."""
         try:
-            df = pd.read_excel(BytesIO(file_content), engine='openpyxl')
+            source = BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+            df = pd.read_excel(source, engine='openpyxl')
             logger.info(f"Excel loaded: {len(df)} rows, {len(df.columns)} columns")
             logger.info(f"Detected Excel columns: {', '.join(df.columns)}")
             return df
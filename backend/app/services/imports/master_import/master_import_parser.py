@@ -4,7 +4,7 @@ Master Import Parser - Facade for Excel parsing.
 Single Responsibility: Provide backward-compatible interface to the new ExcelParser.
 """
 import logging
-from typing import List
+from typing import List, Union
 from .excel_parser import ExcelParser, MasterSkillRow
 
 logger = logging.getLogger(__name__)
@@ -27,12 +27,12 @@ class MasterImportParser:
         """Expose errors from underlying parser."""
         return self._parser.errors
     
-    def parse_excel(self, file_content: bytes) -> List[MasterSkillRow]:
+    def parse_excel(self, file_content: Union[bytes, str]) -> List[MasterSkillRow]:
         """
         Parse Excel file and return list of MasterSkillRow objects.
         
         Args:
-            file_content: Bytes content of the Excel file
+            file_content: Bytes content of the Excel file, or the path of the file
             
         Returns:
             List of MasterSkillRow objects
@@ -14,6 +14,7 @@ from app.schemas.master_import import (
     ImportSummaryCount,
     MasterImportResponse
 )
+from app.services.skill_resolution.resolution_memo import bump_taxonomy_version
 from .excel_parser import MasterSkillRow
 from .data_cache import DataCache
 from .conflict_detector import ConflictDetector
@@ -42,13 +43,16 @@ class MasterImportService:
         self.embedding_enabled = False
         self.embedding_unavailable_reason = None
         try:
-            from app.services.skill_resolution.embedding_provider import create_embedding_provider
+            from app.services.skill_resolution.embedding_provider import resolve_storage_model_name
+            from app.services.skill_resolution.embedding_worker_pool import create_concurrent_embedding_provider
             from app.services.skill_resolution.skill_embedding_service import SkillEmbeddingService
             
-            provider = create_embedding_provider()
+            # Concurrent, rate-limited requests with retry/backoff (limits from EMBEDDING_RPM/TPM)
+            provider = create_concurrent_embedding_provider()
             self.embedding_service = SkillEmbeddingService(
                 db=db,
-                embedding_provider=provider
+                embedding_provider=provider,
+                model_name=resolve_storage_model_name(provider)
             )
             self.embedding_enabled = True
             logger.info("Master import: Embedding service initialized and enabled")
@@ -138,6 +142,10 @@ class MasterImportService:
         elif not skill_ids_processed:
             logger.info("Embedding generation not attempted: no skills processed")
         
+        # New skills, aliases or skill embeddings change resolution outcomes
+        if self._resolution_inputs_changed(embedding_result):
+            bump_taxonomy_version(self.db)
+        
         # Commit embeddings (rows already committed in batches during _process_rows)
         if progress_callback:
             progress_callback(95, "Finalizing...")
@@ -150,6 +158,13 @@ class MasterImportService:
           # Build and return response
         return self._build_response(rows, rows_processed, embedding_result, embedding_attempted)
     
+    def _resolution_inputs_changed(self, embedding_result) -> bool:
+        """Whether this import inserted skills/aliases or (re)generated skill embeddings."""
+        upsert_stats = self.upserter.stats
+        if upsert_stats['skills']['inserted'] or upsert_stats['aliases']['inserted']:
+            return True
+        return bool(embedding_result is not None and embedding_result.succeeded)
+    
     def _process_rows(self, rows: List[MasterSkillRow], skip_rows: set, progress_callback: Optional[ProgressCallback] = None, import_start_time: float = None) -> tuple:
         """Process all rows with batch commits and return (count of successfully processed rows, list of skill_ids).
         
@@ -0,0 +1,12 @@
+"""Import Job Runner Module"""
+
+from .job_queue import ClaimedJob, ImportJobQueue
+from .job_handlers import JOB_HANDLERS
+from .job_worker import (
+    ImportJobWorker, start_embedded_worker, stop_embedded_worker, notify_job_enqueued
+)
+
+__all__ = [
+    'ClaimedJob', 'ImportJobQueue', 'JOB_HANDLERS',
+    'ImportJobWorker', 'start_embedded_worker', 'stop_embedded_worker', 'notify_job_enqueued'
+]
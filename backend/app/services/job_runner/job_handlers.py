@@ -0,0 +1,243 @@
+"""
+Import job handlers - run one claimed job to completion.
+
+Each handler opens its own sessions from the session factory, runs the
+import and marks the job completed or failed. Handlers are looked up by
+import_jobs.job_type in JOB_HANDLERS.
+
+Single Responsibility: Execute a claimed import job and record its outcome.
+"""
+import logging
+import os
+import time
+from typing import Callable, Dict
+
+from sqlalchemy.orm import Session
+
+from app.services.import_job_service import (
+    ImportJobService,
+    JOB_TYPE_EMPLOYEE_IMPORT,
+    JOB_TYPE_MASTER_SKILLS_IMPORT
+)
+from app.services.job_runner.job_queue import ClaimedJob
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Session]
+
+
+def run_employee_import(job: ClaimedJob, session_factory: SessionFactory) -> None:
+    """
+    Run an employee import job, resuming from its checkpoint if it has one.
+
+    The uploaded file is deleted only after the job completes, so a failed or
+    reclaimed job can resume from the same file.
+    """
+    from app.services.import_service import ImportService
+    from app.services.imports.employee_import import IMPORT_ENGINE_ROWS
+
+    job_id = job.job_id
+    engine = job.params.get('engine') or (job.checkpoint or {}).get('engine', IMPORT_ENGINE_ROWS)
+    db = session_factory()
+    job_service = ImportJobService(db)
+    completed = False
+    try:
+        logger.info(f"🔵 Starting employee import job {job_id} (engine: {engine}, "
+                    f"checkpoint: {(job.checkpoint or {}).get('phase')})")
+        import_service = ImportService(db_session=db, job_id=job_id, import_engine=engine)
+        result = import_service.import_excel(job.file_path, resume_checkpoint=job.checkpoint)
+
+        job_service.complete_job(job_id, result)
+        completed = True
+        logger.info(f"✅ Import job {job_id} completed successfully")
+
+    except Exception as e:
+        logger.error(f"❌ Import job {job_id} failed: {type(e).__name__}", exc_info=True)
+        error_msg = f"{type(e).__name__}: {str(e)}"
+        try:
+            db.rollback()
+        except Exception:
+            pass
+        job_service.fail_job(job_id, error_msg)
+        logger.error(f"❌ Job {job_id} marked as failed with error: {error_msg}")
+
+    finally:
+        try:
+            db.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close database session: {str(e)}")
+
+        # Clean up temporary file (kept after a failure so the job can be resumed)
+        if completed and job.file_path and os.path.exists(job.file_path):
+            try:
+                os.unlink(job.file_path)
+                logger.info(f"🧹 Cleaned up temporary file: {job.file_path}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to clean up temporary file {job.file_path}: {str(e)}")
+
+
+def run_master_skills_import(job: ClaimedJob, session_factory: SessionFactory) -> None:
+    """
+    Run a master skills import job.
+
+    Master imports are not resumable (they are idempotent upserts), so the
+    uploaded file is always deleted at the end.
+    """
+    from app.services.master_import_parser import MasterImportParser
+    from app.services.master_import_service import MasterImportService
+
+    job_id = job.job_id
+    db = None
+    progress_db = None  # Separate session for progress updates
+    job_service = None
+    job_start_time = time.time()
+
+    try:
+        logger.info(f"[IMPORT] ====== JOB {job_id} STARTED ======")
+
+        # Main import session
+        db = session_factory()
+
+        # SEPARATE session for progress updates (commits independently)
+        progress_db = session_factory()
+        job_service = ImportJobService(progress_db)
+
+        # Update: Parsing
+        job_service.update_job(
+            job_id,
+            status='processing',
+            percent=5,
+            message='Parsing Excel file...',
+            force_update=True
+        )
+
+        # Parse Excel file
+        parser = MasterImportParser()
+        parse_start = time.time()
+        try:
+            logger.info(f"[IMPORT] Job {job_id} | File size: {os.path.getsize(job.file_path)} bytes")
+            rows = parser.parse_excel(job.file_path)
+            logger.info(f"[IMPORT] Job {job_id} | Excel parsed in {time.time() - parse_start:.2f}s | {len(rows)} valid rows, {len(parser.errors)} errors")
+        except ValueError as e:
+            logger.error(f"[IMPORT] Job {job_id} FAILED | Excel validation error after {time.time() - job_start_time:.2f}s")
+            job_service.fail_job(job_id, f"Excel validation failed: {str(e)}")
+            return
+        except Exception as e:
+            logger.error(f"[IMPORT] Job {job_id} FAILED | Unexpected parsing error after {time.time() - job_start_time:.2f}s")
+            job_service.fail_job(job_id, f"Unexpected parsing error: {type(e).__name__}: {str(e)}")
+            return
+
+        # Check for parsing errors
+        if parser.errors:
+            job_service.fail_job(
+                job_id,
+                f"File contains {len(parser.errors)} validation error(s). Please fix and retry."
+            )
+            return
+
+        # No rows to process
+        if not rows:
+            job_service.complete_job(job_id, {
+                "status": "success",
+                "message": "No valid rows to process",
+                "rows_total": 0,
+                "rows_processed": 0
+            })
+            return
+
+        # Update: Processing
+        job_service.update_job(
+            job_id,
+            percent=10,
+            message=f'Processing {len(rows)} rows...',
+            total_count=len(rows),
+            force_update=True
+        )
+
+        def progress_callback(percent: int, message: str):
+            """Update job progress using separate DB session."""
+            try:
+                logger.info(f"[JOB UPDATE] job_id={job_id} | percent={percent}% | message='{message}' | elapsed={time.time() - job_start_time:.2f}s")
+                job_service.update_job(
+                    job_id,
+                    percent=percent,
+                    message=message,
+                    force_update=False  # Let throttling handle it
+                )
+            except Exception as e:
+                # Don't let progress update failures break the import
+                logger.warning(f"[JOB UPDATE] FAILED job_id={job_id} | error={e}")
+
+        # Process import with progress callback
+        service = MasterImportService(db)
+        process_start = time.time()
+        try:
+            result = service.process_import(rows, progress_callback=progress_callback)
+            logger.info(f"[IMPORT] Job {job_id} | Import service completed in {time.time() - process_start:.2f}s | status={result.status}, processed={result.summary.rows_processed}")
+        except ValueError as e:
+            db.rollback()
+            logger.error(f"[IMPORT] Job {job_id} FAILED | Validation error after {time.time() - job_start_time:.2f}s")
+            job_service.fail_job(job_id, f"Import validation failed: {str(e)}")
+            return
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"[IMPORT] Job {job_id} FAILED after {time.time() - job_start_time:.2f}s | {type(e).__name__}: {str(e)}")
+            job_service.fail_job(job_id, f"Import processing failed: {type(e).__name__}: {str(e)}")
+            return
+
+        job_service.complete_job(job_id, _master_import_result(result))
+        logger.info(f"[IMPORT] ====== JOB {job_id} COMPLETED ======")
+        logger.info(f"[IMPORT] Job {job_id} | Total time: {time.time() - job_start_time:.2f}s")
+
+    except Exception as e:
+        logger.exception(f"[IMPORT] Job {job_id} FAILED after {time.time() - job_start_time:.2f}s | {type(e).__name__}: {str(e)}")
+        error_msg = f"{type(e).__name__}: {str(e)}"
+
+        if job_service:
+            job_service.fail_job(job_id, error_msg)
+        else:
+            # Let the worker mark the job failed (it has its own session)
+            raise
+
+    finally:
+        for session in (db, progress_db):
+            if session:
+                try:
+                    session.close()
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to close database session: {str(e)}")
+
+        if job.file_path and os.path.exists(job.file_path):
+            try:
+                os.unlink(job.file_path)
+                logger.info(f"🧹 Cleaned up temporary file: {job.file_path}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to clean up temporary file {job.file_path}: {str(e)}")
+
+
+def _master_import_result(result) -> Dict:
+    """Build the job result dictionary from a MasterImportResponse."""
+    summary = result.summary
+    return {
+        "status": result.status,
+        "summary": {
+            "rows_total": summary.rows_total,
+            "rows_processed": summary.rows_processed,
+            **{
+                name: {
+                    "inserted": getattr(summary, name).inserted,
+                    "existing": getattr(summary, name).existing,
+                    "conflicts": getattr(summary, name).conflicts
+                }
+                for name in ("categories", "subcategories", "skills", "aliases")
+            }
+        },
+        "errors_count": len(result.errors) if result.errors else 0
+    }
+
+
+# job_type -> handler(job, session_factory)
+JOB_HANDLERS: Dict[str, Callable[[ClaimedJob, SessionFactory], None]] = {
+    JOB_TYPE_EMPLOYEE_IMPORT: run_employee_import,
+    JOB_TYPE_MASTER_SKILLS_IMPORT: run_master_skills_import,
+}
@@ -0,0 +1,168 @@
+"""
+Import job queue on the import_jobs table (PostgreSQL).
+
+Jobs are rows with status 'pending'. Workers claim them with
+SELECT ... FOR UPDATE SKIP LOCKED (concurrent workers never block on or
+double-claim a row), ordered by priority and age. A transaction-scoped
+advisory lock serializes the claim with the count of running jobs, so the
+concurrency limit holds across all processes and hosts.
+
+A running job carries the claiming worker's id and a heartbeat. Jobs whose
+heartbeat is older than the stale limit belonged to a worker that died; they
+are put back in the queue (employee imports then resume from their
+checkpoint) or failed once they have used up their attempts.
+
+Single Responsibility: Claim, heartbeat and reclaim queued import jobs.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key serializing claims (count + claim must be atomic)
+CLAIM_LOCK_KEY = 7324101
+
+COUNT_RUNNING_JOBS = """
+    SELECT count(*) FROM import_jobs
+    WHERE status = 'processing' AND heartbeat_at > now() - make_interval(secs => :stale_after)
+"""
+
+CLAIM_NEXT_JOB = """
+    UPDATE import_jobs j SET
+        status = 'processing',
+        worker_id = :worker_id,
+        heartbeat_at = now(),
+        started_at = coalesce(j.started_at, now()),
+        attempts = j.attempts + 1,
+        message = 'Starting...',
+        updated_at = now()
+    WHERE j.id = (
+        SELECT id FROM import_jobs
+        WHERE status = 'pending' AND job_type = ANY(:job_types)
+        ORDER BY priority, created_at, id
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.job_id, j.job_type, j.file_path, j.params, j.checkpoint, j.attempts
+"""
+
+HEARTBEAT_JOBS = """
+    UPDATE import_jobs SET heartbeat_at = now()
+    WHERE job_id = ANY(:job_ids) AND worker_id = :worker_id AND status = 'processing'
+    RETURNING job_id
+"""
+
+# Out of attempts: failed; otherwise back to pending (checkpoint and file are kept)
+RECLAIM_STALE_JOBS = """
+    UPDATE import_jobs SET
+        status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'pending' END,
+        message = CASE WHEN attempts >= :max_attempts THEN 'Import failed' ELSE 'Requeued after worker stopped' END,
+        error = CASE
+            WHEN attempts >= :max_attempts
+                THEN 'Worker stopped responding (' || attempts || ' attempts)'
+            ELSE error
+        END,
+        completed_at = CASE WHEN attempts >= :max_attempts THEN now() END,
+        worker_id = NULL,
+        updated_at = now()
+    WHERE status = 'processing'
+      AND coalesce(heartbeat_at, updated_at) < now() - make_interval(secs => :stale_after)
+    RETURNING job_id, status, worker_id
+"""
+
+
+@dataclass
+class ClaimedJob:
+    """A job claimed by a worker (the columns its handler needs)."""
+    job_id: str
+    job_type: str
+    file_path: Optional[str] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    checkpoint: Optional[Dict[str, Any]] = None
+    attempts: int = 1
+
+
+class ImportJobQueue:
+    """Claims, heartbeats and reclaims import jobs. Every method commits its own transaction."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim_next(self, worker_id: str, job_types: Sequence[str], max_running: int,
+                   stale_after_seconds: float) -> Optional[ClaimedJob]:
+        """
+        Claim the next pending job if fewer than max_running jobs are running.
+
+        Args:
+            worker_id: Id recorded on the claimed job
+            job_types: Job types this worker has handlers for
+            max_running: Global concurrency limit (all workers)
+            stale_after_seconds: Running jobs with an older heartbeat do not count
+
+        Returns:
+            The claimed job, or None (limit reached or queue empty)
+        """
+        try:
+            self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': CLAIM_LOCK_KEY})
+            running = self.db.execute(text(COUNT_RUNNING_JOBS), {'stale_after': stale_after_seconds}).scalar()
+            if running >= max_running:
+                self.db.commit()
+                return None
+            row = self.db.execute(text(CLAIM_NEXT_JOB), {
+                'worker_id': worker_id, 'job_types': list(job_types)
+            }).first()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if row is None:
+            return None
+        job = ClaimedJob(
+            job_id=row.job_id, job_type=row.job_type, file_path=row.file_path,
+            params=row.params or {}, checkpoint=row.checkpoint, attempts=row.attempts
+        )
+        logger.info(f"📥 Worker {worker_id} claimed {job.job_type} job {job.job_id} (attempt {job.attempts})")
+        return job
+
+    def heartbeat(self, worker_id: str, job_ids: Sequence[str]) -> List[str]:
+        """
+        Refresh the heartbeat of the worker's running jobs.
+
+        Returns:
+            Job ids the worker no longer owns (reclaimed or finished elsewhere)
+        """
+        if not job_ids:
+            return []
+        try:
+            owned = set(self.db.execute(text(HEARTBEAT_JOBS), {
+                'job_ids': list(job_ids), 'worker_id': worker_id
+            }).scalars().all())
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return [job_id for job_id in job_ids if job_id not in owned]
+
+    def reclaim_stale(self, stale_after_seconds: float, max_attempts: int) -> List[Dict[str, Any]]:
+        """
+        Requeue (or fail) running jobs whose worker stopped heartbeating.
+
+        Returns:
+            One dict per reclaimed job: job_id and its new status
+        """
+        try:
+            rows = self.db.execute(text(RECLAIM_STALE_JOBS), {
+                'stale_after': stale_after_seconds, 'max_attempts': max_attempts
+            }).all()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        for row in rows:
+            logger.warning(f"♻️ Reclaimed job {row.job_id} from a dead worker → {row.status}")
+        return [{'job_id': row.job_id, 'status': row.status} for row in rows]
@@ -0,0 +1,223 @@
+"""
+Import job worker - polls the import job queue and runs claimed jobs.
+
+A worker owns a small thread pool. Each loop iteration it heartbeats its
+running jobs, requeues jobs of dead workers and claims pending jobs into
+its free threads; the global limit (IMPORT_JOB_MAX_CONCURRENCY) is enforced
+by the queue across all workers. API processes run an embedded worker
+(IMPORT_JOB_WORKER_MODE=embedded, the default); with
+IMPORT_JOB_WORKER_MODE=external they only enqueue, and scripts/run_import_worker.py
+runs the jobs.
+
+Single Responsibility: Run queued import jobs with bounded concurrency.
+"""
+import logging
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.services.import_job_service import ImportJobService
+from app.services.job_runner.job_handlers import JOB_HANDLERS
+from app.services.job_runner.job_queue import ClaimedJob, ImportJobQueue
+
+logger = logging.getLogger(__name__)
+
+WORKER_MODE_EMBEDDED = "embedded"
+WORKER_MODE_EXTERNAL = "external"
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class ImportJobWorker:
+    """Claims import jobs from the queue and runs them on a thread pool."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        handlers: Optional[Dict[str, Callable]] = None,
+        worker_id: Optional[str] = None,
+        threads: Optional[int] = None
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            session_factory: Creates database sessions (queue and handlers)
+            handlers: job_type -> handler, defaults to JOB_HANDLERS
+            worker_id: Id recorded on claimed jobs, defaults to host-pid-random
+            threads: Jobs this worker runs at once, defaults to IMPORT_JOB_WORKER_THREADS
+        """
+        self.session_factory = session_factory
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self.worker_id = worker_id or _default_worker_id()
+
+        self.max_concurrency = int(os.getenv("IMPORT_JOB_MAX_CONCURRENCY", "2"))
+        self.threads = threads or int(os.getenv("IMPORT_JOB_WORKER_THREADS", "1"))
+        self.poll_seconds = float(os.getenv("IMPORT_JOB_POLL_SECONDS", "2"))
+        self.heartbeat_seconds = float(os.getenv("IMPORT_JOB_HEARTBEAT_SECONDS", "15"))
+        self.stale_seconds = float(os.getenv("IMPORT_JOB_STALE_SECONDS", "120"))
+        self.max_attempts = int(os.getenv("IMPORT_JOB_MAX_ATTEMPTS", "3"))
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running: Dict[str, ClaimedJob] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start the polling loop on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name=f"import-worker-{self.worker_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop claiming jobs; optionally wait for running jobs to finish.
+
+        While waiting, the running jobs keep heartbeating so other workers do
+        not reclaim (and run a second time) a job that is still draining.
+        Blocks the calling thread.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_seconds + 5)
+        if wait:
+            self._drain()
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _drain(self) -> None:
+        """Heartbeat until no job is running (finished jobs wake the loop)."""
+        while self.running_job_ids:
+            self._wake.wait(timeout=min(self.poll_seconds, self.heartbeat_seconds))
+            self._wake.clear()
+            try:
+                self.run_once(claim=False)
+            except Exception as e:
+                logger.error(f"❌ Import job worker {self.worker_id} heartbeat failed while stopping: "
+                             f"{type(e).__name__}: {str(e)}")
+
+    def wake(self) -> None:
+        """Poll now instead of waiting for the next interval (a job was enqueued or finished)."""
+        self._wake.set()
+
+    def run_forever(self) -> None:
+        """Poll until stop() is called."""
+        logger.info(f"🚀 Import job worker {self.worker_id} started "
+                    f"(threads={self.threads}, global limit={self.max_concurrency})")
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"❌ Import job worker {self.worker_id} poll failed: {type(e).__name__}: {str(e)}")
+            # Heartbeats must outpace the stale limit even when idle between polls
+            self._wake.wait(timeout=min(self.poll_seconds, self.heartbeat_seconds))
+            self._wake.clear()
+        logger.info(f"🛑 Import job worker {self.worker_id} stopped")
+
+    def run_once(self, claim: bool = True) -> int:
+        """
+        One poll: heartbeat running jobs, reclaim stale jobs, claim into free threads.
+
+        Args:
+            claim: False to only heartbeat and reclaim (draining the worker)
+
+        Returns:
+            Number of jobs claimed
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="import-job")
+
+        db = self.session_factory()
+        claimed = 0
+        try:
+            queue = ImportJobQueue(db)
+            for job_id in queue.heartbeat(self.worker_id, self.running_job_ids):
+                logger.warning(f"⚠️ Worker {self.worker_id} no longer owns job {job_id} (reclaimed while running)")
+
+            queue.reclaim_stale(self.stale_seconds, self.max_attempts)
+
+            while claim and not self._stop.is_set() and self._free_threads() > 0:
+                job = queue.claim_next(self.worker_id, list(self.handlers), self.max_concurrency, self.stale_seconds)
+                if job is None:
+                    break
+                with self._lock:
+                    self._running[job.job_id] = job
+                self._executor.submit(self._run_job, job)
+                claimed += 1
+        finally:
+            db.close()
+        return claimed
+
+    @property
+    def running_job_ids(self) -> List[str]:
+        """Ids of the jobs this worker is running."""
+        with self._lock:
+            return list(self._running)
+
+    def _free_threads(self) -> int:
+        with self._lock:
+            return self.threads - len(self._running)
+
+    def _run_job(self, job: ClaimedJob) -> None:
+        """Run a claimed job; a handler crash marks the job failed."""
+        try:
+            self.handlers[job.job_type](job, self.session_factory)
+        except Exception as e:
+            logger.error(f"❌ Job {job.job_id} ({job.job_type}) crashed: {type(e).__name__}", exc_info=True)
+            db = None
+            try:
+                db = self.session_factory()
+                ImportJobService(db).fail_job(job.job_id, f"{type(e).__name__}: {str(e)}")
+            except Exception as fail_err:
+                logger.error(f"❌ Failed to update job status on error: {fail_err}")
+            finally:
+                if db:
+                    db.close()
+        finally:
+            with self._lock:
+                self._running.pop(job.job_id, None)
+            self.wake()
+
+
+_embedded_worker: Optional[ImportJobWorker] = None
+
+
+def start_embedded_worker() -> Optional[ImportJobWorker]:
+    """Start this process's worker unless jobs run in external worker processes."""
+    global _embedded_worker
+    mode = os.getenv("IMPORT_JOB_WORKER_MODE", WORKER_MODE_EMBEDDED).lower()
+    if mode != WORKER_MODE_EMBEDDED:
+        logger.info(f"Import job worker mode '{mode}': jobs are run by scripts/run_import_worker.py")
+        return None
+    if _embedded_worker is None:
+        from app.db.session import SessionLocal
+        _embedded_worker = ImportJobWorker(SessionLocal)
+        _embedded_worker.start()
+    return _embedded_worker
+
+
+def stop_embedded_worker() -> None:
+    """Stop the embedded worker, letting running jobs finish (blocks; run it off the event loop)."""
+    global _embedded_worker
+    if _embedded_worker is not None:
+        _embedded_worker.stop()
+        _embedded_worker = None
+
+
+def notify_job_enqueued() -> None:
+    """Wake the embedded worker so a new job starts without waiting for the next poll."""
+    if _embedded_worker is not None:
+        _embedded_worker.wake()
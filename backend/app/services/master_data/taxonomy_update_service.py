@@ -23,6 +23,7 @@ from app.models.subcategory import SkillSubcategory
 from app.models.skill import Skill
 from app.models.skill_alias import SkillAlias
 from app.models.employee_skill import EmployeeSkill
+from app.services.skill_resolution.resolution_memo import bump_taxonomy_version
 from app.schemas.master_data_update import (
     CategoryUpdateResponse,
     SubcategoryUpdateResponse,
@@ -281,6 +282,7 @@ def create_skill(
             message="Alias created successfully"
         ))
     
+    bump_taxonomy_version(db)
     db.commit()
     db.refresh(new_skill)
     
@@ -522,6 +524,7 @@ def update_skill_name(
     
     # TODO: Audit logging
     
+    bump_taxonomy_version(db)
     db.commit()
     db.refresh(skill)
     
@@ -618,6 +621,7 @@ def update_alias(
     
     if changes_made:
         # TODO: Audit logging
+        bump_taxonomy_version(db)
         db.commit()
         db.refresh(alias)
         logger.info(f"Alias {alias_id} updated successfully")
@@ -701,6 +705,7 @@ def create_alias(
     )
     
     db.add(new_alias)
+    bump_taxonomy_version(db)
     db.commit()
     db.refresh(new_alias)
     
@@ -751,6 +756,7 @@ def delete_alias(
     skill_id = alias.skill_id
     
     db.delete(alias)
+    bump_taxonomy_version(db)
     db.commit()
     
     logger.info(f"Alias {alias_id} ('{alias_text}') deleted successfully")
@@ -816,6 +822,7 @@ def soft_delete_category(
     category.deleted_at = func.now()
     category.deleted_by = actor or "system"
     
+    bump_taxonomy_version(db)
     db.commit()
     db.refresh(category)
     
@@ -883,6 +890,7 @@ def soft_delete_subcategory(
     subcategory.deleted_at = func.now()
     subcategory.deleted_by = actor or "system"
     
+    bump_taxonomy_version(db)
     db.commit()
     db.refresh(subcategory)
     
@@ -999,6 +1007,7 @@ def soft_delete_skill(
     skill.deleted_at = func.now()
     skill.deleted_by = actor or "system"
     
+    bump_taxonomy_version(db)
     db.commit()
     db.refresh(skill)
     
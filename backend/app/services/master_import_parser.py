@@ -10,7 +10,7 @@ Usage:
     # Works exactly as before, but uses refactored code under the hood
 """
 import logging
-from typing import List
+from typing import List, Union
 
 # Import from new location
 from app.services.imports.master_import import MasterImportParser as _MasterImportParser
@@ -39,12 +39,12 @@ class MasterImportParser:
         """Expose errors from underlying parser."""
         return self._parser.errors
     
-    def parse_excel(self, file_content: bytes) -> List[MasterSkillRow]:
+    def parse_excel(self, file_content: Union[bytes, str]) -> List[MasterSkillRow]:
         """
         Parse Excel file and return list of MasterSkillRow objects.
         
         Args:
-            file_content: Bytes content of the Excel file
+            file_content: Bytes content of the Excel file, or the path of the file
             
         Returns:
             List of MasterSkillRow objects
@@ -1,13 +1,14 @@
 """
 Service for tracking employee skill changes and history.
 """
-from typing import Optional
+from typing import Optional, Sequence
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
 
 from app.models.employee_skill import EmployeeSkill
-from app.models.skill_history import EmployeeSkillHistory, ChangeAction, ChangeSource
+from app.models.skill_history import EmployeeSkillHistory, ProficiencyChangeHistory, ChangeAction, ChangeSource
 from app.db.session import SessionLocal
 
 
@@ -82,6 +83,96 @@ class SkillHistoryService:
         
         return history_record
     
+    def record_skill_changes_bulk(
+        self,
+        new_skill_records: Sequence[Optional[EmployeeSkill]],
+        old_skill_records: Optional[Sequence[Optional[EmployeeSkill]]] = None,
+        change_source: ChangeSource = ChangeSource.UI,
+        changed_by: Optional[str] = None,
+        change_reason: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        record_proficiency_changes: bool = False
+    ) -> int:
+        """
+        Record many skill changes with one multi-row INSERT per history table.
+        
+        Same rows as calling record_skill_change() once per pair, without the
+        per-record flush. new_skill_records must already carry emp_skill_id
+        (e.g. from INSERT ... RETURNING).
+        
+        Args:
+            new_skill_records: New/updated states (None entries for deletions)
+            old_skill_records: Previous states, aligned with new_skill_records
+                (None or omitted for new skills)
+            change_source: Source of the changes
+            changed_by: Who made the changes (optional)
+            change_reason: Reason for the changes (optional)
+            batch_id: Batch identifier for grouped changes
+            record_proficiency_changes: Also write proficiency_change_history rows
+                for records whose proficiency level was set or changed
+            
+        Returns:
+            Number of employee_skill_history rows inserted
+        """
+        if old_skill_records is None:
+            old_skill_records = [None] * len(new_skill_records)
+        if len(old_skill_records) != len(new_skill_records):
+            raise ValueError("old_skill_records and new_skill_records must be aligned")
+        
+        history_rows = []
+        proficiency_rows = []
+        for old, new in zip(old_skill_records, new_skill_records):
+            current = new if new is not None else old
+            if current is None:
+                continue
+            
+            # Determine action type
+            if old is None:
+                action = ChangeAction.INSERT
+            elif new is None:
+                action = ChangeAction.DELETE
+            else:
+                action = ChangeAction.UPDATE
+            
+            history_rows.append({
+                'employee_id': current.employee_id,
+                'skill_id': current.skill_id,
+                'emp_skill_id': new.emp_skill_id if new is not None else None,
+                'action': action,
+                'change_source': change_source,
+                'changed_by': changed_by,
+                'change_reason': change_reason,
+                'batch_id': batch_id,
+                'old_proficiency_level_id': old.proficiency_level_id if old is not None else None,
+                'old_years_experience': old.years_experience if old is not None else None,
+                'old_last_used': old.last_used if old is not None else None,
+                'old_certification': old.certification if old is not None else None,
+                'new_proficiency_level_id': new.proficiency_level_id if new is not None else None,
+                'new_years_experience': new.years_experience if new is not None else None,
+                'new_last_used': new.last_used if new is not None else None,
+                'new_certification': new.certification if new is not None else None
+            })
+            
+            old_level = old.proficiency_level_id if old is not None else None
+            if record_proficiency_changes and new is not None and new.proficiency_level_id != old_level:
+                proficiency_rows.append({
+                    'employee_id': new.employee_id,
+                    'skill_id': new.skill_id,
+                    'from_proficiency_id': old_level,
+                    'to_proficiency_id': new.proficiency_level_id,
+                    'change_source': change_source,
+                    'changed_by': changed_by,
+                    'change_reason': change_reason,
+                    'batch_id': batch_id
+                })
+        
+        if history_rows:
+            self.db.execute(insert(EmployeeSkillHistory.__table__), history_rows)
+        if proficiency_rows:
+            self.db.execute(insert(ProficiencyChangeHistory.__table__), proficiency_rows)
+        
+        return len(history_rows)
+    
     def update_skill_with_history(
         self,
         emp_skill_id: int,
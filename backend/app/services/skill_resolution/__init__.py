@@ -8,5 +8,11 @@ This package provides a 3-layer skill resolution system:
 """
 
 from .skill_embedding_service import SkillEmbeddingService, EmbeddingResult
+from .skill_lookup_index import SkillLookupIndex
+from .query_embedding_cache import CachedEmbeddingProvider
+from .embedding_worker_pool import ConcurrentEmbeddingProvider, EmbeddingCircuitOpenError
+from .resolution_memo import ResolutionMemo, bump_taxonomy_version
 
-__all__ = ['SkillEmbeddingService', 'EmbeddingResult']
+__all__ = ['SkillEmbeddingService', 'EmbeddingResult', 'SkillLookupIndex', 'CachedEmbeddingProvider',
+           'ConcurrentEmbeddingProvider', 'EmbeddingCircuitOpenError', 'ResolutionMemo',
+           'bump_taxonomy_version']
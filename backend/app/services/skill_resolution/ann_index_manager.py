@@ -0,0 +1,198 @@
+"""
+Approximate nearest-neighbour (ANN) index management for skill_embeddings.
+
+Builds, rebuilds and drops pgvector HNSW / IVFFlat indexes. Each index is
+partial on one model_name, so embeddings from different models (and
+dimensions) never share an index, and the planner only uses it for queries
+that filter on that model.
+
+Single Responsibility: Generate and run DDL for skill_embeddings ANN indexes.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+METHOD_HNSW = "hnsw"
+METHOD_IVFFLAT = "ivfflat"
+SUPPORTED_METHODS = (METHOD_HNSW, METHOD_IVFFLAT)
+
+# pgvector defaults; see https://github.com/pgvector/pgvector#indexing
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 64
+DEFAULT_IVFFLAT_LISTS = 100
+
+INDEX_NAME_PREFIX = "ix_skill_embeddings_"
+POSTGRES_MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass
+class ANNIndexInfo:
+    """An existing ANN index on skill_embeddings."""
+    index_name: str
+    method: str
+    definition: str
+
+
+def ann_index_name(model_name: str, method: str) -> str:
+    """
+    Deterministic index name for a model and method.
+
+    Example: ("text-embedding-3-small", "hnsw") → "ix_skill_embeddings_hnsw_text_embedding_3_small"
+    """
+    _validate_method(method)
+    slug = re.sub(r"[^a-z0-9]+", "_", model_name.lower()).strip("_")
+    return f"{INDEX_NAME_PREFIX}{method}_{slug}"[:POSTGRES_MAX_IDENTIFIER_LENGTH]
+
+
+def build_create_index_sql(
+    model_name: str,
+    method: str = METHOD_HNSW,
+    m: int = DEFAULT_HNSW_M,
+    ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+    lists: int = DEFAULT_IVFFLAT_LISTS,
+    concurrently: bool = False
+) -> str:
+    """
+    Build CREATE INDEX DDL for a partial cosine-distance ANN index.
+
+    Args:
+        model_name: Embedding model the index covers
+        method: "hnsw" or "ivfflat"
+        m: HNSW max connections per layer
+        ef_construction: HNSW candidate list size at build time
+        lists: IVFFlat number of lists (rule of thumb: rows / 1000, min 10)
+        concurrently: Use CREATE INDEX CONCURRENTLY (must run outside a transaction)
+
+    Returns:
+        SQL string
+    """
+    _validate_method(method)
+    if method == METHOD_HNSW:
+        options = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+    else:
+        options = f"lists = {int(lists)}"
+
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        f"{ann_index_name(model_name, method)} "
+        f"ON skill_embeddings USING {method} (embedding vector_cosine_ops) "
+        f"WITH ({options}) "
+        f"WHERE model_name = {_quote_literal(model_name)}"
+    )
+
+
+def build_drop_index_sql(model_name: str, method: str, concurrently: bool = False) -> str:
+    """Build DROP INDEX DDL for a model's ANN index."""
+    return (
+        f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS "
+        f"{ann_index_name(model_name, method)}"
+    )
+
+
+class ANNIndexManager:
+    """
+    Runs ANN index DDL against a database connection or session.
+
+    For CONCURRENTLY builds pass a connection in autocommit mode, e.g.
+    engine.connect().execution_options(isolation_level="AUTOCOMMIT").
+    """
+
+    def __init__(self, bind, concurrently: bool = False):
+        """
+        Initialize index manager.
+
+        Args:
+            bind: SQLAlchemy Session or Connection
+            concurrently: Build/drop without blocking writes (requires autocommit)
+        """
+        self.bind = bind
+        self.concurrently = concurrently
+
+    def build(
+        self,
+        model_name: str,
+        method: str = METHOD_HNSW,
+        m: int = DEFAULT_HNSW_M,
+        ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+        lists: Optional[int] = None
+    ) -> str:
+        """
+        Create the ANN index for a model if it does not exist.
+
+        Args:
+            model_name: Embedding model to index
+            method: "hnsw" or "ivfflat"
+            m: HNSW max connections per layer
+            ef_construction: HNSW build-time candidate list size
+            lists: IVFFlat lists (defaults to rows / 1000, at least 10)
+
+        Returns:
+            Index name
+        """
+        if method == METHOD_IVFFLAT and lists is None:
+            lists = self._default_ivfflat_lists(model_name)
+        sql = build_create_index_sql(
+            model_name, method, m=m, ef_construction=ef_construction,
+            lists=lists or DEFAULT_IVFFLAT_LISTS, concurrently=self.concurrently
+        )
+        logger.info(f"Building ANN index: {sql}")
+        self.bind.execute(text(sql))
+        return ann_index_name(model_name, method)
+
+    def drop(self, model_name: str, method: Optional[str] = None) -> List[str]:
+        """
+        Drop a model's ANN index (both methods when method is None).
+
+        Returns:
+            Names of the indexes dropped (if they existed)
+        """
+        methods = [method] if method else list(SUPPORTED_METHODS)
+        dropped = []
+        for m in methods:
+            self.bind.execute(text(build_drop_index_sql(model_name, m, self.concurrently)))
+            dropped.append(ann_index_name(model_name, m))
+        logger.info(f"Dropped ANN indexes for model={model_name}: {dropped}")
+        return dropped
+
+    def rebuild(self, model_name: str, method: str = METHOD_HNSW, **build_options) -> str:
+        """Drop and re-create a model's ANN index (e.g. after a bulk re-embed)."""
+        self.drop(model_name, method)
+        return self.build(model_name, method, **build_options)
+
+    def list_indexes(self) -> List[ANNIndexInfo]:
+        """List HNSW/IVFFlat indexes currently defined on skill_embeddings."""
+        rows = self.bind.execute(text("""
+            SELECT indexname, indexdef
+            FROM pg_indexes
+            WHERE tablename = 'skill_embeddings'
+              AND (indexdef ILIKE '%USING hnsw%' OR indexdef ILIKE '%USING ivfflat%')
+            ORDER BY indexname
+        """))
+        result = []
+        for name, definition in rows:
+            method = METHOD_HNSW if "using hnsw" in definition.lower() else METHOD_IVFFLAT
+            result.append(ANNIndexInfo(index_name=name, method=method, definition=definition))
+        return result
+
+    def _default_ivfflat_lists(self, model_name: str) -> int:
+        """pgvector guidance: lists ≈ rows / 1000 for up to 1M rows (minimum 10)."""
+        count = self.bind.execute(
+            text("SELECT COUNT(*) FROM skill_embeddings WHERE model_name = :model_name"),
+            {"model_name": model_name}
+        ).scalar() or 0
+        return max(10, count // 1000)
+
+
+def _validate_method(method: str) -> None:
+    if method not in SUPPORTED_METHODS:
+        raise ValueError(f"Unsupported ANN index method: {method} (expected one of {SUPPORTED_METHODS})")
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string as a SQL literal (DDL cannot use bind parameters)."""
+    return "'" + value.replace("'", "''") + "'"
@@ -5,12 +5,94 @@ Provides text embedding generation for semantic skill matching.
 """
 import logging
 import os
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Protocol
+from typing import Iterator, List, Protocol
 from openai import AzureOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Model name skill embeddings are generated and stored under
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Batch limits for embed_batch(). The embeddings endpoint accepts up to 2048
+# inputs per request; we stay well below that and also cap the estimated
+# token count so a batch of long texts is split before the API rejects it.
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+DEFAULT_EMBEDDING_BATCH_TOKENS = 100_000
+
+# Rough token estimate used for batch splitting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (~4 characters per token, minimum 1)."""
+    return max(1, len(text) // CHARS_PER_TOKEN + 1)
+
+
+def iter_embedding_batches(
+    texts: List[str],
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS
+) -> Iterator[List[str]]:
+    """
+    Split texts into batches bounded by item count and estimated token budget.
+    
+    Order is preserved. A single text larger than the token budget is sent
+    in a batch of its own rather than dropped.
+    
+    Args:
+        texts: Texts to split
+        batch_size: Maximum number of texts per batch
+        max_batch_tokens: Maximum estimated tokens per batch
+        
+    Yields:
+        Lists of texts, in input order
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    
+    batch: List[str] = []
+    batch_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if batch and (len(batch) >= batch_size or batch_tokens + tokens > max_batch_tokens):
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+def _create_embeddings_batched(
+    client,
+    model: str,
+    texts: List[str],
+    batch_size: int,
+    max_batch_tokens: int
+) -> List[List[float]]:
+    """
+    Call the (Azure) OpenAI embeddings endpoint once per batch of texts.
+    
+    Returns one vector per input text, in input order.
+    """
+    embeddings: List[List[float]] = []
+    for batch in iter_embedding_batches(texts, batch_size, max_batch_tokens):
+        response = client.embeddings.create(input=batch, model=model)
+        # The API returns items with an index; don't rely on response ordering
+        data = sorted(response.data, key=lambda item: item.index)
+        if len(data) != len(batch):
+            raise ValueError(
+                f"Embedding API returned {len(data)} vectors for {len(batch)} inputs"
+            )
+        embeddings.extend(item.embedding for item in data)
+        logger.debug(f"Generated {len(batch)} embeddings in one request (model={model})")
+    return embeddings
+
 
 class EmbeddingProvider(Protocol):
     """Protocol for embedding providers."""
@@ -29,21 +111,48 @@ class EmbeddingProvider(Protocol):
             Exception: If embedding generation fails
         """
         ...
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for many texts.
+        
+        Implementations should send as few requests as their batch limits allow.
+        
+        Args:
+            texts: Input texts to embed
+            
+        Returns:
+            One embedding vector per input text, in input order
+            
+        Raises:
+            Exception: If embedding generation fails for any batch
+        """
+        ...
 
 
 class OpenAIEmbeddingProvider:
     """OpenAI embedding provider implementation."""
     
-    def __init__(self, api_key: str = None, model: str = "text-embedding-3-small"):
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS
+    ):
         """
         Initialize OpenAI embedding provider.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: Model name for embeddings
+            batch_size: Maximum texts per request in embed_batch()
+            max_batch_tokens: Maximum estimated tokens per request in embed_batch()
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
         
         if not self.api_key:
             raise ValueError("OpenAI API key not provided and OPENAI_API_KEY env var not set")
@@ -64,6 +173,18 @@ class OpenAIEmbeddingProvider:
         except Exception as e:
             logger.error(f"Failed to generate embedding for text '{text[:50]}...': {e}")
             raise
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for many texts using batched OpenAI API requests."""
+        if not texts:
+            return []
+        try:
+            return _create_embeddings_batched(
+                self.client, self.model, texts, self.batch_size, self.max_batch_tokens
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate batch embeddings for {len(texts)} texts: {e}")
+            raise
 
 
 class AzureOpenAIEmbeddingProvider:
@@ -74,7 +195,9 @@ class AzureOpenAIEmbeddingProvider:
         api_key: str = None,
         endpoint: str = None,
         deployment: str = None,
-        api_version: str = "2024-02-01"
+        api_version: str = "2024-02-01",
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS
     ):
         """
         Initialize Azure OpenAI embedding provider.
@@ -84,11 +207,15 @@ class AzureOpenAIEmbeddingProvider:
             endpoint: Azure OpenAI endpoint (defaults to AZURE_OPENAI_ENDPOINT env var)
             deployment: Deployment name (defaults to AZURE_OPENAI_EMBEDDING_DEPLOYMENT env var)
             api_version: API version
+            batch_size: Maximum texts per request in embed_batch()
+            max_batch_tokens: Maximum estimated tokens per request in embed_batch()
         """
         self.api_key = api_key or os.getenv("AZURE_OPENAI_API_KEY")
         self.endpoint = endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
         self.deployment = deployment or os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small")
         self.api_version = api_version
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
         
         if not self.api_key:
             raise ValueError("Azure OpenAI API key not provided and AZURE_OPENAI_API_KEY env var not set")
@@ -115,26 +242,91 @@ class AzureOpenAIEmbeddingProvider:
         except Exception as e:
             logger.error(f"Failed to generate embedding for text '{text[:50]}...': {e}")
             raise
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for many texts using batched Azure OpenAI API requests."""
+        if not texts:
+            return []
+        try:
+            return _create_embeddings_batched(
+                self.client, self.deployment, texts, self.batch_size, self.max_batch_tokens
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate batch embeddings for {len(texts)} texts: {e}")
+            raise
+
+
+class SimulatedRateLimitError(Exception):
+    """HTTP 429 raised by FakeEmbeddingProvider when rate limit injection is enabled."""
+    
+    status_code = 429
+    
+    def __init__(self, retry_after: float = 0.0):
+        super().__init__(f"Simulated 429 Too Many Requests (retry after {retry_after}s)")
+        self.retry_after = retry_after
 
 
 class FakeEmbeddingProvider:
     """Fake embedding provider for testing."""
     
-    def __init__(self, dimension: int = 1536, deterministic: bool = True):
+    def __init__(
+        self,
+        dimension: int = 1536,
+        deterministic: bool = True,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS,
+        latency_seconds: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        retry_after_seconds: float = 0.0,
+        seed: int = None
+    ):
         """
         Initialize fake embedding provider.
         
         Args:
             dimension: Embedding vector dimension
             deterministic: If True, same text always returns same embedding
+            batch_size: Maximum texts per simulated request in embed_batch()
+            max_batch_tokens: Maximum estimated tokens per simulated request
+            latency_seconds: Simulated network latency per request
+            rate_limit_probability: Chance (0-1) that a request fails with a simulated 429
+            retry_after_seconds: Retry-After hint carried by simulated 429s
+            seed: Seed for the 429 injection (None = random)
         """
         self.dimension = dimension
         self.deterministic = deterministic
+        self.model_name = f"fake-{dimension}" if deterministic else f"fake-random-{dimension}"
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.latency_seconds = latency_seconds
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after_seconds = retry_after_seconds
+        self.batch_calls = 0  # Simulated API requests made by embed_batch()
+        self.rate_limited_calls = 0  # Simulated 429 responses
         self._cache = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
         logger.info(f"Initialized fake embedding provider (dim={dimension}, deterministic={deterministic})")
     
     def embed(self, text: str) -> List[float]:
         """Generate fake embedding (for testing only)."""
+        self._simulate_request()
+        return self._fake_vector(text)
+    
+    def _simulate_request(self) -> None:
+        """Apply injected latency, then fail with a simulated 429 if the dice say so."""
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        if self.rate_limit_probability > 0:
+            with self._lock:
+                limited = self._random.random() < self.rate_limit_probability
+                if limited:
+                    self.rate_limited_calls += 1
+            if limited:
+                raise SimulatedRateLimitError(self.retry_after_seconds)
+    
+    def _fake_vector(self, text: str) -> List[float]:
+        """Deterministic (hash-based) or random vector for text."""
         if self.deterministic and text in self._cache:
             return self._cache[text]
         
@@ -153,6 +345,16 @@ class FakeEmbeddingProvider:
         
         logger.debug(f"Generated fake embedding for text: '{text[:50]}...' (dim={len(embedding)})")
         return embedding
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate fake embeddings, split into batches like the real providers."""
+        embeddings: List[List[float]] = []
+        for batch in iter_embedding_batches(texts, self.batch_size, self.max_batch_tokens):
+            with self._lock:
+                self.batch_calls += 1
+            self._simulate_request()
+            embeddings.extend(self._fake_vector(text) for text in batch)
+        return embeddings
 
 
 def create_embedding_provider(
@@ -163,7 +365,7 @@ def create_embedding_provider(
     Factory function to create embedding provider.
     
     Args:
-        provider_type: Type of provider ("openai", "azure_openai", "fake")
+        provider_type: Type of provider ("openai", "azure_openai", "local", "fake")
                       Defaults to EMBEDDING_PROVIDER env var or "azure_openai"
         **kwargs: Additional arguments for provider initialization
         
@@ -179,7 +381,28 @@ def create_embedding_provider(
         return OpenAIEmbeddingProvider(**kwargs)
     elif provider_type == "azure_openai":
         return AzureOpenAIEmbeddingProvider(**kwargs)
+    elif provider_type == "local":
+        from app.services.skill_resolution.local_embedding_provider import LocalNgramEmbeddingProvider
+        return LocalNgramEmbeddingProvider(**kwargs)
     elif provider_type == "fake":
         return FakeEmbeddingProvider(**kwargs)
     else:
         raise ValueError(f"Unknown embedding provider type: {provider_type}")
+
+
+def resolve_storage_model_name(provider: EmbeddingProvider) -> str:
+    """
+    model_name skill embeddings from this provider are stored and searched under.
+    
+    Unwraps caching/concurrency wrappers (anything with a .provider attribute).
+    Providers that declare their own model_name (local n-gram, fake) get their
+    own namespace; OpenAI/Azure store under DEFAULT_EMBEDDING_MODEL, since an
+    Azure deployment name says nothing about the model behind it.
+    """
+    # Instance __dict__ rather than getattr() so Mock providers aren't unwrapped forever
+    while getattr(provider, "__dict__", {}).get("provider") is not None:
+        provider = provider.__dict__["provider"]
+    if isinstance(provider, (OpenAIEmbeddingProvider, AzureOpenAIEmbeddingProvider)):
+        return DEFAULT_EMBEDDING_MODEL
+    model_name = getattr(provider, "model_name", None)
+    return model_name if isinstance(model_name, str) and model_name else DEFAULT_EMBEDDING_MODEL
@@ -0,0 +1,617 @@
+"""
+Concurrent, rate-limited embedding requests.
+
+ConcurrentEmbeddingProvider wraps any EmbeddingProvider and adds:
+1. Bounded concurrency: embed_batch() splits texts into requests and keeps
+   at most max_concurrency of them in flight
+2. Token-bucket rate limiting on requests/minute and (estimated) tokens/minute
+3. Retries with exponential backoff and full jitter on 429s, timeouts and 5xx
+4. A per-request timeout
+5. A circuit breaker: after repeated failures requests are rejected
+   immediately with EmbeddingCircuitOpenError, so resolvers fall back to
+   exact/alias matching instead of waiting on a degraded endpoint
+
+Limits are per deployment, so the rate limiter and circuit breaker are shared
+process-wide per model name (see get_shared_request_guard), as is the executor
+running provider calls under the request timeout (see get_shared_call_executor).
+
+Single Responsibility: Schedule embedding API requests within rate and health limits.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+from app.services.skill_resolution.embedding_provider import (
+    EmbeddingProvider,
+    create_embedding_provider,
+    estimate_tokens,
+    iter_embedding_batches,
+    DEFAULT_EMBEDDING_BATCH_TOKENS
+)
+from app.services.skill_resolution.query_embedding_cache import get_provider_model_name
+
+logger = logging.getLogger(__name__)
+
+# Texts per request. Smaller than the provider's own batch limit so one
+# SkillEmbeddingService batch (256 skills) fans out over several workers.
+DEFAULT_REQUEST_BATCH_SIZE = 64
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE_SECONDS = 0.5
+DEFAULT_BACKOFF_MAX_SECONDS = 30.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT_SECONDS = 30.0
+
+# Token buckets hold this many seconds' worth of the per-minute limit, so a
+# burst cannot spend a whole minute's quota at once
+BUCKET_BURST_SECONDS = 10.0
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class EmbeddingCircuitOpenError(RuntimeError):
+    """Raised instead of calling the provider while the circuit breaker is open."""
+
+
+class EmbeddingTimeoutError(TimeoutError):
+    """Raised when an embedding request exceeds the per-request timeout."""
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether an embedding error is transient (rate limit, timeout, connection, 5xx)."""
+    if isinstance(error, (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)):
+        return True
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Retry-After hint from an error (attribute or HTTP response header), if any."""
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("retry-after") if hasattr(headers, "get") else None
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class EmbeddingPoolConfig:
+    """Concurrency, rate limit and resilience settings for embedding requests."""
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    requests_per_minute: Optional[int] = None  # None = unlimited
+    tokens_per_minute: Optional[int] = None    # None = unlimited
+    request_batch_size: int = DEFAULT_REQUEST_BATCH_SIZE
+    request_timeout_seconds: Optional[float] = DEFAULT_REQUEST_TIMEOUT_SECONDS
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_base_seconds: float = DEFAULT_BACKOFF_BASE_SECONDS
+    backoff_max_seconds: float = DEFAULT_BACKOFF_MAX_SECONDS
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
+    reset_timeout_seconds: float = DEFAULT_RESET_TIMEOUT_SECONDS
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingPoolConfig":
+        """
+        Build config from environment variables.
+
+        EMBEDDING_MAX_CONCURRENCY, EMBEDDING_RPM, EMBEDDING_TPM,
+        EMBEDDING_REQUEST_BATCH_SIZE, EMBEDDING_REQUEST_TIMEOUT_SECONDS,
+        EMBEDDING_MAX_RETRIES, EMBEDDING_CIRCUIT_FAILURE_THRESHOLD,
+        EMBEDDING_CIRCUIT_RESET_SECONDS. RPM/TPM should match the Azure
+        deployment's quota; unset means no client-side limit.
+        """
+        def _int(name: str, default: Optional[int]) -> Optional[int]:
+            value = os.getenv(name)
+            return int(value) if value else default
+
+        def _float(name: str, default: Optional[float]) -> Optional[float]:
+            value = os.getenv(name)
+            return float(value) if value else default
+
+        return cls(
+            max_concurrency=_int("EMBEDDING_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+            requests_per_minute=_int("EMBEDDING_RPM", None),
+            tokens_per_minute=_int("EMBEDDING_TPM", None),
+            request_batch_size=_int("EMBEDDING_REQUEST_BATCH_SIZE", DEFAULT_REQUEST_BATCH_SIZE),
+            request_timeout_seconds=_float("EMBEDDING_REQUEST_TIMEOUT_SECONDS", DEFAULT_REQUEST_TIMEOUT_SECONDS),
+            max_retries=_int("EMBEDDING_MAX_RETRIES", DEFAULT_MAX_RETRIES),
+            failure_threshold=_int("EMBEDDING_CIRCUIT_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD),
+            reset_timeout_seconds=_float("EMBEDDING_CIRCUIT_RESET_SECONDS", DEFAULT_RESET_TIMEOUT_SECONDS)
+        )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at rate_per_minute.
+
+    Requests larger than the bucket capacity are clamped to the capacity,
+    so an oversized request waits for a full bucket instead of forever.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_minute: Refill rate
+            capacity: Maximum stored tokens (default: BUCKET_BURST_SECONDS worth, at least 1)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be > 0, got {rate_per_minute}")
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity or max(1.0, self.rate_per_second * BUCKET_BURST_SECONDS)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """
+        Take amount tokens if available.
+
+        Returns:
+            0.0 if acquired, otherwise the seconds to wait before enough tokens exist
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+            self._updated = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate_per_second
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Block until amount tokens are taken.
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(amount)
+            if wait <= 0:
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+
+class RateLimiter:
+    """
+    Requests/minute and tokens/minute limits for one deployment.
+
+    A 429 with a Retry-After hint pauses every caller sharing the limiter,
+    not only the worker that received it.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute, clock=clock, sleep=sleep) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute, clock=clock, sleep=sleep) if tokens_per_minute else None
+        self._clock = clock
+        self._sleep = sleep
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """
+        Block until one request of estimated_tokens may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        pause = self._paused_until - self._clock()
+        if pause > 0:
+            self._sleep(pause)
+            waited += pause
+        if self.request_bucket:
+            waited += self.request_bucket.acquire(1)
+        if self.token_bucket:
+            waited += self.token_bucket.acquire(estimated_tokens)
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for seconds (e.g. server Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed → open after failure_threshold consecutive failures; open rejects
+    every call until reset_timeout_seconds pass; then one trial call is let
+    through (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = DEFAULT_RESET_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._state == CIRCUIT_OPEN and self._clock() - self._opened_at >= self.reset_timeout_seconds:
+                return CIRCUIT_HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may go to the provider now."""
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return True
+            if self._state == CIRCUIT_OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout_seconds:
+                    return False
+                self._state = CIRCUIT_HALF_OPEN
+                self._trial_in_flight = False
+            # Half-open: exactly one trial call at a time
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CIRCUIT_CLOSED:
+                logger.info("✅ Embedding circuit closed (provider recovered)")
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """End a call without counting it either way (the error says nothing about provider health)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != CIRCUIT_OPEN:
+                    logger.warning(
+                        f"⚠️ Embedding circuit opened after {self._failures} consecutive failures; "
+                        f"embedding requests rejected for {self.reset_timeout_seconds:.0f}s"
+                    )
+                self._state = CIRCUIT_OPEN
+                self._opened_at = self._clock()
+
+
+# Process-wide (RateLimiter, CircuitBreaker) per model/deployment
+_shared_guards: Dict[str, Tuple[RateLimiter, CircuitBreaker]] = {}
+_shared_guards_lock = threading.Lock()
+
+
+def get_shared_request_guard(
+    model_name: str,
+    config: EmbeddingPoolConfig
+) -> Tuple[RateLimiter, CircuitBreaker]:
+    """Return the process-wide rate limiter and circuit breaker for a model (created on first use)."""
+    with _shared_guards_lock:
+        guard = _shared_guards.get(model_name)
+        if guard is None:
+            guard = (
+                RateLimiter(config.requests_per_minute, config.tokens_per_minute),
+                CircuitBreaker(config.failure_threshold, config.reset_timeout_seconds)
+            )
+            _shared_guards[model_name] = guard
+        return guard
+
+
+# Process-wide provider call executor per model/deployment
+_shared_call_executors: Dict[str, ThreadPoolExecutor] = {}
+
+
+def get_shared_call_executor(model_name: str, config: EmbeddingPoolConfig) -> ThreadPoolExecutor:
+    """Return the process-wide executor for timed provider calls of a model (created on first use)."""
+    with _shared_guards_lock:
+        executor = _shared_call_executors.get(model_name)
+        if executor is None:
+            executor = _new_call_executor(config)
+            _shared_call_executors[model_name] = executor
+        return executor
+
+
+def _new_call_executor(config: EmbeddingPoolConfig) -> ThreadPoolExecutor:
+    # Headroom for calls abandoned after a timeout
+    return ThreadPoolExecutor(
+        max_workers=max(1, config.max_concurrency) * 2,
+        thread_name_prefix="embedding-call"
+    )
+
+
+class ConcurrentEmbeddingProvider:
+    """
+    EmbeddingProvider wrapper that runs requests concurrently within rate limits.
+
+    embed() sends one request; embed_batch() splits texts into requests of
+    request_batch_size and runs up to max_concurrency of them at once.
+    Output order always matches input order. Each request is retried on
+    transient errors; if any request still fails, embed_batch() raises, so
+    callers keep their existing per-item fallback behaviour.
+
+    Timed-out requests cannot be cancelled: their worker thread finishes in
+    the background and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        config: Optional[EmbeddingPoolConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        call_executor: Optional[ThreadPoolExecutor] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize concurrent embedding provider.
+
+        Args:
+            provider: Underlying provider (OpenAI, Azure OpenAI, fake)
+            config: Concurrency/limit settings (defaults to EmbeddingPoolConfig())
+            rate_limiter: Limiter to use (default: built from config, not shared)
+            circuit_breaker: Breaker to use (default: built from config, not shared)
+            call_executor: Executor for timed provider calls (default: own one, created
+                on first use and shut down by close())
+            sleep: Sleep function for backoff (injectable for tests)
+            rng: Random source for backoff jitter
+        """
+        self.provider = provider
+        self.config = config or EmbeddingPoolConfig()
+        self.model_name = get_provider_model_name(provider)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            self.config.requests_per_minute, self.config.tokens_per_minute
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            self.config.failure_threshold, self.config.reset_timeout_seconds
+        )
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._call_executor = call_executor
+        self._owns_call_executor = call_executor is None
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'texts': 0,
+            'estimated_tokens': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'timeouts': 0,
+            'failures': 0,
+            'circuit_rejections': 0,
+            'rate_limit_wait_seconds': 0.0,
+            'busy_seconds': 0.0
+        }
+
+    @property
+    def is_available(self) -> bool:
+        """False while the circuit breaker is open (callers should skip the embedding layer)."""
+        return self.circuit_breaker.state != CIRCUIT_OPEN
+
+    def embed(self, text: str) -> List[float]:
+        """Embed one text (rate-limited, retried, circuit-protected)."""
+        start = time.perf_counter()
+        try:
+            return self._request([text], single=True)[0]
+        finally:
+            self._add_stat('busy_seconds', time.perf_counter() - start)
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts with up to max_concurrency requests in flight, in input order."""
+        if not texts:
+            return []
+        requests = list(iter_embedding_batches(
+            texts, self.config.request_batch_size, DEFAULT_EMBEDDING_BATCH_TOKENS
+        ))
+        start = time.perf_counter()
+        try:
+            if len(requests) == 1 or self.config.max_concurrency <= 1:
+                results = [self._request(batch) for batch in requests]
+            else:
+                workers = min(self.config.max_concurrency, len(requests))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embedding-worker") as executor:
+                    results = list(executor.map(self._request, requests))
+        finally:
+            elapsed = time.perf_counter() - start
+            self._add_stat('busy_seconds', elapsed)
+        logger.info(
+            f"Embedded {len(texts)} texts in {len(requests)} requests, {elapsed:.2f}s "
+            f"({len(texts) / elapsed if elapsed > 0 else 0:.0f} texts/s, "
+            f"concurrency={min(self.config.max_concurrency, len(requests))})"
+        )
+        return [vector for batch in results for vector in batch]
+
+    def throughput_report(self) -> Dict[str, float]:
+        """
+        Achieved throughput since creation.
+
+        Rates are over busy time (wall time spent inside embed/embed_batch),
+        so idle time between imports does not dilute them.
+        """
+        with self._lock:
+            stats = dict(self.stats)
+        busy = stats['busy_seconds']
+        stats['texts_per_second'] = stats['texts'] / busy if busy > 0 else 0.0
+        stats['requests_per_minute'] = stats['requests'] * 60.0 / busy if busy > 0 else 0.0
+        stats['tokens_per_minute'] = stats['estimated_tokens'] * 60.0 / busy if busy > 0 else 0.0
+        return stats
+
+    def close(self) -> None:
+        """
+        Shut down this wrapper's own request timeout executor.
+
+        Outstanding calls finish in the background; a shared executor is left running.
+        """
+        if not self._owns_call_executor:
+            return
+        with self._lock:
+            executor, self._call_executor = self._call_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _request(self, texts: List[str], single: bool = False) -> List[List[float]]:
+        """Send one request with rate limiting, timeout, retries and circuit breaking."""
+        tokens = sum(estimate_tokens(text) for text in texts)
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow_request():
+                self._add_stat('circuit_rejections', 1)
+                raise EmbeddingCircuitOpenError(
+                    f"Embedding circuit open for model '{self.model_name}'; request rejected"
+                )
+
+            self._add_stat('rate_limit_wait_seconds', self.rate_limiter.acquire(tokens))
+            self._add_stat('requests', 1)
+            try:
+                vectors = self._call_with_timeout(texts, single)
+            except Exception as e:
+                retryable = is_retryable_error(e)
+                if getattr(e, "status_code", None) == 429 or isinstance(e, RateLimitError):
+                    self._add_stat('rate_limited', 1)
+                if isinstance(e, EmbeddingTimeoutError):
+                    self._add_stat('timeouts', 1)
+                if not retryable:
+                    # Bad input, auth etc. - not a provider health problem, so the breaker state is kept
+                    self.circuit_breaker.release_trial()
+                    self._add_stat('failures', 1)
+                    raise
+                self.circuit_breaker.record_failure()
+                if attempt >= self.config.max_retries:
+                    self._add_stat('failures', 1)
+                    logger.warning(
+                        f"Embedding request failed after {attempt + 1} attempts "
+                        f"({len(texts)} texts): {type(e).__name__}: {str(e)}"
+                    )
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                attempt += 1
+                self._add_stat('retries', 1)
+                logger.debug(
+                    f"Retrying embedding request in {delay:.2f}s (attempt {attempt}/{self.config.max_retries}): "
+                    f"{type(e).__name__}"
+                )
+                self._sleep(delay)
+                continue
+
+            self.circuit_breaker.record_success()
+            self._add_stat('texts', len(texts))
+            self._add_stat('estimated_tokens', tokens)
+            return vectors
+
+    def _call_with_timeout(self, texts: List[str], single: bool) -> List[List[float]]:
+        """Call the provider, raising EmbeddingTimeoutError if it exceeds the request timeout."""
+        call = (lambda: [self.provider.embed(texts[0])]) if single else (lambda: self.provider.embed_batch(texts))
+        timeout = self.config.request_timeout_seconds
+        if not timeout:
+            return call()
+        future = self._get_call_executor().submit(call)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise EmbeddingTimeoutError(
+                f"Embedding request timed out after {timeout}s ({len(texts)} texts)"
+            ) from None
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """
+        Exponential backoff with full jitter, honouring Retry-After.
+
+        A Retry-After hint also pauses the shared rate limiter so other
+        workers back off too.
+        """
+        cap = min(self.config.backoff_max_seconds, self.config.backoff_base_seconds * (2 ** attempt))
+        delay = self._rng.uniform(0, cap)
+        retry_after = _retry_after_seconds(error)
+        if retry_after:
+            self.rate_limiter.pause(retry_after)
+            delay = max(delay, retry_after)
+        return delay
+
+    def _get_call_executor(self) -> ThreadPoolExecutor:
+        """Executor running provider calls so they can be timed out (created on first use)."""
+        with self._lock:
+            if self._call_executor is None:
+                self._call_executor = _new_call_executor(self.config)
+            return self._call_executor
+
+    def _add_stat(self, key: str, value: float) -> None:
+        with self._lock:
+            self.stats[key] += value
+
+
+def create_concurrent_embedding_provider(
+    provider_type: str = None,
+    config: Optional[EmbeddingPoolConfig] = None,
+    **kwargs
+) -> ConcurrentEmbeddingProvider:
+    """
+    Create an embedding provider wrapped in the concurrent, rate-limited layer.
+
+    The rate limiter, circuit breaker and call executor are shared by every
+    wrapper for the same model in this process, so concurrent imports respect
+    one quota, see one circuit state and need not close their wrappers.
+
+    Args:
+        provider_type: Passed to create_embedding_provider()
+        config: Pool settings (defaults to EmbeddingPoolConfig.from_env())
+        **kwargs: Provider constructor arguments
+
+    Returns:
+        ConcurrentEmbeddingProvider
+    """
+    provider = create_embedding_provider(provider_type, **kwargs)
+    config = config or EmbeddingPoolConfig.from_env()
+    model_name = get_provider_model_name(provider)
+    rate_limiter, circuit_breaker = get_shared_request_guard(model_name, config)
+    return ConcurrentEmbeddingProvider(
+        provider, config=config, rate_limiter=rate_limiter, circuit_breaker=circuit_breaker,
+        call_executor=get_shared_call_executor(model_name, config)
+    )
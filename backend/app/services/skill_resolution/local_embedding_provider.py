@@ -0,0 +1,185 @@
+"""
+Offline embedding provider: hashed character n-gram TF-IDF vectors.
+
+Builds fixed-size vectors with the hashing trick (no vocabulary, no model
+download, no network): every character n-gram of the padded, normalized text
+and every word is hashed (CRC32) into one of `dimension` signed buckets,
+weighted by sublinear term frequency and optionally by IDF fitted on a skill
+corpus, then L2-normalized. Cosine similarity between these vectors is a
+good fuzzy string similarity ("reactjs" ~ "react.js" ~ "react js"), which
+makes the provider useful for air-gapped imports, CI, and as a cheap
+pre-filter before paid embeddings.
+
+Vectors are stored in skill_embeddings under their own model_name
+("local-char-ngram-2-4-1536", plus an IDF digest when fitted), so they never
+mix with OpenAI embeddings.
+
+Single Responsibility: Turn text into deterministic hashed n-gram vectors.
+"""
+import hashlib
+import logging
+import math
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# skill_embeddings.embedding is vector(1536); use the same width so local
+# vectors can be stored and indexed alongside OpenAI ones
+DEFAULT_LOCAL_DIMENSION = 1536
+DEFAULT_NGRAM_RANGE = (2, 4)
+LOCAL_MODEL_PREFIX = "local-char-ngram"
+
+# Word tokens carry more signal than any single n-gram
+WORD_FEATURE_WEIGHT = 2.0
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join(text.lower().split())
+
+
+@lru_cache(maxsize=262_144)
+def _hash_feature(feature: str, dimension: int) -> Tuple[int, float]:
+    """Bucket and sign for a feature (CRC32 is stable across processes, unlike hash())."""
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % dimension, (1.0 if (h >> 31) & 1 == 0 else -1.0)
+
+
+def extract_features(text: str, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE) -> Counter:
+    """
+    Count character n-grams and word tokens of a text.
+
+    The text is padded with spaces so word boundaries become part of the
+    n-grams (" py", "on "). Word features are prefixed with "w:" so they
+    never collide with an n-gram of the same characters.
+    """
+    normalized = _normalize(text)
+    features: Counter = Counter()
+    if not normalized:
+        return features
+    padded = f" {normalized} "
+    min_n, max_n = ngram_range
+    for n in range(min_n, max_n + 1):
+        for i in range(len(padded) - n + 1):
+            features[padded[i:i + n]] += 1
+    for word in normalized.split():
+        features[f"w:{word}"] += WORD_FEATURE_WEIGHT
+    return features
+
+
+class LocalNgramEmbeddingProvider:
+    """
+    Deterministic, offline embedding provider based on hashed character n-grams.
+
+    Without fit_idf() every feature has IDF 1 (pure sublinear TF). After
+    fit_idf(corpus), frequent n-grams ("ing", " de") are down-weighted and
+    model_name gains a digest of the IDF table, so embeddings stored with
+    different IDF tables are never compared.
+    """
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_LOCAL_DIMENSION,
+        ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+        idf_weights: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize local n-gram embedding provider.
+
+        Args:
+            dimension: Vector width (hash buckets)
+            ngram_range: Inclusive (min_n, max_n) character n-gram sizes
+            idf_weights: Optional per-bucket IDF weights (length dimension)
+        """
+        if dimension < 1:
+            raise ValueError(f"dimension must be >= 1, got {dimension}")
+        if ngram_range[0] < 1 or ngram_range[0] > ngram_range[1]:
+            raise ValueError(f"Invalid ngram_range: {ngram_range}")
+        self.dimension = dimension
+        self.ngram_range = tuple(ngram_range)
+        self.idf_weights: Optional[np.ndarray] = None
+        if idf_weights is not None:
+            self._set_idf(np.asarray(idf_weights, dtype=np.float32))
+        logger.info(f"Initialized local n-gram embedding provider: {self.model_name}")
+
+    @property
+    def model_name(self) -> str:
+        """Storage/cache namespace; changes with dimension, n-gram range and IDF table."""
+        name = f"{LOCAL_MODEL_PREFIX}-{self.ngram_range[0]}-{self.ngram_range[1]}-{self.dimension}"
+        if self.idf_weights is not None:
+            digest = hashlib.md5(self.idf_weights.tobytes()).hexdigest()[:8]
+            name = f"{name}-idf{digest}"
+        return name
+
+    def fit_idf(self, corpus: Iterable[str]) -> "LocalNgramEmbeddingProvider":
+        """
+        Fit per-bucket IDF weights on a corpus (e.g. all skill names and aliases).
+
+        Uses smoothed IDF: log((1 + N) / (1 + df)) + 1.
+
+        Returns:
+            self (for chaining)
+        """
+        document_frequency = np.zeros(self.dimension, dtype=np.float64)
+        documents = 0
+        for text in corpus:
+            buckets = {
+                _hash_feature(feature, self.dimension)[0]
+                for feature in extract_features(text, self.ngram_range)
+            }
+            document_frequency[list(buckets)] += 1
+            documents += 1
+        idf = np.log((1.0 + documents) / (1.0 + document_frequency)) + 1.0
+        self._set_idf(idf.astype(np.float32))
+        logger.info(f"Fitted IDF on {documents} texts → {self.model_name}")
+        return self
+
+    def embed(self, text: str) -> List[float]:
+        """Embed one text."""
+        return self.embed_matrix([text])[0].tolist()
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts (one vectorized pass, no requests)."""
+        if not texts:
+            return []
+        return self.embed_matrix(texts).tolist()
+
+    def embed_matrix(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts into an L2-normalized float32 matrix (len(texts) x dimension).
+
+        Feature hashing and weighting are accumulated into flat index/weight
+        arrays and summed with a single np.bincount.
+        """
+        flat_indexes: List[int] = []
+        weights: List[float] = []
+        for row, text in enumerate(texts):
+            offset = row * self.dimension
+            for feature, count in extract_features(text, self.ngram_range).items():
+                bucket, sign = _hash_feature(feature, self.dimension)
+                flat_indexes.append(offset + bucket)
+                weights.append(sign * (1.0 + math.log(count)))
+
+        matrix = np.bincount(
+            np.asarray(flat_indexes, dtype=np.int64),
+            weights=np.asarray(weights, dtype=np.float64),
+            minlength=len(texts) * self.dimension
+        ).reshape(len(texts), self.dimension).astype(np.float32)
+
+        if self.idf_weights is not None:
+            matrix *= self.idf_weights
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _set_idf(self, idf_weights: np.ndarray) -> None:
+        if idf_weights.shape != (self.dimension,):
+            raise ValueError(
+                f"idf_weights must have shape ({self.dimension},), got {idf_weights.shape}"
+            )
+        self.idf_weights = idf_weights
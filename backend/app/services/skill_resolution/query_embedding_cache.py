@@ -0,0 +1,324 @@
+"""
+Two-tier cache for query (raw skill text) embeddings.
+
+Employee imports embed the same raw strings ("reactjs", "ms excel", "k8s")
+every time a workbook is re-imported. CachedEmbeddingProvider wraps any
+EmbeddingProvider and serves repeated texts from:
+1. An in-process LRU (shared across imports in the same worker)
+2. The persistent query_embedding_cache table (shared across restarts)
+Only texts missing from both tiers reach the underlying provider.
+
+The persistent tier uses its own short-lived sessions, committed
+immediately: rows written during an import survive the import rolling back,
+and the import's transaction never carries cache writes.
+
+Single Responsibility: Cache embeddings keyed by (model_name, normalized text hash).
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.query_embedding_cache import QueryEmbeddingCache
+from app.services.skill_resolution.embedding_provider import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+# In-process tier size (entries). 10k vectors of 1536 floats is ~120MB as
+# Python lists, which is the upper end of what we want to hold per worker.
+DEFAULT_MEMORY_CACHE_SIZE = 10_000
+
+# Persistent tier size (rows) before least-recently-used rows are evicted
+DEFAULT_PERSISTENT_CACHE_SIZE = 100_000
+
+# Run persistent eviction once per this many inserted rows
+EVICTION_CHECK_INTERVAL = 500
+
+# (model_name, text_hash)
+CacheKey = Tuple[str, str]
+
+
+def normalize_query_text(query: str) -> str:
+    """Normalize query text for caching: strip, lowercase, collapse whitespace."""
+    return " ".join(query.strip().lower().split())
+
+
+def compute_query_hash(normalized_text: str) -> str:
+    """SHA-256 hex digest of normalized query text."""
+    return hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+
+
+def get_provider_model_name(provider: EmbeddingProvider) -> str:
+    """
+    Best-effort model identifier for a provider, used to namespace cache keys.
+
+    Checks model_name, model (OpenAI) and deployment (Azure OpenAI) attributes,
+    falling back to the provider class name.
+    """
+    for attr in ("model_name", "model", "deployment"):
+        value = getattr(provider, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(provider).__name__
+
+
+class EmbeddingLRUCache:
+    """Thread-safe, size-bounded LRU mapping of CacheKey → embedding."""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_CACHE_SIZE):
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_entries: Maximum number of embeddings held (oldest evicted first)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[List[float]]:
+        """Return cached embedding and mark it most recently used, or None."""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, key: CacheKey, embedding: List[float]) -> None:
+        """Store embedding, evicting the least recently used entry if full."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared in-process tier so consecutive imports in one worker reuse vectors
+_shared_memory_cache = EmbeddingLRUCache(DEFAULT_MEMORY_CACHE_SIZE)
+
+
+def get_shared_memory_cache() -> EmbeddingLRUCache:
+    """Return the process-wide in-memory query embedding cache."""
+    return _shared_memory_cache
+
+
+class CachedEmbeddingProvider:
+    """
+    EmbeddingProvider wrapper that caches query embeddings in memory and in the DB.
+
+    Texts are normalized (strip, lowercase, collapse whitespace) before both
+    lookup and embedding, so the cached vector is exactly what the provider
+    would return for the key. Persistent-tier errors are logged and ignored:
+    the cache can make resolution faster but never makes it fail.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        db: Optional[Session] = None,
+        model_name: Optional[str] = None,
+        memory_cache: Optional[EmbeddingLRUCache] = None,
+        max_persistent_entries: int = DEFAULT_PERSISTENT_CACHE_SIZE,
+        session_factory: Optional[Callable[[], Session]] = None
+    ):
+        """
+        Initialize cached embedding provider.
+
+        Args:
+            provider: Underlying provider used on cache misses
+            db: Database session whose engine holds the persistent tier
+                (None = memory tier only); the tier never uses this session itself
+            model_name: Cache namespace (defaults to the provider's model name)
+            memory_cache: In-process LRU tier (defaults to the shared process cache)
+            max_persistent_entries: Row bound for the persistent tier
+            session_factory: Sessions for the persistent tier (default: new
+                sessions bound to db's engine)
+        """
+        self.provider = provider
+        self.db = db
+        if session_factory is None and db is not None:
+            session_factory = sessionmaker(bind=db.get_bind())
+        self._session_factory = session_factory
+        self.model_name = model_name or get_provider_model_name(provider)
+        self.memory_cache = memory_cache if memory_cache is not None else get_shared_memory_cache()
+        self.max_persistent_entries = max_persistent_entries
+        self._inserts_since_eviction = 0
+        self.stats = {
+            'memory_hits': 0,
+            'persistent_hits': 0,
+            'misses': 0
+        }
+
+    def embed(self, text: str) -> List[float]:
+        """Return embedding for text, calling the provider only on a cache miss."""
+        normalized = normalize_query_text(text)
+        text_hash = compute_query_hash(normalized)
+
+        embedding = self._lookup_cached({text_hash: normalized}).get(text_hash)
+        if embedding is not None:
+            return embedding
+
+        self.stats['misses'] += 1
+        embedding = self.provider.embed(normalized)
+        self._store({text_hash: (normalized, embedding)})
+        return embedding
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for texts, sending only uncached texts to the provider in one batch."""
+        normalized_by_hash: Dict[str, str] = {}
+        hashes: List[str] = []
+        for raw in texts:
+            normalized = normalize_query_text(raw)
+            text_hash = compute_query_hash(normalized)
+            normalized_by_hash[text_hash] = normalized
+            hashes.append(text_hash)
+
+        found = self._lookup_cached(normalized_by_hash)
+
+        missing = [h for h in normalized_by_hash if h not in found]
+        if missing:
+            self.stats['misses'] += len(missing)
+            vectors = self.provider.embed_batch([normalized_by_hash[h] for h in missing])
+            if len(vectors) != len(missing):
+                raise ValueError(
+                    f"Embedding provider returned {len(vectors)} vectors for {len(missing)} texts "
+                    f"(model '{self.model_name}')"
+                )
+            new_entries = {}
+            for text_hash, embedding in zip(missing, vectors):
+                found[text_hash] = embedding
+                new_entries[text_hash] = (normalized_by_hash[text_hash], embedding)
+            self._store(new_entries)
+
+        return [found[h] for h in hashes]
+
+    def _lookup_cached(self, normalized_by_hash: Dict[str, str]) -> Dict[str, List[float]]:
+        """Look up hashes in the memory tier, then the persistent tier. Returns hits only."""
+        found: Dict[str, List[float]] = {}
+        for text_hash in normalized_by_hash:
+            embedding = self.memory_cache.get((self.model_name, text_hash))
+            if embedding is not None:
+                found[text_hash] = embedding
+                self.stats['memory_hits'] += 1
+
+        remaining = [h for h in normalized_by_hash if h not in found]
+        if remaining and self._session_factory is not None:
+            for text_hash, embedding in self._load_persistent(remaining).items():
+                found[text_hash] = embedding
+                self.memory_cache.put((self.model_name, text_hash), embedding)
+                self.stats['persistent_hits'] += 1
+
+        return found
+
+    def _load_persistent(self, text_hashes: List[str]) -> Dict[str, List[float]]:
+        """Fetch cached rows and bump their LRU stamp with one UPDATE (own session, committed)."""
+        session = self._session_factory()
+        try:
+            rows = session.query(QueryEmbeddingCache.text_hash, QueryEmbeddingCache.embedding).filter(
+                QueryEmbeddingCache.model_name == self.model_name,
+                QueryEmbeddingCache.text_hash.in_(text_hashes)
+            ).all()
+            loaded = {text_hash: [float(v) for v in embedding] for text_hash, embedding in rows}
+            if loaded:
+                session.execute(
+                    update(QueryEmbeddingCache)
+                    .where(
+                        QueryEmbeddingCache.model_name == self.model_name,
+                        QueryEmbeddingCache.text_hash.in_(list(loaded))
+                    )
+                    .values(last_used_at=datetime.utcnow(), hit_count=QueryEmbeddingCache.hit_count + 1)
+                )
+                session.commit()
+            return loaded
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Query embedding cache lookup failed: {type(e).__name__}: {str(e)}")
+            return {}
+        finally:
+            session.close()
+
+    def _store(self, entries: Dict[str, Tuple[str, List[float]]]) -> None:
+        """Store new embeddings in both tiers."""
+        for text_hash, (_, embedding) in entries.items():
+            self.memory_cache.put((self.model_name, text_hash), embedding)
+
+        if self._session_factory is None or not entries:
+            return
+
+        rows = [
+            {
+                'model_name': self.model_name,
+                'text_hash': text_hash,
+                'query_text': normalized,
+                'embedding': embedding
+            }
+            for text_hash, (normalized, embedding) in entries.items()
+        ]
+        session = self._session_factory()
+        try:
+            session.execute(
+                pg_insert(QueryEmbeddingCache)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=['model_name', 'text_hash'])
+            )
+            self._inserts_since_eviction += len(rows)
+            if self._inserts_since_eviction >= EVICTION_CHECK_INTERVAL:
+                self._evict(session)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Query embedding cache write failed: {type(e).__name__}: {str(e)}")
+        finally:
+            session.close()
+
+    def evict_persistent(self) -> int:
+        """
+        Delete least recently used rows beyond max_persistent_entries.
+
+        Returns:
+            Number of rows deleted
+        """
+        session = self._session_factory()
+        try:
+            deleted = self._evict(session)
+            session.commit()
+            return deleted
+        finally:
+            session.close()
+
+    def _evict(self, session: Session) -> int:
+        """Run the eviction DELETE on session (caller commits)."""
+        self._inserts_since_eviction = 0
+        result = session.execute(
+            text("""
+                DELETE FROM query_embedding_cache
+                WHERE (model_name, text_hash) IN (
+                    SELECT model_name, text_hash
+                    FROM query_embedding_cache
+                    ORDER BY last_used_at DESC
+                    OFFSET :max_entries
+                )
+            """),
+            {'max_entries': self.max_persistent_entries}
+        )
+        deleted = result.rowcount or 0
+        if deleted:
+            logger.info(f"Evicted {deleted} least recently used query embeddings from cache")
+        return deleted
@@ -0,0 +1,242 @@
+"""
+Durable cross-import memo of skill resolution outcomes.
+
+Every employee import resolves the same raw skill strings again. The memo
+stores normalized_text → (skill_id, method, confidence) in
+skill_resolution_memo, tagged with the taxonomy version the outcome was
+computed against. SkillResolverService.resolve_many() consults it before any
+resolution layer, so a repeat import of an unchanged workbook against an
+unchanged taxonomy resolves nothing.
+
+Invalidation is version based: bump_taxonomy_version() is called in the same
+transaction as any change to skills or aliases (taxonomy update APIs, master
+import). Lookups only return rows recorded against the current version, and
+the bump purges older rows.
+
+Single Responsibility: Persist and look up resolution outcomes per taxonomy version.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.skill_resolution_memo import SkillResolutionMemo
+from app.models.taxonomy_version import TaxonomyVersion
+
+logger = logging.getLogger(__name__)
+
+# Single row in taxonomy_version
+TAXONOMY_VERSION_ID = 1
+
+# Bound IN-lists and multi-row VALUES
+MEMO_CHUNK_SIZE = 1000
+
+# resolver_key of a resolver without embedding layers
+EXACT_ALIAS_RESOLVER_KEY = "exact-alias"
+
+# (resolved_skill_id, resolution_method, resolution_confidence)
+MemoEntry = Tuple[Optional[int], str, Optional[float]]
+
+
+def get_taxonomy_version(db: Session) -> int:
+    """
+    Current taxonomy version (0 if the counter row does not exist yet).
+    """
+    version = db.query(TaxonomyVersion.version).filter(
+        TaxonomyVersion.version_id == TAXONOMY_VERSION_ID
+    ).scalar()
+    return int(version) if version is not None else 0
+
+
+def bump_taxonomy_version(db: Session) -> int:
+    """
+    Increment the taxonomy version and purge memo rows of older versions.
+
+    Does not commit: call it before the commit of the transaction that
+    changes skills or aliases, so the bump and the change land together.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        New taxonomy version
+    """
+    new_version = db.execute(
+        pg_insert(TaxonomyVersion)
+        .values(version_id=TAXONOMY_VERSION_ID, version=1)
+        .on_conflict_do_update(
+            index_elements=['version_id'],
+            set_={'version': TaxonomyVersion.version + 1, 'updated_at': func.now()}
+        )
+        .returning(TaxonomyVersion.version)
+    ).scalar()
+    current_version = select(TaxonomyVersion.version).where(
+        TaxonomyVersion.version_id == TAXONOMY_VERSION_ID
+    ).scalar_subquery()
+    db.execute(
+        delete(SkillResolutionMemo).where(SkillResolutionMemo.taxonomy_version < current_version)
+    )
+    logger.info(f"Taxonomy version bumped to {new_version}; resolution memo invalidated")
+    return new_version
+
+
+def build_resolver_key(
+    embedding_model_name: Optional[str] = None,
+    prefilter_model_name: Optional[str] = None,
+    prefilter_accept_threshold: Optional[float] = None
+) -> str:
+    """
+    Namespace for memo rows, naming the layers that produced an outcome.
+
+    Args:
+        embedding_model_name: Model searched by the embedding layer (None if disabled)
+        prefilter_model_name: Model of the local pre-filter (None if not configured)
+        prefilter_accept_threshold: Pre-filter auto-accept threshold
+
+    Returns:
+        e.g. "exact-alias", "embedding:text-embedding-3-small",
+        "embedding:text-embedding-3-small+prefilter:local-char-ngram-2-4-1536@0.95"
+    """
+    parts = [f"embedding:{embedding_model_name}"] if embedding_model_name else [EXACT_ALIAS_RESOLVER_KEY]
+    if prefilter_model_name:
+        parts.append(f"prefilter:{prefilter_model_name}@{prefilter_accept_threshold}")
+    return "+".join(parts)
+
+
+class ResolutionMemo:
+    """
+    Bulk lookup/store of memoized resolution outcomes for one resolver_key.
+
+    lookup() remembers the taxonomy version it read; store() records outcomes
+    against that version, so outcomes computed while the taxonomy changed
+    underneath are recorded as already stale rather than as current.
+
+    Failures are logged and swallowed (inside savepoints): the memo is an
+    optimization and must never fail an import.
+    """
+
+    def __init__(self, db: Session, resolver_key: str):
+        """
+        Initialize resolution memo.
+
+        Args:
+            db: SQLAlchemy database session
+            resolver_key: Namespace from build_resolver_key()
+        """
+        self.db = db
+        self.resolver_key = resolver_key
+        self.taxonomy_version: Optional[int] = None
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stored': 0
+        }
+
+    def lookup(self, texts: Iterable[str]) -> Dict[str, MemoEntry]:
+        """
+        Fetch current-version outcomes for texts and bump their usage counters.
+
+        Args:
+            texts: Normalized skill texts
+
+        Returns:
+            Dict of text → MemoEntry for memo hits only
+        """
+        distinct = list(dict.fromkeys(texts))
+        found: Dict[str, MemoEntry] = {}
+        if not distinct:
+            return found
+
+        try:
+            with self.db.begin_nested():
+                self.taxonomy_version = get_taxonomy_version(self.db)
+                for chunk in _chunks(distinct):
+                    rows = self.db.query(
+                        SkillResolutionMemo.normalized_text,
+                        SkillResolutionMemo.resolved_skill_id,
+                        SkillResolutionMemo.resolution_method,
+                        SkillResolutionMemo.resolution_confidence
+                    ).filter(
+                        SkillResolutionMemo.resolver_key == self.resolver_key,
+                        SkillResolutionMemo.taxonomy_version == self.taxonomy_version,
+                        SkillResolutionMemo.normalized_text.in_(chunk)
+                    ).all()
+                    for text, skill_id, method, confidence in rows:
+                        found[text] = (skill_id, method, confidence)
+
+                    hit_texts = [text for text in chunk if text in found]
+                    if hit_texts:
+                        self.db.execute(
+                            update(SkillResolutionMemo)
+                            .where(
+                                SkillResolutionMemo.resolver_key == self.resolver_key,
+                                SkillResolutionMemo.normalized_text.in_(hit_texts)
+                            )
+                            .values(
+                                hit_count=SkillResolutionMemo.hit_count + 1,
+                                last_used_at=func.now()
+                            )
+                        )
+        except Exception as e:
+            logger.warning(f"Resolution memo lookup failed: {type(e).__name__}: {str(e)}")
+            return {}
+
+        self.stats['hits'] += len(found)
+        self.stats['misses'] += len(distinct) - len(found)
+        return found
+
+    def store(self, entries: Dict[str, MemoEntry]) -> int:
+        """
+        Upsert outcomes under the taxonomy version read by the last lookup().
+
+        Args:
+            entries: Dict of normalized text → MemoEntry
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not entries:
+            return 0
+
+        try:
+            with self.db.begin_nested():
+                if self.taxonomy_version is None:
+                    self.taxonomy_version = get_taxonomy_version(self.db)
+                rows = [
+                    {
+                        'resolver_key': self.resolver_key,
+                        'normalized_text': text,
+                        'resolved_skill_id': skill_id,
+                        'resolution_method': method,
+                        'resolution_confidence': confidence,
+                        'taxonomy_version': self.taxonomy_version
+                    }
+                    for text, (skill_id, method, confidence) in entries.items()
+                ]
+                for chunk in _chunks(rows):
+                    stmt = pg_insert(SkillResolutionMemo).values(chunk)
+                    self.db.execute(
+                        stmt.on_conflict_do_update(
+                            index_elements=['resolver_key', 'normalized_text'],
+                            set_={
+                                'resolved_skill_id': stmt.excluded.resolved_skill_id,
+                                'resolution_method': stmt.excluded.resolution_method,
+                                'resolution_confidence': stmt.excluded.resolution_confidence,
+                                'taxonomy_version': stmt.excluded.taxonomy_version,
+                                'last_used_at': func.now()
+                            }
+                        )
+                    )
+        except Exception as e:
+            logger.warning(f"Resolution memo write failed: {type(e).__name__}: {str(e)}")
+            return 0
+
+        self.stats['stored'] += len(rows)
+        return len(rows)
+
+
+def _chunks(items: List, size: int = MEMO_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -1,30 +1,50 @@
 """
 Skill embedding repository for vector similarity search.
 
-Provides database access for skill embeddings with pgvector similarity search.
+Provides database access for skill embeddings with pgvector similarity search,
+or in-process NumPy search when a SkillVectorIndex is supplied. Candidates
+from a compact (truncated/quantized) index are rescored against the
+full-precision stored vectors.
 """
 import logging
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from datetime import datetime
+import numpy as np
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.skill_embedding import SkillEmbedding
+from app.services.skill_resolution.skill_vector_index import SkillVectorIndex, cosine_to_similarity
 
 logger = logging.getLogger(__name__)
 
+# find_top_k search modes
+SEARCH_MODE_EXACT = "exact"
+SEARCH_MODE_APPROXIMATE = "approximate"
+SEARCH_MODES = (SEARCH_MODE_EXACT, SEARCH_MODE_APPROXIMATE)
+
+# Max IDs per IN (...) list when reading versions
+VERSION_LOOKUP_CHUNK_SIZE = 5000
+
+# Max rows per multi-row INSERT (each row carries a full vector)
+BULK_UPSERT_CHUNK_SIZE = 500
+
 
 class SkillEmbeddingRepository:
     """Repository for skill embedding vector similarity search."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, vector_index: Optional[SkillVectorIndex] = None):
         """
         Initialize skill embedding repository.
         
         Args:
             db: SQLAlchemy database session
+            vector_index: Optional in-process index; when set, similarity search
+                          runs in NumPy instead of pgvector SQL
         """
         self.db = db
+        self.vector_index = vector_index
     
     def get_by_skill_and_model(
         self,
@@ -89,6 +109,7 @@ class SkillEmbeddingRepository:
                     f"Embedding updated: skill_id={skill_id}, model={model_name}, "
                     f"version={embedding_version}"
                 )
+                self._mark_index_stale()
                 return existing
             else:
                 # Insert new
@@ -105,6 +126,7 @@ class SkillEmbeddingRepository:
                     f"Embedding inserted: skill_id={skill_id}, model={model_name}, "
                     f"version={embedding_version}"
                 )
+                self._mark_index_stale()
                 return new_embedding
                 
         except Exception as e:
@@ -113,11 +135,92 @@ class SkillEmbeddingRepository:
             )
             raise
     
+    def get_versions_for_skills(
+        self,
+        skill_ids: List[int],
+        model_name: str
+    ) -> Dict[int, Optional[str]]:
+        """
+        Get embedding_version for many skills in one query (chunked for very large lists).
+        
+        Args:
+            skill_ids: Skill IDs to look up
+            model_name: Model name
+            
+        Returns:
+            Dict of skill_id → embedding_version for skills that have an embedding
+        """
+        versions: Dict[int, Optional[str]] = {}
+        try:
+            for start in range(0, len(skill_ids), VERSION_LOOKUP_CHUNK_SIZE):
+                chunk = skill_ids[start:start + VERSION_LOOKUP_CHUNK_SIZE]
+                rows = self.db.query(
+                    SkillEmbedding.skill_id,
+                    SkillEmbedding.embedding_version
+                ).filter(
+                    SkillEmbedding.skill_id.in_(chunk),
+                    SkillEmbedding.model_name == model_name
+                ).all()
+                versions.update({skill_id: version for skill_id, version in rows})
+            return versions
+        except Exception as e:
+            logger.error(f"Failed to get embedding versions for {len(skill_ids)} skills, model={model_name}: {e}")
+            raise
+    
+    def bulk_upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update many skill embeddings with multi-row INSERT ... ON CONFLICT.
+        
+        Args:
+            rows: Dicts with skill_id, model_name, embedding, embedding_version
+                  and optional updated_at (defaults to now)
+            
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        
+        now = datetime.utcnow()
+        values = [
+            {
+                'skill_id': row['skill_id'],
+                'model_name': row['model_name'],
+                'embedding': row['embedding'],
+                'embedding_version': row['embedding_version'],
+                'updated_at': row.get('updated_at') or now
+            }
+            for row in rows
+        ]
+        
+        try:
+            for start in range(0, len(values), BULK_UPSERT_CHUNK_SIZE):
+                stmt = pg_insert(SkillEmbedding).values(values[start:start + BULK_UPSERT_CHUNK_SIZE])
+                # skill_embeddings is keyed by (skill_id, model_name)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[SkillEmbedding.skill_id, SkillEmbedding.model_name],
+                    set_={
+                        'embedding': stmt.excluded.embedding,
+                        'embedding_version': stmt.excluded.embedding_version,
+                        'updated_at': stmt.excluded.updated_at
+                    }
+                )
+                self.db.execute(stmt)
+            self._mark_index_stale()
+            logger.debug(f"Bulk upserted {len(values)} embeddings")
+            return len(values)
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert {len(values)} embeddings: {e}")
+            raise
+    
     def find_top_k(
         self,
         query_vector: List[float],
         k: int = 5,
-        model_name: str = None
+        model_name: str = None,
+        search_mode: str = SEARCH_MODE_EXACT,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
     ) -> List[Tuple[int, float]]:
         """
         Find top K most similar skills using cosine similarity.
@@ -126,6 +229,11 @@ class SkillEmbeddingRepository:
             query_vector: Query embedding vector
             k: Number of top matches to return
             model_name: Optional filter by model name
+            search_mode: "exact" (full scan, guaranteed top-k; served by the
+                         in-process vector index when one is set) or "approximate"
+                         (SQL using the model's HNSW/IVFFlat index if one exists)
+            ef_search: HNSW candidate list size for approximate search (higher = better recall)
+            probes: IVFFlat lists probed for approximate search (higher = better recall)
             
         Returns:
             List of tuples (skill_id, similarity_score) ordered by similarity (highest first)
@@ -134,32 +242,60 @@ class SkillEmbeddingRepository:
         Note:
             pgvector's <=> operator returns cosine distance (0 = identical, 2 = opposite)
             We convert to similarity: similarity = 1 - (distance / 2)
+            The in-process vector index uses the same scale and stands in for
+            exact search; approximate searches always go to SQL.
         """
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search_mode: {search_mode} (expected one of {SEARCH_MODES})")
+        
+        if search_mode == SEARCH_MODE_EXACT and self._uses_index(model_name):
+            matches = self._search_index([query_vector], k)[0]
+            logger.debug(f"Found {len(matches)} embedding matches (top-{k}, in-process index)")
+            return matches
+        
         try:
+            params = {"query_vector": str(query_vector)}
+            
+            if search_mode == SEARCH_MODE_APPROXIMATE:
+                # Transaction-local ANN tuning; only affects hnsw/ivfflat scans
+                if ef_search is not None:
+                    self.db.execute(
+                        text("SELECT set_config('hnsw.ef_search', :value, true)"),
+                        {"value": str(int(ef_search))}
+                    )
+                if probes is not None:
+                    self.db.execute(
+                        text("SELECT set_config('ivfflat.probes', :value, true)"),
+                        {"value": str(int(probes))}
+                    )
+                # Must match the index operator exactly for the planner to use it
+                order_by = "embedding <=> CAST(:query_vector AS vector)"
+            else:
+                # "+ 0" stops the planner from using an ANN index, forcing an exact scan
+                order_by = "(embedding <=> CAST(:query_vector AS vector)) + 0"
+            
             # Build query using pgvector cosine distance operator
             # <=> is cosine distance operator (0 = identical, 2 = opposite)
             query_str = """
                 SELECT 
                     skill_id,
-                    1 - (embedding <=> :query_vector::vector) / 2 AS similarity
+                    1 - (embedding <=> CAST(:query_vector AS vector)) / 2 AS similarity
                 FROM skill_embeddings
             """
             
-            params = {"query_vector": str(query_vector)}
-            
-            # Add model filter if specified
+            # Add model filter if specified (ANN indexes are partial per model_name)
             if model_name:
                 query_str += " WHERE model_name = :model_name"
                 params["model_name"] = model_name
             
             # Order by similarity (highest first) and limit
-            query_str += " ORDER BY embedding <=> :query_vector::vector LIMIT :k"
+            query_str += f" ORDER BY {order_by} LIMIT :k"
             params["k"] = k
             
             result = self.db.execute(text(query_str), params)
             matches = [(row[0], float(row[1])) for row in result]
             
-            logger.debug(f"Found {len(matches)} embedding matches (top-{k})")
+            logger.debug(f"Found {len(matches)} embedding matches (top-{k}, {search_mode})")
             if matches:
                 logger.debug(f"Top match: skill_id={matches[0][0]}, similarity={matches[0][1]:.4f}")
             
@@ -169,6 +305,119 @@ class SkillEmbeddingRepository:
             logger.error(f"Failed to find similar embeddings: {e}")
             raise
     
+    def find_top_k_batch(
+        self,
+        query_vectors: List[List[float]],
+        k: int = 5,
+        model_name: str = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Find top K most similar skills for several query vectors.
+        
+        With a vector index all queries are scored in one matrix product
+        (and, for a compact index, rescored with one embedding fetch);
+        otherwise falls back to one find_top_k() query per vector.
+        
+        Args:
+            query_vectors: Query embedding vectors
+            k: Number of top matches per query
+            model_name: Optional filter by model name
+            
+        Returns:
+            One list of (skill_id, similarity_score) per query vector, in input order
+        """
+        if self._uses_index(model_name):
+            return self._search_index(query_vectors, k)
+        return [self.find_top_k(vector, k=k, model_name=model_name) for vector in query_vectors]
+    
+    def find_most_similar(
+        self,
+        embedding: List[float],
+        model_name: str = None,
+        limit: int = 1,
+        min_similarity: float = 0.0
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the most similar skills at or above a similarity floor.
+        
+        Args:
+            embedding: Query embedding vector
+            model_name: Optional filter by model name
+            limit: Maximum number of matches
+            min_similarity: Minimum similarity score to include
+            
+        Returns:
+            List of (skill_id, similarity_score) ordered by similarity (highest first)
+        """
+        matches = self.find_top_k(embedding, k=limit, model_name=model_name)
+        return [(skill_id, similarity) for skill_id, similarity in matches if similarity >= min_similarity]
+    
+    def _search_index(self, query_vectors: List[List[float]], k: int) -> List[List[Tuple[int, float]]]:
+        """Search the vector index, rescoring candidates of a compact index at full precision."""
+        index = self.vector_index
+        index.ensure_fresh(self.db)
+        if not index.is_compact or index.rescore_multiplier <= 0:
+            return index.search_batch(query_vectors, k=k)
+        candidates = index.search_batch(query_vectors, k=k * index.rescore_multiplier)
+        return self._rescore(query_vectors, candidates, k)
+    
+    def _rescore(
+        self,
+        query_vectors: List[List[float]],
+        candidates: List[List[Tuple[int, float]]],
+        k: int
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Re-rank approximate candidates by exact cosine against the stored vectors.
+        
+        All candidate embeddings are fetched in one query. If the fetch fails
+        the approximate ranking is returned (truncated to k).
+        """
+        candidate_ids = sorted({skill_id for matches in candidates for skill_id, _ in matches})
+        if not candidate_ids:
+            return [[] for _ in query_vectors]
+        try:
+            rows = self.db.query(SkillEmbedding.skill_id, SkillEmbedding.embedding).filter(
+                SkillEmbedding.model_name == self.vector_index.model_name,
+                SkillEmbedding.skill_id.in_(candidate_ids)
+            ).all()
+        except Exception as e:
+            logger.warning(f"Rescoring fetch failed, using approximate scores: {e}")
+            return [matches[:k] for matches in candidates]
+        
+        vectors = {int(skill_id): np.asarray(embedding, dtype=np.float32) for skill_id, embedding in rows}
+        results = []
+        for query, matches in zip(query_vectors, candidates):
+            ids = [skill_id for skill_id, _ in matches if skill_id in vectors]
+            if not ids:
+                results.append([])
+                continue
+            query = np.asarray(query, dtype=np.float32)
+            stored = np.stack([vectors[skill_id] for skill_id in ids])
+            norms = np.linalg.norm(stored, axis=1) * (np.linalg.norm(query) or 1.0)
+            norms[norms == 0] = 1.0
+            similarities = cosine_to_similarity((stored @ query / norms).astype(np.float64))
+            order = np.argsort(-similarities, kind="stable")[:k]
+            results.append([(ids[i], float(similarities[i])) for i in order])
+        return results
+    
+    def _uses_index(self, model_name: Optional[str]) -> bool:
+        """Whether searches for model_name can be served by the vector index."""
+        if self.vector_index is None:
+            return False
+        if model_name is not None and model_name != self.vector_index.model_name:
+            logger.debug(
+                f"Vector index is for model={self.vector_index.model_name}, "
+                f"falling back to SQL for model={model_name}"
+            )
+            return False
+        return True
+    
+    def _mark_index_stale(self) -> None:
+        """Tell the vector index an embedding was written so the next search refreshes it."""
+        if self.vector_index is not None:
+            self.vector_index.mark_stale()
+    
     def get_embedding_count(self) -> int:
         """
         Get total count of skill embeddings in database.
@@ -9,12 +9,18 @@ import hashlib
 import time
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from dataclasses import dataclass, field
 
 from app.models.skill import Skill
-from app.services.skill_resolution.embedding_provider import EmbeddingProvider
+from app.models.subcategory import SkillSubcategory
+from app.services.skill_resolution.embedding_provider import (
+    EmbeddingProvider,
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    DEFAULT_EMBEDDING_MODEL
+)
 from app.services.skill_resolution.skill_embedding_repository import SkillEmbeddingRepository
+from app.services.skill_resolution.skill_vector_index import get_shared_vector_index
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +48,9 @@ class SkillEmbeddingService:
         db: Session,
         embedding_provider: EmbeddingProvider,
         embedding_repository: SkillEmbeddingRepository = None,
-        model_name: str = "text-embedding-3-small",
-        embedding_version: str = "v1"
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        embedding_version: str = "v1",
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE
     ):
         """
         Initialize skill embedding service.
@@ -51,15 +58,20 @@ class SkillEmbeddingService:
         Args:
             db: Database session
             embedding_provider: Provider for generating embeddings
-            embedding_repository: Repository for DB operations (auto-created if None)
+            embedding_repository: Repository for DB operations (auto-created if None,
+                                  bound to the shared vector index so upserts refresh it)
             model_name: Model name to use for embeddings
             embedding_version: Version string for embeddings
+            batch_size: Number of skills embedded per provider.embed_batch() call
         """
         self.db = db
         self.embedding_provider = embedding_provider
-        self.embedding_repository = embedding_repository or SkillEmbeddingRepository(db)
+        self.embedding_repository = embedding_repository or SkillEmbeddingRepository(
+            db, vector_index=get_shared_vector_index(model_name)
+        )
         self.model_name = model_name
         self.embedding_version = embedding_version
+        self.batch_size = max(1, batch_size)
     
     def ensure_embeddings_for_skill_ids(
         self,
@@ -71,6 +83,13 @@ class SkillEmbeddingService:
         """
         Ensure embeddings exist for given skill IDs (batch operation).
         
+        Skills needing an embedding are sent to the provider in batches of
+        batch_size via embed_batch(), so a master import of thousands of skills
+        takes a handful of API requests.
+        
+        Staleness is checked with a single version query for all skills, and
+        each batch is written with one multi-row upsert.
+        
         Only generates embeddings for skills that need them:
         - No existing embedding
         - Embedding version/model mismatch
@@ -93,8 +112,10 @@ class SkillEmbeddingService:
         
         logger.info(f"Ensuring embeddings for {len(skill_ids)} skills")
         
-        # Fetch all skills in one query
-        skills = self.db.query(Skill).filter(Skill.skill_id.in_(skill_ids)).all()
+        # Fetch all skills in one query, with the subcategory/category the embedding text uses
+        skills = self.db.query(Skill).options(
+            joinedload(Skill.subcategory).joinedload(SkillSubcategory.category)
+        ).filter(Skill.skill_id.in_(skill_ids)).all()
         skill_map = {skill.skill_id: skill for skill in skills}
         
         # Progress tracking
@@ -104,7 +125,11 @@ class SkillEmbeddingService:
         last_progress_count = 0
         progress_range = progress_end - progress_start
         
-        # Process each skill
+        # Pass 1: one query for existing versions, diffed in memory against name hashes
+        existing_versions = self.embedding_repository.get_versions_for_skills(
+            list(skill_map.keys()), self.model_name
+        )
+        pending: List[Skill] = []
         for skill_id in skill_ids:
             skill = skill_map.get(skill_id)
             if not skill:
@@ -112,51 +137,36 @@ class SkillEmbeddingService:
                 processed_count += 1
                 continue
             
-            try:
-                # Check if embedding needed
-                if self._is_embedding_up_to_date(skill):
-                    logger.debug(f"Embedding skipped (up-to-date): skill_id={skill_id}, skill_name='{skill.skill_name}'")
-                    result.skipped.append(skill_id)
-                    processed_count += 1
-                else:
-                    # Generate and save embedding
-                    success = self._generate_and_save_embedding(skill)
-                    processed_count += 1
-                    
-                    if success:
-                        logger.info(f"Embedding upserted: skill_id={skill_id}, skill_name='{skill.skill_name}', model={self.model_name}, version={self.embedding_version}")
-                        result.succeeded.append(skill_id)
-                    else:
-                        result.failed.append({
-                            'skill_id': skill_id,
-                            'skill_name': skill.skill_name,
-                            'error': 'Unknown error'
-                        })
-                
-                # Throttled progress update
-                if progress_callback:
-                    elapsed = time.time() - last_progress_time
-                    count_since_last = processed_count - last_progress_count
-                    
-                    if elapsed >= EMBEDDING_PROGRESS_MIN_INTERVAL_SECONDS or count_since_last >= EMBEDDING_PROGRESS_MIN_COUNT:
-                        percent = progress_start + int((processed_count / total_skills) * progress_range)
-                        progress_callback(percent, f"Generating embeddings... ({processed_count} / {total_skills})")
-                        last_progress_time = time.time()
-                        last_progress_count = processed_count
-                        logger.debug(f"[EMBEDDING] Progress update: {percent}% | {processed_count}/{total_skills}")
-                    
-            except Exception as e:
+            if existing_versions.get(skill_id) == self._expected_version(skill):
+                logger.debug(f"Embedding skipped (up-to-date): skill_id={skill_id}, skill_name='{skill.skill_name}'")
+                result.skipped.append(skill_id)
                 processed_count += 1
-                # Log warning but continue processing
-                logger.warning(
-                    f"Embedding failed: skill_id={skill_id}, skill_name='{skill.skill_name}', "
-                    f"error={type(e).__name__}: {str(e)}"
-                )
-                result.failed.append({
-                    'skill_id': skill_id,
-                    'skill_name': skill.skill_name,
-                    'error': f"{type(e).__name__}: {str(e)}"
-                })
+            else:
+                pending.append(skill)
+        
+        if pending:
+            logger.info(
+                f"Generating {len(pending)} embeddings in batches of {self.batch_size} "
+                f"({len(result.skipped)} up-to-date)"
+            )
+        
+        # Pass 2: generate embeddings one provider batch at a time
+        for batch_start in range(0, len(pending), self.batch_size):
+            batch = pending[batch_start:batch_start + self.batch_size]
+            self._generate_and_save_batch(batch, result)
+            processed_count += len(batch)
+            
+            # Throttled progress update
+            if progress_callback:
+                elapsed = time.time() - last_progress_time
+                count_since_last = processed_count - last_progress_count
+                
+                if elapsed >= EMBEDDING_PROGRESS_MIN_INTERVAL_SECONDS or count_since_last >= EMBEDDING_PROGRESS_MIN_COUNT:
+                    percent = progress_start + int((processed_count / total_skills) * progress_range)
+                    progress_callback(percent, f"Generating embeddings... ({processed_count} / {total_skills})")
+                    last_progress_time = time.time()
+                    last_progress_count = processed_count
+                    logger.debug(f"[EMBEDDING] Progress update: {percent}% | {processed_count}/{total_skills}")
         
         logger.info(
             f"Embedding batch complete: succeeded={len(result.succeeded)}, "
@@ -165,6 +175,78 @@ class SkillEmbeddingService:
         
         return result
     
+    def _generate_and_save_batch(self, skills: List[Skill], result: EmbeddingResult) -> None:
+        """
+        Generate embeddings for a batch of skills with one provider call and save them.
+        
+        If the batch call fails, falls back to one call per skill so a single
+        bad input only fails that skill. Generated embeddings are written with
+        one multi-row upsert. Outcomes are recorded on result.
+        
+        Args:
+            skills: Skills needing embeddings (at most batch_size)
+            result: EmbeddingResult to append outcomes to
+        """
+        texts = [self._build_embedding_text(skill) for skill in skills]
+        
+        try:
+            vectors = self.embedding_provider.embed_batch(texts)
+            if len(vectors) != len(skills):
+                raise ValueError(f"Provider returned {len(vectors)} embeddings for {len(skills)} texts")
+        except Exception as e:
+            logger.warning(
+                f"Batch embedding failed for {len(skills)} skills, retrying one at a time: "
+                f"{type(e).__name__}: {str(e)}"
+            )
+            vectors = [None] * len(skills)
+        
+        embedded: List[Skill] = []
+        rows: List[Dict[str, Any]] = []
+        updated_at = datetime.utcnow()
+        for skill, text, vector in zip(skills, texts, vectors):
+            try:
+                if vector is None:
+                    vector = self.embedding_provider.embed(text)
+            except Exception as e:
+                self._record_failure(result, skill, e)
+                continue
+            embedded.append(skill)
+            rows.append({
+                'skill_id': skill.skill_id,
+                'model_name': self.model_name,
+                'embedding': vector,
+                'embedding_version': self._expected_version(skill),
+                'updated_at': updated_at
+            })
+        
+        if not rows:
+            return
+        
+        try:
+            self.embedding_repository.bulk_upsert(rows)
+        except Exception as e:
+            for skill in embedded:
+                self._record_failure(result, skill, e)
+            return
+        
+        for skill in embedded:
+            logger.debug(f"Embedding upserted: skill_id={skill.skill_id}, skill_name='{skill.skill_name}', model={self.model_name}, version={self.embedding_version}")
+            result.succeeded.append(skill.skill_id)
+        logger.info(f"Embeddings upserted: {len(embedded)} skills, model={self.model_name}, version={self.embedding_version}")
+    
+    @staticmethod
+    def _record_failure(result: EmbeddingResult, skill: Skill, error: Exception) -> None:
+        """Log and record a per-skill embedding failure (processing continues)."""
+        logger.warning(
+            f"Embedding failed: skill_id={skill.skill_id}, skill_name='{skill.skill_name}', "
+            f"error={type(error).__name__}: {str(error)}"
+        )
+        result.failed.append({
+            'skill_id': skill.skill_id,
+            'skill_name': skill.skill_name,
+            'error': f"{type(error).__name__}: {str(error)}"
+        })
+    
     def ensure_embedding_for_skill(self, skill: Skill) -> bool:
         """
         Ensure embedding exists for a single skill.
@@ -199,10 +281,9 @@ class SkillEmbeddingService:
         Check if embedding is up-to-date for a skill.
         
         Returns True if:
-        - Embedding exists
-        - Model name matches
-        - Version matches
-        - Skill name hash matches (skill not changed)
+        - Embedding exists for the model
+        - Stored version equals "<embedding_version>:<hash of normalized skill name>"
+          (so both a version bump and a skill rename trigger regeneration)
         """
         try:
             existing = self.embedding_repository.get_by_skill_and_model(
@@ -213,34 +294,23 @@ class SkillEmbeddingService:
             if not existing:
                 return False
             
-            # Check version
-            if existing.embedding_version != self.embedding_version:
-                return False
-            
-            # Check if skill name changed (using hash comparison)
-            # We use a simple hash of normalized skill name to detect changes
-            normalized_name = self._normalize_text(skill.skill_name)
-            current_hash = self._compute_text_hash(normalized_name)
-            
-            # Store hash in embedding_version as "v1:hash" format for tracking
-            # This allows us to detect if skill_name changed
-            version_with_hash = f"{self.embedding_version}:{current_hash}"
-            
-            # If version doesn't include hash, assume it might be outdated
-            if ':' not in existing.embedding_version:
-                return False
-            
-            # Compare hashes
-            if existing.embedding_version != version_with_hash:
-                return False
-            
-            return True
+            return existing.embedding_version == self._expected_version(skill)
             
         except Exception as e:
             logger.error(f"Error checking embedding status for skill_id={skill.skill_id}: {e}")
             # If we can't check, assume it needs update to be safe
             return False
     
+    def _expected_version(self, skill: Skill) -> str:
+        """
+        Version stamp an up-to-date embedding for this skill carries.
+        
+        Format "v1:<md5[:8] of normalized skill name>" so a renamed skill is
+        detected as stale.
+        """
+        text_hash = self._compute_text_hash(self._normalize_text(skill.skill_name))
+        return f"{self.embedding_version}:{text_hash}"
+    
     def _generate_and_save_embedding(self, skill: Skill) -> bool:
         """
         Generate embedding for skill and save to database.
@@ -254,29 +324,35 @@ class SkillEmbeddingService:
         Raises:
             Exception if embedding generation or save fails
         """
-        # Generate enhanced embedding text (includes aliases, category, subcategory)
-        embedding_text = self._generate_enhanced_embedding_text(skill)
-        
-        # Normalize for consistency
-        normalized_text = self._normalize_text(embedding_text)
-        
-        # Generate embedding using enhanced text
-        embedding_vector = self.embedding_provider.embed(normalized_text)
+        embedding_vector = self.embedding_provider.embed(self._build_embedding_text(skill))
+        self._save_embedding(skill, embedding_vector)
+        return True
+    
+    def _build_embedding_text(self, skill: Skill) -> str:
+        """
+        Build the normalized text sent to the embedding provider for a skill.
         
-        # Compute hash for change detection (use skill name only for backwards compatibility)
-        text_hash = self._compute_text_hash(self._normalize_text(skill.skill_name))
-        version_with_hash = f"{self.embedding_version}:{text_hash}"
+        Uses the enhanced text (includes aliases, category, subcategory),
+        normalized for consistency.
+        """
+        return self._normalize_text(self._generate_enhanced_embedding_text(skill))
+    
+    def _save_embedding(self, skill: Skill, embedding_vector: List[float]) -> None:
+        """
+        Upsert a generated embedding for a skill, stamped with version and name hash.
         
-        # Upsert to database
+        Args:
+            skill: Skill object
+            embedding_vector: Embedding generated for the skill
+        """
+        # Upsert to database (version carries the skill name hash for change detection)
         self.embedding_repository.upsert(
             skill_id=skill.skill_id,
             model_name=self.model_name,
             embedding=embedding_vector,
-            embedding_version=version_with_hash,
+            embedding_version=self._expected_version(skill),
             updated_at=datetime.utcnow()
         )
-        
-        return True
     
     def _generate_enhanced_embedding_text(self, skill: Skill) -> str:
         """
@@ -0,0 +1,140 @@
+"""
+In-memory skill lookup index for exact and alias resolution.
+
+Loads every skill name and alias once into normalized hash maps so the
+exact/alias resolution layers run in O(1) without a DB round trip per row.
+Single Responsibility: Hold normalized name → skill_id maps for one taxonomy version.
+"""
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from app.models.skill import Skill
+from app.models.skill_alias import SkillAlias
+from app.services.skill_resolution.resolution_memo import get_taxonomy_version
+from app.utils.normalization import normalize_key
+
+logger = logging.getLogger(__name__)
+
+
+class SkillLookupIndex:
+    """
+    Normalized exact/alias lookup maps built from skills and skill_aliases.
+
+    Keys use the same rules as app.utils.normalization.normalize_key, so
+    "Node-JS", " node_js " and "node js" all hit the same entry. When two
+    rows normalize to the same key the first one loaded (lowest ID) wins,
+    which keeps results deterministic across reloads.
+
+    The index is loaded lazily on first lookup. Call refresh() to rebuild it
+    when the taxonomy version (the taxonomy_version counter, bumped by every
+    skill/alias write) has changed.
+    """
+
+    def __init__(self, db: Optional[Session] = None):
+        """
+        Initialize lookup index.
+
+        Args:
+            db: SQLAlchemy database session (None for an index built from entries)
+        """
+        self.db = db
+        self.skills_by_key: Dict[str, int] = {}
+        self.aliases_by_key: Dict[str, int] = {}
+        self.taxonomy_version: Optional[int] = None
+        self._loaded = False
+
+    @classmethod
+    def from_entries(
+        cls,
+        skills: Iterable[Tuple[int, str]] = (),
+        aliases: Iterable[Tuple[str, int]] = ()
+    ) -> "SkillLookupIndex":
+        """
+        Build an index from in-memory entries (no DB access).
+
+        Args:
+            skills: Iterable of (skill_id, skill_name)
+            aliases: Iterable of (alias_text, skill_id)
+
+        Returns:
+            Loaded SkillLookupIndex
+        """
+        index = cls(db=None)
+        index._build(skills, aliases)
+        return index
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the maps have been populated."""
+        return self._loaded
+
+    def load(self) -> None:
+        """Load all skill names and aliases from the database (two queries)."""
+        # Read the version first: a write landing during the load then bumps
+        # it past the stamp and the next refresh() reloads
+        taxonomy_version = self.fetch_taxonomy_version()
+        skills = self.db.query(Skill.skill_id, Skill.skill_name).order_by(Skill.skill_id).all()
+        aliases = self.db.query(SkillAlias.alias_text, SkillAlias.skill_id).order_by(SkillAlias.alias_id).all()
+        self._build(skills, aliases)
+        self.taxonomy_version = taxonomy_version
+        logger.info(
+            f"Loaded skill lookup index: {len(self.skills_by_key)} skill keys, "
+            f"{len(self.aliases_by_key)} alias keys"
+        )
+
+    def refresh(self) -> bool:
+        """
+        Rebuild the index if the taxonomy version changed since the last load.
+
+        Returns:
+            True if the index was (re)loaded, False if it was already current
+        """
+        if self.db is None:
+            return False
+        if self._loaded and self.fetch_taxonomy_version() == self.taxonomy_version:
+            return False
+        self.load()
+        return True
+
+    def fetch_taxonomy_version(self) -> int:
+        """
+        Fetch the taxonomy version counter from the database.
+
+        Changes on every skill or alias insert, rename, move or delete made
+        through the taxonomy update APIs or the master import.
+        """
+        return get_taxonomy_version(self.db)
+
+    def find_exact(self, text: str) -> Optional[int]:
+        """Return skill_id whose normalized skill_name equals the normalized text."""
+        self._ensure_loaded()
+        return self.skills_by_key.get(normalize_key(text))
+
+    def find_alias(self, text: str) -> Optional[int]:
+        """Return skill_id whose normalized alias_text equals the normalized text."""
+        self._ensure_loaded()
+        return self.aliases_by_key.get(normalize_key(text))
+
+    def _ensure_loaded(self) -> None:
+        """Load the index on first use."""
+        if not self._loaded:
+            self.load()
+
+    def _build(self, skills: Iterable[Tuple[int, str]], aliases: Iterable[Tuple[str, int]]) -> None:
+        """Populate the normalized maps (first entry wins on key collision)."""
+        skills_by_key: Dict[str, int] = {}
+        for skill_id, skill_name in skills:
+            key = normalize_key(skill_name)
+            if key:
+                skills_by_key.setdefault(key, skill_id)
+
+        aliases_by_key: Dict[str, int] = {}
+        for alias_text, skill_id in aliases:
+            key = normalize_key(alias_text)
+            if key:
+                aliases_by_key.setdefault(key, skill_id)
+
+        self.skills_by_key = skills_by_key
+        self.aliases_by_key = aliases_by_key
+        self._loaded = True
@@ -7,15 +7,26 @@ Resolves raw skill text to skill IDs using:
 3. Embedding-based semantic similarity
 """
 import logging
-from typing import Optional, Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from app.models.skill import Skill
-from app.models.skill_alias import SkillAlias
-from app.services.skill_resolution.embedding_provider import EmbeddingProvider
+from app.services.skill_resolution.embedding_provider import (
+    EmbeddingProvider,
+    DEFAULT_EMBEDDING_MODEL,
+    resolve_storage_model_name
+)
+from app.services.skill_resolution.embedding_worker_pool import EmbeddingCircuitOpenError
+from app.services.skill_resolution.query_embedding_cache import CachedEmbeddingProvider
+from app.services.skill_resolution.resolution_memo import (
+    MemoEntry,
+    ResolutionMemo,
+    build_resolver_key
+)
 from app.services.skill_resolution.skill_embedding_repository import SkillEmbeddingRepository
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
+from app.services.skill_resolution.skill_vector_index import get_shared_vector_index
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +48,8 @@ class SkillResolverService:
     Service for resolving raw skill text to skill IDs.
     
     Implements 3-layer resolution strategy:
-    1. Exact match on skills.skill_name (case-insensitive)
-    2. Alias match on skill_aliases.alias_text (case-insensitive)
+    1. Exact match on skills.skill_name (normalized, in-memory index)
+    2. Alias match on skill_aliases.alias_text (normalized, in-memory index)
     3. Embedding match using semantic similarity
        - similarity >= 0.88: auto-accept
        - 0.80 <= similarity < 0.88: mark for review
@@ -53,7 +64,13 @@ class SkillResolverService:
         self,
         db: Session,
         embedding_provider: Optional[EmbeddingProvider] = None,
-        enable_embedding: bool = True
+        enable_embedding: bool = True,
+        lookup_index: Optional[SkillLookupIndex] = None,
+        cache_query_embeddings: bool = True,
+        embedding_model_name: Optional[str] = None,
+        prefilter_provider: Optional[EmbeddingProvider] = None,
+        prefilter_accept_threshold: float = 0.95,
+        use_resolution_memo: bool = False
     ):
         """
         Initialize skill resolver service.
@@ -62,11 +79,61 @@ class SkillResolverService:
             db: SQLAlchemy database session
             embedding_provider: Optional embedding provider (if None, embedding layer is disabled)
             enable_embedding: Whether to enable embedding-based resolution
+            lookup_index: Optional shared exact/alias index (created lazily if None)
+            cache_query_embeddings: Wrap the provider in the memory + DB query embedding cache
+            embedding_model_name: Model whose stored skill embeddings are searched
+                                  (default: derived from the provider, see resolve_storage_model_name)
+            prefilter_provider: Optional cheap local provider (e.g. LocalNgramEmbeddingProvider)
+                                tried before the paid provider; its skill embeddings must be
+                                stored under its own model_name
+            prefilter_accept_threshold: Pre-filter similarity at or above which the match is
+                                        accepted without calling the paid provider
+            use_resolution_memo: Consult/populate the durable skill_resolution_memo
+                                 table in resolve_many()
         """
         self.db = db
+        self.lookup_index = lookup_index or SkillLookupIndex(db)
+        if (
+            cache_query_embeddings
+            and embedding_provider is not None
+            and not isinstance(embedding_provider, CachedEmbeddingProvider)
+        ):
+            embedding_provider = CachedEmbeddingProvider(embedding_provider, db)
         self.embedding_provider = embedding_provider
         self.enable_embedding = enable_embedding and embedding_provider is not None
-        self.embedding_repo = SkillEmbeddingRepository(db) if self.enable_embedding else None
+        self.embedding_model_name = embedding_model_name or (
+            resolve_storage_model_name(embedding_provider) if embedding_provider is not None
+            else DEFAULT_EMBEDDING_MODEL
+        )
+        self.embedding_repo = SkillEmbeddingRepository(
+            db, vector_index=get_shared_vector_index(self.embedding_model_name)
+        ) if self.enable_embedding else None
+        self.prefilter_provider = prefilter_provider
+        self.prefilter_accept_threshold = prefilter_accept_threshold
+        self.prefilter_model_name = resolve_storage_model_name(prefilter_provider) if prefilter_provider else None
+        self.prefilter_repo = SkillEmbeddingRepository(
+            db, vector_index=get_shared_vector_index(self.prefilter_model_name)
+        ) if prefilter_provider else None
+        self.resolution_memo = ResolutionMemo(db, build_resolver_key(
+            self.embedding_model_name if self.enable_embedding else None,
+            self.prefilter_model_name,
+            prefilter_accept_threshold
+        )) if use_resolution_memo else None
+        # Cumulative resolve_many() counters: texts per layer and seconds per layer
+        self.resolve_stats = {
+            'calls': 0,
+            'texts': 0,
+            'memo': 0,
+            'exact': 0,
+            'alias': 0,
+            'embedding': 0,
+            'review': 0,
+            'unresolved': 0,
+            'exact_seconds': 0.0,
+            'alias_seconds': 0.0,
+            'prefilter_seconds': 0.0,
+            'embedding_seconds': 0.0
+        }
         
         if not self.enable_embedding:
             logger.info("Skill resolver initialized WITHOUT embedding support (exact + alias only)")
@@ -93,12 +160,21 @@ class SkillResolverService:
         if result.is_resolved():
             return result
         
+        # Layer 3a: Local pre-filter (near-identical spellings never reach the paid provider)
+        if self.prefilter_provider is not None:
+            result = self._try_prefilter_match(normalized_text)
+            if result is not None:
+                return result
+        
         # Layer 3: Embedding match (if enabled)
         if self.enable_embedding:
             try:
                 result = self._try_embedding_match(normalized_text)
                 if result.resolved_skill_id is not None or result.resolution_method == "review":
                     return result
+            except EmbeddingCircuitOpenError:
+                # Embedding endpoint degraded - exact/alias only until the circuit closes
+                logger.debug(f"Embedding layer skipped for '{normalized_text}' (circuit open)")
             except Exception as e:
                 # Log error but don't fail the import
                 logger.error(f"Embedding match failed for '{normalized_text}': {e}")
@@ -111,16 +187,152 @@ class SkillResolverService:
             resolution_confidence=None
         )
     
+    def resolve_many(self, texts: Iterable[str]) -> Dict[str, ResolutionResult]:
+        """
+        Resolve many normalized skill texts at once.
+        
+        Input is deduplicated, exact and alias matching run as one in-memory
+        pass over the distinct texts, and only the leftovers reach the
+        embedding layer: one embed_batch() call and one find_top_k_batch()
+        search (plus the same for the local pre-filter, if configured).
+        Results equal calling resolve() on each text.
+        
+        With use_resolution_memo, texts memoized under the current taxonomy
+        version are answered before any layer runs, and fresh outcomes are
+        memoized (except when the embedding layer failed, since those
+        "unresolved" outcomes are transient).
+        
+        Per-layer counts and timings are accumulated in self.resolve_stats.
+        
+        Args:
+            texts: Normalized skill texts (lowercased, trimmed); duplicates allowed
+            
+        Returns:
+            Dict of distinct text → ResolutionResult
+        """
+        distinct = list(dict.fromkeys(texts))
+        results: Dict[str, ResolutionResult] = {}
+        stats = self.resolve_stats
+        stats['calls'] += 1
+        stats['texts'] += len(distinct)
+        
+        # Layer 0: durable memo (taxonomy-version checked)
+        if self.resolution_memo is not None:
+            for text, (skill_id, method, confidence) in self.resolution_memo.lookup(distinct).items():
+                results[text] = ResolutionResult(skill_id, method, confidence)
+            stats['memo'] += len(results)
+        pending = [text for text in distinct if text not in results]
+        
+        # Layers 1 + 2: exact then alias, one set-based pass each
+        start = time.perf_counter()
+        exact_count = 0
+        for text in pending:
+            skill_id = self.lookup_index.find_exact(text)
+            if skill_id is not None:
+                results[text] = ResolutionResult(skill_id, "exact", 1.0)
+                exact_count += 1
+        stats['exact_seconds'] += time.perf_counter() - start
+        stats['exact'] += exact_count
+        
+        start = time.perf_counter()
+        alias_count = 0
+        for text in pending:
+            if text in results:
+                continue
+            skill_id = self.lookup_index.find_alias(text)
+            if skill_id is not None:
+                results[text] = ResolutionResult(skill_id, "alias", 1.0)
+                alias_count += 1
+        stats['alias_seconds'] += time.perf_counter() - start
+        stats['alias'] += alias_count
+        
+        leftovers = [text for text in pending if text not in results]
+        
+        # Layer 3a: local pre-filter, batched
+        if leftovers and self.prefilter_provider is not None:
+            start = time.perf_counter()
+            results.update(self._prefilter_many(leftovers))
+            stats['prefilter_seconds'] += time.perf_counter() - start
+            leftovers = [text for text in leftovers if text not in results]
+        
+        # Layer 3: embeddings - one batched embed, one batched top-k
+        embedding_failed = False
+        if leftovers and self.enable_embedding:
+            start = time.perf_counter()
+            try:
+                vectors = self.embedding_provider.embed_batch(leftovers)
+                all_matches = self.embedding_repo.find_top_k_batch(
+                    vectors, k=5, model_name=self.embedding_model_name
+                )
+                for text, matches in zip(leftovers, all_matches):
+                    result = self._classify_embedding_matches(text, matches)
+                    if result.resolved_skill_id is not None or result.resolution_method == "review":
+                        results[text] = result
+            except EmbeddingCircuitOpenError:
+                embedding_failed = True
+                logger.info(f"Embedding layer skipped for {len(leftovers)} texts (circuit open)")
+            except Exception as e:
+                # Log error but don't fail the import
+                embedding_failed = True
+                logger.error(f"Batched embedding match failed for {len(leftovers)} texts: {e}")
+            stats['embedding_seconds'] += time.perf_counter() - start
+        
+        for text in pending:
+            if text not in results:
+                results[text] = ResolutionResult(
+                    resolved_skill_id=None,
+                    resolution_method="unresolved",
+                    resolution_confidence=None
+                )
+            if results[text].resolution_method in ("embedding", "review", "unresolved"):
+                stats[results[text].resolution_method] += 1
+        
+        if self.resolution_memo is not None and pending:
+            transient = set(leftovers) if embedding_failed else set()
+            self.resolution_memo.store({
+                text: self._to_memo_entry(results[text])
+                for text in pending
+                if text not in transient
+            })
+        
+        logger.info(
+            f"Resolved {len(distinct)} distinct skill texts: memo={stats['memo']}, "
+            f"exact={stats['exact']}, alias={stats['alias']}, "
+            f"embedding={stats['embedding']}, review={stats['review']}, unresolved={stats['unresolved']} "
+            f"(cumulative; embedding layer {stats['embedding_seconds']:.2f}s)"
+        )
+        return results
+    
+    @staticmethod
+    def _to_memo_entry(result: ResolutionResult) -> MemoEntry:
+        return (result.resolved_skill_id, result.resolution_method, result.resolution_confidence)
+    
+    def _prefilter_many(self, texts: List[str]) -> Dict[str, ResolutionResult]:
+        """Batched local pre-filter; returns only texts it accepted."""
+        try:
+            vectors = self.prefilter_provider.embed_batch(texts)
+            all_matches = self.prefilter_repo.find_top_k_batch(vectors, k=1, model_name=self.prefilter_model_name)
+        except Exception as e:
+            logger.warning(f"Batched embedding pre-filter failed for {len(texts)} texts: {e}")
+            return {}
+        return {
+            text: ResolutionResult(matches[0][0], "embedding", matches[0][1])
+            for text, matches in zip(texts, all_matches)
+            if matches and matches[0][1] >= self.prefilter_accept_threshold
+        }
+    
+    def refresh_lookup_index(self) -> bool:
+        """Rebuild the exact/alias index if the taxonomy changed since it was loaded."""
+        return self.lookup_index.refresh()
+    
     def _try_exact_match(self, normalized_text: str) -> ResolutionResult:
         """Try exact match on skills.skill_name."""
-        skill = self.db.query(Skill).filter(
-            func.lower(func.trim(Skill.skill_name)) == normalized_text
-        ).first()
+        skill_id = self.lookup_index.find_exact(normalized_text)
         
-        if skill:
-            logger.debug(f"✓ Resolved '{normalized_text}' via EXACT match → skill_id={skill.skill_id}")
+        if skill_id is not None:
+            logger.debug(f"✓ Resolved '{normalized_text}' via EXACT match → skill_id={skill_id}")
             return ResolutionResult(
-                resolved_skill_id=skill.skill_id,
+                resolved_skill_id=skill_id,
                 resolution_method="exact",
                 resolution_confidence=1.0
             )
@@ -133,14 +345,12 @@ class SkillResolverService:
     
     def _try_alias_match(self, normalized_text: str) -> ResolutionResult:
         """Try alias match on skill_aliases.alias_text."""
-        alias = self.db.query(SkillAlias).filter(
-            func.lower(func.trim(SkillAlias.alias_text)) == normalized_text
-        ).first()
+        skill_id = self.lookup_index.find_alias(normalized_text)
         
-        if alias:
-            logger.debug(f"✓ Resolved '{normalized_text}' via ALIAS match → skill_id={alias.skill_id}")
+        if skill_id is not None:
+            logger.debug(f"✓ Resolved '{normalized_text}' via ALIAS match → skill_id={skill_id}")
             return ResolutionResult(
-                resolved_skill_id=alias.skill_id,
+                resolved_skill_id=skill_id,
                 resolution_method="alias",
                 resolution_confidence=1.0
             )
@@ -151,6 +361,34 @@ class SkillResolverService:
             resolution_confidence=None
         )
     
+    def _try_prefilter_match(self, normalized_text: str) -> Optional[ResolutionResult]:
+        """
+        Try the cheap local embedding pre-filter.
+        
+        Returns:
+            Auto-accepted embedding ResolutionResult if the best local match clears
+            prefilter_accept_threshold, otherwise None (caller continues to layer 3)
+        """
+        try:
+            query_embedding = self.prefilter_provider.embed(normalized_text)
+            matches = self.prefilter_repo.find_top_k(query_embedding, k=1, model_name=self.prefilter_model_name)
+        except Exception as e:
+            logger.warning(f"Embedding pre-filter failed for '{normalized_text}': {e}")
+            return None
+        
+        if matches and matches[0][1] >= self.prefilter_accept_threshold:
+            skill_id, similarity = matches[0]
+            logger.debug(
+                f"✓ Resolved '{normalized_text}' via local PRE-FILTER "
+                f"→ skill_id={skill_id}, similarity={similarity:.4f}"
+            )
+            return ResolutionResult(
+                resolved_skill_id=skill_id,
+                resolution_method="embedding",
+                resolution_confidence=similarity
+            )
+        return None
+    
     def _try_embedding_match(self, normalized_text: str) -> ResolutionResult:
         """
         Try embedding-based semantic similarity match.
@@ -165,8 +403,24 @@ class SkillResolverService:
         query_embedding = self.embedding_provider.embed(normalized_text)
         
         # Find top-5 most similar skills
-        matches = self.embedding_repo.find_top_k(query_embedding, k=5)
+        matches = self.embedding_repo.find_top_k(query_embedding, k=5, model_name=self.embedding_model_name)
+        return self._classify_embedding_matches(normalized_text, matches)
+    
+    def _classify_embedding_matches(
+        self,
+        normalized_text: str,
+        matches: List[Tuple[int, float]]
+    ) -> ResolutionResult:
+        """
+        Apply the auto-accept / review thresholds to a text's top-k matches.
         
+        Args:
+            normalized_text: Normalized skill text (for logging)
+            matches: (skill_id, similarity) ordered by similarity
+            
+        Returns:
+            ResolutionResult with embedding match, review status or unresolved
+        """
         if not matches:
             logger.debug(f"✗ No embedding matches found for '{normalized_text}'")
             return ResolutionResult(
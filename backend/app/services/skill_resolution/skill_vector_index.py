@@ -0,0 +1,456 @@
+"""
+In-process vector index over skill embeddings.
+
+Loads skill_embeddings rows for one model into an L2-normalized float32
+NumPy matrix and answers top-k cosine queries with a single matrix-vector
+product (or one matrix-matrix product for a batch of queries). No pgvector
+operators are used, so resolution also works against a Postgres without the
+vector extension or against SQLite.
+
+The matrix can be made compact for large taxonomies:
+- dimensions: keep only the first N components and re-normalize. For
+  text-embedding-3 models this is exactly what the API's `dimensions`
+  parameter returns (Matryoshka embeddings), so stored 1536-d vectors
+  serve any shortened size without re-embedding.
+- precision: "float16" (2 bytes/component) or "int8" (symmetric per-row
+  scalar quantization, 1 byte/component plus one float32 scale per row).
+Compact scores are approximate; SkillEmbeddingRepository rescores the top
+k * rescore_multiplier candidates against the full-precision stored vectors.
+
+Single Responsibility: Hold normalized skill vectors and answer similarity queries.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.skill_embedding import SkillEmbedding
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between automatic refresh checks against the database
+DEFAULT_REFRESH_INTERVAL_SECONDS = 30.0
+
+# Storage precisions for the in-memory matrix
+PRECISION_FLOAT32 = "float32"
+PRECISION_FLOAT16 = "float16"
+PRECISION_INT8 = "int8"
+SUPPORTED_PRECISIONS = (PRECISION_FLOAT32, PRECISION_FLOAT16, PRECISION_INT8)
+
+# Candidates rescored at full precision = k * multiplier (compact indexes only)
+DEFAULT_RESCORE_MULTIPLIER = 4
+
+# Rows upcast to float32 at a time when scanning a float16/int8 matrix
+SCAN_CHUNK_ROWS = 8192
+
+_INT8_MAX = 127.0
+
+
+def cosine_to_similarity(cosine: np.ndarray) -> np.ndarray:
+    """
+    Map cosine similarity [-1, 1] to the [0, 1] score used by the resolvers.
+
+    Matches SkillEmbeddingRepository's pgvector query: 1 - (cosine distance / 2).
+    """
+    return 1.0 - (1.0 - cosine) / 2.0
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _prepare_vectors(vectors: np.ndarray, dimensions: Optional[int]) -> np.ndarray:
+    """Truncate to the first `dimensions` components (if set) and L2-normalize."""
+    if dimensions is not None and dimensions < vectors.shape[1]:
+        vectors = vectors[:, :dimensions]
+    return _normalize_rows(vectors)
+
+
+def quantize_rows(vectors: np.ndarray, precision: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert normalized float32 rows to the storage precision.
+
+    Returns:
+        (stored matrix, per-row float32 scales for int8 / None otherwise)
+    """
+    if precision == PRECISION_FLOAT32:
+        return vectors.astype(np.float32, copy=False), None
+    if precision == PRECISION_FLOAT16:
+        return vectors.astype(np.float16), None
+    if precision == PRECISION_INT8:
+        scales = np.abs(vectors).max(axis=1) / _INT8_MAX
+        scales[scales == 0] = 1.0
+        quantized = np.rint(vectors / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    raise ValueError(f"Unknown precision: {precision} (expected one of {SUPPORTED_PRECISIONS})")
+
+
+class SkillVectorIndex:
+    """
+    Normalized float32 matrix of skill embeddings for one model.
+
+    Call load() once, then refresh() to pick up upserted rows incrementally
+    (rows with updated_at at or after the last seen timestamp). A full reload
+    happens when the table's row count, highest skill_id or latest updated_at
+    no longer match the index, e.g. after deletions.
+    Searches are served from an immutable snapshot, so concurrent readers
+    never see a half-applied refresh.
+
+    With dimensions and/or a float16/int8 precision the index is "compact":
+    it holds less memory and scans faster, and its scores are approximate
+    (see is_compact and rescore_multiplier).
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        dimensions: Optional[int] = None,
+        precision: str = PRECISION_FLOAT32,
+        rescore_multiplier: int = DEFAULT_RESCORE_MULTIPLIER
+    ):
+        """
+        Initialize vector index.
+
+        Args:
+            model_name: Only index embeddings for this model (None = all rows)
+            refresh_interval_seconds: Minimum interval between automatic refresh checks
+            dimensions: Keep only the first N components of each vector (None = all)
+            precision: "float32", "float16" or "int8" storage for the matrix
+            rescore_multiplier: Compact indexes only - candidates per requested
+                                match rescored at full precision (0 = no rescoring)
+        """
+        if precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision} (expected one of {SUPPORTED_PRECISIONS})")
+        if dimensions is not None and dimensions < 1:
+            raise ValueError(f"dimensions must be >= 1, got {dimensions}")
+        self.model_name = model_name
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.dimensions = dimensions
+        self.precision = precision
+        self.rescore_multiplier = rescore_multiplier
+        # (skill_ids, matrix, int8 scales or None) swapped as one tuple so readers see a consistent set
+        self._snapshot: Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]] = (
+            np.empty(0, dtype=np.int64),
+            np.empty((0, 0), dtype=np.float32),
+            None
+        )
+        # Width of the stored (source) vectors, before truncation
+        self._source_dimension = 0
+        self._positions: Dict[int, int] = {}
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._stale = False
+        self._last_refresh_check = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_vectors(
+        cls,
+        skill_ids: Sequence[int],
+        vectors: Sequence[Sequence[float]],
+        model_name: Optional[str] = None,
+        **options
+    ) -> "SkillVectorIndex":
+        """
+        Build a loaded index from in-memory vectors (tests, benchmarks).
+
+        The index never refreshes from a database.
+
+        Args:
+            skill_ids: Skill ID per vector
+            vectors: Embeddings (same width)
+            model_name: Model name the vectors belong to
+            **options: dimensions / precision / rescore_multiplier
+        """
+        index = cls(model_name=model_name, refresh_interval_seconds=float("inf"), **options)
+        index._set_rows([(skill_id, vector, None) for skill_id, vector in zip(skill_ids, vectors)])
+        index._loaded = True
+        return index
+
+    @property
+    def skill_ids(self) -> np.ndarray:
+        """Skill IDs, one per matrix row."""
+        return self._snapshot[0]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Embedding matrix (n_skills x dimension) in the storage precision."""
+        return self._snapshot[1]
+
+    @property
+    def is_compact(self) -> bool:
+        """Whether scores are approximate (truncated dimensions or reduced precision)."""
+        truncated = self.dimensions is not None and self.dimension < self._source_dimension
+        return truncated or self.precision != PRECISION_FLOAT32
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the skill IDs, matrix and quantization scales."""
+        skill_ids, matrix, scales = self._snapshot
+        return skill_ids.nbytes + matrix.nbytes + (scales.nbytes if scales is not None else 0)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index has been populated."""
+        return self._loaded
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension (0 when empty)."""
+        return self.matrix.shape[1] if self.matrix.ndim == 2 else 0
+
+    def __len__(self) -> int:
+        return len(self.skill_ids)
+
+    def load(self, db: Session) -> None:
+        """Load all embeddings for the model from the database."""
+        with self._lock:
+            rows = self._query_rows(db)
+            self._set_rows(rows)
+            self._loaded = True
+            self._stale = False
+            self._last_refresh_check = time.monotonic()
+        logger.info(
+            f"Loaded skill vector index: {len(self.skill_ids)} embeddings "
+            f"(model={self.model_name or 'all'}, dim={self.dimension}, precision={self.precision}, "
+            f"{self.memory_bytes / 1024 / 1024:.1f} MiB)"
+        )
+
+    def mark_stale(self) -> None:
+        """Force the next ensure_fresh() call to check the database."""
+        self._stale = True
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Load on first use, then refresh when marked stale or the refresh interval elapsed."""
+        if not self._loaded:
+            self.load(db)
+            return
+        elapsed = time.monotonic() - self._last_refresh_check
+        if self._stale or elapsed >= self.refresh_interval_seconds:
+            self.refresh(db)
+
+    def refresh(self, db: Session) -> int:
+        """
+        Incrementally apply embeddings upserted since the last load/refresh.
+
+        Returns:
+            Number of rows added or replaced (all rows on a full reload)
+        """
+        if not self._loaded:
+            self.load(db)
+            return len(self.skill_ids)
+
+        with self._lock:
+            self._stale = False
+            self._last_refresh_check = time.monotonic()
+
+            changed = []
+            if self._watermark is not None:
+                changed = self._query_rows(db, since=self._watermark)
+            if changed:
+                self._merge_rows(changed)
+
+            if self._table_state(db) != self._index_state():
+                # Deletions (or rows older than the watermark) - rebuild from scratch
+                rows = self._query_rows(db)
+                self._set_rows(rows)
+                logger.info(f"Skill vector index fully reloaded: {len(rows)} embeddings")
+                return len(rows)
+
+        if changed:
+            logger.info(f"Skill vector index refreshed: {len(changed)} embeddings updated")
+        return len(changed)
+
+    def search(self, query_vector: Sequence[float], k: int = 5) -> List[Tuple[int, float]]:
+        """
+        Return the top-k most similar skills for one query vector.
+
+        Returns:
+            List of (skill_id, similarity) ordered by similarity (highest first),
+            similarity in [0, 1] on the same scale as the pgvector query
+        """
+        return self.search_batch([query_vector], k=k)[0]
+
+    def search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        k: int = 5
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Return the top-k most similar skills for each query vector.
+
+        All queries are scored with a single matrix-matrix product (chunked
+        over rows for float16/int8 matrices). Query vectors have the width of
+        the stored embeddings and are truncated like the index.
+        """
+        skill_ids, matrix, scales = self._snapshot
+        if len(query_vectors) == 0:
+            return []
+        if len(skill_ids) == 0 or k <= 0:
+            return [[] for _ in query_vectors]
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[1] != self._source_dimension:
+            raise ValueError(
+                f"Query dimension {queries.shape[-1]} does not match index dimension {self._source_dimension}"
+            )
+        queries = _prepare_vectors(queries, self.dimensions)
+
+        scores = self._scores(queries, matrix, scales)  # (n_queries, n_skills) cosine
+        k = min(k, scores.shape[1])
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+
+        results = []
+        for row, candidates in enumerate(top):
+            ordered = candidates[np.argsort(-scores[row, candidates], kind="stable")]
+            similarities = cosine_to_similarity(scores[row, ordered].astype(np.float64))
+            results.append([
+                (int(skill_ids[i]), float(sim)) for i, sim in zip(ordered, similarities)
+            ])
+        return results
+
+    @staticmethod
+    def _scores(queries: np.ndarray, matrix: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+        """Cosine scores of normalized queries against the stored matrix."""
+        if matrix.dtype == np.float32:
+            return queries @ matrix.T
+        # NumPy has no BLAS path for float16/int8: upcast a bounded block at a time
+        scores = np.empty((queries.shape[0], matrix.shape[0]), dtype=np.float32)
+        for start in range(0, matrix.shape[0], SCAN_CHUNK_ROWS):
+            block = matrix[start:start + SCAN_CHUNK_ROWS].astype(np.float32)
+            scores[:, start:start + SCAN_CHUNK_ROWS] = queries @ block.T
+        if scales is not None:
+            scores *= scales
+        return scores
+
+    def _compact_rows(self, rows: list) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Truncate, normalize and quantize the embeddings of rows."""
+        vectors = np.asarray([r[1] for r in rows], dtype=np.float32)
+        self._source_dimension = vectors.shape[1]
+        return quantize_rows(_prepare_vectors(vectors, self.dimensions), self.precision)
+
+    def _query_rows(self, db: Session, since: Optional[datetime] = None) -> list:
+        """Fetch (skill_id, embedding, updated_at) rows for the model."""
+        query = db.query(SkillEmbedding.skill_id, SkillEmbedding.embedding, SkillEmbedding.updated_at)
+        if self.model_name:
+            query = query.filter(SkillEmbedding.model_name == self.model_name)
+        if since is not None:
+            query = query.filter(SkillEmbedding.updated_at >= since)
+        return query.order_by(SkillEmbedding.skill_id).all()
+
+    def _table_state(self, db: Session) -> Tuple[int, Optional[int], Optional[datetime]]:
+        """(row count, max skill_id, max updated_at) of the model's embeddings, in one query."""
+        query = db.query(
+            func.count(SkillEmbedding.skill_id),
+            func.max(SkillEmbedding.skill_id),
+            func.max(SkillEmbedding.updated_at)
+        )
+        if self.model_name:
+            query = query.filter(SkillEmbedding.model_name == self.model_name)
+        count, max_skill_id, max_updated_at = query.one()
+        return count or 0, max_skill_id, max_updated_at
+
+    def _index_state(self) -> Tuple[int, Optional[int], Optional[datetime]]:
+        """The same triple for the rows held by the index."""
+        skill_ids = self.skill_ids
+        max_skill_id = int(skill_ids.max()) if len(skill_ids) else None
+        return len(skill_ids), max_skill_id, self._watermark
+
+    def _set_rows(self, rows: list) -> None:
+        """Replace the whole snapshot with rows."""
+        if rows:
+            matrix, scales = self._compact_rows(rows)
+            skill_ids = np.asarray([r[0] for r in rows], dtype=np.int64)
+        else:
+            matrix, scales = np.empty((0, 0), dtype=np.float32), None
+            skill_ids = np.empty(0, dtype=np.int64)
+            self._source_dimension = 0
+        self._positions = {int(sid): i for i, sid in enumerate(skill_ids)}
+        self._watermark = max((r[2] for r in rows if r[2] is not None), default=None)
+        self._snapshot = (skill_ids, matrix, scales)
+
+    def _merge_rows(self, rows: list) -> None:
+        """Replace existing vectors and append new ones (copy-on-write)."""
+        source_dimension = self._source_dimension
+        vectors, vector_scales = self._compact_rows(rows)
+        if len(self.skill_ids) and self._source_dimension != source_dimension:
+            # Dimension change (new model version) - caller falls back to full reload
+            self._set_rows(rows)
+            return
+
+        old_ids, old_matrix, old_scales = self._snapshot
+        if len(old_ids):
+            matrix = old_matrix.copy()
+            scales = old_scales.copy() if old_scales is not None else None
+        else:
+            matrix = np.empty((0, vectors.shape[1]), dtype=vectors.dtype)
+            scales = np.empty(0, dtype=np.float32) if vector_scales is not None else None
+        skill_ids = old_ids.copy()
+        positions = dict(self._positions)
+
+        new_ids, new_rows = [], []
+        for i, (skill_id, _, _) in enumerate(rows):
+            position = positions.get(int(skill_id))
+            if position is not None:
+                matrix[position] = vectors[i]
+                if scales is not None:
+                    scales[position] = vector_scales[i]
+            else:
+                positions[int(skill_id)] = len(skill_ids) + len(new_ids)
+                new_ids.append(int(skill_id))
+                new_rows.append(i)
+
+        if new_ids:
+            matrix = np.vstack([matrix, vectors[new_rows]])
+            if scales is not None:
+                scales = np.concatenate([scales, vector_scales[new_rows]])
+            skill_ids = np.concatenate([skill_ids, np.asarray(new_ids, dtype=np.int64)])
+
+        self._positions = positions
+        watermarks = [r[2] for r in rows if r[2] is not None]
+        if watermarks:
+            self._watermark = max([self._watermark, *watermarks]) if self._watermark else max(watermarks)
+        self._snapshot = (skill_ids, matrix, scales)
+
+
+# Process-wide indexes, one per model name
+_shared_indexes: Dict[Optional[str], SkillVectorIndex] = {}
+_shared_indexes_lock = threading.Lock()
+
+
+def get_shared_vector_index(model_name: Optional[str] = None) -> SkillVectorIndex:
+    """
+    Return the process-wide SkillVectorIndex for a model (created empty, loaded on first use).
+
+    Storage is configured from the environment:
+        SKILL_VECTOR_INDEX_DIMENSIONS: e.g. 256 or 512 (default: full width)
+        SKILL_VECTOR_INDEX_PRECISION: float32 (default), float16 or int8
+        SKILL_VECTOR_INDEX_RESCORE_MULTIPLIER: default 4 (0 = no rescoring)
+    """
+    with _shared_indexes_lock:
+        index = _shared_indexes.get(model_name)
+        if index is None:
+            dimensions = os.getenv("SKILL_VECTOR_INDEX_DIMENSIONS")
+            index = SkillVectorIndex(
+                model_name=model_name,
+                dimensions=int(dimensions) if dimensions else None,
+                precision=os.getenv("SKILL_VECTOR_INDEX_PRECISION", PRECISION_FLOAT32),
+                rescore_multiplier=int(
+                    os.getenv("SKILL_VECTOR_INDEX_RESCORE_MULTIPLIER", str(DEFAULT_RESCORE_MULTIPLIER))
+                )
+            )
+            _shared_indexes[model_name] = index
+        return index
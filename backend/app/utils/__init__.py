@@ -3,6 +3,6 @@ Utils package for the Competency Tracking System.
 Contains utility functions and classes for data processing.
 """
 
-from app.utils.excel_reader import read_excel, ExcelReaderError
+from app.utils.excel_reader import read_excel, iter_employee_chunks, iter_skill_chunks, ExcelReaderError
 
-__all__ = ["read_excel", "ExcelReaderError"]
+__all__ = ["read_excel", "iter_employee_chunks", "iter_skill_chunks", "ExcelReaderError"]
@@ -2,10 +2,12 @@
 Excel reading utility for the Competency Tracking System.
 Handles Excel file parsing with data validation and normalization.
 """
+import numpy as np
 import pandas as pd
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Iterator, List, Optional, Sequence
 from pathlib import Path
+from openpyxl import load_workbook
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,18 @@ EMPLOYEE_SKILLS_COLUMN_MAPPING = {
     'Interest Level': 'interest_level'  # Added optional field
 }
 
+# Columns read by the streaming reader (usecols); other columns are skipped.
+# Headers match case-insensitively and are renamed to these spellings, so an
+# 'Email' header arrives as 'email' (the optional column the persisters read).
+EMPLOYEE_STREAM_COLUMNS = tuple(EMPLOYEE_COLUMN_MAPPING) + ('email',)
+EMPLOYEE_SKILLS_STREAM_COLUMNS = tuple(EMPLOYEE_SKILLS_COLUMN_MAPPING)
+
+# Rows per DataFrame chunk yielded by the streaming reader
+EXCEL_READ_CHUNK_SIZE = 5000
+
+EMPLOYEE_SHEET = 'Employee'
+EMPLOYEE_SKILLS_SHEET = 'Employee_Skills'
+
 # Required columns for validation
 REQUIRED_EMPLOYEE_COLUMNS = [
     'Employee ID (ZID)',
@@ -107,6 +121,192 @@ def read_excel(file_path: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         raise ExcelReaderError(f"Failed to read Excel file: {str(e)}")
 
 
+def iter_employee_chunks(file_path: str, chunk_size: int = EXCEL_READ_CHUNK_SIZE,
+                         usecols: Sequence[str] = EMPLOYEE_STREAM_COLUMNS) -> Iterator[pd.DataFrame]:
+    """
+    Stream the Employee sheet as normalized DataFrame chunks.
+    
+    Args:
+        file_path: Path to the Excel file
+        chunk_size: Sheet rows per chunk
+        usecols: Excel headers to read
+        
+    Yields:
+        Normalized employee DataFrames (same shape as read_excel's employees_df),
+        indexed by data row position in the sheet; one empty DataFrame if the
+        sheet has no valid rows
+        
+    Raises:
+        ExcelReaderError: If file reading or validation fails
+    """
+    yield from _iter_normalized_chunks(
+        file_path, 0, chunk_size, usecols, REQUIRED_EMPLOYEE_COLUMNS, _validate_and_normalize_employees
+    )
+
+
+def iter_skill_chunks(file_path: str, chunk_size: int = EXCEL_READ_CHUNK_SIZE,
+                      usecols: Sequence[str] = EMPLOYEE_SKILLS_STREAM_COLUMNS) -> Iterator[pd.DataFrame]:
+    """
+    Stream the Employee_Skills sheet as normalized DataFrame chunks.
+    
+    Args:
+        file_path: Path to the Excel file
+        chunk_size: Sheet rows per chunk
+        usecols: Excel headers to read
+        
+    Yields:
+        Normalized skill DataFrames (same shape as read_excel's skills_df),
+        indexed by data row position in the sheet; one empty DataFrame if the
+        sheet has no valid rows
+        
+    Raises:
+        ExcelReaderError: If file reading or validation fails
+    """
+    yield from _iter_normalized_chunks(
+        file_path, 1, chunk_size, usecols, REQUIRED_EMPLOYEE_SKILLS_COLUMNS, _validate_and_normalize_skills
+    )
+
+
+def read_employee_sheet(file_path: str, chunk_size: int = EXCEL_READ_CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Read the whole Employee sheet through the streaming reader.
+    
+    Args:
+        file_path: Path to the Excel file
+        chunk_size: Sheet rows per chunk while reading
+        
+    Returns:
+        Normalized employees DataFrame
+    """
+    return pd.concat(list(iter_employee_chunks(file_path, chunk_size)))
+
+
+def count_sheet_rows(file_path: str) -> Tuple[int, int]:
+    """
+    Data row counts of the Employee and Employee_Skills sheets (from the sheet dimensions).
+    
+    Counts can include trailing formatted-but-empty rows, so they are only
+    suitable for progress reporting.
+    
+    Returns:
+        Tuple of (employee_rows, skill_rows)
+    """
+    workbook = _open_workbook(file_path)
+    try:
+        return tuple(
+            max(0, (_select_sheet(workbook, position).max_row or 1) - 1) for position in (0, 1)
+        )
+    finally:
+        workbook.close()
+
+
+def _open_workbook(file_path: str):
+    if not Path(file_path).exists():
+        raise ExcelReaderError(f"File not found: {file_path}")
+    try:
+        # read_only: rows are streamed from the XML instead of building the full cell tree
+        return load_workbook(file_path, read_only=True, data_only=True)
+    except Exception as e:
+        raise ExcelReaderError(f"Failed to read Excel file: {str(e)}")
+
+
+def _select_sheet(workbook, position: int):
+    """Employee (0) / Employee_Skills (1) sheet by name, else by position (as read_excel)."""
+    sheet_names = workbook.sheetnames
+    if EMPLOYEE_SHEET in sheet_names and EMPLOYEE_SKILLS_SHEET in sheet_names:
+        return workbook[(EMPLOYEE_SHEET, EMPLOYEE_SKILLS_SHEET)[position]]
+    if len(sheet_names) < 2:
+        raise ExcelReaderError("Excel file must contain at least 2 sheets")
+    logger.warning(f"Using sheet by position: '{sheet_names[position]}'")
+    return workbook[sheet_names[position]]
+
+
+def _iter_normalized_chunks(file_path: str, position: int, chunk_size: int, usecols: Sequence[str],
+                            required_columns: List[str], normalize) -> Iterator[pd.DataFrame]:
+    workbook = _open_workbook(file_path)
+    try:
+        sheet = _select_sheet(workbook, position)
+        logger.info(f"Streaming sheet '{sheet.title}' in chunks of {chunk_size} rows")
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        
+        selected = _select_columns(header, usecols)
+        missing_cols = [col for col in required_columns if col not in {name for _, name in selected}]
+        if missing_cols:
+            raise ExcelReaderError(f"Missing required columns in sheet '{sheet.title}': {missing_cols}")
+        columns = [name for _, name in selected]
+        
+        total_rows, yielded = 0, False
+        for offset, raw_rows in _batched_rows(rows, max(1, chunk_size)):
+            chunk = _build_chunk(raw_rows, offset, selected, columns)
+            total_rows += len(raw_rows)
+            if chunk.empty:
+                continue
+            normalized = normalize(chunk)
+            if not normalized.empty:
+                yielded = True
+                yield normalized
+        if not yielded:
+            # Always yield once so consumers get the normalized columns
+            yield normalize(_build_chunk([], 0, selected, columns))
+        logger.info(f"Streamed {total_rows} rows from sheet '{sheet.title}'")
+    except ExcelReaderError:
+        raise
+    except Exception as e:
+        logger.error(f"Error reading Excel file: {str(e)}")
+        raise ExcelReaderError(f"Failed to read Excel file: {str(e)}")
+    finally:
+        workbook.close()
+
+
+def _select_columns(header: Sequence[Any], usecols: Sequence[str]) -> List[Tuple[int, str]]:
+    """(position, usecols name) of the header cells to read; the first match of each name wins."""
+    wanted = {name.strip().lower(): name for name in usecols}
+    selected, seen = [], set()
+    for i, cell in enumerate(header):
+        name = wanted.get(str(cell).strip().lower()) if cell is not None else None
+        if name and name not in seen:
+            seen.add(name)
+            selected.append((i, name))
+    return selected
+
+
+def _batched_rows(rows, chunk_size: int) -> Iterator[Tuple[int, List[tuple]]]:
+    """Group sheet rows into (first data row position, rows) batches."""
+    batch, offset = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) == chunk_size:
+            yield offset, batch
+            offset += len(batch)
+            batch = []
+    if batch:
+        yield offset, batch
+
+
+def _build_chunk(raw_rows: List[tuple], offset: int, selected: List[Tuple[int, Any]],
+                 columns: List[str]) -> pd.DataFrame:
+    """
+    One chunk as an object-dtype DataFrame of the selected columns.
+    
+    Every column is object dtype so chunks never differ in inferred types;
+    the normalize functions do the typed conversions. Empty cells are NaN
+    (as with pd.read_excel) and fully empty rows are dropped. The index is
+    the data row position in the sheet, so Excel row numbers stay correct.
+    """
+    values = [
+        tuple(row[i] if i < len(row) else None for i, _ in selected)
+        for row in raw_rows
+    ]
+    index = [
+        offset + i for i, row in enumerate(values)
+        if any(value is not None and value != '' for value in row)
+    ]
+    data = np.array([values[i - offset] for i in index], dtype=object).reshape(len(index), len(columns))
+    data[pd.isna(data)] = np.nan
+    return pd.DataFrame(data, index=index, columns=columns, dtype=object)
+
+
 def _validate_and_normalize_employees(df: pd.DataFrame) -> pd.DataFrame:
     """Validate and normalize employee data."""
     logger.info("Validating employee data...")
@@ -221,7 +421,7 @@ def _validate_and_normalize_skills(df: pd.DataFrame) -> pd.DataFrame:
     return df_normalized
 
 
-def get_master_data_for_scanning(employees_df: pd.DataFrame, skills_df: pd.DataFrame) -> Dict[str, set]:
+def get_master_data_for_scanning(employees_df: pd.DataFrame, skills_df: Optional[pd.DataFrame] = None) -> Dict[str, set]:
     """
     Extract all unique master data values from the DataFrames for hierarchical validation.
     This follows the 2-step approach: scan first, then validate/update master tables.
@@ -0,0 +1,82 @@
+"""
+Streamed storage of uploaded import files.
+
+Uploads are copied to a temporary file in fixed-size chunks, checking the
+size limit and hashing as the bytes arrive, so memory per upload stays at
+one chunk whatever the file size. Set IMPORT_UPLOAD_DIR to put the files on
+storage shared with external import workers (default: the system temp dir).
+"""
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import UploadFile
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # 50MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the size limit (the partial file is removed)."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"File exceeds maximum allowed size ({max_bytes} bytes)")
+
+
+@dataclass
+class SavedUpload:
+    """An upload written to disk."""
+    path: str
+    size: int
+    sha256: str
+
+
+async def save_upload_stream(
+    upload_file: UploadFile,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> SavedUpload:
+    """
+    Stream an uploaded file to a temporary file.
+
+    Args:
+        upload_file: The uploaded file
+        max_bytes: Size limit, checked while reading
+        chunk_size: Bytes read and written per step
+
+    Returns:
+        SavedUpload with the file path, size and SHA-256 hex digest
+
+    Raises:
+        UploadTooLargeError: If the upload is larger than max_bytes
+    """
+    suffix = Path(upload_file.filename or "").suffix
+    upload_dir = os.getenv("IMPORT_UPLOAD_DIR") or None
+    digest = hashlib.sha256()
+    size = 0
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=upload_dir) as temp_file:
+        temp_file_path = temp_file.name
+        try:
+            while True:
+                chunk = await upload_file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                digest.update(chunk)
+                temp_file.write(chunk)
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_file_path)
+            raise
+
+    logger.info(f"Saved {size} bytes to temporary file: {temp_file_path}")
+    return SavedUpload(path=temp_file_path, size=size, sha256=digest.hexdigest())
@@ -0,0 +1,191 @@
+"""
+ANN Search Recall vs Latency Benchmark
+======================================
+
+PURPOSE:
+    Compare approximate (HNSW / IVFFlat) search against exact search on
+    skill_embeddings, so index settings can be chosen without changing
+    which skills cross THRESHOLD_AUTO_ACCEPT / THRESHOLD_REVIEW.
+
+USAGE:
+    python scripts/benchmark_ann_search.py [--model text-embedding-3-small] [--queries 200]
+        [--top-k 5] [--ef-search 10 40 100 200] [--probes 1 5 10 20] [--noise 0.02]
+
+    Queries are stored skill embeddings plus Gaussian noise (so the nearest
+    neighbour is not trivially the query itself). Build an index first with
+    scripts/manage_vector_indexes.py; without one "approximate" is exact.
+
+REPORTS (per setting):
+    - recall@k: fraction of exact top-k skill IDs also returned
+    - top1: fraction of queries with the same best skill
+    - decision: fraction of queries classified the same way
+      (auto-accept / review / unresolved) as exact search
+    - p50 / p95 latency in ms
+
+READS:
+    - skill_embeddings table
+"""
+
+import sys
+import os
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from app.db.session import SessionLocal
+from app.models.skill_embedding import SkillEmbedding
+from app.services.skill_resolution.embedding_provider import DEFAULT_EMBEDDING_MODEL
+from app.services.skill_resolution.skill_embedding_repository import (
+    SkillEmbeddingRepository,
+    SEARCH_MODE_EXACT,
+    SEARCH_MODE_APPROXIMATE
+)
+from app.services.skill_resolution.skill_resolver_service import SkillResolverService
+
+Matches = List[Tuple[int, float]]
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def classify(matches: Matches) -> str:
+    """Resolution decision for a top-k list, using the resolver thresholds."""
+    if not matches:
+        return "unresolved"
+    best = matches[0][1]
+    if best >= SkillResolverService.THRESHOLD_AUTO_ACCEPT:
+        return "auto_accept"
+    if best >= SkillResolverService.THRESHOLD_REVIEW:
+        return "review"
+    return "unresolved"
+
+
+def recall_at_k(exact: Matches, approximate: Matches) -> float:
+    """Fraction of exact top-k skill IDs present in the approximate result."""
+    if not exact:
+        return 1.0
+    exact_ids = {skill_id for skill_id, _ in exact}
+    approx_ids = {skill_id for skill_id, _ in approximate}
+    return len(exact_ids & approx_ids) / len(exact_ids)
+
+
+def percentile_ms(latencies: Sequence[float], pct: float) -> float:
+    return float(np.percentile(np.asarray(latencies) * 1000.0, pct)) if latencies else 0.0
+
+
+def summarize(
+    exact_results: List[Matches],
+    approx_results: List[Matches],
+    latencies: List[float]
+) -> Dict[str, float]:
+    n = len(exact_results)
+    return {
+        'recall': sum(recall_at_k(e, a) for e, a in zip(exact_results, approx_results)) / n,
+        'top1': sum(
+            bool(e) and bool(a) and e[0][0] == a[0][0] for e, a in zip(exact_results, approx_results)
+        ) / n,
+        'decision': sum(classify(e) == classify(a) for e, a in zip(exact_results, approx_results)) / n,
+        'p50_ms': percentile_ms(latencies, 50),
+        'p95_ms': percentile_ms(latencies, 95)
+    }
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def load_queries(db, model_name: str, count: int, noise: float, seed: int) -> List[List[float]]:
+    """Sample stored embeddings and perturb them with Gaussian noise."""
+    rows = db.query(SkillEmbedding.embedding).filter(
+        SkillEmbedding.model_name == model_name
+    ).all()
+    if not rows:
+        return []
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(len(rows), size=min(count, len(rows)), replace=False)
+    queries = []
+    for i in picks:
+        vector = np.asarray(rows[i][0], dtype=np.float64)
+        vector = vector + rng.normal(0.0, noise, size=vector.shape)
+        queries.append(vector.tolist())
+    return queries
+
+
+def run_setting(
+    repo: SkillEmbeddingRepository,
+    queries: List[List[float]],
+    top_k: int,
+    model_name: str,
+    search_mode: str,
+    ef_search: Optional[int] = None,
+    probes: Optional[int] = None
+) -> Tuple[List[Matches], List[float]]:
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(repo.find_top_k(
+            query, k=top_k, model_name=model_name,
+            search_mode=search_mode, ef_search=ef_search, probes=probes
+        ))
+        latencies.append(time.perf_counter() - start)
+    return results, latencies
+
+
+def print_row(label: str, stats: Dict[str, float]):
+    print(
+        f"{label:<22} recall@k={stats['recall']:.3f}  top1={stats['top1']:.3f}  "
+        f"decision={stats['decision']:.3f}  p50={stats['p50_ms']:.2f}ms  p95={stats['p95_ms']:.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ANN recall/latency vs exact search")
+    parser.add_argument("--model", default=DEFAULT_EMBEDDING_MODEL)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--ef-search", type=int, nargs="*", default=[10, 40, 100, 200])
+    parser.add_argument("--probes", type=int, nargs="*", default=[])
+    parser.add_argument("--noise", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        # No vector_index: every search goes through SQL
+        repo = SkillEmbeddingRepository(db)
+        queries = load_queries(db, args.model, args.queries, args.noise, args.seed)
+        if not queries:
+            print(f"❌ No embeddings found for model '{args.model}'")
+            return
+
+        print("=" * 100)
+        print(f"ANN BENCHMARK | model={args.model} | queries={len(queries)} | top-k={args.top_k}")
+        print("=" * 100)
+
+        exact, exact_latencies = run_setting(repo, queries, args.top_k, args.model, SEARCH_MODE_EXACT)
+        print_row("exact", summarize(exact, exact, exact_latencies))
+
+        for ef in args.ef_search:
+            approx, latencies = run_setting(
+                repo, queries, args.top_k, args.model, SEARCH_MODE_APPROXIMATE, ef_search=ef
+            )
+            print_row(f"hnsw ef_search={ef}", summarize(exact, approx, latencies))
+
+        for probes in args.probes:
+            approx, latencies = run_setting(
+                repo, queries, args.top_k, args.model, SEARCH_MODE_APPROXIMATE, probes=probes
+            )
+            print_row(f"ivfflat probes={probes}", summarize(exact, approx, latencies))
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Compact Embedding Index Benchmark
+=================================
+
+PURPOSE:
+    Compare reduced-dimension and float16/int8 in-memory skill vector
+    indexes against the full-precision (float32, full width) baseline on the
+    real taxonomy, so SKILL_VECTOR_INDEX_DIMENSIONS / _PRECISION /
+    _RESCORE_MULTIPLIER can be chosen without changing which skills cross
+    THRESHOLD_AUTO_ACCEPT / THRESHOLD_REVIEW.
+
+USAGE:
+    python scripts/benchmark_compact_embeddings.py [--model text-embedding-3-small] [--queries 200]
+        [--top-k 5] [--dimensions 1536 512 256] [--precisions float32 float16 int8]
+        [--rescore 0 4] [--noise 0.02]
+
+    Queries are stored skill embeddings plus Gaussian noise (so the nearest
+    neighbour is not trivially the query itself). Rescoring fetches candidate
+    embeddings from skill_embeddings, exactly as the resolver does.
+
+REPORTS (per setting):
+    - memory: bytes held by the index (IDs + matrix + int8 scales)
+    - recall@k: fraction of baseline top-k skill IDs also returned
+    - top1: fraction of queries with the same best skill
+    - decision: fraction of queries classified the same way
+      (auto-accept / review / unresolved) as the baseline
+    - max|Δsim|: largest top-1 similarity difference vs the baseline
+    - p50 / p95 single-query latency in ms
+
+READS:
+    - skill_embeddings table
+"""
+
+import sys
+import os
+import argparse
+import time
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.session import SessionLocal
+from app.services.skill_resolution.embedding_provider import DEFAULT_EMBEDDING_MODEL
+from app.services.skill_resolution.skill_embedding_repository import SkillEmbeddingRepository
+from app.services.skill_resolution.skill_vector_index import (
+    SkillVectorIndex,
+    SUPPORTED_PRECISIONS,
+    PRECISION_FLOAT32
+)
+# Same metrics and query sampling as the ANN benchmark (this script's directory is on sys.path)
+from benchmark_ann_search import Matches, load_queries, summarize as summarize_recall
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def summarize(baseline: List[Matches], results: List[Matches], latencies: List[float]) -> Dict[str, float]:
+    """ANN benchmark metrics plus the largest top-1 similarity difference."""
+    return {
+        **summarize_recall(baseline, results, latencies),
+        'max_delta': max(
+            (abs(b[0][1] - r[0][1]) for b, r in zip(baseline, results) if b and r), default=0.0
+        )
+    }
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def run_setting(db, model_name: str, queries: List[List[float]], top_k: int, **index_options):
+    """Build one index configuration and time single-query searches through the repository."""
+    index = SkillVectorIndex(model_name=model_name, **index_options)
+    index.load(db)
+    repo = SkillEmbeddingRepository(db, vector_index=index)
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(repo.find_top_k(query, k=top_k, model_name=model_name))
+        latencies.append(time.perf_counter() - start)
+    return index, results, latencies
+
+
+def print_row(label: str, memory_bytes: int, stats: Dict[str, float]):
+    print(
+        f"{label:<30} mem={memory_bytes / 1024 / 1024:7.2f}MiB  recall@k={stats['recall']:.3f}  "
+        f"top1={stats['top1']:.3f}  decision={stats['decision']:.3f}  max|Δsim|={stats['max_delta']:.4f}  "
+        f"p50={stats['p50_ms']:.2f}ms  p95={stats['p95_ms']:.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compact (reduced/quantized) skill vector indexes")
+    parser.add_argument("--model", default=DEFAULT_EMBEDDING_MODEL)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--dimensions", type=int, nargs="*", default=[1536, 512, 256])
+    parser.add_argument("--precisions", nargs="*", choices=SUPPORTED_PRECISIONS, default=list(SUPPORTED_PRECISIONS))
+    parser.add_argument("--rescore", type=int, nargs="*", default=[0, 4],
+                        help="Rescore multipliers to try (0 = approximate scores only)")
+    parser.add_argument("--noise", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        queries = load_queries(db, args.model, args.queries, args.noise, args.seed)
+        if not queries:
+            print(f"❌ No embeddings found for model '{args.model}'")
+            return
+
+        print("=" * 130)
+        print(f"COMPACT INDEX BENCHMARK | model={args.model} | queries={len(queries)} | top-k={args.top_k}")
+        print("=" * 130)
+
+        baseline_index, baseline, latencies = run_setting(db, args.model, queries, args.top_k)
+        print_row("baseline float32 full", baseline_index.memory_bytes, summarize(baseline, baseline, latencies))
+
+        for dimensions in args.dimensions:
+            for precision in args.precisions:
+                if precision == PRECISION_FLOAT32 and dimensions >= baseline_index.dimension:
+                    continue  # same as baseline
+                for multiplier in args.rescore:
+                    index, results, latencies = run_setting(
+                        db, args.model, queries, args.top_k,
+                        dimensions=dimensions, precision=precision, rescore_multiplier=multiplier
+                    )
+                    label = f"{precision} dim={index.dimension} rescore={multiplier}"
+                    print_row(label, index.memory_bytes, summarize(baseline, results, latencies))
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
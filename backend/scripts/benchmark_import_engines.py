@@ -0,0 +1,210 @@
+"""
+Employee Import Engine Benchmark
+================================
+
+PURPOSE:
+    Compare the two employee import engines on the same synthetic workbook
+    against a real PostgreSQL database:
+    - 'rows': EmployeePersister/SkillPersister (per-chunk upserts and commits)
+    - 'staging': StagingImportEngine (COPY into staging tables, set-based
+      merge, one transaction)
+    Each engine imports the workbook twice (all employees new, then all
+    existing), and the outcomes are compared: imported/created/updated
+    counts, skills written and failed rows per (sheet, error code, Excel row).
+
+USAGE:
+    python scripts/benchmark_import_engines.py [--employees 2000] [--skills-per-employee 10]
+        [--unknown-ratio 0.02] [--invalid-ratio 0.01] [--seed 42] [--keep-file] [--delta]
+
+    Exits with status 1 if the engines' outcomes differ. Delta import is off
+    unless --delta is given (the second run would otherwise be skipped as an
+    unchanged file).
+
+DATA:
+    Employees use 'BENCH-' ZIDs under a 'Bench Sub-Segment' org branch;
+    skills are sampled from the skills table plus unknown names, so
+    raw_skill_inputs rows are written too. Invalid employee rows leave
+    Project and Team empty (MISSING_REFERENCE; their skills fail with
+    EMPLOYEE_NOT_IMPORTED). Everything written for BENCH- employees (and the
+    bench segment) is deleted before each run and at the end.
+"""
+
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from openpyxl import Workbook
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.models import Skill, ProficiencyLevel
+from app.services.imports.employee_import import (
+    EmployeeImportOrchestrator, IMPORT_ENGINE_ROWS, IMPORT_ENGINE_STAGING
+)
+from app.utils.excel_reader import EMPLOYEE_COLUMN_MAPPING, EMPLOYEE_SKILLS_COLUMN_MAPPING
+
+ZID_PREFIX = 'BENCH-'
+SEGMENT = 'Bench Segment'
+SUB_SEGMENT = 'Bench Sub-Segment'
+PROJECTS = ['Bench Project A', 'Bench Project B']
+TEAMS = ['Bench Team 1', 'Bench Team 2', 'Bench Team 3']
+
+CLEANUP_STATEMENTS = (
+    "DELETE FROM employee_skill_history WHERE employee_id IN (SELECT employee_id FROM employees WHERE zid LIKE :zids)",
+    "DELETE FROM proficiency_change_history WHERE employee_id IN "
+    "(SELECT employee_id FROM employees WHERE zid LIKE :zids)",
+    "DELETE FROM raw_skill_inputs WHERE employee_id IN (SELECT employee_id FROM employees WHERE zid LIKE :zids)",
+    "DELETE FROM employee_skills WHERE employee_id IN (SELECT employee_id FROM employees WHERE zid LIKE :zids)",
+    "DELETE FROM employee_project_allocations WHERE employee_id IN "
+    "(SELECT employee_id FROM employees WHERE zid LIKE :zids)",
+    "DELETE FROM employees WHERE zid LIKE :zids",
+    "DELETE FROM teams WHERE project_id IN (SELECT project_id FROM projects WHERE sub_segment_id IN "
+    "(SELECT sub_segment_id FROM sub_segments WHERE sub_segment_name = :sub_segment))",
+    "DELETE FROM projects WHERE sub_segment_id IN "
+    "(SELECT sub_segment_id FROM sub_segments WHERE sub_segment_name = :sub_segment)",
+    "DELETE FROM sub_segments WHERE sub_segment_name = :sub_segment",
+    "DELETE FROM segments WHERE segment_name = :segment",
+)
+
+
+def load_master_names() -> Tuple[List[str], List[str]]:
+    """Existing skill names and proficiency level names to build valid rows from."""
+    db = SessionLocal()
+    try:
+        skills = [name for (name,) in db.query(Skill.skill_name).order_by(Skill.skill_id).limit(500).all()]
+        levels = [name for (name,) in db.query(ProficiencyLevel.level_name).all()]
+    finally:
+        db.close()
+    if not skills or not levels:
+        raise SystemExit("The database needs skills and proficiency levels (run init_db first)")
+    return skills, levels
+
+
+def generate_workbook(path: str, employees: int, skills_per_employee: int, unknown_ratio: float,
+                      invalid_ratio: float, skills: List[str], levels: List[str], seed: int):
+    """Write the synthetic workbook (Employee + Employee_Skills sheets)."""
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+
+    employee_sheet = workbook.create_sheet('Employee')
+    employee_sheet.append(list(EMPLOYEE_COLUMN_MAPPING))
+    for index in range(employees):
+        invalid = rng.random() < invalid_ratio
+        project = None if invalid else PROJECTS[index % len(PROJECTS)]
+        team = None if invalid else rng.choice(TEAMS)
+        employee_sheet.append([
+            f"{ZID_PREFIX}{index:06d}", f"Bench Employee {index}", SEGMENT, SUB_SEGMENT, project, team, 'Developer', '2020-01-15', rng.choice([None, 50, '100%'])
+        ])
+
+    skill_sheet = workbook.create_sheet('Employee_Skills')
+    skill_sheet.append(list(EMPLOYEE_SKILLS_COLUMN_MAPPING))
+    for index in range(employees):
+        for _ in range(skills_per_employee):
+            if rng.random() < unknown_ratio:
+                skill_name = f"Bench Unknown Skill {rng.randint(0, 50)}"
+            else:
+                skill_name = rng.choice(skills)
+            skill_sheet.append([
+                f"{ZID_PREFIX}{index:06d}", f"Bench Employee {index}", skill_name, rng.choice(levels),
+                rng.randint(0, 15), '2024-06-01', '2018-01-01', None, None, rng.randint(1, 5)
+            ])
+    workbook.save(path)
+
+
+def cleanup():
+    db = SessionLocal()
+    try:
+        for statement in CLEANUP_STATEMENTS:
+            db.execute(text(statement), {'zids': f"{ZID_PREFIX}%", 'segment': SEGMENT, 'sub_segment': SUB_SEGMENT})
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_import(path: str, engine: str) -> Tuple[float, Dict]:
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        result = EmployeeImportOrchestrator(db, import_engine=engine).import_excel(path)
+        return time.perf_counter() - start, result
+    finally:
+        db.close()
+
+
+def outcome(result: Dict) -> Dict:
+    """Engine-independent part of an import result."""
+    return {
+        'employee_imported': result['employee_imported'],
+        'employees_created': result.get('employees_created'),
+        'employees_updated': result.get('employees_updated'),
+        'skill_imported': result['skill_imported'],
+        'failed_rows': sorted(
+            (row['sheet'], row['error_code'], row['excel_row_number'] or 0) for row in result['failed_rows']
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the row-by-row and staging import engines")
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--skills-per-employee", type=int, default=10)
+    parser.add_argument("--unknown-ratio", type=float, default=0.02,
+                        help="Share of skill rows with names not in the taxonomy")
+    parser.add_argument("--invalid-ratio", type=float, default=0.01,
+                        help="Share of employee rows without project/team")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep-file", action="store_true", help="Keep the generated workbook")
+    parser.add_argument("--delta", action="store_true", help="Run with delta import (EMPLOYEE_IMPORT_DELTA)")
+    args = parser.parse_args()
+    os.environ["EMPLOYEE_IMPORT_DELTA"] = "true" if args.delta else "false"
+
+    skills, levels = load_master_names()
+    handle, path = tempfile.mkstemp(suffix='.xlsx', prefix='bench_import_')
+    os.close(handle)
+    print(f"Generating {args.employees} employees x {args.skills_per_employee} skills → {path}")
+    generate_workbook(path, args.employees, args.skills_per_employee, args.unknown_ratio,
+                      args.invalid_ratio, skills, levels, args.seed)
+
+    timings: Dict[str, List[float]] = {}
+    outcomes: Dict[str, List[Dict]] = {}
+    try:
+        for engine in (IMPORT_ENGINE_ROWS, IMPORT_ENGINE_STAGING):
+            cleanup()
+            for label in ('new', 'existing'):
+                seconds, result = run_import(path, engine)
+                timings.setdefault(engine, []).append(seconds)
+                outcomes.setdefault(engine, []).append(outcome(result))
+                failures = Counter(row['error_code'] for row in result['failed_rows'])
+                print(f"  {engine:8s} {label:9s} {seconds:8.2f}s  employees={result['employee_imported']} "
+                      f"skills={result['skill_imported']} failed={dict(failures)}")
+    finally:
+        cleanup()
+        if not args.keep_file:
+            os.unlink(path)
+
+    print("\nSpeedup (rows / staging):")
+    for index, label in enumerate(('new', 'existing')):
+        rows_seconds = timings[IMPORT_ENGINE_ROWS][index]
+        staging_seconds = timings[IMPORT_ENGINE_STAGING][index]
+        print(f"  {label:9s} {rows_seconds / staging_seconds:6.2f}x")
+
+    if outcomes[IMPORT_ENGINE_ROWS] != outcomes[IMPORT_ENGINE_STAGING]:
+        print("\nOUTCOMES DIFFER between engines")
+        for rows_outcome, staging_outcome in zip(outcomes[IMPORT_ENGINE_ROWS], outcomes[IMPORT_ENGINE_STAGING]):
+            for key in rows_outcome:
+                if rows_outcome[key] != staging_outcome[key]:
+                    print(f"  {key}: rows={rows_outcome[key]!r:.200} staging={staging_outcome[key]!r:.200}")
+        sys.exit(1)
+    print("\nOutcomes identical")
+
+
+if __name__ == "__main__":
+    main()
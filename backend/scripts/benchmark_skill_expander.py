@@ -0,0 +1,134 @@
+"""
+Skill Expander Micro-Benchmark
+==============================
+
+PURPOSE:
+    Check that the column-wise SkillExpander (str.split + explode) returns
+    the same rows as the previous iterrows()/row.copy() implementation, and
+    measure the speedup on a large synthetic Employee_Skills sheet.
+
+USAGE:
+    python scripts/benchmark_skill_expander.py [--rows 100000] [--multi-ratio 0.3]
+        [--repeat 3] [--seed 42] [--min-speedup 10]
+
+    Exits with status 1 if the outputs differ or the speedup is below
+    --min-speedup.
+
+COMPARED:
+    - index labels (Excel row numbers are derived from them), column order
+      and every cell value; dtypes are not compared because the old
+      implementation rebuilt the frame from row Series (object columns)
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+from typing import Callable, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from app.services.imports.employee_import.skill_expander import SkillExpander
+
+SKILLS = ["Python", "Java", "PostgreSQL", "SQL Server", "React", "Docker", "Kubernetes", "AWS", "Go", "C#"]
+
+
+def legacy_expand_skills(skills_df: pd.DataFrame) -> pd.DataFrame:
+    """Previous row-by-row SkillExpander.expand_skills, kept as the reference."""
+    expanded_rows = []
+    for idx, row in skills_df.iterrows():
+        skill_name_raw = str(row.get('skill_name', '')).strip()
+        if ',' in skill_name_raw or ';' in skill_name_raw:
+            skill_names = [s.strip() for s in skill_name_raw.replace(';', ',').split(',')]
+            skill_names = [s for s in skill_names if s]
+            for skill_name in skill_names:
+                row_copy = row.copy()
+                row_copy['skill_name'] = skill_name
+                expanded_rows.append(row_copy)
+        else:
+            expanded_rows.append(row)
+    if len(expanded_rows) > len(skills_df):
+        return pd.DataFrame(expanded_rows)
+    return skills_df
+
+
+def generate_sheet(rows: int, multi_ratio: float, seed: int) -> pd.DataFrame:
+    """Synthetic Employee_Skills sheet with single, comma/semicolon and messy cells."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(rows):
+        roll = rng.random()
+        if roll < multi_ratio:
+            separator = rng.choice([", ", ";", " ,", "; "])
+            skill_name = separator.join(rng.sample(SKILLS, rng.randint(2, 4)))
+            if rng.random() < 0.1:
+                skill_name += ","  # trailing separator → empty token
+        elif roll < multi_ratio + 0.02:
+            skill_name = None
+        else:
+            skill_name = f"  {rng.choice(SKILLS)} "
+        records.append({
+            'zid': f"Z{i // 5:06d}",
+            'employee_full_name': f"Employee {i // 5}",
+            'skill_name': skill_name,
+            'proficiency': rng.choice(["Beginner", "Intermediate", "Advanced", "Expert"]),
+            'years_experience': rng.randint(0, 20),
+            'last_used': "2024-01-01"
+        })
+    return pd.DataFrame(records)
+
+
+def best_time(func: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SkillExpander against the row-by-row implementation")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--multi-ratio", type=float, default=0.3,
+                        help="Fraction of cells holding several skills")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min-speedup", type=float, default=10.0)
+    args = parser.parse_args()
+
+    sheet = generate_sheet(args.rows, args.multi_ratio, args.seed)
+    expander = SkillExpander()
+
+    print("=" * 80)
+    print(f"SKILL EXPANDER BENCHMARK | rows={len(sheet)} | multi-ratio={args.multi_ratio}")
+    print("=" * 80)
+
+    expected = legacy_expand_skills(sheet)
+    actual = expander.expand_skills(sheet)
+    try:
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        print(f"✅ Identical output: {len(actual)} rows")
+    except AssertionError as e:
+        print(f"❌ Outputs differ: {e}")
+        sys.exit(1)
+
+    legacy_seconds = best_time(lambda: legacy_expand_skills(sheet), 1)
+    vectorized_seconds = best_time(lambda: expander.expand_skills(sheet), args.repeat)
+    speedup = legacy_seconds / vectorized_seconds if vectorized_seconds else float('inf')
+
+    print(f"row-by-row:  {legacy_seconds * 1000:10.1f} ms")
+    print(f"vectorized:  {vectorized_seconds * 1000:10.1f} ms")
+    print(f"speedup:     {speedup:10.1f}x")
+
+    if speedup < args.min_speedup:
+        print(f"❌ Speedup below {args.min_speedup}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,576 @@
+"""
+Skill Resolution Benchmark Suite
+================================
+
+PURPOSE:
+    Reproducible performance benchmark for skill resolution, the measured
+    counterpart of scripts/embedding_match_test.py. Runs entirely in memory
+    (no database, no API calls) so results are comparable across machines
+    and commits:
+    - a synthetic taxonomy generator (skills + aliases, seeded)
+    - a noisy raw-skill generator (typos, abbreviations, casing, separators,
+      garbage tokens, unknown skills) with the expected skill per sample
+    - per-layer latency (token validation, exact, alias, embedding) and
+      end-to-end throughput for the employee-import SkillResolver and for
+      SkillResolverService, one text at a time and in bulk (resolve_many)
+    - accuracy per noise kind against the generator's ground truth
+
+USAGE:
+    python scripts/benchmark_skill_resolution.py [--skills 1000] [--samples 5000] [--seed 42]
+        [--provider local|fake] [--embedding-latency-ms 0] [--json results.json]
+        [--compare baseline.json] [--tolerance 0.25]
+
+    --json writes the machine-readable report ("-" for stdout).
+    --compare exits with status 1 if any p95 latency or throughput is worse
+    than the baseline report by more than --tolerance (fraction).
+
+OUTPUT (JSON):
+    {
+      "meta": {...run parameters...},
+      "resolvers": {
+        "SkillResolver": {
+          "per_text": {"throughput_per_sec", "total": {...}, "layers": {layer: {...}}},
+          "bulk": {"seconds", "throughput_per_sec"},
+          "accuracy": {noise_kind: {"samples", "correct", "rate"}}
+        },
+        "SkillResolverService": {...}
+      }
+    }
+    Latency summaries hold count, mean_ms, p50_ms, p95_ms and p99_ms.
+"""
+
+import sys
+import os
+import argparse
+import json
+import logging
+import platform
+import random
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from app.services.imports.employee_import.skill_resolver import SkillResolver
+from app.services.skill_resolution.embedding_provider import FakeEmbeddingProvider
+from app.services.skill_resolution.local_embedding_provider import LocalNgramEmbeddingProvider
+from app.services.skill_resolution.skill_embedding_repository import SkillEmbeddingRepository
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
+from app.services.skill_resolution.skill_resolver_service import SkillResolverService
+from app.services.skill_resolution.skill_vector_index import SkillVectorIndex
+from app.utils.normalization import normalize_key
+
+
+# ============================================================================
+# SYNTHETIC TAXONOMY
+# ============================================================================
+
+BASE_SKILLS = [
+    "python", "java", "javascript", "typescript", "react", "angular", "vue", "node",
+    "django", "flask", "spring boot", "kafka", "spark", "hadoop", "docker", "kubernetes",
+    "terraform", "ansible", "jenkins", "postgres", "mongodb", "redis", "elasticsearch",
+    "snowflake", "dbt", "airflow", "pandas", "tensorflow", "pytorch", "scikit learn",
+    "aws", "azure", "gcp", "linux", "power bi", "tableau", "excel", "sql server",
+    "oracle", "sap", "salesforce", "selenium", "cypress", "graphql", "rust", "go",
+    "scala", "kotlin", "swift", "flutter"
+]
+
+QUALIFIERS = [
+    "", "development", "administration", "architecture", "analytics", "automation",
+    "integration", "monitoring", "performance tuning", "migration", "security",
+    "testing", "design", "cloud", "data engineering", "devops", "support",
+    "optimization", "modeling", "reporting"
+]
+
+# Common workbook abbreviations (word → abbreviation)
+ABBREVIATIONS = {
+    "javascript": "js", "typescript": "ts", "kubernetes": "k8s", "postgres": "pg",
+    "elasticsearch": "es", "tensorflow": "tf", "power bi": "pbi", "scikit learn": "sklearn",
+    "development": "dev", "administration": "admin", "architecture": "arch",
+    "automation": "auto", "integration": "integ", "monitoring": "mon",
+    "performance tuning": "perf tuning", "optimization": "optim", "engineering": "eng",
+    "reporting": "rpt", "security": "sec", "testing": "qa"
+}
+
+# Rejected by SkillTokenValidator (cf. TEST_SKILLS in embedding_match_test.py)
+GARBAGE_TOKENS = [")", "4", "6", "-", "..", "#", "12", "()"]
+
+UNKNOWN_SKILLS = [
+    "underwater basket weaving", "cobol on mainframes", "quantum annealing",
+    "medieval latin", "beekeeping", "origami", "competitive chess", "sourdough baking"
+]
+
+SEPARATORS = ["-", "_", ".", "/", ""]
+
+# Noise kind → sampling weight
+DEFAULT_NOISE_MIX = {
+    "exact": 0.30,
+    "casing": 0.10,
+    "separator": 0.10,
+    "alias": 0.15,
+    "typo": 0.15,
+    "abbreviation": 0.10,
+    "garbage": 0.05,
+    "unknown": 0.05
+}
+
+
+def generate_taxonomy(
+    n_skills: int,
+    seed: int,
+    alias_ratio: float = 0.3
+) -> Tuple[List[Tuple[int, str]], List[Tuple[str, int]]]:
+    """
+    Generate a deterministic synthetic taxonomy.
+
+    Skill names combine a base technology with a qualifier ("kafka monitoring");
+    beyond the 1000 combinations, numbered variants are added. About
+    alias_ratio of skills get an abbreviation or squashed-separator alias.
+
+    Returns:
+        (skills as (skill_id, skill_name), aliases as (alias_text, skill_id))
+    """
+    rng = random.Random(seed)
+    combinations = [f"{base} {qualifier}".strip() for base in BASE_SKILLS for qualifier in QUALIFIERS]
+    rng.shuffle(combinations)
+    names = combinations[:n_skills]
+    suffix = 2
+    while len(names) < n_skills:
+        names.extend(f"{name} {suffix}" for name in combinations[:n_skills - len(names)])
+        suffix += 1
+
+    skills = [(skill_id, name.title()) for skill_id, name in enumerate(names, start=1)]
+    taken = {normalize_key(name) for name in names}
+    aliases = []
+    for skill_id, name in enumerate(names, start=1):
+        if rng.random() >= alias_ratio:
+            continue
+        alias = abbreviate(name) if rng.random() < 0.5 else name.replace(" ", "")
+        if normalize_key(alias) not in taken:
+            taken.add(normalize_key(alias))
+            aliases.append((alias, skill_id))
+    return skills, aliases
+
+
+def abbreviate(name: str) -> str:
+    """Apply known abbreviations; otherwise shorten the last word to 4 letters."""
+    lowered = name.lower()
+    for word, abbreviation in ABBREVIATIONS.items():
+        if word in lowered:
+            return lowered.replace(word, abbreviation)
+    words = lowered.split()
+    if len(words[-1]) > 5:
+        words[-1] = words[-1][:4]
+    return " ".join(words)
+
+
+# ============================================================================
+# NOISY RAW SKILLS
+# ============================================================================
+
+def random_casing(text: str, rng: random.Random) -> str:
+    style = rng.choice(["upper", "lower", "title", "alternating"])
+    if style == "upper":
+        return text.upper()
+    if style == "lower":
+        return text.lower()
+    if style == "title":
+        return text.title()
+    return "".join(c.upper() if i % 2 else c.lower() for i, c in enumerate(text))
+
+
+def random_typo(text: str, rng: random.Random) -> str:
+    """One edit: delete, transpose, duplicate or substitute a letter."""
+    positions = [i for i, c in enumerate(text) if c.isalpha()]
+    if len(positions) < 3:
+        return text
+    i = rng.choice(positions[1:-1])
+    edit = rng.choice(["delete", "transpose", "duplicate", "substitute"])
+    if edit == "delete":
+        return text[:i] + text[i + 1:]
+    if edit == "transpose":
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if edit == "duplicate":
+        return text[:i] + text[i] + text[i:]
+    return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1:]
+
+
+def generate_raw_skills(
+    skills: List[Tuple[int, str]],
+    aliases: List[Tuple[str, int]],
+    n_samples: int,
+    seed: int,
+    noise_mix: Optional[Dict[str, float]] = None
+) -> List[Tuple[str, str, Optional[int]]]:
+    """
+    Generate noisy raw skill strings as they appear in employee workbooks.
+
+    Returns:
+        List of (raw_text, noise_kind, expected_skill_id or None)
+    """
+    rng = random.Random(seed + 1)
+    mix = noise_mix or DEFAULT_NOISE_MIX
+    kinds, weights = list(mix), list(mix.values())
+    samples = []
+    for _ in range(n_samples):
+        kind = rng.choices(kinds, weights)[0]
+        skill_id, name = rng.choice(skills)
+        if kind == "exact":
+            raw = name
+        elif kind == "casing":
+            raw = random_casing(name, rng)
+        elif kind == "separator":
+            raw = name.replace(" ", rng.choice(SEPARATORS))
+        elif kind == "alias" and aliases:
+            raw, skill_id = rng.choice(aliases)
+        elif kind == "typo":
+            raw = random_typo(name, rng)
+        elif kind == "abbreviation":
+            raw = abbreviate(name)
+        elif kind == "garbage":
+            raw, skill_id = rng.choice(GARBAGE_TOKENS), None
+        elif kind == "unknown":
+            raw, skill_id = rng.choice(UNKNOWN_SKILLS), None
+        else:
+            raw, kind = name, "exact"
+        samples.append((raw, kind, skill_id))
+    return samples
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def summarize_latencies(seconds: Sequence[float]) -> Dict[str, float]:
+    if not seconds:
+        return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+    ms = np.asarray(seconds) * 1000.0
+    return {
+        'count': int(len(ms)),
+        'mean_ms': round(float(ms.mean()), 4),
+        'p50_ms': round(float(np.percentile(ms, 50)), 4),
+        'p95_ms': round(float(np.percentile(ms, 95)), 4),
+        'p99_ms': round(float(np.percentile(ms, 99)), 4)
+    }
+
+
+class LayerTimer:
+    """Wraps resolver methods on an instance and records one latency sample per call."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def wrap(self, obj, method_name: str, layer: str) -> None:
+        original = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.samples[layer].append(time.perf_counter() - start)
+
+        setattr(obj, method_name, timed)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        return {layer: summarize_latencies(samples) for layer, samples in self.samples.items()}
+
+
+class Fixture:
+    """Taxonomy, provider and vector index shared by every resolver under test."""
+
+    def __init__(self, skills, aliases, provider, model_name: str, skill_vectors):
+        self.skills = skills
+        self.aliases = aliases
+        self.provider = provider
+        self.model_name = model_name
+        self.vector_index = SkillVectorIndex.from_vectors(
+            [skill_id for skill_id, _ in skills], skill_vectors, model_name=model_name
+        )
+
+    def lookup_index(self) -> SkillLookupIndex:
+        return SkillLookupIndex.from_entries(skills=self.skills, aliases=self.aliases)
+
+    def repository(self) -> SkillEmbeddingRepository:
+        return SkillEmbeddingRepository(None, vector_index=self.vector_index)
+
+    def service(self) -> SkillResolverService:
+        service = SkillResolverService(
+            None,
+            embedding_provider=self.provider,
+            lookup_index=self.lookup_index(),
+            cache_query_embeddings=False,
+            embedding_model_name=self.model_name
+        )
+        service.embedding_repo = self.repository()
+        return service
+
+    def employee_resolver(self) -> SkillResolver:
+        stats = {
+            'skills_resolved_exact': 0,
+            'skills_resolved_alias': 0,
+            'skills_unresolved': 0,
+            'unresolved_skill_names': []
+        }
+        resolver = SkillResolver(None, stats, lookup_index=self.lookup_index())
+        resolver.set_name_normalizer(normalize_key)
+        resolver.embedding_provider = self.provider
+        resolver.embedding_enabled = True
+        resolver.embedding_model_name = self.model_name
+        resolver._embedding_repo = self.repository()
+        resolver._bulk_resolver = self.service()
+        return resolver
+
+
+def build_fixture(args) -> Fixture:
+    skills, aliases = generate_taxonomy(args.skills, args.seed)
+    if args.provider == "local":
+        provider = LocalNgramEmbeddingProvider().fit_idf(
+            [name for _, name in skills] + [alias for alias, _ in aliases]
+        )
+    else:
+        provider = FakeEmbeddingProvider(
+            dimension=1536, deterministic=True, latency_seconds=args.embedding_latency_ms / 1000.0
+        )
+    vectors = provider.embed_batch([name.lower() for _, name in skills])
+    if args.provider == "local" and args.embedding_latency_ms:
+        provider = _with_latency(provider, args.embedding_latency_ms / 1000.0)
+    return Fixture(skills, aliases, provider, provider.model_name, vectors)
+
+
+def _with_latency(provider, latency_seconds: float):
+    """Add a fixed per-request delay, simulating a remote embedding endpoint."""
+    embed, embed_batch = provider.embed, provider.embed_batch
+
+    def slow_embed(text):
+        time.sleep(latency_seconds)
+        return embed(text)
+
+    def slow_embed_batch(texts):
+        time.sleep(latency_seconds)
+        return embed_batch(texts)
+
+    provider.embed, provider.embed_batch = slow_embed, slow_embed_batch
+    return provider
+
+
+def accuracy_report(
+    samples: List[Tuple[str, str, Optional[int]]],
+    resolved: Callable[[str], Optional[int]]
+) -> Dict[str, Dict[str, float]]:
+    totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    for raw, kind, expected in samples:
+        totals[kind][0] += 1
+        totals[kind][1] += resolved(raw) == expected
+    return {
+        kind: {'samples': n, 'correct': correct, 'rate': round(correct / n, 4)}
+        for kind, (n, correct) in sorted(totals.items())
+    }
+
+
+def bench_employee_resolver(fixture: Fixture, samples) -> Dict:
+    raw_texts = [raw for raw, _, _ in samples]
+
+    resolver = fixture.employee_resolver()
+    timer = LayerTimer()
+    timer.wrap(resolver.token_validator, 'clean_and_validate', 'token_validation')
+    timer.wrap(resolver.lookup_index, 'find_exact', 'exact')
+    timer.wrap(resolver.lookup_index, 'find_alias', 'alias')
+    timer.wrap(resolver, '_try_embedding_match', 'embedding')
+
+    totals, outcomes = [], {}
+    wall_start = time.perf_counter()
+    for raw in raw_texts:
+        start = time.perf_counter()
+        outcomes[raw] = resolver.resolve_skill(raw)
+        totals.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+
+    bulk_resolver = fixture.employee_resolver()
+    bulk_start = time.perf_counter()
+    bulk_resolver.resolve_many(raw_texts)
+    for raw in raw_texts:
+        bulk_resolver.resolve_skill(raw)
+    bulk_wall = time.perf_counter() - bulk_start
+
+    return {
+        'per_text': {
+            'throughput_per_sec': round(len(raw_texts) / wall, 2),
+            'total': summarize_latencies(totals),
+            'layers': timer.report()
+        },
+        'bulk': {
+            'seconds': round(bulk_wall, 4),
+            'throughput_per_sec': round(len(raw_texts) / bulk_wall, 2)
+        },
+        'accuracy': accuracy_report(samples, lambda raw: outcomes[raw][0])
+    }
+
+
+def bench_resolver_service(fixture: Fixture, samples) -> Dict:
+    # The service takes normalized text; garbage tokens are the caller's job
+    texts = [normalize_key(raw) for raw, _, _ in samples]
+
+    service = fixture.service()
+    timer = LayerTimer()
+    timer.wrap(service, '_try_exact_match', 'exact')
+    timer.wrap(service, '_try_alias_match', 'alias')
+    timer.wrap(service, '_try_embedding_match', 'embedding')
+
+    totals, outcomes = [], {}
+    wall_start = time.perf_counter()
+    for text in texts:
+        start = time.perf_counter()
+        outcomes[text] = service.resolve(text)
+        totals.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+
+    bulk_service = fixture.service()
+    bulk_start = time.perf_counter()
+    bulk_service.resolve_many(texts)
+    bulk_wall = time.perf_counter() - bulk_start
+    bulk_stats = bulk_service.resolve_stats
+
+    return {
+        'per_text': {
+            'throughput_per_sec': round(len(texts) / wall, 2),
+            'total': summarize_latencies(totals),
+            'layers': timer.report()
+        },
+        'bulk': {
+            'seconds': round(bulk_wall, 4),
+            'throughput_per_sec': round(len(texts) / bulk_wall, 2),
+            'layer_seconds': {
+                layer: round(bulk_stats[f'{layer}_seconds'], 4)
+                for layer in ('exact', 'alias', 'prefilter', 'embedding')
+            }
+        },
+        'accuracy': accuracy_report(
+            samples, lambda raw: outcomes[normalize_key(raw)].resolved_skill_id
+        )
+    }
+
+
+# ============================================================================
+# REGRESSION CHECK
+# ============================================================================
+
+def compare_reports(baseline: Dict, current: Dict, tolerance: float) -> List[str]:
+    """List p95 latencies and throughputs worse than baseline by more than tolerance."""
+    regressions = []
+    for name, result in current['resolvers'].items():
+        base = baseline.get('resolvers', {}).get(name)
+        if base is None:
+            continue
+        checks = [('per_text.total.p95_ms', base['per_text']['total']['p95_ms'], result['per_text']['total']['p95_ms'])]
+        for layer, summary in result['per_text']['layers'].items():
+            base_layer = base['per_text']['layers'].get(layer)
+            if base_layer:
+                checks.append((f'per_text.layers.{layer}.p95_ms', base_layer['p95_ms'], summary['p95_ms']))
+        for label, before, after in checks:
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(f"{name} {label}: {before:.4f} → {after:.4f}")
+        for mode in ('per_text', 'bulk'):
+            before, after = base[mode]['throughput_per_sec'], result[mode]['throughput_per_sec']
+            if after < before * (1 - tolerance):
+                regressions.append(f"{name} {mode}.throughput_per_sec: {before:.1f} → {after:.1f}")
+    return regressions
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def print_report(report: Dict):
+    meta = report['meta']
+    print("=" * 100)
+    print(
+        f"SKILL RESOLUTION BENCHMARK | skills={meta['skills']} aliases={meta['aliases']} "
+        f"samples={meta['samples']} provider={meta['model_name']}"
+    )
+    print("=" * 100)
+    for name, result in report['resolvers'].items():
+        per_text, bulk = result['per_text'], result['bulk']
+        print(f"\n{name}")
+        print(
+            f"  per-text: {per_text['throughput_per_sec']:.0f} texts/s  "
+            f"p50={per_text['total']['p50_ms']:.3f}ms p95={per_text['total']['p95_ms']:.3f}ms "
+            f"p99={per_text['total']['p99_ms']:.3f}ms"
+        )
+        for layer, summary in per_text['layers'].items():
+            print(
+                f"    {layer:<17} calls={summary['count']:<6} p50={summary['p50_ms']:.4f}ms "
+                f"p95={summary['p95_ms']:.4f}ms p99={summary['p99_ms']:.4f}ms"
+            )
+        print(f"  bulk:     {bulk['throughput_per_sec']:.0f} texts/s ({bulk['seconds']:.3f}s)")
+        accuracy = ", ".join(f"{kind}={stats['rate']:.2f}" for kind, stats in result['accuracy'].items())
+        print(f"  accuracy: {accuracy}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill resolution layers on a synthetic taxonomy")
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--provider", choices=["local", "fake"], default="local",
+                        help="local = hashed n-gram embeddings (meaningful matches), fake = hash vectors")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0,
+                        help="Simulated per-request embedding latency")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write JSON report ('-' = stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    # Resolver logging would dominate the timings
+    logging.disable(logging.WARNING)
+
+    fixture = build_fixture(args)
+    samples = generate_raw_skills(fixture.skills, fixture.aliases, args.samples, args.seed)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'skills': len(fixture.skills),
+            'aliases': len(fixture.aliases),
+            'samples': len(samples),
+            'seed': args.seed,
+            'provider': args.provider,
+            'model_name': fixture.model_name,
+            'embedding_latency_ms': args.embedding_latency_ms,
+            'python': platform.python_version(),
+            'numpy': np.__version__
+        },
+        'resolvers': {
+            'SkillResolver': bench_employee_resolver(fixture, samples),
+            'SkillResolverService': bench_resolver_service(fixture, samples)
+        }
+    }
+
+    if args.json_path == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        if args.json_path:
+            with open(args.json_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"\n✅ JSON report written to: {args.json_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"   {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%} vs {args.compare}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Local (Offline) Skill Embedding Generation
+==========================================
+
+PURPOSE:
+    Generate hashed character n-gram embeddings for all skills with
+    LocalNgramEmbeddingProvider. No network or API key is needed. The vectors
+    are stored under the provider's own model_name
+    (e.g. local-char-ngram-2-4-1536), next to any OpenAI embeddings.
+
+    These embeddings power offline resolution (EMBEDDING_PROVIDER=local) and
+    SkillResolverService's prefilter_provider.
+
+USAGE:
+    python scripts/generate_local_embeddings.py [--batch-size 1000] [--dry-run]
+
+WRITES:
+    - skill_embeddings rows for model_name=local-char-ngram-2-4-1536
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.session import SessionLocal
+from app.models.skill import Skill
+from app.services.skill_resolution.local_embedding_provider import LocalNgramEmbeddingProvider
+from app.services.skill_resolution.skill_embedding_service import SkillEmbeddingService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate offline n-gram embeddings for all skills")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Generate but roll back")
+    args = parser.parse_args()
+
+    provider = LocalNgramEmbeddingProvider()
+    db = SessionLocal()
+    try:
+        skill_ids = [row[0] for row in db.query(Skill.skill_id).all()]
+        print(f"Generating {provider.model_name} embeddings for {len(skill_ids)} skills")
+
+        service = SkillEmbeddingService(
+            db=db,
+            embedding_provider=provider,
+            model_name=provider.model_name,
+            batch_size=args.batch_size
+        )
+        start = time.time()
+        result = service.ensure_embeddings_for_skill_ids(skill_ids)
+        elapsed = time.time() - start
+
+        if args.dry_run:
+            db.rollback()
+            print("Dry run: rolled back")
+        else:
+            db.commit()
+        print(
+            f"✅ succeeded={len(result.succeeded)} skipped={len(result.skipped)} "
+            f"failed={len(result.failed)} in {elapsed:.1f}s"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
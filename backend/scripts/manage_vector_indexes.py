@@ -0,0 +1,94 @@
+"""
+Vector Index Management Command
+===============================
+
+PURPOSE:
+    Build, rebuild, drop or list approximate nearest-neighbour (HNSW / IVFFlat)
+    indexes on skill_embeddings. Indexes are partial per model_name.
+
+USAGE:
+    python scripts/manage_vector_indexes.py list
+    python scripts/manage_vector_indexes.py build   --model text-embedding-3-small [--method hnsw] [--m 16] [--ef-construction 64]
+    python scripts/manage_vector_indexes.py build   --model text-embedding-3-small --method ivfflat [--lists 100]
+    python scripts/manage_vector_indexes.py rebuild --model text-embedding-3-small [--method hnsw]
+    python scripts/manage_vector_indexes.py drop    --model text-embedding-3-small [--method hnsw]
+
+    Add --concurrently to build/drop without blocking writes (slower).
+
+NOTES:
+    - IVFFlat should be (re)built after embeddings are loaded; its lists are
+      trained on the rows present at build time.
+    - HNSW can be built on an empty table and stays accurate as rows are added.
+
+WRITES:
+    - DDL on skill_embeddings (CREATE/DROP INDEX)
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.session import engine
+from app.services.skill_resolution.ann_index_manager import (
+    ANNIndexManager,
+    SUPPORTED_METHODS,
+    METHOD_HNSW,
+    DEFAULT_HNSW_M,
+    DEFAULT_HNSW_EF_CONSTRUCTION
+)
+from app.services.skill_resolution.embedding_provider import DEFAULT_EMBEDDING_MODEL
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Manage ANN indexes on skill_embeddings")
+    parser.add_argument("action", choices=["list", "build", "rebuild", "drop"])
+    parser.add_argument("--model", default=DEFAULT_EMBEDDING_MODEL, help="model_name the index covers")
+    parser.add_argument("--method", choices=SUPPORTED_METHODS, default=None,
+                        help="Index method (default: hnsw for build/rebuild, both for drop)")
+    parser.add_argument("--m", type=int, default=DEFAULT_HNSW_M, help="HNSW max connections per layer")
+    parser.add_argument("--ef-construction", type=int, default=DEFAULT_HNSW_EF_CONSTRUCTION,
+                        help="HNSW build-time candidate list size")
+    parser.add_argument("--lists", type=int, default=None,
+                        help="IVFFlat lists (default: rows / 1000, min 10)")
+    parser.add_argument("--concurrently", action="store_true",
+                        help="Use CREATE/DROP INDEX CONCURRENTLY")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Autocommit so CONCURRENTLY works and each DDL statement stands alone
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        manager = ANNIndexManager(conn, concurrently=args.concurrently)
+
+        if args.action == "list":
+            indexes = manager.list_indexes()
+            if not indexes:
+                print("No ANN indexes on skill_embeddings")
+            for info in indexes:
+                print(f"{info.index_name} [{info.method}]")
+                print(f"    {info.definition}")
+            return
+
+        start = time.time()
+        if args.action == "drop":
+            dropped = manager.drop(args.model, args.method)
+            print(f"✅ Dropped (if present): {', '.join(dropped)}")
+        else:
+            build_options = dict(m=args.m, ef_construction=args.ef_construction, lists=args.lists)
+            method = args.method or METHOD_HNSW
+            if args.action == "build":
+                name = manager.build(args.model, method, **build_options)
+            else:
+                name = manager.rebuild(args.model, method, **build_options)
+            print(f"✅ {args.action.title()} complete: {name}")
+        print(f"Elapsed: {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Import Job Worker
+=================
+
+PURPOSE:
+    Run queued import jobs (employee and master skills imports) outside the
+    API processes. Start the API with IMPORT_JOB_WORKER_MODE=external so it
+    only enqueues jobs, and run one or more of these workers. Any number of
+    workers may run on any hosts: jobs are claimed with FOR UPDATE SKIP
+    LOCKED, and IMPORT_JOB_MAX_CONCURRENCY caps running jobs across all of
+    them. Uploaded files must be on storage all workers can read.
+
+USAGE:
+    python scripts/run_import_worker.py [--threads 2] [--job-type employee_import] [--once]
+
+    --threads    Jobs this worker runs at once (default: IMPORT_JOB_WORKER_THREADS)
+    --job-type   Only claim these job types (repeatable; default: all)
+    --once       Claim what is available now, wait for those jobs, then exit
+
+    Stops on Ctrl+C / SIGTERM after running jobs finish.
+"""
+
+import sys
+import os
+import argparse
+import logging
+import signal
+import threading
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.session import SessionLocal
+from app.services.job_runner import ImportJobWorker, JOB_HANDLERS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run queued import jobs")
+    parser.add_argument('--threads', type=int, default=None, help="Jobs this worker runs at once")
+    parser.add_argument('--job-type', action='append', choices=sorted(JOB_HANDLERS),
+                        help="Only claim this job type (repeatable)")
+    parser.add_argument('--once', action='store_true', help="Run the jobs available now, then exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    handlers = {job_type: JOB_HANDLERS[job_type] for job_type in (args.job_type or JOB_HANDLERS)}
+    worker = ImportJobWorker(SessionLocal, handlers=handlers, threads=args.threads)
+
+    if args.once:
+        claimed = worker.run_once()
+        print(f"Claimed {claimed} job(s); waiting for them to finish...")
+        worker.stop(wait=True)  # keeps heartbeating until the jobs finish
+        return
+
+    stopped = threading.Event()
+
+    def _stop(signum, frame):
+        print("Stopping worker (running jobs finish first)...")
+        stopped.set()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    worker.start()
+    stopped.wait()
+    worker.stop(wait=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -344,3 +344,28 @@ class TestExpandSkills:
         # Original: 3 rows, Result: 2 + 1 + 3 = 6 rows
         # Expansion: 6 - 3 = 3 additional rows
         assert len(result) == 6
+    
+    def test_expanded_rows_keep_source_index(self, expander):
+        """Should keep the source row's index label (Excel row numbers derive from it)."""
+        df = pd.DataFrame([
+            {'skill_name': 'A', 'employee_id': 1},
+            {'skill_name': 'B; C', 'employee_id': 2},
+            {'skill_name': 'D', 'employee_id': 3}
+        ])
+        
+        result = expander.expand_skills(df)
+        
+        assert list(result.index) == [0, 1, 1, 2]
+        assert result['skill_name'].tolist() == ['A', 'B', 'C', 'D']
+    
+    def test_duplicate_index_labels(self, expander):
+        """Should expand positionally when index labels repeat (e.g. concatenated sheets)."""
+        df = pd.DataFrame(
+            [{'skill_name': 'A, B', 'employee_id': 1}, {'skill_name': 'C', 'employee_id': 2}],
+            index=[5, 5]
+        )
+        
+        result = expander.expand_skills(df)
+        
+        assert result['skill_name'].tolist() == ['A', 'B', 'C']
+        assert result['employee_id'].tolist() == [1, 1, 2]
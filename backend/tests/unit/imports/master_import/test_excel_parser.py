@@ -52,7 +52,14 @@ class TestReadExcelFile:
         
         assert len(result) == 1
         assert 'Category' in result.columns
-    
+
+    def test_reads_excel_file_from_path(self, parser):
+        """Should pass a file path to pandas as-is (no in-memory copy)."""
+        with patch('pandas.read_excel', return_value=pd.DataFrame()) as read_excel:
+            parser._read_excel_file('/tmp/upload.xlsx')
+
+        assert read_excel.call_args.args[0] == '/tmp/upload.xlsx'
+
     def test_logs_column_information(self, parser, caplog):
         """Should log detected columns."""
         import logging
@@ -0,0 +1,107 @@
+"""
+Unit tests for the column-wise date/integer pre-pass.
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.imports.employee_import.column_parser import (
+    PARSE_ERROR_COLUMN,
+    parse_skill_columns,
+    parsed_value
+)
+from app.services.imports.employee_import.date_parser import DateParser
+from app.services.imports.employee_import.field_sanitizer import FieldSanitizer
+
+DATE_CELLS = [
+    '2011-02-02', '2011-2-2', ' 02-03-2011 ', '02/13/2011', '13/02/2011', '2011/02/02', '1-Sep-25',
+    '1-September-25', '1-Sep-2025', 'Sep-25', 'September-25', '2019', '1800', '3000-01-01',
+    '1500-06-30', '0500-01-01', 'garbage', '', '   ', None, np.nan, 0, 'None', 'NaN',
+    pd.Timestamp('2020-05-01'), datetime(2021, 1, 1), '2011-02-02'
+]
+INTEGER_CELLS = [5, 5.0, 3.7, -2, 0, '7', ' 8 ', '5.0', 'abc', '', None, np.nan, True,
+                 np.int64(4), 2 ** 40, float('inf'), pd.Timestamp('2020-01-01'), 5]
+
+
+class TestDateColumn:
+    """parse_date_column must agree with parse_date_safely cell by cell."""
+
+    def test_matches_scalar_parser(self):
+        parser = DateParser()
+        values = pd.Series(DATE_CELLS, dtype=object)
+
+        parsed, invalid = parser.parse_date_column(values, 'last_used', pd.Series(['Z1'] * len(values)))
+
+        expected = [parser.parse_date_safely(value, 'last_used', 'Z1') for value in DATE_CELLS]
+        assert parsed.tolist() == expected
+        assert invalid.tolist() == [
+            value is None and not (not cell or str(cell).lower() in ['nan', 'none', ''])
+            for cell, value in zip(DATE_CELLS, expected)
+        ]
+
+    def test_warnings_name_the_record(self, caplog):
+        parser = DateParser()
+
+        parser.parse_date_column(pd.Series(['2011-02-02', 'bad']), 'last_used', pd.Series(['employee Z1', 'employee Z2']))
+
+        assert "Could not parse last_used 'bad' for record employee Z2" in caplog.text
+
+    def test_keeps_index_labels(self):
+        parsed, invalid = DateParser().parse_date_column(
+            pd.Series(['2011-02-02', 'x'], index=[7, 7]), 'last_used', pd.Series(['Z1', 'Z1'])
+        )
+
+        assert list(parsed.index) == [7, 7] and list(invalid.index) == [7, 7]
+
+
+class TestIntegerColumn:
+    """sanitize_integer_column must agree with sanitize_integer_field within INTEGER range."""
+
+    def test_matches_scalar_sanitizer(self):
+        sanitizer = FieldSanitizer()
+        values = pd.Series(INTEGER_CELLS, dtype=object)
+
+        sanitized, invalid = sanitizer.sanitize_integer_column(values, 'years_experience', pd.Series(['Z1'] * len(values)))
+
+        expected = []
+        for cell in INTEGER_CELLS:
+            try:
+                number = sanitizer.sanitize_integer_field(cell, 'years_experience', 'Z1')
+            except OverflowError:
+                number = None
+            expected.append(None if number is not None and abs(number) >= 2 ** 31 else number)
+        assert sanitized.tolist() == expected
+        assert invalid.tolist() == [not pd.isna(cell) and value is None for cell, value in zip(INTEGER_CELLS, expected)]
+        assert all(type(value) is int for value in sanitized if value is not None)
+
+
+class TestSkillPrePass:
+    """Test suite for parse_skill_columns / parsed_value."""
+
+    def test_adds_parsed_columns_error_mask_and_stats(self):
+        skills_df = pd.DataFrame({
+            'zid': ['Z1', 'Z2'],
+            'skill_name': ['Python', 'Java'],
+            'last_used': ['2024-01-01', 'someday'],
+            'years_experience': [3, 'many']
+        })
+        stats = {}
+
+        parsed_df = parse_skill_columns(skills_df, DateParser(), FieldSanitizer(), stats)
+
+        assert parsed_df['last_used__parsed'].tolist() == [date(2024, 1, 1), None]
+        assert parsed_df['years_experience__parsed'].tolist() == [3, None]
+        assert parsed_df[PARSE_ERROR_COLUMN].tolist() == [False, True]
+        assert stats['parse_errors'] == {'last_used': 1, 'years_experience': 1}
+        assert 'last_used__parsed' not in skills_df.columns
+
+    def test_parsed_value_prefers_pre_pass(self):
+        parsed_df = parse_skill_columns(
+            pd.DataFrame({'zid': ['Z1'], 'last_used': ['2024-01-01']}), DateParser(), FieldSanitizer()
+        )
+        row = parsed_df.iloc[0]
+
+        assert parsed_value(row, 'last_used', lambda: pytest.fail("cell parsed again")) == date(2024, 1, 1)
+        assert parsed_value({'interest_level': 4}, 'interest_level', lambda: 4) == 4
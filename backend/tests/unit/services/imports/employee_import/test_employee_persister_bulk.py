@@ -0,0 +1,194 @@
+"""
+Unit tests for EmployeePersister bulk (set-based) upsert mode.
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.services.imports.employee_import.employee_persister import EmployeePersister
+from app.services.imports.employee_import.reference_data_cache import ReferenceDataCache
+
+
+def make_persister(db, chunk_size=500):
+    date_parser = MagicMock()
+    date_parser.parse_date_safely.side_effect = lambda value, *_: date(2020, 1, 1) if value else None
+    stats = {'failed_rows': []}
+    reference_cache = ReferenceDataCache.from_entries(
+        sub_segment={'SS1': 1},
+        project={('P1', 1): 10},
+        team={('T1', 10): 100, ('T2', 10): 200},
+        team_project={100: 10, 200: 10},
+        role={'Developer': 5}
+    )
+    persister = EmployeePersister(db, stats, date_parser, MagicMock(), bulk_mode=True, chunk_size=chunk_size,
+                                  reference_cache=reference_cache)
+    return persister, stats
+
+
+def employee_row(zid, team='T1', **overrides):
+    row = {
+        'zid': zid, 'full_name': f'Name {zid}', 'sub_segment': 'SS1', 'project': 'P1',
+        'team': team, 'role': 'Developer', 'start_date_of_working': '2020-01-01',
+        'email': f'{zid}@example.com', 'project_allocation_pct': None
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def mock_db():
+    db = MagicMock(spec=Session)
+    db.begin_nested.return_value = MagicMock()
+    return db
+
+
+class TestBulkEmployeeUpsert:
+    """Test suite for the chunked INSERT ... ON CONFLICT path."""
+
+    def test_chunk_is_upserted_with_one_statement_and_commit(self, mock_db):
+        persister, stats = make_persister(mock_db)
+        mock_db.query.return_value.filter.return_value.all.return_value = [('Z2', 100, 'Old Name')]
+        mock_db.execute.return_value.all.return_value = [(1, 'Z1', 100, None), (2, 'Z2', 100, None)]
+        df = pd.DataFrame([employee_row('Z1'), employee_row('Z2')])
+
+        mapping = persister.import_employees(df, datetime(2024, 1, 1))
+
+        assert mapping == {'Z1': 1, 'Z2': 2}
+        assert (stats['employees_created'], stats['employees_updated']) == (1, 1)
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    def test_missing_reference_reported_without_failing_chunk(self, mock_db):
+        persister, stats = make_persister(mock_db)
+        mock_db.query.return_value.filter.return_value.all.return_value = []
+        mock_db.execute.return_value.all.return_value = [(1, 'Z1', 100, None)]
+        df = pd.DataFrame([employee_row('Z1'), employee_row('Z2', team='Unknown')])
+
+        mapping = persister.import_employees(df, datetime(2024, 1, 1))
+
+        assert mapping == {'Z1': 1}
+        [failed] = stats['failed_rows']
+        assert (failed['zid'], failed['excel_row_number'], failed['error_code']) == ('Z2', 3, 'MISSING_REFERENCE')
+        assert failed['message'] == 'Team not found: Unknown under project: P1'
+
+    def test_failing_chunk_is_replayed_row_by_row(self, mock_db):
+        persister, stats = make_persister(mock_db)
+        persister._upsert_chunk = MagicMock(side_effect=Exception("deadlock detected"))
+        persister._import_employee_row = MagicMock()
+        df = pd.DataFrame([employee_row('Z1'), employee_row('Z2')])
+
+        persister.import_employees(df, datetime(2024, 1, 1))
+
+        mock_db.rollback.assert_called_once()
+        assert [c.args[0] for c in persister._import_employee_row.call_args_list] == [0, 1]
+        assert stats['employee_chunks_retried'] == 1
+
+    def test_repeated_zid_in_chunk_is_deferred_to_row_path(self, mock_db):
+        persister, _ = make_persister(mock_db)
+        persister._upsert_chunk = MagicMock(return_value=([('Z1', 1, True)], []))
+        persister._import_employee_row = MagicMock()
+        df = pd.DataFrame([employee_row('Z1'), employee_row('Z1', team='T2')])
+
+        persister.import_employees(df, datetime(2024, 1, 1))
+
+        assert len(persister._upsert_chunk.call_args[0][0]) == 1
+        persister._import_employee_row.assert_called_once()
+        assert persister._import_employee_row.call_args[0][0] == 1
+
+    def test_chunks_respect_chunk_size(self, mock_db):
+        persister, _ = make_persister(mock_db, chunk_size=2)
+        persister._upsert_chunk = MagicMock(return_value=([], []))
+        df = pd.DataFrame([employee_row(f'Z{i}') for i in range(5)])
+
+        persister.import_employees(df, datetime(2024, 1, 1))
+
+        assert [len(c.args[0]) for c in persister._upsert_chunk.call_args_list] == [2, 2, 1]
+        assert mock_db.commit.call_count == 3
+
+    def test_allocations_upserted_in_same_chunk(self, mock_db):
+        persister, _ = make_persister(mock_db)
+        mock_db.query.return_value.filter.return_value.all.return_value = []
+        mock_db.execute.return_value.all.return_value = [(1, 'Z1', 100, date(2020, 1, 1))]
+        df = pd.DataFrame([employee_row('Z1', project_allocation_pct='60%')])
+
+        with patch(
+            'app.services.imports.employee_import.employee_persister.upsert_active_project_allocations'
+        ) as bulk_allocations:
+            persister.import_employees(df, datetime(2024, 1, 1))
+
+        [allocations] = bulk_allocations.call_args[0][1:]
+        assert allocations == [{
+            'employee_id': 1, 'project_id': 10, 'allocation_pct': 60,
+            'start_date': date(2020, 1, 1), 'allocation_type': 'BILLABLE'
+        }]
+
+
+class TestEmployeeValues:
+    """Test suite for the 'never overwrite with empty values' rule."""
+
+    def test_existing_employee_keeps_values_for_empty_cells(self, mock_db):
+        persister, _ = make_persister(mock_db)
+        row = employee_row('Z1', full_name=None, team=None, role='', start_date_of_working=None, email=' ')
+
+        values = persister._build_employee_values(row, 'Z1', (200, 'Stored Name'), datetime(2024, 1, 1))
+
+        assert values['full_name'] == 'Stored Name'
+        assert values['team_id'] == 200
+        assert (values['role_id'], values['start_date_of_working'], values['email']) == (None, None, None)
+
+    def test_upsert_statement_coalesces_nullable_columns(self):
+        stmt = EmployeePersister._build_upsert_statement([{
+            'zid': 'Z1', 'full_name': 'A', 'team_id': 1, 'role_id': None,
+            'start_date_of_working': None, 'email': None, 'created_at': datetime(2024, 1, 1)
+        }])
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert 'ON CONFLICT (zid) DO UPDATE' in sql
+        assert 'coalesce(excluded.email, employees.email)' in sql
+        assert 'RETURNING employees.employee_id, employees.zid' in sql
+
+
+class TestBulkAllocationUpsert:
+    """Test suite for allocation_writer.upsert_active_project_allocations."""
+
+    @pytest.fixture
+    def sqlite_db(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from app.models.employee_project_allocation import EmployeeProjectAllocation
+
+        engine = create_engine("sqlite://")
+        EmployeeProjectAllocation.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_updates_active_and_inserts_missing(self, sqlite_db):
+        from app.models.employee_project_allocation import EmployeeProjectAllocation
+        from app.services.imports.employee_import.allocation_writer import upsert_active_project_allocations
+
+        sqlite_db.add_all([
+            EmployeeProjectAllocation(employee_id=1, project_id=10, allocation_pct=20,
+                                      allocation_type='BILLABLE', start_date=date(2020, 1, 1)),
+            EmployeeProjectAllocation(employee_id=1, project_id=10, allocation_pct=30, allocation_type='BILLABLE',
+                                      start_date=date(2019, 1, 1), end_date=date(2019, 12, 31))
+        ])
+        sqlite_db.flush()
+
+        written = upsert_active_project_allocations(sqlite_db, [
+            {'employee_id': 1, 'project_id': 10, 'allocation_pct': 80},
+            {'employee_id': 2, 'project_id': 10, 'allocation_pct': 50, 'start_date': date(2021, 5, 1)},
+            {'employee_id': 3, 'project_id': 10, 'allocation_pct': None}
+        ])
+
+        rows = sqlite_db.query(
+            EmployeeProjectAllocation.employee_id, EmployeeProjectAllocation.allocation_pct,
+            EmployeeProjectAllocation.end_date
+        ).order_by(EmployeeProjectAllocation.allocation_id).all()
+        assert written == 2
+        assert rows == [(1, 80, None), (1, 30, date(2019, 12, 31)), (2, 50, None)]
@@ -0,0 +1,118 @@
+"""
+Unit tests for the streaming (openpyxl read_only) Excel reader.
+"""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from sqlalchemy.orm import Session
+
+from app.services.imports.employee_import.employee_persister import EmployeePersister
+from app.utils.excel_reader import (
+    ExcelReaderError,
+    count_sheet_rows,
+    iter_skill_chunks,
+    read_employee_sheet,
+    read_excel
+)
+
+EMPLOYEE_HEADER = ['Employee ID (ZID)', 'Employee Full Name', 'Segment', 'Sub-Segment', 'Project', 'Team',
+                   'Role/Designation', 'Start Date of Working', 'Project Allocation %', 'Notes']
+SKILL_HEADER = ['Employee ID (ZID)', 'Employee Full Name', 'Skill Name', 'Proficiency', 'Experience Years',
+                'Last Used', 'Started learning from (Date)', 'Certification', 'Comment', 'Interest Level']
+
+
+def write_workbook(path, employee_rows, skill_rows, sheet_names=('Employee', 'Employee_Skills'),
+                   employee_header=EMPLOYEE_HEADER):
+    workbook = Workbook()
+    employees = workbook.active
+    employees.title = sheet_names[0]
+    employees.append(employee_header)
+    for row in employee_rows:
+        employees.append(row)
+    skills = workbook.create_sheet(sheet_names[1])
+    skills.append(SKILL_HEADER)
+    for row in skill_rows:
+        skills.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+def employee(i, zid=None):
+    return [zid or f'Z{i}', f' Name {i} ', 'Seg', 'SS', 'P', 'T', 'Dev' if i % 2 else None,
+            datetime(2020, 1, 1 + i % 20), '60%', 'ignored']
+
+
+def skill(i):
+    return [f'Z{i % 5}', 'n', 'Python, Java' if i % 4 == 0 else 'SQL', 'Expert' if i % 2 else 'Competent',
+            i % 7 or None, datetime(2024, 1, 1) if i % 2 else 'Jun-24', None, None if i % 3 else 'AWS', 'c', 3]
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    employees = [employee(i) for i in range(12)]
+    employees.insert(5, [None] * 10)                      # blank row in the middle
+    employees.append(employee(99, zid=''))                # dropped: no ZID
+    return write_workbook(tmp_path / 'import.xlsx', employees, [skill(i) for i in range(30)])
+
+
+class TestStreamingReader:
+    """The streamed chunks must match read_excel() output."""
+
+    @pytest.mark.parametrize('chunk_size', [1, 4, 5000])
+    def test_matches_read_excel(self, workbook_path, chunk_size):
+        employees_df, skills_df = read_excel(workbook_path)
+
+        streamed_employees = read_employee_sheet(workbook_path, chunk_size)
+        streamed_skills = pd.concat(list(iter_skill_chunks(workbook_path, chunk_size)))
+
+        pd.testing.assert_frame_equal(streamed_employees, employees_df.drop(columns=['Notes']), check_dtype=False)
+        pd.testing.assert_frame_equal(streamed_skills, skills_df, check_dtype=False)
+
+    def test_index_is_sheet_row_position(self, workbook_path):
+        employees_df = read_employee_sheet(workbook_path, chunk_size=4)
+
+        # Row 5 is blank, so Z5 is the 7th data row → Excel row 8
+        assert employees_df.index[employees_df['zid'] == 'Z5'].tolist() == [6]
+
+    def test_chunks_are_bounded(self, workbook_path):
+        chunks = list(iter_skill_chunks(workbook_path, chunk_size=8))
+
+        assert [len(chunk) for chunk in chunks] == [8, 8, 8, 6]
+
+    def test_sheets_fall_back_to_position(self, tmp_path):
+        path = write_workbook(tmp_path / 'renamed.xlsx', [employee(1)], [skill(1)], sheet_names=('People', 'Skills'))
+
+        assert read_employee_sheet(path)['zid'].tolist() == ['Z1']
+        assert count_sheet_rows(path) == (1, 1)
+
+    def test_empty_sheet_yields_one_empty_frame(self, tmp_path):
+        path = write_workbook(tmp_path / 'empty.xlsx', [employee(1)], [])
+
+        [chunk] = list(iter_skill_chunks(path))
+
+        assert chunk.empty and 'skill_name' in chunk.columns
+
+    def test_missing_required_column_raises(self, tmp_path):
+        workbook = Workbook()
+        workbook.active.title = 'Employee'
+        workbook.active.append(['Employee ID (ZID)', 'Employee Full Name'])
+        workbook.create_sheet('Employee_Skills').append(SKILL_HEADER)
+        workbook.save(tmp_path / 'bad.xlsx')
+
+        with pytest.raises(ExcelReaderError, match="Missing required columns"):
+            read_employee_sheet(str(tmp_path / 'bad.xlsx'))
+
+    def test_email_header_is_matched_case_insensitively(self, tmp_path):
+        path = write_workbook(tmp_path / 'email.xlsx', [employee(1) + [' z1@example.com ']], [skill(1)],
+                              employee_header=EMPLOYEE_HEADER + ['Email'])
+
+        [row] = read_employee_sheet(path).to_dict('records')
+        persister = EmployeePersister(MagicMock(spec=Session), {'failed_rows': []}, MagicMock(), MagicMock(),
+                                      bulk_mode=True, reference_cache=MagicMock())
+        values = persister._build_employee_values(row, 'Z1', (100, 'Stored Name'), datetime(2024, 1, 1))
+
+        assert read_excel(path)[0]['Email'].tolist() == [' z1@example.com ']
+        assert values['email'] == 'z1@example.com'
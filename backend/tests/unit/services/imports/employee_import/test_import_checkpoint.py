@@ -0,0 +1,141 @@
+"""
+Unit tests for checkpointed, resumable employee import jobs.
+"""
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import ImportJob
+from app.services.import_job_service import ImportJobService
+from app.services.imports.employee_import import EmployeeImportOrchestrator, IMPORT_ENGINE_STAGING
+from app.services.imports.employee_import.employee_import_orchestrator import (
+    PHASE_EMPLOYEES,
+    PHASE_SKILLS,
+    _json_safe,
+    _rows_from
+)
+
+
+@pytest.fixture
+def sqlite_db():
+    engine = create_engine("sqlite://")
+    ImportJob.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def orchestrator_with_job(**kwargs):
+    orchestrator = EmployeeImportOrchestrator(MagicMock(spec=Session), job_id='job-1', **kwargs)
+    orchestrator.job_service = MagicMock()
+    return orchestrator
+
+
+class TestCheckpointHelpers:
+    """Test suite for skipping committed rows and storing stats."""
+
+    def test_rows_before_checkpoint_are_skipped(self):
+        chunks = [pd.DataFrame({'zid': ['a', 'b']}, index=[0, 1]), pd.DataFrame({'zid': ['c', 'd']}, index=[2, 3])]
+
+        remaining = list(_rows_from(iter(chunks), 3))
+
+        assert [chunk['zid'].tolist() for chunk in remaining] == [['d']]
+        assert [len(chunk) for chunk in _rows_from(iter(chunks), 0)] == [2, 2]
+
+    def test_stats_are_made_json_safe(self):
+        stats = {'failed_rows': [{'excel_row_number': np.int64(7), 'date': date(2024, 1, 2)}], 'ids': {1}}
+
+        assert _json_safe(stats) == {'failed_rows': [{'excel_row_number': 7, 'date': '2024-01-02'}], 'ids': [1]}
+
+
+class TestOrchestratorCheckpoints:
+    """Test suite for checkpoint writes and the resume employee mapping."""
+
+    def test_rows_engine_commits_then_saves_stats(self):
+        orchestrator = orchestrator_with_job()
+        orchestrator.import_stats['skills_imported'] = np.int64(5)
+
+        orchestrator._save_checkpoint(PHASE_SKILLS, skill_rows_done=100, last_zid='Z9')
+
+        orchestrator.db.commit.assert_called_once()
+        job_id, checkpoint = orchestrator.job_service.save_checkpoint.call_args.args
+        assert (job_id, checkpoint['phase'], checkpoint['skill_rows_done'], checkpoint['last_zid']) == (
+            'job-1', PHASE_SKILLS, 100, 'Z9'
+        )
+        assert checkpoint['stats']['skills_imported'] == 5
+
+    def test_staging_engine_only_records_initial_checkpoint(self):
+        orchestrator = orchestrator_with_job(import_engine=IMPORT_ENGINE_STAGING)
+
+        orchestrator._save_checkpoint(PHASE_EMPLOYEES)
+        orchestrator._save_checkpoint(PHASE_SKILLS, skill_rows_done=100)
+
+        [call] = orchestrator.job_service.save_checkpoint.call_args_list
+        assert call.args[1] == {'phase': PHASE_EMPLOYEES, 'engine': IMPORT_ENGINE_STAGING, 'stats': {}}
+        orchestrator.db.commit.assert_not_called()
+
+    def test_resume_writes_skills_in_delta_mode(self, monkeypatch):
+        monkeypatch.setenv("EMPLOYEE_IMPORT_DELTA", "false")
+        monkeypatch.setenv("EMPLOYEE_IMPORT_BULK_UPSERT", "false")
+        orchestrator = orchestrator_with_job()
+
+        fresh = orchestrator._create_skill_persister(MagicMock(), MagicMock())
+        resumed = orchestrator._create_skill_persister(MagicMock(), MagicMock(), resuming=True)
+
+        assert (fresh.bulk_mode, fresh.delta_mode) == (False, False)
+        assert (resumed.bulk_mode, resumed.delta_mode) == (True, True)
+
+    def test_resume_mapping_excludes_employees_whose_rows_all_failed(self):
+        orchestrator = orchestrator_with_job()
+        orchestrator.import_stats['failed_rows'] = [
+            {'sheet': 'Employee', 'zid': 'Z2'}, {'sheet': 'Employee', 'zid': 'Z3'}
+        ]
+        query = orchestrator.db.query.return_value.filter.return_value
+        query.all.return_value = [('Z1', 1), ('Z3', 3)]
+        employees_df = pd.DataFrame({'zid': ['Z1', 'Z2', 'Z3', 'Z3']})
+
+        mapping = orchestrator._resume_employee_mapping(employees_df)
+
+        [condition] = orchestrator.db.query.return_value.filter.call_args.args
+        assert sorted(condition.right.value) == ['Z1', 'Z3']
+        assert mapping == {'Z1': 1, 'Z3': 3}
+
+
+class TestImportJobResume:
+    """Test suite for ImportJobService checkpoint and resume methods."""
+
+    def test_checkpoint_is_saved(self, sqlite_db):
+        service = ImportJobService(sqlite_db)
+        job_id = service.create_job(file_path='/tmp/a.xlsx', file_hash='f' * 64)
+
+        assert service.save_checkpoint(job_id, {'phase': PHASE_SKILLS, 'skill_rows_done': 10})
+
+        job = service.get_job(job_id)
+        assert (job.file_path, job.checkpoint['skill_rows_done']) == ('/tmp/a.xlsx', 10)
+        assert job.to_dict()['checkpoint_phase'] == PHASE_SKILLS
+
+    def test_only_failed_or_stale_jobs_are_reopened(self, sqlite_db):
+        service = ImportJobService(sqlite_db)
+        running, stale, failed = (service.create_job() for _ in range(3))
+        service.update_job(running, status='processing', force_update=True)
+        service.fail_job(failed, 'worker died')
+        sqlite_db.query(ImportJob).filter_by(job_id=stale).update({
+            'status': 'processing',
+            'updated_at': datetime.now(timezone.utc) - timedelta(seconds=service.RESUME_STALE_AFTER_SECONDS + 60)
+        })
+        sqlite_db.commit()
+
+        assert not service.reopen_for_resume(running)
+        assert service.reopen_for_resume(stale, file_path='/tmp/new.xlsx')
+        assert service.reopen_for_resume(failed)
+        assert not service.reopen_for_resume(failed)
+
+        sqlite_db.expire_all()
+        reopened = service.get_job(stale)
+        assert (reopened.status, reopened.file_path) == ('pending', '/tmp/new.xlsx')
+        assert (service.get_job(failed).status, service.get_job(failed).error) == ('pending', None)
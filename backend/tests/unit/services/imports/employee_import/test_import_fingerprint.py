@@ -0,0 +1,142 @@
+"""
+Unit tests for delta employee import (content fingerprints and skill diffs).
+"""
+import hashlib
+from datetime import date
+from unittest.mock import MagicMock
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from app.models import EmployeeSkill
+from app.services.imports.employee_import import EmployeeImportOrchestrator
+from app.services.imports.employee_import.import_fingerprint import EmployeeFingerprinter, file_sha256
+from app.services.imports.employee_import.skill_persister import SkillPersister
+from app.services.imports.employee_import.staging_import_engine import (
+    INSERT_NEW_SKILLS_WITH_HISTORY,
+    INSERT_SKILLS_WITH_HISTORY,
+    UPDATE_CHANGED_SKILLS_WITH_HISTORY
+)
+
+EMPLOYEES = pd.DataFrame([
+    {'zid': 'Z1', 'full_name': 'Ann', 'sub_segment': 'SS1', 'project': 'P1', 'team': 'T1',
+     'role': 'Dev', 'start_date_of_working': pd.Timestamp('2020-01-01'), 'project_allocation_pct': 50.0},
+    {'zid': 'Z2', 'full_name': 'Bob', 'sub_segment': 'SS1', 'project': 'P1', 'team': 'T1',
+     'role': 'Dev', 'start_date_of_working': None, 'project_allocation_pct': None}
+])
+
+
+def skills(*rows):
+    return pd.DataFrame([
+        {'zid': zid, 'employee_full_name': 'x', 'skill_name': name, 'proficiency': level,
+         'years_experience': years, 'last_used': None}
+        for zid, name, level, years in rows
+    ])
+
+
+def fingerprints(employees_df, *skill_chunks):
+    fingerprinter = EmployeeFingerprinter()
+    fingerprinter.add_employees(employees_df)
+    for chunk in skill_chunks:
+        fingerprinter.add_skills(chunk)
+    return fingerprinter.fingerprints()
+
+
+class TestEmployeeFingerprinter:
+    """Test suite for per-employee fingerprints."""
+
+    def test_skill_order_and_chunking_do_not_matter(self):
+        one_chunk = fingerprints(EMPLOYEES, skills(('Z1', 'Python', 'Expert', 3), ('Z1', 'Go', 'Beginner', 1)))
+        reordered = fingerprints(EMPLOYEES, skills(('Z1', 'Go', 'Beginner', 1.0)), skills(('Z1', 'Python', 'Expert', 3)))
+
+        assert one_chunk == reordered
+        assert set(one_chunk) == {'Z1', 'Z2'}
+
+    def test_changed_skill_changes_only_that_employee(self):
+        before = fingerprints(EMPLOYEES, skills(('Z1', 'Python', 'Expert', 3), ('Z2', 'Go', 'Beginner', 1)))
+        after = fingerprints(EMPLOYEES, skills(('Z1', 'Python', 'Advanced', 3), ('Z2', 'Go', 'Beginner', 1)))
+
+        assert before['Z1'] != after['Z1']
+        assert before['Z2'] == after['Z2']
+
+    def test_blank_cells_and_whitespace_are_normalized(self):
+        padded = EMPLOYEES.assign(full_name=[' Ann ', 'Bob'], start_date_of_working=[pd.Timestamp('2020-01-01'), float('nan')])
+
+        assert fingerprints(padded) == fingerprints(EMPLOYEES)
+
+    def test_file_sha256(self, tmp_path):
+        path = tmp_path / 'workbook.xlsx'
+        path.write_bytes(b'x' * 3_000_000)
+
+        assert file_sha256(str(path)) == hashlib.sha256(b'x' * 3_000_000).hexdigest()
+
+
+class TestSkillPersisterDelta:
+    """Test suite for the delta-mode skill diff."""
+
+    def make_persister(self, current):
+        db = MagicMock(spec=Session)
+        stats = {'failed_rows': []}
+        persister = SkillPersister(db, stats, MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                                   bulk_mode=True, delta_mode=True)
+        persister._current_skills = MagicMock(return_value={
+            (record.employee_id, record.skill_id): record for record in current
+        })
+        return persister, db, stats
+
+    def test_only_changed_skills_are_updated_and_new_ones_inserted(self):
+        stored = [
+            EmployeeSkill(emp_skill_id=100, employee_id=1, skill_id=10, proficiency_level_id=3,
+                          years_experience=2, last_used=date(2024, 1, 1), comment=None),
+            EmployeeSkill(emp_skill_id=101, employee_id=1, skill_id=11, proficiency_level_id=2,
+                          years_experience=1, comment=None)
+        ]
+        persister, db, stats = self.make_persister(stored)
+        unchanged = EmployeeSkill(employee_id=1, skill_id=10, proficiency_level_id=3, years_experience=2,
+                                  last_used=date(2024, 1, 1), comment=float('nan'))
+        changed = EmployeeSkill(employee_id=1, skill_id=11, proficiency_level_id=4, years_experience=1)
+        new = EmployeeSkill(employee_id=1, skill_id=12, proficiency_level_id=1)
+        history_service = MagicMock()
+
+        remaining, updated = persister._apply_skill_changes([unchanged, changed, new], history_service)
+
+        assert (remaining, updated) == ([new], 1)
+        assert (stats['skills_unchanged'], stats['skills_updated']) == (1, 1)
+        [params] = [call.args[1] for call in db.execute.call_args_list]
+        assert params == [{
+            'b_emp_skill_id': 101, 'b_proficiency_level_id': 4, 'b_years_experience': 1, 'b_last_used': None,
+            'b_started_learning_from': None, 'b_certification': None, 'b_comment': None, 'b_interest_level': None
+        }]
+        history_args = history_service.record_skill_changes_bulk.call_args
+        assert history_args.args[0] == [changed]
+        assert history_args.kwargs['old_skill_records'] == [stored[1]]
+
+    def test_failed_chunk_does_not_double_count(self):
+        persister, db, stats = self.make_persister([
+            EmployeeSkill(emp_skill_id=100, employee_id=1, skill_id=10, proficiency_level_id=3)
+        ])
+        db.commit.side_effect = [Exception("deadlock"), None]
+        record = EmployeeSkill(employee_id=1, skill_id=10, proficiency_level_id=3)
+
+        persister._commit_skill_chunk([('Z1', 'Ann', [record])], MagicMock(), None)
+
+        assert stats['skills_unchanged'] == 0
+        assert stats['failed_rows'][0]['error_code'] == 'BATCH_COMMIT_FAILED'
+
+
+def test_staging_delta_statements():
+    assert 'NOT EXISTS' in INSERT_NEW_SKILLS_WITH_HISTORY
+    assert 'NOT EXISTS' not in INSERT_SKILLS_WITH_HISTORY
+    assert 'IS DISTINCT FROM' in UPDATE_CHANGED_SKILLS_WITH_HISTORY
+    assert 'CAST(:action AS changeaction)' in UPDATE_CHANGED_SKILLS_WITH_HISTORY
+
+
+def test_fingerprints_saved_only_for_error_free_employees():
+    orchestrator = EmployeeImportOrchestrator(MagicMock(spec=Session))
+    orchestrator.import_stats['failed_rows'] = [{'sheet': 'Employee_Skills', 'zid': 'Z2'}]
+    store = MagicMock()
+
+    orchestrator._save_fingerprints(store, {'Z1': 'a', 'Z2': 'b', 'Z3': 'c'}, {'Z1': 1, 'Z2': 2}, 'filehash')
+
+    store.save_employee_fingerprints.assert_called_once_with({1: 'a'})
+    store.save_file_hash.assert_not_called()
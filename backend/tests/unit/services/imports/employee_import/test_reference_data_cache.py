@@ -0,0 +1,155 @@
+"""
+Unit tests for the import-scoped reference data cache and its use by
+OrgMasterDataProcessor.
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Segment, SubSegment, Project, Team, Role, ProficiencyLevel
+from app.services.imports.employee_import.org_master_data_processor import OrgMasterDataProcessor
+from app.services.imports.employee_import.reference_data_cache import ReferenceDataCache
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    for model in (Segment, SubSegment, Project, Team, Role, ProficiencyLevel):
+        model.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    segment = Segment(segment_name="Digital")
+    session.add_all([segment, Role(role_name="Developer"), ProficiencyLevel(level_name="Expert")])
+    session.flush()
+    sub_segment = SubSegment(sub_segment_name="Cloud", segment_id=segment.segment_id)
+    session.add(sub_segment)
+    session.flush()
+    project = Project(project_name="Atlas", sub_segment_id=sub_segment.sub_segment_id)
+    session.add(project)
+    session.flush()
+    session.add(Team(team_name="Backend", project_id=project.project_id))
+    session.commit()
+    yield session
+    session.close()
+
+
+def count_selects(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, *args: statements.append(sql) if sql.startswith("SELECT") else None)
+    return statements
+
+
+class TestReferenceDataCache:
+    """Test suite for ReferenceDataCache lookups and stats."""
+
+    def test_loaded_lookups_do_not_query(self, engine, db):
+        cache = ReferenceDataCache(db).load()
+        selects = count_selects(engine)
+
+        sub_segment_id = cache.sub_segment_id("Cloud")
+        project_id = cache.project_id("Atlas", sub_segment_id)
+        team_id = cache.team_id("Backend", project_id)
+
+        assert None not in (sub_segment_id, project_id, team_id)
+        assert cache.team_project_id(team_id) == project_id
+        assert cache.role_id("Developer") and cache.proficiency_level_id("Expert")
+        assert selects == []
+        assert cache.summary()['hits'] == 6 and cache.summary()['misses'] == 0
+
+    def test_miss_reads_through_once_and_remembers_not_found(self, engine, db):
+        cache = ReferenceDataCache(db).load()
+        selects = count_selects(engine)
+
+        assert cache.proficiency_level_id("Guru") is None
+        assert cache.proficiency_level_id("Guru") is None
+
+        assert len(selects) == 1
+        assert cache.summary()['by_kind'] == {'proficiency': {'hits': 1, 'misses': 1}}
+
+    def test_unloaded_cache_reads_through(self, db):
+        cache = ReferenceDataCache(db)
+
+        assert cache.role_id("Developer") is not None
+        assert cache.summary()['misses'] == 1
+
+    def test_blank_names_are_not_looked_up(self, db):
+        cache = ReferenceDataCache(db).load()
+
+        assert cache.role_id(None) is None
+        assert cache.role_id(float('nan')) is None
+        assert cache.summary()['hits'] + cache.summary()['misses'] == 0
+
+
+class TestOrgProcessorUsesCache:
+    """Test suite for OrgMasterDataProcessor with a shared reference cache."""
+
+    def test_created_entities_are_added_in_place(self, db):
+        cache = ReferenceDataCache(db).load()
+        stats = {}
+        processor = OrgMasterDataProcessor(db, stats, reference_cache=cache)
+
+        processor.process_all({
+            'segments': {"Digital"},
+            'sub_segments': {"Cloud", "Data"},
+            'segment_subsegment_mappings': {("Digital", "Data")},
+            'roles': {"Developer", "Architect"},
+            'projects': {"Atlas", "Orion"},
+            'sub_segment_project_mappings': {("Cloud", "Atlas"), ("Data", "Orion")},
+            'teams': {"Backend", "ML"},
+            'project_team_mappings': {("Cloud", "Atlas", "Backend"), ("Data", "Orion", "ML")}
+        })
+
+        assert stats['new_sub_segments'] == ["Data"]
+        assert stats['new_projects'] == ["Orion"]
+        assert stats['new_teams'] == ["ML"]
+        assert stats['new_roles'] == ["Architect"]
+        data_id = cache.sub_segment_id("Data")
+        ml_team_id = cache.team_id("ML", cache.project_id("Orion", data_id))
+        assert ml_team_id == db.query(Team.team_id).filter(Team.team_name == "ML").scalar()
+        assert cache.sub_segment_segment_id(data_id) == cache.segment_id("Digital")
+        assert cache.role_id("Architect") is not None
+
+    def test_missing_entities_inserted_one_statement_per_level(self, engine, db):
+        cache = ReferenceDataCache(db).load()
+        stats = {}
+        statements = []
+        event.listen(engine, "before_cursor_execute",
+                     lambda conn, cursor, sql, *args: statements.append(sql.split()[0]))
+        teams = {("Cloud", "Atlas", f"Team {i}") for i in range(200)} | {("Data", "Orion", "ML")}
+
+        OrgMasterDataProcessor(db, stats, reference_cache=cache).process_all({
+            'segments': {"Digital", " Retail "},
+            'sub_segments': {"Cloud", "Data"},
+            'segment_subsegment_mappings': {("Retail", "Data"), ("Digital", "Cloud")},
+            'roles': {"Developer"},
+            'projects': {"Atlas", "Orion"},
+            'sub_segment_project_mappings': {("Cloud", "Atlas"), ("Data", "Orion")},
+            'teams': {team for _, _, team in teams},
+            'project_team_mappings': teams
+        })
+
+        assert [s for s in statements if s != 'SELECT'] == ['INSERT'] * 4
+        assert not [s for s in statements if s == 'SELECT']
+        assert stats['new_segments'] == ["Retail"]
+        assert len(stats['new_teams']) == 201 and "Backend" not in stats['new_teams']
+        assert cache.sub_segment_segment_id(cache.sub_segment_id("Data")) == cache.segment_id("Retail")
+        assert db.query(Team).count() == 202
+
+    def test_existing_unlinked_sub_segment_is_linked(self, db):
+        db.add(SubSegment(sub_segment_name="Legacy"))
+        db.commit()
+        cache = ReferenceDataCache(db).load()
+
+        OrgMasterDataProcessor(db, {}, reference_cache=cache).process_all({
+            'segments': {"Digital"}, 'sub_segments': {"Legacy"},
+            'segment_subsegment_mappings': {("Digital", "Legacy")}, 'roles': set(), 'projects': set(),
+            'sub_segment_project_mappings': set(), 'teams': set(), 'project_team_mappings': set()
+        })
+
+        linked = db.query(SubSegment.segment_id).filter(SubSegment.sub_segment_name == "Legacy").scalar()
+        assert linked == cache.segment_id("Digital") == cache.sub_segment_segment_id(cache.sub_segment_id("Legacy"))
@@ -0,0 +1,155 @@
+"""
+Unit tests for bulk EmployeeSkill + history writes (SkillPersister bulk mode,
+SkillHistoryService.record_skill_changes_bulk).
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.employee_skill import EmployeeSkill
+from app.models.raw_skill_input import RawSkillInput
+from app.models.skill_history import EmployeeSkillHistory, ProficiencyChangeHistory, ChangeAction, ChangeSource
+from app.services.imports.employee_import.reference_data_cache import ReferenceDataCache
+from app.services.imports.employee_import.skill_persister import EmployeeSkillBatch, SkillPersister
+from app.services.skill_history_service import SkillHistoryService
+
+
+@pytest.fixture
+def sqlite_db():
+    engine = create_engine("sqlite://")
+    for model in (EmployeeSkill, EmployeeSkillHistory, ProficiencyChangeHistory, RawSkillInput):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def skill(employee_id, skill_id, level=3, emp_skill_id=None):
+    return EmployeeSkill(
+        emp_skill_id=emp_skill_id, employee_id=employee_id, skill_id=skill_id,
+        proficiency_level_id=level, years_experience=2, last_used=date(2024, 1, 1),
+        certification=None, comment=None, interest_level=None, started_learning_from=None,
+        created_at=datetime(2024, 1, 1)
+    )
+
+
+class TestRecordSkillChangesBulk:
+    """Test suite for SkillHistoryService.record_skill_changes_bulk."""
+
+    def test_inserts_and_updates_in_one_call(self, sqlite_db):
+        service = SkillHistoryService(sqlite_db)
+        new_records = [skill(1, 10, emp_skill_id=100), skill(1, 11, level=4, emp_skill_id=101)]
+        old_records = [None, skill(1, 11, level=2, emp_skill_id=101)]
+
+        written = service.record_skill_changes_bulk(
+            new_records, old_records, change_source=ChangeSource.IMPORT, batch_id="b1",
+            record_proficiency_changes=True
+        )
+
+        history = sqlite_db.query(
+            EmployeeSkillHistory.emp_skill_id, EmployeeSkillHistory.action,
+            EmployeeSkillHistory.old_proficiency_level_id, EmployeeSkillHistory.new_proficiency_level_id
+        ).order_by(EmployeeSkillHistory.history_id).all()
+        transitions = sqlite_db.query(
+            ProficiencyChangeHistory.from_proficiency_id, ProficiencyChangeHistory.to_proficiency_id
+        ).order_by(ProficiencyChangeHistory.change_id).all()
+        assert written == 2
+        assert history == [(100, ChangeAction.INSERT, None, 3), (101, ChangeAction.UPDATE, 2, 4)]
+        assert transitions == [(None, 3), (2, 4)]
+
+    def test_proficiency_history_is_opt_in(self, sqlite_db):
+        SkillHistoryService(sqlite_db).record_skill_changes_bulk([skill(1, 10, emp_skill_id=100)])
+
+        assert sqlite_db.query(ProficiencyChangeHistory).count() == 0
+
+    def test_misaligned_inputs_rejected(self, sqlite_db):
+        with pytest.raises(ValueError):
+            SkillHistoryService(sqlite_db).record_skill_changes_bulk([skill(1, 10)], [None, None])
+
+
+class TestSkillPersisterBulkWrites:
+    """Test suite for SkillPersister chunked INSERT ... RETURNING path."""
+
+    def make_persister(self, db, chunk_size=1000):
+        return SkillPersister(db, {'failed_rows': []}, MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                              bulk_mode=True, chunk_size=chunk_size,
+                              reference_cache=ReferenceDataCache.from_entries(proficiency={'Expert': 3}))
+
+    def test_chunk_insert_assigns_returned_ids_to_history(self, sqlite_db):
+        persister = self.make_persister(sqlite_db)
+        records = [skill(1, 10), skill(1, 11), skill(2, 10)]
+
+        written = persister._commit_skill_chunk(
+            [("Z1", "A", records[:2]), ("Z2", "B", records[2:])],
+            SkillHistoryService(sqlite_db), datetime(2024, 1, 1)
+        )
+
+        stored = sqlite_db.query(EmployeeSkill.emp_skill_id, EmployeeSkill.skill_id).order_by(
+            EmployeeSkill.emp_skill_id).all()
+        history = sqlite_db.query(EmployeeSkillHistory.emp_skill_id, EmployeeSkillHistory.skill_id).order_by(
+            EmployeeSkillHistory.history_id).all()
+        assert written == 3
+        assert [record.emp_skill_id for record in records] == [1, 2, 3]
+        assert history == stored
+
+    def test_failed_chunk_retried_per_employee(self):
+        db = MagicMock(spec=Session)
+        persister = self.make_persister(db)
+        persister._insert_skill_records = MagicMock(
+            side_effect=[Exception("constraint violated"), 2, Exception("constraint violated")]
+        )
+        good, bad = [skill(1, 10), skill(1, 11)], [skill(2, 10)]
+
+        written = persister._commit_skill_chunk([("Z1", "A", good), ("Z2", "B", bad)], MagicMock(), datetime.now())
+
+        assert written == 2
+        assert persister.stats['skill_chunks_retried'] == 1
+        [failed] = persister.stats['failed_rows']
+        assert (failed['zid'], failed['error_code']) == ("Z2", "BATCH_COMMIT_FAILED")
+
+    def test_unresolved_skills_survive_failed_chunk(self, sqlite_db):
+        persister = self.make_persister(sqlite_db)
+        persister.unresolved_logger.record_unresolved_skill.side_effect = lambda skill_name, employee_id, **_: \
+            sqlite_db.add(RawSkillInput(raw_text=skill_name, normalized_text=skill_name.lower(),
+                                        employee_id=employee_id, sub_segment_id=1, source_type="excel_import"))
+        persister._insert_skill_records = MagicMock(
+            side_effect=[Exception("constraint violated"), 1, Exception("constraint violated")]
+        )
+        batches = [
+            EmployeeSkillBatch("Z1", "A", [skill(1, 10)], [{'skill_name': 'Cobol++', 'employee_id': 1}]),
+            EmployeeSkillBatch("Z2", "B", [skill(2, 10)], [{'skill_name': 'Rust-ish', 'employee_id': 2}])
+        ]
+
+        written = persister._commit_skill_chunk(batches, MagicMock(), datetime.now())
+
+        stored = sqlite_db.query(RawSkillInput.employee_id, RawSkillInput.raw_text).order_by(
+            RawSkillInput.employee_id).all()
+        assert written == 1
+        assert stored == [(1, 'Cobol++'), (2, 'Rust-ish')]
+
+    def test_bulk_mode_defers_unresolved_skills_to_commit(self):
+        persister = self.make_persister(MagicMock(spec=Session))
+        persister.skill_resolver.resolve_skill.return_value = (None, None, None)
+
+        batch = persister._prepare_employee_skills(
+            "Z1", [(2, {'skill_name': 'Cobol++'})], {"Z1": 1}, {}, {}, datetime(2024, 1, 1)
+        )
+
+        persister.unresolved_logger.record_unresolved_skill.assert_not_called()
+        assert [entry['skill_name'] for entry in batch.unresolved] == ['Cobol++']
+        assert persister.stats['failed_rows'][0]['error_code'] == 'SKILL_NOT_RESOLVED'
+
+    def test_bulk_mode_does_not_flush_per_skill(self):
+        db = MagicMock(spec=Session)
+        persister = self.make_persister(db)
+        persister.skill_resolver.resolve_skill.return_value = (10, "exact", 1.0)
+        row = {'skill_name': 'Python', 'proficiency': 'Expert'}
+
+        record = persister._process_single_skill(row, 2, "Z1", "A", 1, None, datetime(2024, 1, 1))
+
+        assert (record.employee_id, record.skill_id, record.proficiency_level_id) == (1, 10, 3)
+        db.add.assert_not_called()
+        db.flush.assert_not_called()
@@ -0,0 +1,108 @@
+"""
+Unit tests for SkillResolutionPipeline (skill resolution ahead of the persister).
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from app.services.imports.employee_import.skill_resolution_pipeline import SkillResolutionPipeline
+from app.services.imports.employee_import.skill_resolver import SkillResolver
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
+
+KNOWN_SKILLS = {'Python': 1, 'Java': 2, 'SQL': 3}
+# (name, worker thread) of every name resolved by fake_resolve_many
+RESOLVED = []
+CHUNKS = [['Python', 'Java', 'Cobol'], ['Java', 'SQL', ')'], ['Cobol', 'Rust', 'Python']]
+
+
+def new_stats():
+    return {'skills_resolved_exact': 0, 'skills_resolved_alias': 0, 'skills_unresolved': 0,
+            'unresolved_skill_names': []}
+
+
+def fake_resolve_many(self, skill_names):
+    """Stand-in for the exact/alias/embedding layers: one memo hit per call, records the thread."""
+    names = [name for name in dict.fromkeys(skill_names) if name not in self._prepared and name != ')']
+    for name in names:
+        skill_id = KNOWN_SKILLS.get(name)
+        self._prepared[name] = (skill_id, 'exact' if skill_id else None, None)
+    if names:
+        self.stats['resolution_memo_hits'] = self.stats.get('resolution_memo_hits', 0) + 1
+        RESOLVED.extend((name, threading.current_thread().name) for name in names)
+    return {name: self._prepared.get(name, (None, None, None)) for name in skill_names}
+
+
+@pytest.fixture(autouse=True)
+def offline_resolver():
+    RESOLVED.clear()
+    with patch('app.services.skill_resolution.embedding_worker_pool.create_concurrent_embedding_provider',
+               side_effect=RuntimeError("no provider")), \
+         patch.object(SkillResolver, 'resolve_many', fake_resolve_many):
+        yield
+
+
+def make_resolver(db=None, stats=None):
+    return SkillResolver(db or MagicMock(), stats if stats is not None else new_stats(),
+                         lookup_index=SkillLookupIndex.from_entries())
+
+
+def chunk_frames():
+    return [pd.DataFrame({'zid': 'Z1', 'skill_name': names}) for names in CHUNKS]
+
+
+def persist(resolver, chunk):
+    """What SkillPersister does per chunk: pre-resolve, then resolve_skill() per row."""
+    resolver.resolve_many(chunk['skill_name'])
+    return [resolver.resolve_skill(name) for name in chunk['skill_name']]
+
+
+class TestSkillResolutionPipeline:
+    """Test suite for SkillResolutionPipeline."""
+
+    def test_outcomes_and_stats_match_sequential_mode(self):
+        sequential = make_resolver()
+        expected = [persist(sequential, chunk) for chunk in chunk_frames()]
+        RESOLVED.clear()
+
+        target = make_resolver()
+        sessions = []
+        pipeline = SkillResolutionPipeline(target, lambda: sessions.append(MagicMock()) or sessions[-1],
+                                           SkillLookupIndex.from_entries(), workers=2)
+        results = [persist(target, chunk) for chunk in pipeline.run(chunk_frames())]
+
+        assert results == expected
+        assert target.stats == sequential.stats
+        assert all(thread.startswith('skill-resolution') for _, thread in RESOLVED)
+        assert sorted(name for name, _ in RESOLVED) == ['Cobol', 'Java', 'Python', 'Rust', 'SQL']
+        assert sessions and all(session.close.called for session in sessions)
+
+    def test_reads_at_most_depth_chunks_ahead(self):
+        pulled = []
+
+        def reader():
+            for chunk in chunk_frames():
+                pulled.append(chunk)
+                yield chunk
+
+        pipeline = SkillResolutionPipeline(make_resolver(), MagicMock, SkillLookupIndex.from_entries(), depth=1)
+        chunks = pipeline.run(reader())
+
+        first = next(chunks)
+        assert first['skill_name'].tolist() == CHUNKS[0]
+        assert len(pulled) == 2
+        assert [chunk['skill_name'].tolist() for chunk in chunks] == CHUNKS[1:]
+
+    def test_failed_resolution_leaves_chunk_to_persister(self):
+        target = make_resolver()
+        failing_session = MagicMock()
+        failing_session.commit.side_effect = RuntimeError("connection lost")
+        pipeline = SkillResolutionPipeline(target, lambda: failing_session, SkillLookupIndex.from_entries())
+
+        chunks = list(pipeline.run(chunk_frames()[:1]))
+
+        assert len(chunks) == 1
+        assert target.prepared_outcome('Python') is None
+        assert pipeline.stats['chunks_failed'] == 1
+        failing_session.rollback.assert_called()
@@ -6,6 +6,7 @@ Tests resolution precedence and threshold logic.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from app.services.imports.employee_import.skill_resolver import SkillResolver
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
 
 
 class TestSkillResolverPrecedence:
@@ -22,7 +23,7 @@ class TestSkillResolverPrecedence:
             'skills_unresolved': 0,
             'unresolved_skill_names': []
         }
-        self.resolver = SkillResolver(self.mock_db, self.stats)
+        self.resolver = SkillResolver(self.mock_db, self.stats, lookup_index=SkillLookupIndex.from_entries())
         self.resolver.set_name_normalizer(lambda x: x.lower().strip())
     
     def test_reject_invalid_token(self):
@@ -39,14 +40,11 @@ class TestSkillResolverPrecedence:
     
     def test_exact_match_takes_precedence(self):
         """Test that exact match is tried before alias."""
-        # Mock exact match found
-        mock_skill = Mock()
-        mock_skill.skill_id = 42
-        mock_skill.skill_name = "Python"
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        self.mock_db.query.return_value = mock_query
+        # Skill name and alias both normalize to "python"
+        self.resolver.lookup_index = SkillLookupIndex.from_entries(
+            skills=[(42, "Python")],
+            aliases=[("python", 7)]
+        )
         
         skill_id, method, confidence = self.resolver.resolve_skill("Python")
         
@@ -57,23 +55,11 @@ class TestSkillResolverPrecedence:
     
     def test_alias_match_after_exact_fails(self):
         """Test that alias match is tried after exact match fails."""
-        # Mock: exact match fails, alias match succeeds
-        mock_alias = Mock()
-        mock_alias.skill_id = 99
-        
-        call_count = [0]
-        def mock_query_side_effect(*args):
-            call_count[0] += 1
-            mock_q = Mock()
-            if call_count[0] == 1:
-                # First call: exact match (returns None)
-                mock_q.filter.return_value.first.return_value = None
-            else:
-                # Second call: alias match (returns alias)
-                mock_q.filter.return_value.first.return_value = mock_alias
-            return mock_q
-        
-        self.mock_db.query.side_effect = mock_query_side_effect
+        # No skill named "py", but an alias exists
+        self.resolver.lookup_index = SkillLookupIndex.from_entries(
+            skills=[(42, "Python")],
+            aliases=[("py", 99)]
+        )
         
         skill_id, method, confidence = self.resolver.resolve_skill("py")
         
@@ -97,7 +83,7 @@ class TestSkillResolverEmbeddingThresholds:
             'skills_unresolved': 0,
             'unresolved_skill_names': []
         }
-        self.resolver = SkillResolver(self.mock_db, self.stats)
+        self.resolver = SkillResolver(self.mock_db, self.stats, lookup_index=SkillLookupIndex.from_entries())
         self.resolver.set_name_normalizer(lambda x: x.lower().strip())
         
         # Enable embedding (mock provider)
@@ -106,11 +92,6 @@ class TestSkillResolverEmbeddingThresholds:
     
     def test_auto_accept_high_confidence(self):
         """Test auto-accept for similarity ≥ 0.88."""
-        # Mock: no exact/alias match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         # Mock embedding match with high confidence
         with patch.object(self.resolver, '_try_embedding_match', return_value=(123, 0.92)):
             skill_id, method, confidence = self.resolver.resolve_skill("Python Programming")
@@ -122,11 +103,6 @@ class TestSkillResolverEmbeddingThresholds:
     
     def test_needs_review_medium_confidence(self):
         """Test needs_review for 0.80 ≤ similarity < 0.88."""
-        # Mock: no exact/alias match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         # Mock embedding match with medium confidence
         with patch.object(self.resolver, '_try_embedding_match', return_value=(456, 0.83)):
             skill_id, method, confidence = self.resolver.resolve_skill("ML Programming")
@@ -138,11 +114,6 @@ class TestSkillResolverEmbeddingThresholds:
     
     def test_reject_low_confidence(self):
         """Test rejection for similarity < 0.80."""
-        # Mock: no exact/alias match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         # Mock embedding match with low confidence (should be filtered by repository)
         with patch.object(self.resolver, '_try_embedding_match', return_value=(None, None)):
             skill_id, method, confidence = self.resolver.resolve_skill("Unknown Skill")
@@ -154,11 +125,6 @@ class TestSkillResolverEmbeddingThresholds:
     
     def test_threshold_boundary_0_88(self):
         """Test exact boundary at 0.88 (auto-accept threshold)."""
-        # Mock: no exact/alias match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         # Test exactly 0.88 - should auto-accept
         with patch.object(self.resolver, '_try_embedding_match', return_value=(100, 0.88)):
             skill_id, method, confidence = self.resolver.resolve_skill("Test Skill")
@@ -179,11 +145,6 @@ class TestSkillResolverEmbeddingThresholds:
     
     def test_threshold_boundary_0_80(self):
         """Test exact boundary at 0.80 (review threshold)."""
-        # Mock: no exact/alias match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         # Test exactly 0.80 - should need review
         with patch.object(self.resolver, '_try_embedding_match', return_value=(200, 0.80)):
             skill_id, method, confidence = self.resolver.resolve_skill("Boundary Test")
@@ -204,7 +165,7 @@ class TestSkillResolverEmbeddingDisabled:
             'skills_unresolved': 0,
             'unresolved_skill_names': []
         }
-        self.resolver = SkillResolver(self.mock_db, self.stats)
+        self.resolver = SkillResolver(self.mock_db, self.stats, lookup_index=SkillLookupIndex.from_entries())
         self.resolver.set_name_normalizer(lambda x: x.lower().strip())
         
         # Ensure embedding is disabled
@@ -213,11 +174,6 @@ class TestSkillResolverEmbeddingDisabled:
     
     def test_fallback_to_unresolved_when_embedding_disabled(self):
         """Test that skills are unresolved when embedding is disabled and no exact/alias match."""
-        # Mock: no exact/alias match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         skill_id, method, confidence = self.resolver.resolve_skill("Unknown Skill")
         
         assert skill_id is None
@@ -241,24 +197,23 @@ class TestSkillResolverStatsTracking:
             'skills_unresolved': 0,
             'unresolved_skill_names': []
         }
-        self.resolver = SkillResolver(self.mock_db, self.stats)
+        self.resolver = SkillResolver(self.mock_db, self.stats, lookup_index=SkillLookupIndex.from_entries())
         self.resolver.set_name_normalizer(lambda x: x.lower().strip())
         self.resolver.embedding_enabled = True
         self.resolver.embedding_provider = Mock()
     
     def test_stats_increment_correctly(self):
         """Test that stats increment for each resolution method."""
-        # Mock: exact match
-        mock_skill = Mock()
-        mock_skill.skill_id = 1
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        self.mock_db.query.return_value = mock_query
+        self.resolver.lookup_index = SkillLookupIndex.from_entries(
+            skills=[(1, "Exact Match")],
+            aliases=[("Alias Match", 2)]
+        )
         
+        # Exact match
         self.resolver.resolve_skill("Exact Match")
         assert self.stats['skills_resolved_exact'] == 1
         
-        # Mock: alias match
+        # Alias match
         self.stats = {
             'skills_resolved_exact': 0,
             'skills_resolved_alias': 0,
@@ -269,30 +224,11 @@ class TestSkillResolverStatsTracking:
         }
         self.resolver.stats = self.stats
         
-        mock_alias = Mock()
-        mock_alias.skill_id = 2
-        
-        call_count = [0]
-        def mock_query_side_effect(*args):
-            call_count[0] += 1
-            mock_q = Mock()
-            if call_count[0] == 1:
-                mock_q.filter.return_value.first.return_value = None
-            else:
-                mock_q.filter.return_value.first.return_value = mock_alias
-            return mock_q
-        
-        self.mock_db.query.side_effect = mock_query_side_effect
         self.resolver.resolve_skill("Alias Match")
         assert self.stats['skills_resolved_alias'] == 1
     
     def test_unresolved_names_tracked(self):
         """Test that unresolved skill names are tracked."""
-        # Mock: no match
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        self.mock_db.query.return_value = mock_query
-        
         with patch.object(self.resolver, '_try_embedding_match', return_value=(None, None)):
             self.resolver.resolve_skill("Unknown 1")
             self.resolver.resolve_skill("Unknown 2")
@@ -302,3 +238,58 @@ class TestSkillResolverStatsTracking:
             assert len(self.stats['unresolved_skill_names']) == 2  # No duplicates in list
             assert "Unknown 1" in self.stats['unresolved_skill_names']
             assert "Unknown 2" in self.stats['unresolved_skill_names']
+
+
+class TestSkillResolverBulk:
+    """Test resolve_many() pre-resolution."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_db = Mock()
+        self.stats = {
+            'skills_resolved_exact': 0,
+            'skills_resolved_alias': 0,
+            'skills_resolved_embedding': 0,
+            'skills_needs_review': 0,
+            'skills_unresolved': 0,
+            'unresolved_skill_names': []
+        }
+        self.resolver = SkillResolver(
+            self.mock_db, self.stats,
+            lookup_index=SkillLookupIndex.from_entries(skills=[(1, "Python")], aliases=[("py3", 1)])
+        )
+        self.resolver.set_name_normalizer(lambda x: x.lower().strip())
+        self.resolver.embedding_enabled = False
+        self.resolver.embedding_provider = None
+    
+    def test_resolve_many_returns_resolve_skill_tuples(self):
+        """Bulk outcomes should use the resolve_skill() tuple format without touching stats."""
+        outcomes = self.resolver.resolve_many(["Python", "py3", "Python", "Cobol", ")"])
+        
+        assert outcomes == {
+            "Python": (1, "exact", None),
+            "py3": (1, "alias", None),
+            "Cobol": (None, None, None),
+            ")": (None, None, None)
+        }
+        assert self.stats['skills_resolved_exact'] == 0
+    
+    def test_resolve_skill_served_from_bulk_and_counted_per_call(self):
+        """After resolve_many(), resolve_skill() should not re-resolve but still count every row."""
+        self.resolver.resolve_many(["Python", "Cobol"])
+        self.resolver.lookup_index = Mock(side_effect=AssertionError("index should not be used"))
+        
+        assert self.resolver.resolve_skill("Python") == (1, "exact", None)
+        assert self.resolver.resolve_skill("Python") == (1, "exact", None)
+        assert self.resolver.resolve_skill("Cobol") == (None, None, None)
+        
+        assert self.stats['skills_resolved_exact'] == 2
+        assert self.stats['skills_unresolved'] == 1
+        assert self.stats['unresolved_skill_names'] == ["Cobol"]
+    
+    def test_review_outcome_maps_to_needs_review(self):
+        """A review result from the embedding layer should map to 'needs_review'."""
+        from app.services.skill_resolution.skill_resolver_service import ResolutionResult
+        
+        assert SkillResolver._to_outcome(ResolutionResult(None, "review", 0.84)) == (None, "needs_review", 0.84)
+        assert SkillResolver._to_outcome(ResolutionResult(5, "embedding", 0.9)) == (5, "embedding", 0.9)
@@ -0,0 +1,142 @@
+"""
+Unit tests for StagingImportEngine (COPY + set-based merge import engine).
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.imports.employee_import import EmployeeImportOrchestrator, ImportServiceError
+from app.services.imports.employee_import.staging_import_engine import (
+    EMPLOYEE_COPY_COLUMNS,
+    INSERT_SKILLS_WITH_HISTORY,
+    SKILL_COPY_COLUMNS,
+    StagingImportEngine
+)
+
+
+def make_engine(db=None, outcomes=None):
+    skill_resolver = MagicMock()
+    skill_resolver.resolve_skill.side_effect = lambda name: outcomes[name]
+    field_sanitizer = MagicMock()
+    field_sanitizer.sanitize_integer_field.side_effect = lambda value, *_: int(value) if value else None
+    date_parser = MagicMock()
+    date_parser.parse_date_safely.side_effect = lambda value, *_: date(2020, 1, 1) if value else None
+    stats = {'failed_rows': []}
+    engine = StagingImportEngine(db or MagicMock(spec=Session), stats, date_parser, field_sanitizer,
+                                 skill_resolver, name_normalizer=str.lower)
+    return engine, stats
+
+
+def skill_row(zid, skill_name, **overrides):
+    row = {
+        'zid': zid, 'employee_full_name': f'Name {zid}', 'skill_name': skill_name,
+        'proficiency': 'Expert', 'years_experience': '3', 'last_used': '2024-01-01',
+        'started_learning_from': None, 'certification': None, 'comment': None, 'interest_level': None
+    }
+    row.update(overrides)
+    return row
+
+
+class TestStagingRows:
+    """Test suite for the Python-side normalization before COPY."""
+
+    def test_employee_rows_follow_copy_columns(self):
+        engine, _ = make_engine()
+        df = pd.DataFrame([
+            {'zid': 'Z1', 'full_name': 'Ann', 'sub_segment': 'SS1', 'project': 'P1', 'team': 'T1',
+             'role': 'Dev', 'start_date_of_working': '2020-01-01', 'email': ' ann@x.io ',
+             'project_allocation_pct': '60%'},
+            {'zid': 'Z2', 'full_name': ' ', 'sub_segment': 'SS1', 'project': None, 'team': float('nan'),
+             'role': '', 'start_date_of_working': None, 'email': None, 'project_allocation_pct': None}
+        ], index=[0, 5])
+
+        rows = [dict(zip(EMPLOYEE_COPY_COLUMNS, row)) for row in engine.employee_staging_rows(df)]
+
+        assert rows[0] == {
+            'excel_row': 2, 'zid': 'Z1', 'full_name': 'Ann', 'sub_segment': 'SS1', 'project': 'P1',
+            'team': 'T1', 'role': 'Dev', 'start_date_of_working': date(2020, 1, 1),
+            'email': 'ann@x.io', 'allocation_pct': 60
+        }
+        assert rows[1]['excel_row'] == 7
+        assert [rows[1][c] for c in ('full_name', 'project', 'team', 'role', 'email', 'allocation_pct')] == [None] * 6
+
+    def test_skills_resolved_only_for_imported_employees(self):
+        engine, _ = make_engine(outcomes={
+            'Python': (1, 'exact', None),
+            'Pyhton': (None, 'needs_review', 0.84),
+            'Cobol': (None, None, None)
+        })
+        df = pd.DataFrame([
+            skill_row('Z1', 'Python'), skill_row('Z1', ' Pyhton '), skill_row('Z1', 'Cobol'),
+            skill_row('Z1', ' '), skill_row('Z9', 'Python')
+        ])
+
+        rows = [dict(zip(SKILL_COPY_COLUMNS, row)) for row in engine.skill_staging_rows(df, {'Z1': 10})]
+
+        assert [(r['skill_name'], r['skill_id'], r['resolution_method'], r['review_confidence'], r['normalized_name'])
+                for r in rows] == [
+            ('Python', 1, 'exact', None, None),
+            ('Pyhton', None, 'needs_review', 0.84, 'pyhton'),
+            ('Cobol', None, None, None, 'cobol'),
+            (None, None, None, None, None),
+            ('Python', None, None, None, None)
+        ]
+        assert engine.skill_resolver.resolve_skill.call_count == 3
+        assert (rows[0]['years_experience'], rows[0]['last_used']) == (3, date(2020, 1, 1))
+
+    def test_resolution_error_is_staged_with_error_code(self):
+        engine, _ = make_engine(outcomes={})
+        engine.skill_resolver.resolve_skill.side_effect = Exception("constraint violated")
+
+        [row] = [dict(zip(SKILL_COPY_COLUMNS, row))
+                 for row in engine.skill_staging_rows(pd.DataFrame([skill_row('Z1', 'Go')]), {'Z1': 10})]
+
+        assert (row['error_code'], row['error']) == ('CONSTRAINT_VIOLATION', 'constraint violated')
+
+
+class TestSkillMerge:
+    """Test suite for the per-chunk skill statements."""
+
+    def test_failed_rows_and_counts_from_sql(self):
+        db = MagicMock(spec=Session)
+        failed = MagicMock()
+        failed.all.return_value = [
+            (3, 'Z9', 'Name Z9', 'Python', 'EMPLOYEE_NOT_IMPORTED', 'Employee ZID Z9 was not successfully imported')
+        ]
+        inserted = MagicMock(rowcount=4)
+        db.execute.side_effect = lambda statement, *args: {
+            'SELECT_SKILL_ERRORS': failed, 'INSERT_SKILLS': inserted
+        }.get(_statement_kind(statement), MagicMock())
+        engine, stats = make_engine(db, outcomes={})
+        engine._staging_ready = True
+        engine._copy_rows = MagicMock(return_value=5)
+
+        processed = engine.import_employee_skills(pd.DataFrame([skill_row('Z1', 'Go')] * 5), {}, datetime(2024, 1, 1))
+
+        assert (processed, stats['skills_imported']) == (5, 4)
+        assert stats['failed_rows'] == [{
+            'sheet': 'Employee_Skills', 'excel_row_number': 3, 'row_number': 3, 'zid': 'Z9',
+            'employee_name': 'Name Z9', 'skill_name': 'Python', 'error_code': 'EMPLOYEE_NOT_IMPORTED',
+            'message': 'Employee ZID Z9 was not successfully imported'
+        }]
+
+    def test_history_enums_are_cast_to_their_types(self):
+        assert 'CAST(:action AS changeaction)' in INSERT_SKILLS_WITH_HISTORY
+        assert 'CAST(:change_source AS changesource)' in INSERT_SKILLS_WITH_HISTORY
+
+
+def test_orchestrator_rejects_unknown_engine():
+    with pytest.raises(ImportServiceError, match="Unknown import engine"):
+        EmployeeImportOrchestrator(MagicMock(spec=Session), import_engine='bulk')
+
+
+def _statement_kind(statement) -> str:
+    sql = str(statement)
+    if 'EMPLOYEE_NOT_IMPORTED' in sql:
+        return 'SELECT_SKILL_ERRORS'
+    if 'INSERT INTO employee_skill_history' in sql:
+        return 'INSERT_SKILLS'
+    return ''
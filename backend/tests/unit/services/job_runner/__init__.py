@@ -0,0 +1 @@
+# Test module for the import job runner
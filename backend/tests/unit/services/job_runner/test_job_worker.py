@@ -0,0 +1,131 @@
+"""
+Unit tests for the DB-backed import job queue and worker.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import ImportJob
+from app.services.import_job_service import (
+    ImportJobService,
+    JOB_TYPE_EMPLOYEE_IMPORT,
+    JOB_TYPE_MASTER_SKILLS_IMPORT
+)
+from app.services.job_runner import ClaimedJob, ImportJobQueue, ImportJobWorker
+from app.services.job_runner.job_queue import CLAIM_NEXT_JOB, RECLAIM_STALE_JOBS
+
+
+@pytest.fixture
+def sqlite_factory():
+    engine = create_engine("sqlite://")
+    ImportJob.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def make_worker(queue, handlers, threads=2):
+    worker = ImportJobWorker(MagicMock(return_value=MagicMock(spec=Session)), handlers=handlers,
+                             worker_id='w1', threads=threads)
+    worker._executor = MagicMock()
+    patcher = patch('app.services.job_runner.job_worker.ImportJobQueue', return_value=queue)
+    patcher.start()
+    return worker, patcher
+
+
+class TestImportJobWorker:
+    """Test suite for one worker poll."""
+
+    def test_claims_until_threads_are_full(self):
+        queue = MagicMock()
+        queue.heartbeat.return_value = []
+        queue.claim_next.side_effect = [ClaimedJob('j1', 'a'), ClaimedJob('j2', 'a'), ClaimedJob('j3', 'a')]
+        worker, patcher = make_worker(queue, {'a': MagicMock()})
+        try:
+            assert worker.run_once() == 2
+        finally:
+            patcher.stop()
+
+        assert worker.running_job_ids == ['j1', 'j2']
+        assert queue.claim_next.call_args.args == ('w1', ['a'], worker.max_concurrency, worker.stale_seconds)
+        queue.reclaim_stale.assert_called_once_with(worker.stale_seconds, worker.max_attempts)
+
+    def test_running_jobs_are_heartbeated_and_queue_end_stops_claims(self):
+        queue = MagicMock()
+        queue.heartbeat.return_value = []
+        queue.claim_next.return_value = None
+        worker, patcher = make_worker(queue, {'a': MagicMock()})
+        worker._running['j1'] = ClaimedJob('j1', 'a')
+        try:
+            assert worker.run_once() == 0
+            assert worker.run_once(claim=False) == 0
+        finally:
+            patcher.stop()
+
+        queue.heartbeat.assert_called_with('w1', ['j1'])
+        queue.claim_next.assert_called_once()
+
+    def test_stopping_worker_heartbeats_until_jobs_finish(self):
+        queue = MagicMock()
+        worker, patcher = make_worker(queue, {'a': MagicMock()})
+        worker.poll_seconds = 0.01
+        worker._running['j1'] = ClaimedJob('j1', 'a')
+        executor = worker._executor
+
+        def heartbeat(worker_id, job_ids):
+            if queue.heartbeat.call_count == 3:
+                worker._running.clear()  # the job finishes while draining
+            return []
+
+        queue.heartbeat.side_effect = heartbeat
+        try:
+            worker.stop(wait=True)
+        finally:
+            patcher.stop()
+
+        assert [call.args for call in queue.heartbeat.call_args_list] == [('w1', ['j1'])] * 3
+        queue.claim_next.assert_not_called()
+        executor.shutdown.assert_called_once_with(wait=True)
+
+    def test_crashed_handler_fails_job_and_frees_thread(self):
+        handler = MagicMock(side_effect=RuntimeError("boom"))
+        worker = ImportJobWorker(MagicMock(), handlers={'a': handler}, worker_id='w1')
+        job = ClaimedJob('j1', 'a')
+        worker._running['j1'] = job
+
+        with patch('app.services.job_runner.job_worker.ImportJobService') as service:
+            worker._run_job(job)
+
+        service.return_value.fail_job.assert_called_once_with('j1', 'RuntimeError: boom')
+        assert worker.running_job_ids == []
+        assert worker._wake.is_set()
+
+
+class TestImportJobQueue:
+    """Test suite for the claim statements."""
+
+    def test_claim_stops_at_global_limit(self):
+        db = MagicMock(spec=Session)
+        db.execute.return_value.scalar.return_value = 2
+
+        assert ImportJobQueue(db).claim_next('w1', ['a'], max_running=2, stale_after_seconds=60) is None
+
+        statements = [str(call.args[0]) for call in db.execute.call_args_list]
+        assert 'pg_advisory_xact_lock' in statements[0]
+        assert len(statements) == 2
+        db.commit.assert_called_once()
+
+    def test_claim_statement_skips_locked_rows_in_priority_order(self):
+        assert 'FOR UPDATE SKIP LOCKED' in CLAIM_NEXT_JOB
+        assert 'ORDER BY priority, created_at' in CLAIM_NEXT_JOB
+        assert 'attempts >= :max_attempts' in RECLAIM_STALE_JOBS
+
+
+def test_jobs_are_created_with_type_priority_and_params(sqlite_factory):
+    service = ImportJobService(sqlite_factory())
+    employee = service.create_job(JOB_TYPE_EMPLOYEE_IMPORT, file_path='/tmp/a.xlsx', params={'engine': 'staging'})
+    master = service.create_job(JOB_TYPE_MASTER_SKILLS_IMPORT, file_path='/tmp/b.xlsx')
+
+    employee_job, master_job = service.get_job(employee), service.get_job(master)
+    assert master_job.priority < employee_job.priority
+    assert (employee_job.status, employee_job.params, employee_job.attempts) == ('pending', {'engine': 'staging'}, 0)
@@ -251,6 +251,19 @@ class TestUpdateSkillName:
         assert result.name == "New Name"
         mock_db.commit.assert_called_once()
     
+    def test_success_update_invalidates_resolution_memo(self, mock_db, mock_skill):
+        """Renaming a skill should bump the taxonomy version in the same transaction."""
+        # Arrange
+        skill = mock_skill(skill_id=1, skill_name="Old Name", subcategory_id=1)
+        mock_db.query.return_value.filter.return_value.first.side_effect = [skill, None]
+        
+        # Act
+        with patch("app.services.master_data.taxonomy_update_service.bump_taxonomy_version") as mock_bump:
+            update_skill_name(mock_db, 1, "New Name", actor="user1")
+        
+        # Assert
+        mock_bump.assert_called_once_with(mock_db)
+    
     def test_not_found(self, mock_db):
         """Should raise NotFoundError when skill doesn't exist."""
         # Arrange
@@ -0,0 +1,87 @@
+"""
+Unit tests for ANN index management on skill_embeddings.
+
+Tests DDL generation and ANNIndexManager build/drop/rebuild.
+"""
+import pytest
+from unittest.mock import Mock
+
+from app.services.skill_resolution.ann_index_manager import (
+    ANNIndexManager,
+    ann_index_name,
+    build_create_index_sql,
+    build_drop_index_sql
+)
+
+
+class TestANNIndexSql:
+    """Test suite for ANN index DDL helpers."""
+
+    def test_index_name_is_sanitized_per_model_and_method(self):
+        """Model names should become safe identifiers."""
+        assert ann_index_name("text-embedding-3-small", "hnsw") == "ix_skill_embeddings_hnsw_text_embedding_3_small"
+        assert ann_index_name("Local/NGram v1", "ivfflat") == "ix_skill_embeddings_ivfflat_local_ngram_v1"
+
+    def test_index_name_fits_postgres_identifier_limit(self):
+        """Long model names should be truncated to 63 characters."""
+        assert len(ann_index_name("x" * 200, "hnsw")) == 63
+
+    def test_hnsw_sql(self):
+        """HNSW DDL should be a partial cosine index with m/ef_construction."""
+        sql = build_create_index_sql("text-embedding-3-small", "hnsw", m=24, ef_construction=128)
+
+        assert "USING hnsw (embedding vector_cosine_ops)" in sql
+        assert "WITH (m = 24, ef_construction = 128)" in sql
+        assert sql.endswith("WHERE model_name = 'text-embedding-3-small'")
+
+    def test_ivfflat_sql_concurrently(self):
+        """IVFFlat DDL should use lists and support CONCURRENTLY."""
+        sql = build_create_index_sql("m", "ivfflat", lists=50, concurrently=True)
+
+        assert sql.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS")
+        assert "USING ivfflat" in sql
+        assert "WITH (lists = 50)" in sql
+
+    def test_model_name_literal_is_escaped(self):
+        """Quotes in model names should not break out of the literal."""
+        sql = build_create_index_sql("o'brien", "hnsw")
+        assert "WHERE model_name = 'o''brien'" in sql
+
+    def test_unknown_method_rejected(self):
+        """Only hnsw and ivfflat are supported."""
+        with pytest.raises(ValueError, match="Unsupported ANN index method"):
+            build_create_index_sql("m", "lsh")
+
+    def test_drop_sql(self):
+        """DROP should be idempotent."""
+        assert build_drop_index_sql("m", "hnsw") == "DROP INDEX IF EXISTS ix_skill_embeddings_hnsw_m"
+
+
+class TestANNIndexManager:
+    """Test suite for ANNIndexManager."""
+
+    def test_drop_without_method_drops_both(self):
+        """Dropping without a method should drop HNSW and IVFFlat indexes."""
+        bind = Mock()
+        dropped = ANNIndexManager(bind).drop("m")
+
+        assert dropped == ["ix_skill_embeddings_hnsw_m", "ix_skill_embeddings_ivfflat_m"]
+        assert bind.execute.call_count == 2
+
+    def test_rebuild_drops_then_builds(self):
+        """Rebuild should drop the index before re-creating it."""
+        bind = Mock()
+        ANNIndexManager(bind).rebuild("m", "hnsw")
+
+        statements = [c[0][0].text for c in bind.execute.call_args_list]
+        assert statements[0].startswith("DROP INDEX")
+        assert statements[1].startswith("CREATE INDEX")
+
+    def test_ivfflat_lists_default_from_row_count(self):
+        """IVFFlat lists should default to rows / 1000 (minimum 10)."""
+        bind = Mock()
+        bind.execute.return_value.scalar.return_value = 50_000
+
+        ANNIndexManager(bind).build("m", "ivfflat")
+
+        assert "lists = 50" in bind.execute.call_args_list[-1][0][0].text
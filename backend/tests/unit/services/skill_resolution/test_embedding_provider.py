@@ -11,7 +11,8 @@ from app.services.skill_resolution.embedding_provider import (
     OpenAIEmbeddingProvider,
     AzureOpenAIEmbeddingProvider,
     FakeEmbeddingProvider,
-    create_embedding_provider
+    create_embedding_provider,
+    iter_embedding_batches
 )
 
 
@@ -73,6 +74,59 @@ class TestOpenAIEmbeddingProvider:
             provider.embed("test text")
 
 
+    @patch('app.services.skill_resolution.embedding_provider.OpenAI')
+    def test_embed_batch_single_request(self, mock_openai_class):
+        """Should embed many texts in one request and return vectors in input order."""
+        # Arrange - API returns items out of order; index identifies the input
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.data = [
+            Mock(index=1, embedding=[0.2]),
+            Mock(index=0, embedding=[0.1]),
+            Mock(index=2, embedding=[0.3])
+        ]
+        mock_client.embeddings.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+        
+        provider = OpenAIEmbeddingProvider(api_key="test-key")
+        
+        # Act
+        result = provider.embed_batch(["a", "b", "c"])
+        
+        # Assert
+        assert result == [[0.1], [0.2], [0.3]]
+        mock_client.embeddings.create.assert_called_once_with(
+            input=["a", "b", "c"],
+            model="text-embedding-3-small"
+        )
+    
+    @patch('app.services.skill_resolution.embedding_provider.OpenAI')
+    def test_embed_batch_respects_batch_size(self, mock_openai_class):
+        """Should split into one request per batch_size texts."""
+        mock_client = Mock()
+        mock_client.embeddings.create.side_effect = lambda input, model: Mock(
+            data=[Mock(index=i, embedding=[float(i)]) for i in range(len(input))]
+        )
+        mock_openai_class.return_value = mock_client
+        
+        provider = OpenAIEmbeddingProvider(api_key="test-key", batch_size=2)
+        result = provider.embed_batch(["a", "b", "c", "d", "e"])
+        
+        assert len(result) == 5
+        assert mock_client.embeddings.create.call_count == 3
+    
+    @patch('app.services.skill_resolution.embedding_provider.OpenAI')
+    def test_embed_batch_empty(self, mock_openai_class):
+        """Should not call the API for an empty list."""
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        
+        provider = OpenAIEmbeddingProvider(api_key="test-key")
+        
+        assert provider.embed_batch([]) == []
+        mock_client.embeddings.create.assert_not_called()
+
+
 class TestAzureOpenAIEmbeddingProvider:
     """Test suite for AzureOpenAIEmbeddingProvider."""
     
@@ -211,6 +265,46 @@ class TestFakeEmbeddingProvider:
         embedding2 = provider.embed(text)
         assert embedding1 == embedding2
         assert embedding2 is provider._cache[text]
+    
+    def test_embed_batch_matches_embed(self):
+        """embed_batch should return the same vectors as embed, in order."""
+        provider = FakeEmbeddingProvider(dimension=16)
+        texts = ["python", "java", "go"]
+        
+        assert provider.embed_batch(texts) == [provider.embed(t) for t in texts]
+    
+    def test_embed_batch_counts_simulated_requests(self):
+        """Should split into batches like the real providers."""
+        provider = FakeEmbeddingProvider(dimension=8, batch_size=2)
+        
+        provider.embed_batch(["a", "b", "c", "d", "e"])
+        
+        assert provider.batch_calls == 3
+
+
+class TestIterEmbeddingBatches:
+    """Test suite for iter_embedding_batches."""
+    
+    def test_splits_by_batch_size(self):
+        """Should cap each batch at batch_size texts, preserving order."""
+        batches = list(iter_embedding_batches(["a", "b", "c", "d", "e"], batch_size=2))
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+    
+    def test_splits_by_token_budget(self):
+        """Should start a new batch when the estimated token budget is exceeded."""
+        texts = ["x" * 400, "y" * 400, "z" * 400]  # ~101 tokens each
+        batches = list(iter_embedding_batches(texts, batch_size=100, max_batch_tokens=250))
+        assert [len(b) for b in batches] == [2, 1]
+    
+    def test_oversized_text_gets_own_batch(self):
+        """A single text over the budget should still be sent, alone."""
+        texts = ["short", "x" * 4000, "short"]
+        batches = list(iter_embedding_batches(texts, batch_size=100, max_batch_tokens=50))
+        assert batches == [["short"], ["x" * 4000], ["short"]]
+    
+    def test_empty_input(self):
+        """Should yield nothing for no texts."""
+        assert list(iter_embedding_batches([])) == []
 
 
 class TestCreateEmbeddingProvider:
@@ -0,0 +1,322 @@
+"""
+Unit tests for the concurrent, rate-limited embedding layer.
+
+Uses FakeEmbeddingProvider with injected latency and simulated 429s.
+"""
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.skill_resolution.embedding_provider import (
+    FakeEmbeddingProvider,
+    SimulatedRateLimitError
+)
+from app.services.skill_resolution.embedding_worker_pool import (
+    CircuitBreaker,
+    ConcurrentEmbeddingProvider,
+    EmbeddingCircuitOpenError,
+    EmbeddingPoolConfig,
+    EmbeddingTimeoutError,
+    RateLimiter,
+    TokenBucket,
+    create_concurrent_embedding_provider,
+    is_retryable_error,
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock; sleep() advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ConcurrencyTrackingProvider:
+    """Provider that records the peak number of concurrent embed_batch calls."""
+
+    def __init__(self, latency_seconds=0.05):
+        self.model_name = "tracking"
+        self.latency_seconds = latency_seconds
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def embed(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            self.in_flight -= 1
+        return [[float(len(text))] for text in texts]
+
+
+def _pool(provider, **config):
+    """Pool with no-op backoff sleeps."""
+    return ConcurrentEmbeddingProvider(provider, config=EmbeddingPoolConfig(**config), sleep=lambda s: None)
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_wait(self):
+        """Capacity is available immediately; further requests wait for the refill rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_minute=60, capacity=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(1.0)
+
+        clock.now += 1.0
+        assert bucket.try_acquire() == 0.0
+
+    def test_acquire_blocks_for_refill(self):
+        """acquire() should sleep exactly long enough for the tokens to refill."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_minute=600, capacity=10, clock=clock, sleep=clock.sleep)
+        bucket.acquire(10)
+
+        waited = bucket.acquire(5)
+
+        assert waited == pytest.approx(0.5)
+
+    def test_oversized_request_is_clamped(self):
+        """A request larger than capacity should wait for a full bucket, not forever."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_minute=60, capacity=5, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire(100) == 0.0
+
+    def test_rate_limiter_pause_delays_all_callers(self):
+        """A Retry-After pause should delay the next acquire."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.pause(3.0)
+
+        assert limiter.acquire(estimated_tokens=10) == pytest.approx(3.0)
+        assert limiter.acquire(estimated_tokens=10) == 0.0
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        assert not breaker.allow_request()
+
+        clock.now += 10
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # one trial at a time
+
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_OPEN
+
+
+class TestConcurrentEmbeddingProvider:
+    """Test suite for ConcurrentEmbeddingProvider."""
+
+    def test_embed_batch_runs_requests_concurrently_in_order(self):
+        """Requests should overlap up to max_concurrency and results keep input order."""
+        provider = ConcurrencyTrackingProvider()
+        pool = _pool(provider, max_concurrency=4, request_batch_size=2)
+        texts = ["a" * n for n in range(1, 17)]
+
+        vectors = pool.embed_batch(texts)
+
+        assert vectors == [[float(n)] for n in range(1, 17)]
+        assert 1 < provider.peak_in_flight <= 4
+        assert pool.stats['requests'] == 8
+
+    def test_concurrency_speeds_up_latency_bound_batches(self):
+        """With 50ms latency per request, 8 requests on 4 workers take ~2 rounds, not 8."""
+        provider = FakeEmbeddingProvider(dimension=4, batch_size=1000, latency_seconds=0.05)
+        pool = _pool(provider, max_concurrency=4, request_batch_size=4)
+
+        start = time.perf_counter()
+        pool.embed_batch([f"skill {i}" for i in range(32)])
+        elapsed = time.perf_counter() - start
+
+        assert provider.batch_calls == 8
+        assert elapsed < 0.3
+
+    def test_retries_simulated_429s(self):
+        """Transient 429s should be retried with backoff until success."""
+        provider = FakeEmbeddingProvider(dimension=4, rate_limit_probability=0.5, seed=7)
+        pool = _pool(provider, max_concurrency=2, request_batch_size=1, max_retries=20, failure_threshold=100)
+        texts = [f"skill {i}" for i in range(20)]
+
+        vectors = pool.embed_batch(texts)
+
+        assert vectors == FakeEmbeddingProvider(dimension=4).embed_batch(texts)
+        assert provider.rate_limited_calls > 0
+        assert pool.stats['rate_limited'] == provider.rate_limited_calls
+        assert pool.stats['retries'] == provider.rate_limited_calls
+
+    def test_backoff_is_exponential_with_jitter_and_honours_retry_after(self):
+        """Backoff delays should stay under the exponential cap but at least Retry-After."""
+        provider = Mock(model_name="mock")
+        provider.embed.side_effect = [SimulatedRateLimitError(retry_after=0.0)] * 3 + [[1.0]]
+        sleeps = []
+        pool = ConcurrentEmbeddingProvider(
+            provider,
+            config=EmbeddingPoolConfig(backoff_base_seconds=1.0, request_timeout_seconds=None),
+            sleep=sleeps.append
+        )
+
+        assert pool.embed("python") == [1.0]
+        assert len(sleeps) == 3
+        for attempt, delay in enumerate(sleeps):
+            assert 0 <= delay <= 2 ** attempt
+
+        provider.embed.side_effect = [SimulatedRateLimitError(retry_after=5.0), [1.0]]
+        sleeps.clear()
+        pool.embed("python")
+        assert sleeps[0] >= 5.0
+
+    def test_gives_up_after_max_retries(self):
+        """Persistent 429s should raise after max_retries retries."""
+        provider = FakeEmbeddingProvider(dimension=4, rate_limit_probability=1.0)
+        pool = _pool(provider, max_retries=2, failure_threshold=100)
+
+        with pytest.raises(SimulatedRateLimitError):
+            pool.embed("python")
+        assert pool.stats['requests'] == 3
+        assert pool.stats['failures'] == 1
+
+    def test_non_retryable_error_is_not_retried(self):
+        """Errors like bad input should propagate immediately and not trip the breaker."""
+        provider = Mock(model_name="mock")
+        provider.embed.side_effect = ValueError("bad input")
+        pool = _pool(provider, failure_threshold=1)
+
+        with pytest.raises(ValueError):
+            pool.embed("python")
+        assert provider.embed.call_count == 1
+        assert pool.is_available
+
+    def test_non_retryable_error_keeps_breaker_state(self):
+        """A bad-input error during a half-open trial should neither close nor re-open the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+        provider = Mock(model_name="mock")
+        provider.embed.side_effect = ValueError("bad input")
+        pool = ConcurrentEmbeddingProvider(provider, circuit_breaker=breaker, sleep=lambda s: None)
+
+        with pytest.raises(ValueError):
+            pool.embed("python")
+
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.allow_request()  # the trial slot was released
+
+    def test_request_timeout(self):
+        """A request slower than the timeout should raise EmbeddingTimeoutError."""
+        provider = FakeEmbeddingProvider(dimension=4, latency_seconds=0.5)
+        pool = _pool(provider, request_timeout_seconds=0.05, max_retries=0)
+
+        with pytest.raises(EmbeddingTimeoutError):
+            pool.embed("python")
+        assert pool.stats['timeouts'] == 1
+        pool.close()
+
+    def test_circuit_opens_and_rejects_fast(self):
+        """After repeated failures, calls should be rejected without reaching the provider."""
+        provider = FakeEmbeddingProvider(dimension=4, rate_limit_probability=1.0)
+        pool = _pool(provider, max_retries=0, failure_threshold=2, reset_timeout_seconds=60)
+
+        for _ in range(2):
+            with pytest.raises(SimulatedRateLimitError):
+                pool.embed("python")
+        calls_before = provider.rate_limited_calls
+
+        with pytest.raises(EmbeddingCircuitOpenError):
+            pool.embed("python")
+        assert provider.rate_limited_calls == calls_before
+        assert not pool.is_available
+        assert pool.stats['circuit_rejections'] == 1
+
+    def test_throughput_report(self):
+        """Throughput should be reported over busy time."""
+        pool = _pool(FakeEmbeddingProvider(dimension=4, latency_seconds=0.01), request_batch_size=5)
+        pool.embed_batch([f"skill {i}" for i in range(10)])
+
+        report = pool.throughput_report()
+
+        assert report['texts'] == 10
+        assert report['requests'] == 2
+        assert report['texts_per_second'] > 0
+        assert report['requests_per_minute'] > 0
+        assert report['tokens_per_minute'] > 0
+
+    def test_factory_wrappers_share_one_call_executor(self):
+        """Wrappers built per import should not each start their own executor."""
+        first = create_concurrent_embedding_provider("fake", dimension=8)
+        second = create_concurrent_embedding_provider("fake", dimension=8)
+
+        first.embed("python")
+        first.close()
+
+        assert first._get_call_executor() is second._get_call_executor()
+        assert second.embed("python")
+
+    def test_exposes_inner_model_name(self):
+        """Cache namespacing should not change when the provider is wrapped."""
+        pool = _pool(FakeEmbeddingProvider(dimension=8))
+        assert pool.model_name == "fake-8"
+
+
+class TestRetryableErrors:
+    """Test suite for is_retryable_error."""
+
+    @pytest.mark.parametrize("error, expected", [
+        (SimulatedRateLimitError(), True),
+        (EmbeddingTimeoutError(), True),
+        (ConnectionError(), True),
+        (ValueError(), False),
+        (EmbeddingCircuitOpenError(), False),
+    ])
+    def test_classification(self, error, expected):
+        assert is_retryable_error(error) is expected
+
+    def test_status_code_attribute(self):
+        error = Exception("server error")
+        error.status_code = 503
+        assert is_retryable_error(error)
+        error.status_code = 401
+        assert not is_retryable_error(error)
@@ -0,0 +1,106 @@
+"""
+Unit tests for LocalNgramEmbeddingProvider.
+"""
+import numpy as np
+import pytest
+
+from app.services.skill_resolution.embedding_provider import (
+    FakeEmbeddingProvider,
+    create_embedding_provider,
+    resolve_storage_model_name,
+    DEFAULT_EMBEDDING_MODEL
+)
+from app.services.skill_resolution.local_embedding_provider import (
+    LocalNgramEmbeddingProvider,
+    extract_features
+)
+from app.services.skill_resolution.query_embedding_cache import CachedEmbeddingProvider
+
+
+def _cosine(a, b):
+    return float(np.dot(a, b))
+
+
+class TestLocalNgramEmbeddingProvider:
+    """Test suite for LocalNgramEmbeddingProvider."""
+
+    @pytest.fixture
+    def provider(self):
+        return LocalNgramEmbeddingProvider(dimension=1024)
+
+    def test_embed_is_normalized_and_deterministic(self, provider):
+        """Same text should always give the same unit vector, across instances."""
+        vector = provider.embed("Python")
+
+        assert len(vector) == 1024
+        assert np.linalg.norm(vector) == pytest.approx(1.0, abs=1e-5)
+        assert LocalNgramEmbeddingProvider(dimension=1024).embed("Python") == vector
+
+    def test_similar_spellings_score_higher(self, provider):
+        """Spelling variants should be closer than unrelated skills."""
+        react, react_dot, java = provider.embed_matrix(["reactjs", "react.js", "java"])
+
+        assert _cosine(react, react_dot) > 0.5
+        assert _cosine(react, react_dot) > _cosine(react, java)
+
+    def test_case_and_whitespace_insensitive(self, provider):
+        assert provider.embed("  Machine   Learning ") == provider.embed("machine learning")
+
+    def test_embed_batch_matches_embed(self, provider):
+        texts = ["python", "java", "ms excel", ""]
+
+        batched = provider.embed_batch(texts)
+
+        assert batched == [provider.embed(text) for text in texts]
+        assert provider.embed_batch([]) == []
+
+    def test_empty_text_gives_zero_vector(self, provider):
+        assert not any(provider.embed(""))
+
+    def test_fit_idf_changes_model_name_and_downweights_common_ngrams(self, provider):
+        """Fitting IDF should namespace the model name and reduce the weight of shared n-grams."""
+        base_name = provider.model_name
+        before = _cosine(*provider.embed_matrix(["java developer", "python developer"]))
+
+        provider.fit_idf(["java developer", "python developer", "go developer", "sql"])
+
+        assert provider.model_name.startswith(base_name + "-idf")
+        after = _cosine(*provider.embed_matrix(["java developer", "python developer"]))
+        assert after < before
+
+    def test_model_name_reflects_configuration(self):
+        assert LocalNgramEmbeddingProvider().model_name == "local-char-ngram-2-4-1536"
+        assert LocalNgramEmbeddingProvider(dimension=256, ngram_range=(3, 3)).model_name == "local-char-ngram-3-3-256"
+
+    def test_invalid_configuration_raises(self):
+        with pytest.raises(ValueError):
+            LocalNgramEmbeddingProvider(dimension=0)
+        with pytest.raises(ValueError):
+            LocalNgramEmbeddingProvider(ngram_range=(4, 2))
+        with pytest.raises(ValueError, match="idf_weights"):
+            LocalNgramEmbeddingProvider(dimension=8, idf_weights=np.ones(4))
+
+    def test_extract_features_includes_boundary_ngrams_and_words(self):
+        features = extract_features("Go Lang", ngram_range=(2, 2))
+
+        assert features[" g"] == 1  # word start
+        assert features["g "] == 1  # word end ("lang ")
+        assert features["o "] == 1
+        assert "w:go" in features and "w:lang" in features
+
+
+class TestLocalProviderIntegration:
+    """Factory and storage namespace wiring."""
+
+    def test_factory_creates_local_provider(self):
+        provider = create_embedding_provider("local", dimension=64)
+
+        assert isinstance(provider, LocalNgramEmbeddingProvider)
+        assert provider.dimension == 64
+
+    def test_storage_model_name_unwraps_wrappers(self):
+        provider = LocalNgramEmbeddingProvider(dimension=64)
+
+        assert resolve_storage_model_name(provider) == "local-char-ngram-2-4-64"
+        assert resolve_storage_model_name(CachedEmbeddingProvider(provider)) == "local-char-ngram-2-4-64"
+        assert resolve_storage_model_name(FakeEmbeddingProvider(dimension=8)) == "fake-8"
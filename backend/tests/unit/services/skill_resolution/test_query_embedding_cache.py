@@ -0,0 +1,178 @@
+"""
+Unit tests for the query embedding cache.
+
+Tests the in-process LRU tier, the persistent tier and the
+CachedEmbeddingProvider wrapper.
+"""
+import pytest
+from unittest.mock import Mock, MagicMock
+from sqlalchemy.orm import Session
+
+from app.services.skill_resolution.embedding_provider import FakeEmbeddingProvider
+from app.services.skill_resolution.query_embedding_cache import (
+    CachedEmbeddingProvider,
+    EmbeddingLRUCache,
+    compute_query_hash,
+    get_provider_model_name,
+    normalize_query_text
+)
+
+
+class TestEmbeddingLRUCache:
+    """Test suite for EmbeddingLRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the oldest entry when full."""
+        cache = EmbeddingLRUCache(max_entries=2)
+        cache.put(("m", "a"), [1.0])
+        cache.put(("m", "b"), [2.0])
+        cache.put(("m", "c"), [3.0])
+
+        assert cache.get(("m", "a")) is None
+        assert cache.get(("m", "c")) == [3.0]
+        assert len(cache) == 2
+
+    def test_get_refreshes_recency(self):
+        """A read should protect the entry from the next eviction."""
+        cache = EmbeddingLRUCache(max_entries=2)
+        cache.put(("m", "a"), [1.0])
+        cache.put(("m", "b"), [2.0])
+        cache.get(("m", "a"))
+        cache.put(("m", "c"), [3.0])
+
+        assert cache.get(("m", "a")) == [1.0]
+        assert cache.get(("m", "b")) is None
+
+
+class TestCachedEmbeddingProvider:
+    """Test suite for CachedEmbeddingProvider."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create a fake provider with spied embed/embed_batch."""
+        fake = FakeEmbeddingProvider(dimension=8)
+        provider = Mock(wraps=fake)
+        provider.model_name = fake.model_name
+        return provider
+
+    @pytest.fixture
+    def memory_cache(self):
+        """Create an isolated in-memory tier."""
+        return EmbeddingLRUCache(max_entries=100)
+
+    def test_memory_hit_skips_provider(self, provider, memory_cache):
+        """Second embed of the same text should not call the provider."""
+        cached = CachedEmbeddingProvider(provider, memory_cache=memory_cache)
+
+        first = cached.embed("reactjs")
+        second = cached.embed("reactjs")
+
+        assert first == second
+        assert provider.embed.call_count == 1
+        assert cached.stats == {'memory_hits': 1, 'persistent_hits': 0, 'misses': 1}
+
+    def test_normalized_text_shares_entry(self, provider, memory_cache):
+        """Case and whitespace variants should hit the same entry."""
+        cached = CachedEmbeddingProvider(provider, memory_cache=memory_cache)
+
+        cached.embed("  MS   Excel ")
+        cached.embed("ms excel")
+
+        provider.embed.assert_called_once_with("ms excel")
+
+    def test_reimport_makes_zero_provider_calls(self, provider, memory_cache):
+        """A new wrapper (next import) sharing the memory tier should not re-embed."""
+        texts = ["reactjs", "ms excel", "k8s"]
+        CachedEmbeddingProvider(provider, memory_cache=memory_cache).embed_batch(texts)
+        provider.reset_mock()
+
+        second_import = CachedEmbeddingProvider(provider, memory_cache=memory_cache)
+        second_import.embed_batch(texts)
+
+        provider.embed.assert_not_called()
+        provider.embed_batch.assert_not_called()
+
+    def test_model_name_namespaces_entries(self, provider, memory_cache):
+        """Entries cached under one model must not be served for another."""
+        CachedEmbeddingProvider(provider, model_name="model-a", memory_cache=memory_cache).embed("k8s")
+        CachedEmbeddingProvider(provider, model_name="model-b", memory_cache=memory_cache).embed("k8s")
+
+        assert provider.embed.call_count == 2
+
+    def test_embed_batch_sends_only_unique_misses(self, provider, memory_cache):
+        """Cached and duplicate texts should not be sent to the provider."""
+        cached = CachedEmbeddingProvider(provider, memory_cache=memory_cache)
+        cached.embed("python")
+
+        result = cached.embed_batch(["python", "go", "Go", "rust"])
+
+        provider.embed_batch.assert_called_once_with(["go", "rust"])
+        assert len(result) == 4
+        assert result[1] == result[2]
+
+    def test_embed_batch_rejects_short_provider_result(self, provider, memory_cache):
+        """A provider returning fewer vectors than texts should fail clearly, not with KeyError."""
+        provider.embed_batch = Mock(return_value=[[0.1] * 8])
+        cached = CachedEmbeddingProvider(provider, memory_cache=memory_cache)
+
+        with pytest.raises(ValueError, match="1 vectors for 2 texts"):
+            cached.embed_batch(["go", "rust"])
+
+    def test_persistent_hit_skips_provider_and_touches_row(self, provider, memory_cache):
+        """A row in query_embedding_cache should be used and its LRU stamp bumped in one UPDATE."""
+        db, session = MagicMock(spec=Session), MagicMock(spec=Session)
+        session.query.return_value.filter.return_value.all.return_value = [(compute_query_hash("k8s"), [0.5] * 8)]
+        cached = CachedEmbeddingProvider(provider, db=db, memory_cache=memory_cache,
+                                         session_factory=Mock(return_value=session))
+
+        result = cached.embed("K8s")
+
+        assert result == [0.5] * 8
+        provider.embed.assert_not_called()
+        [touch] = session.execute.call_args_list
+        assert 'hit_count' in str(touch.args[0])
+        session.commit.assert_called_once()
+        assert memory_cache.get((provider.model_name, compute_query_hash("k8s"))) == [0.5] * 8
+        assert cached.stats['persistent_hits'] == 1
+
+    def test_miss_is_written_on_its_own_session(self, provider, memory_cache):
+        """A provider result should be inserted and committed outside the import's session."""
+        db, session = MagicMock(spec=Session), MagicMock(spec=Session)
+        session.query.return_value.filter.return_value.all.return_value = []
+        cached = CachedEmbeddingProvider(provider, db=db, memory_cache=memory_cache,
+                                         session_factory=Mock(return_value=session))
+
+        cached.embed("terraform")
+
+        provider.embed.assert_called_once_with("terraform")
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+        assert db.mock_calls == []
+
+    def test_persistent_errors_do_not_fail_embedding(self, provider, memory_cache):
+        """DB failures in the cache should degrade to calling the provider."""
+        session = MagicMock(spec=Session)
+        session.query.side_effect = Exception("DB down")
+        session.execute.side_effect = Exception("DB down")
+        cached = CachedEmbeddingProvider(provider, db=MagicMock(spec=Session), memory_cache=memory_cache,
+                                         session_factory=Mock(return_value=session))
+
+        result = cached.embed("ansible")
+
+        assert len(result) == 8
+        provider.embed.assert_called_once_with("ansible")
+        assert session.close.call_count == 2
+
+
+class TestCacheKeyHelpers:
+    """Test suite for cache key helpers."""
+
+    def test_normalize_query_text(self):
+        """Should strip, lowercase and collapse whitespace."""
+        assert normalize_query_text("  Power   BI ") == "power bi"
+
+    def test_provider_model_name(self):
+        """Should prefer model_name/model/deployment attributes."""
+        assert get_provider_model_name(FakeEmbeddingProvider(dimension=16)) == "fake-16"
+        assert get_provider_model_name(Mock(spec=[], model="text-embedding-3-small")) == "text-embedding-3-small"
+        assert get_provider_model_name(object()) == "object"
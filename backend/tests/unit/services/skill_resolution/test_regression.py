@@ -9,8 +9,7 @@ from unittest.mock import Mock
 from sqlalchemy.orm import Session
 
 from app.services.skill_resolution.skill_resolver_service import SkillResolverService
-from app.models.skill import Skill
-from app.models.skill_alias import SkillAlias
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
 
 
 class TestSkillResolutionRegression:
@@ -30,9 +29,29 @@ class TestSkillResolutionRegression:
         return Mock(spec=Session)
     
     @pytest.fixture
-    def resolver(self, mock_db):
+    def lookup_index(self):
+        """Create exact/alias lookup index over a small taxonomy."""
+        return SkillLookupIndex.from_entries(
+            skills=[
+                (42, "Python"),
+                (100, "Java"),
+                (200, "JavaScript"),
+                (300, "SQL"),
+                (400, "Machine Learning"),
+            ],
+            aliases=[
+                ("js", 99),
+                ("ts", 250),
+                ("ml", 400),
+                ("ai", 450),
+                ("python", 999),  # Collides with exact skill name
+            ]
+        )
+    
+    @pytest.fixture
+    def resolver(self, mock_db, lookup_index):
         """Create resolver without embedding (legacy mode)."""
-        return SkillResolverService(db=mock_db, enable_embedding=False)
+        return SkillResolverService(db=mock_db, enable_embedding=False, lookup_index=lookup_index)
     
     # ===== Regression: Exact Match =====
     
@@ -45,15 +64,6 @@ class TestSkillResolutionRegression:
         - Returns skill_id
         - Confidence = 1.0
         """
-        # Arrange
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 42
-        mock_skill.skill_name = "Python"
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        mock_db.query.return_value = mock_query
-        
         # Act
         result = resolver.resolve("python")
         
@@ -70,22 +80,13 @@ class TestSkillResolutionRegression:
         All these should resolve to the same skill as before.
         """
         test_cases = [
-            ("Python", 100, "Python"),
-            ("JavaScript", 200, "JavaScript"),
-            ("SQL", 300, "SQL"),
-            ("Machine Learning", 400, "Machine Learning"),
+            ("Python", 42),
+            ("JavaScript", 200),
+            ("SQL", 300),
+            ("Machine Learning", 400),
         ]
         
-        for normalized_text, expected_id, skill_name in test_cases:
-            # Arrange
-            mock_skill = Mock(spec=Skill)
-            mock_skill.skill_id = expected_id
-            mock_skill.skill_name = skill_name
-            
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = mock_skill
-            mock_db.query.return_value = mock_query
-            
+        for normalized_text, expected_id in test_cases:
             # Act
             result = resolver.resolve(normalized_text.lower())
             
@@ -106,23 +107,6 @@ class TestSkillResolutionRegression:
         - Returns skill_id from alias
         - Confidence = 1.0
         """
-        # Arrange
-        mock_alias = Mock(spec=SkillAlias)
-        mock_alias.skill_id = 99
-        mock_alias.alias_text = "js"
-        
-        def query_side_effect(model):
-            mock_query = Mock()
-            if model == Skill:
-                # No exact match
-                mock_query.filter.return_value.first.return_value = None
-            elif model == SkillAlias:
-                # Alias match found
-                mock_query.filter.return_value.first.return_value = mock_alias
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Act
         result = resolver.resolve("js")
         
@@ -137,28 +121,13 @@ class TestSkillResolutionRegression:
         REGRESSION: Test alias match with various common aliases.
         """
         test_cases = [
-            ("js", 200, "JavaScript"),
-            ("ts", 250, "TypeScript"),
-            ("ml", 400, "Machine Learning"),
-            ("ai", 450, "Artificial Intelligence"),
+            ("js", 99),
+            ("ts", 250),
+            ("ml", 400),
+            ("ai", 450),
         ]
         
-        for alias_text, expected_id, _ in test_cases:
-            # Arrange
-            mock_alias = Mock(spec=SkillAlias)
-            mock_alias.skill_id = expected_id
-            mock_alias.alias_text = alias_text
-            
-            def query_side_effect(model):
-                mock_query = Mock()
-                if model == Skill:
-                    mock_query.filter.return_value.first.return_value = None
-                elif model == SkillAlias:
-                    mock_query.filter.return_value.first.return_value = mock_alias
-                return mock_query
-            
-            mock_db.query.side_effect = query_side_effect
-            
+        for alias_text, expected_id in test_cases:
             # Act
             result = resolver.resolve(alias_text)
             
@@ -176,40 +145,12 @@ class TestSkillResolutionRegression:
         If a text matches both exact skill name AND an alias,
         exact match should win.
         """
-        # Arrange
-        text = "python"
-        
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 111
-        mock_skill.skill_name = "Python"
-        
-        mock_alias = Mock(spec=SkillAlias)
-        mock_alias.skill_id = 999  # Different skill
-        mock_alias.alias_text = "python"
-        
-        def query_side_effect(model):
-            mock_query = Mock()
-            if model == Skill:
-                # Exact match found
-                mock_query.filter.return_value.first.return_value = mock_skill
-            elif model == SkillAlias:
-                # Alias also exists (but should not be used)
-                mock_query.filter.return_value.first.return_value = mock_alias
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Act
-        result = resolver.resolve(text)
+        result = resolver.resolve("python")
         
         # Assert - should use exact match, not alias
-        assert result.resolved_skill_id == 111  # NOT 999
+        assert result.resolved_skill_id == 42  # NOT 999
         assert result.resolution_method == "exact"
-        
-        # Verify alias query was NOT called (early exit after exact match)
-        # Only one query should have been made (for Skill)
-        assert mock_db.query.call_count == 1
-        mock_db.query.assert_called_with(Skill)
     
     # ===== Regression: Unresolved Behavior =====
     
@@ -222,14 +163,6 @@ class TestSkillResolutionRegression:
         - Method = "unresolved"
         - Confidence = None
         """
-        # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Act
         result = resolver.resolve("unknown skill")
         
@@ -248,14 +181,6 @@ class TestSkillResolutionRegression:
         Original implementation only reads from DB.
         New implementation should preserve this.
         """
-        # Arrange
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 42
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        mock_db.query.return_value = mock_query
-        
         # Act
         resolver.resolve("python")
         
@@ -276,16 +201,8 @@ class TestSkillResolutionRegression:
         - resolution_method
         - resolution_confidence
         """
-        # Arrange
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 123
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        mock_db.query.return_value = mock_query
-        
         # Act
-        result = resolver.resolve("test")
+        result = resolver.resolve("sql")
         
         # Assert - verify result has expected fields
         assert hasattr(result, 'resolved_skill_id')
@@ -0,0 +1,95 @@
+"""
+Unit tests for the durable skill resolution memo.
+"""
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.skill_resolution.resolution_memo import (
+    ResolutionMemo,
+    bump_taxonomy_version,
+    build_resolver_key,
+    get_taxonomy_version
+)
+
+
+@pytest.fixture
+def mock_db():
+    """Session mock whose begin_nested() works as a context manager."""
+    db = MagicMock(spec=Session)
+    db.begin_nested.return_value = MagicMock()
+    return db
+
+
+class TestResolverKey:
+    """Test suite for build_resolver_key."""
+
+    @pytest.mark.parametrize("args, expected", [
+        ((), "exact-alias"),
+        (("text-embedding-3-small",), "embedding:text-embedding-3-small"),
+        (("text-embedding-3-small", "local-char-ngram-2-4-1536", 0.95),
+         "embedding:text-embedding-3-small+prefilter:local-char-ngram-2-4-1536@0.95"),
+    ])
+    def test_key(self, args, expected):
+        assert build_resolver_key(*args) == expected
+
+
+class TestTaxonomyVersion:
+    """Test suite for get/bump_taxonomy_version."""
+
+    def test_missing_row_is_version_zero(self, mock_db):
+        mock_db.query.return_value.filter.return_value.scalar.return_value = None
+        assert get_taxonomy_version(mock_db) == 0
+
+    def test_bump_returns_new_version_and_purges_memo(self, mock_db):
+        mock_db.execute.return_value.scalar.return_value = 7
+
+        assert bump_taxonomy_version(mock_db) == 7
+        assert mock_db.execute.call_count == 2  # upsert counter, delete stale memo rows
+        mock_db.commit.assert_not_called()
+
+
+class TestResolutionMemo:
+    """Test suite for ResolutionMemo."""
+
+    def test_lookup_returns_hits_for_current_version(self, mock_db):
+        mock_db.query.return_value.filter.return_value.scalar.return_value = 3
+        mock_db.query.return_value.filter.return_value.all.return_value = [
+            ("reactjs", 12, "alias", 1.0),
+            ("deep learning", None, "review", 0.84)
+        ]
+        memo = ResolutionMemo(mock_db, "exact-alias")
+
+        found = memo.lookup(["reactjs", "deep learning", "cobol", "reactjs"])
+
+        assert found == {"reactjs": (12, "alias", 1.0), "deep learning": (None, "review", 0.84)}
+        assert memo.taxonomy_version == 3
+        assert (memo.stats['hits'], memo.stats['misses']) == (2, 1)
+        mock_db.execute.assert_called_once()  # hit_count / last_used_at bump
+
+    def test_store_uses_version_read_by_lookup(self, mock_db):
+        mock_db.query.return_value.filter.return_value.scalar.return_value = 3
+        mock_db.query.return_value.filter.return_value.all.return_value = []
+        memo = ResolutionMemo(mock_db, "exact-alias")
+        memo.lookup(["reactjs"])
+
+        written = memo.store({"reactjs": (12, "alias", 1.0)})
+
+        assert written == 1
+        insert = mock_db.execute.call_args[0][0]
+        assert insert.compile().params['taxonomy_version_m0'] == 3
+
+    def test_failures_are_swallowed(self):
+        """A broken memo must degrade to misses, never fail the import."""
+        memo = ResolutionMemo(Mock(spec=Session), "exact-alias")
+
+        assert memo.lookup(["reactjs"]) == {}
+        assert memo.store({"reactjs": (12, "alias", 1.0)}) == 0
+
+    def test_empty_inputs_do_not_touch_db(self, mock_db):
+        memo = ResolutionMemo(mock_db, "exact-alias")
+
+        assert memo.lookup([]) == {}
+        assert memo.store({}) == 0
+        mock_db.begin_nested.assert_not_called()
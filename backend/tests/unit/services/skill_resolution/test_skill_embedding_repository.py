@@ -82,6 +82,37 @@ class TestSkillEmbeddingRepository:
         assert call_args[1]['model_name'] == "text-embedding-3-small"
         assert 'model_name' in call_args[0][0].text
     
+    def test_find_top_k_exact_mode_bypasses_ann_index(self, repository, mock_db):
+        """Exact mode should order by an expression the ANN index cannot serve."""
+        mock_db.execute.return_value = iter([])
+        
+        repository.find_top_k([0.1] * 3, k=5, model_name="test-model")
+        
+        sql = mock_db.execute.call_args[0][0].text
+        assert "CAST(:query_vector AS vector)) + 0" in sql
+        assert mock_db.execute.call_args[0][1]["query_vector"] == str([0.1] * 3)
+    
+    def test_find_top_k_approximate_mode_sets_tuning(self, repository, mock_db):
+        """Approximate mode should set ef_search/probes and order by the raw operator."""
+        mock_db.execute.return_value = iter([(7, 0.93)])
+        
+        matches = repository.find_top_k(
+            [0.1] * 3, k=5, model_name="test-model",
+            search_mode="approximate", ef_search=100, probes=10
+        )
+        
+        assert matches == [(7, 0.93)]
+        statements = [c[0][0].text for c in mock_db.execute.call_args_list]
+        assert "hnsw.ef_search" in statements[0]
+        assert mock_db.execute.call_args_list[0][0][1] == {"value": "100"}
+        assert "ivfflat.probes" in statements[1]
+        assert statements[2].rstrip().endswith("ORDER BY embedding <=> CAST(:query_vector AS vector) LIMIT :k")
+    
+    def test_find_top_k_invalid_search_mode(self, repository):
+        """Unknown search modes should be rejected."""
+        with pytest.raises(ValueError, match="search_mode"):
+            repository.find_top_k([0.1], search_mode="fuzzy")
+    
     def test_find_top_k_empty_results(self, repository, mock_db):
         """Should return empty list when no matches found."""
         # Arrange
@@ -362,3 +393,44 @@ class TestSkillEmbeddingRepository:
         # Assert
         added_embedding = mock_db.add.call_args[0][0]
         assert added_embedding.updated_at == mock_now
+    
+    # ===== Test: get_versions_for_skills =====
+    
+    def test_get_versions_for_skills_single_query(self, repository, mock_db):
+        """Should fetch versions for all skills with one query."""
+        mock_db.query.return_value.filter.return_value.all.return_value = [
+            (1, "v1:aaaa1111"),
+            (3, "v1:cccc3333")
+        ]
+        
+        versions = repository.get_versions_for_skills([1, 2, 3], "test-model")
+        
+        assert versions == {1: "v1:aaaa1111", 3: "v1:cccc3333"}
+        mock_db.query.assert_called_once()
+    
+    # ===== Test: bulk_upsert =====
+    
+    def test_bulk_upsert_multi_row_on_conflict(self, repository, mock_db):
+        """Should write all rows in one INSERT ... ON CONFLICT DO UPDATE."""
+        from sqlalchemy.dialects import postgresql
+        
+        rows = [
+            {'skill_id': i, 'model_name': "test-model", 'embedding': [0.1] * 3, 'embedding_version': "v1:x"}
+            for i in range(1, 4)
+        ]
+        
+        written = repository.bulk_upsert(rows)
+        
+        assert written == 3
+        mock_db.execute.assert_called_once()
+        stmt = mock_db.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO skill_embeddings" in sql
+        assert "ON CONFLICT (skill_id, model_name) DO UPDATE" in sql
+        assert "embedding_version = excluded.embedding_version" in sql
+        mock_db.flush.assert_not_called()
+    
+    def test_bulk_upsert_empty(self, repository, mock_db):
+        """Should not touch the database for no rows."""
+        assert repository.bulk_upsert([]) == 0
+        mock_db.execute.assert_not_called()
@@ -32,12 +32,15 @@ class TestSkillEmbeddingService:
         provider = Mock(spec=EmbeddingProvider)
         # Return deterministic embeddings
         provider.embed.return_value = [0.1] * 1536
+        provider.embed_batch.side_effect = lambda texts: [[0.1] * 1536 for _ in texts]
         return provider
     
     @pytest.fixture
     def mock_repository(self):
         """Create mock embedding repository."""
-        return Mock(spec=SkillEmbeddingRepository)
+        repository = Mock(spec=SkillEmbeddingRepository)
+        repository.get_versions_for_skills.return_value = {}  # No existing embeddings
+        return repository
     
     @pytest.fixture
     def service(self, mock_db, mock_provider, mock_repository):
@@ -196,12 +199,9 @@ class TestSkillEmbeddingService:
         ]
         
         mock_query = Mock()
-        mock_query.filter.return_value.all.return_value = skills
+        mock_query.options.return_value.filter.return_value.all.return_value = skills
         mock_db.query.return_value = mock_query
         
-        # No existing embeddings
-        mock_repository.get_by_skill_and_model.return_value = None
-        
         # Act
         result = service.ensure_embeddings_for_skill_ids(skill_ids)
         
@@ -212,9 +212,53 @@ class TestSkillEmbeddingService:
         
         assert result.succeeded == [1, 2, 3]
         
-        # Should call embed 3 times
-        assert mock_provider.embed.call_count == 3
-        assert mock_repository.upsert.call_count == 3
+        # Should embed all 3 skills in a single batch call
+        mock_provider.embed_batch.assert_called_once_with(["python", "java", "javascript"])
+        mock_provider.embed.assert_not_called()
+        
+        # Staleness checked with one query, saved with one bulk upsert
+        mock_repository.get_versions_for_skills.assert_called_once_with([1, 2, 3], "test-model")
+        mock_repository.get_by_skill_and_model.assert_not_called()
+        mock_repository.upsert.assert_not_called()
+        mock_repository.bulk_upsert.assert_called_once()
+        rows = mock_repository.bulk_upsert.call_args[0][0]
+        assert [row['skill_id'] for row in rows] == [1, 2, 3]
+        assert all(row['model_name'] == "test-model" for row in rows)
+        assert all(row['embedding_version'].startswith("v1:") for row in rows)
+    
+    def test_ensure_embeddings_for_skill_ids_splits_into_batches(
+        self, mock_db, mock_provider, mock_repository
+    ):
+        """Should call embed_batch once per batch_size skills."""
+        # Arrange
+        service = SkillEmbeddingService(
+            db=mock_db,
+            embedding_provider=mock_provider,
+            embedding_repository=mock_repository,
+            model_name="test-model",
+            batch_size=2
+        )
+        skills = [Skill(skill_id=i, skill_name=f"Skill {i}") for i in range(1, 6)]
+        
+        mock_query = Mock()
+        mock_query.options.return_value.filter.return_value.all.return_value = skills
+        mock_db.query.return_value = mock_query
+        
+        progress_calls = []
+        
+        # Act (progress throttle lowered so every batch reports)
+        with patch('app.services.skill_resolution.skill_embedding_service.EMBEDDING_PROGRESS_MIN_COUNT', 1):
+            result = service.ensure_embeddings_for_skill_ids(
+                [1, 2, 3, 4, 5],
+                progress_callback=lambda pct, msg: progress_calls.append(pct)
+            )
+        
+        # Assert
+        assert result.succeeded == [1, 2, 3, 4, 5]
+        batch_sizes = [len(c.args[0]) for c in mock_provider.embed_batch.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert mock_repository.bulk_upsert.call_count == 3
+        assert progress_calls == [92, 94, 95]  # 90-95% range, after 2, 4 and 5 of 5 skills
     
     # ===== Test: ensure_embeddings_for_skill_ids - Mixed Results =====
     
@@ -236,21 +280,16 @@ class TestSkillEmbeddingService:
         ]
         
         mock_query = Mock()
-        mock_query.filter.return_value.all.return_value = skills
+        mock_query.options.return_value.filter.return_value.all.return_value = skills
         mock_db.query.return_value = mock_query
         
         # Skill 1: new (success)
         # Skill 2: up-to-date (skip)
         # Skill 3: error (fail)
-        def get_embedding_side_effect(skill_id, model_name):
-            if skill_id == 2:
-                # Return up-to-date embedding
-                existing = Mock(spec=SkillEmbedding)
-                existing.embedding_version = f"v1:{java_hash}"
-                return existing
-            return None
-        
-        mock_repository.get_by_skill_and_model.side_effect = get_embedding_side_effect
+        mock_repository.get_versions_for_skills.return_value = {
+            1: "v1:oldhash",          # Stale (name changed)
+            2: f"v1:{java_hash}"      # Up-to-date
+        }
         
         # Make skill 3 fail
         def embed_side_effect(text):
@@ -259,6 +298,8 @@ class TestSkillEmbeddingService:
             return [0.1] * 1536
         
         mock_provider.embed.side_effect = embed_side_effect
+        # Batch call fails, so the service falls back to one call per skill
+        mock_provider.embed_batch.side_effect = Exception("Batch API Error")
         
         # Act
         result = service.ensure_embeddings_for_skill_ids(skill_ids)
@@ -273,6 +314,49 @@ class TestSkillEmbeddingService:
         assert result.failed[0]['skill_id'] == 3
         assert result.failed[0]['skill_name'] == "JavaScript"
         assert "API Error" in result.failed[0]['error']
+        
+        # Only the successfully embedded skill is written
+        rows = mock_repository.bulk_upsert.call_args[0][0]
+        assert [row['skill_id'] for row in rows] == [1]
+    
+    def test_ensure_embeddings_for_skill_ids_noop_when_all_uptodate(
+        self, service, mock_db, mock_provider, mock_repository
+    ):
+        """Unchanged skills should cost one version query and no provider or write calls."""
+        # Arrange
+        skills = [Skill(skill_id=i, skill_name=f"Skill {i}") for i in range(1, 101)]
+        mock_query = Mock()
+        mock_query.options.return_value.filter.return_value.all.return_value = skills
+        mock_db.query.return_value = mock_query
+        mock_repository.get_versions_for_skills.return_value = {
+            skill.skill_id: service._expected_version(skill) for skill in skills
+        }
+        
+        # Act
+        result = service.ensure_embeddings_for_skill_ids([s.skill_id for s in skills])
+        
+        # Assert
+        assert len(result.skipped) == 100
+        mock_repository.get_versions_for_skills.assert_called_once()
+        mock_repository.get_by_skill_and_model.assert_not_called()
+        mock_provider.embed_batch.assert_not_called()
+        mock_repository.bulk_upsert.assert_not_called()
+    
+    def test_ensure_embeddings_for_skill_ids_bulk_upsert_failure(
+        self, service, mock_db, mock_provider, mock_repository
+    ):
+        """A failed bulk write should mark every skill in the batch as failed."""
+        skills = [Skill(skill_id=1, skill_name="Python"), Skill(skill_id=2, skill_name="Java")]
+        mock_query = Mock()
+        mock_query.options.return_value.filter.return_value.all.return_value = skills
+        mock_db.query.return_value = mock_query
+        mock_repository.bulk_upsert.side_effect = Exception("DB Error")
+        
+        result = service.ensure_embeddings_for_skill_ids([1, 2])
+        
+        assert result.succeeded == []
+        assert [f['skill_id'] for f in result.failed] == [1, 2]
+        assert "DB Error" in result.failed[0]['error']
     
     # ===== Test: ensure_embeddings_for_skill_ids - Empty List =====
     
@@ -301,7 +385,7 @@ class TestSkillEmbeddingService:
         skill_ids = [999]
         
         mock_query = Mock()
-        mock_query.filter.return_value.all.return_value = []  # No skills found
+        mock_query.options.return_value.filter.return_value.all.return_value = []  # No skills found
         mock_db.query.return_value = mock_query
         
         # Act
@@ -314,6 +398,7 @@ class TestSkillEmbeddingService:
         
         # Should not call provider
         mock_provider.embed.assert_not_called()
+        mock_provider.embed_batch.assert_not_called()
     
     # ===== Test: Normalization =====
     
@@ -0,0 +1,135 @@
+"""
+Unit tests for SkillLookupIndex.
+
+Tests normalized exact/alias lookups and taxonomy-version based reloads.
+"""
+import pytest
+from unittest.mock import Mock
+from sqlalchemy.orm import Session
+
+from app.models.skill import Skill
+from app.models.skill_alias import SkillAlias
+from app.models.taxonomy_version import TaxonomyVersion
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
+
+
+def _configure_taxonomy(mock_db, skills, aliases, version):
+    """Make mock session serve skill/alias rows and a taxonomy version counter."""
+    def query_side_effect(*columns):
+        mock_query = Mock()
+        first = columns[0]
+        if first is Skill.skill_id:
+            mock_query.order_by.return_value.all.return_value = list(skills)
+        elif first is SkillAlias.alias_text:
+            mock_query.order_by.return_value.all.return_value = list(aliases)
+        elif first is TaxonomyVersion.version:
+            mock_query.filter.return_value.scalar.return_value = version
+        return mock_query
+
+    mock_db.query.side_effect = query_side_effect
+
+
+class TestSkillLookupIndex:
+    """Test suite for SkillLookupIndex."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create mock database session."""
+        return Mock(spec=Session)
+
+    def test_from_entries_exact_and_alias(self):
+        """Should resolve exact names and aliases from in-memory entries."""
+        index = SkillLookupIndex.from_entries(
+            skills=[(1, "Python"), (2, "Machine Learning")],
+            aliases=[("ML", 2)]
+        )
+
+        assert index.find_exact("python") == 1
+        assert index.find_exact("  machine   learning ") == 2
+        assert index.find_alias("ml") == 2
+        assert index.find_alias("python") is None
+
+    def test_normalize_key_rules_applied_both_sides(self):
+        """Hyphens and underscores should normalize to spaces on both sides."""
+        index = SkillLookupIndex.from_entries(skills=[(5, "CI-CD")], aliases=[("node_js", 6)])
+
+        assert index.find_exact("ci cd") == 5
+        assert index.find_exact("CI_CD") == 5
+        assert index.find_alias("Node-JS") == 6
+
+    def test_first_entry_wins_on_collision(self):
+        """Rows that normalize to the same key keep the first (lowest ID) entry."""
+        index = SkillLookupIndex.from_entries(skills=[(10, "C-Sharp"), (11, "c sharp")])
+
+        assert index.find_exact("c sharp") == 10
+
+    def test_empty_names_ignored(self):
+        """Blank names should not create an empty-string key."""
+        index = SkillLookupIndex.from_entries(skills=[(1, "   ")], aliases=[("", 2)])
+
+        assert index.find_exact("") is None
+        assert index.find_alias("") is None
+
+    def test_lazy_load_queries_once(self, mock_db):
+        """Should load from the DB on first lookup and serve later lookups from memory."""
+        _configure_taxonomy(
+            mock_db,
+            skills=[(1, "Python")],
+            aliases=[("py", 1)],
+            version=1
+        )
+        index = SkillLookupIndex(mock_db)
+        assert index.is_loaded is False
+
+        assert index.find_exact("python") == 1
+        calls_after_load = mock_db.query.call_count
+        assert index.find_alias("PY") == 1
+        assert index.find_exact("java") is None
+
+        assert mock_db.query.call_count == calls_after_load
+        assert index.taxonomy_version == 1
+
+    def test_refresh_skips_when_version_unchanged(self, mock_db):
+        """refresh() should not reload when the taxonomy version is the same."""
+        _configure_taxonomy(mock_db, skills=[(1, "Python")], aliases=[], version=1)
+        index = SkillLookupIndex(mock_db)
+        index.load()
+
+        assert index.refresh() is False
+
+    def test_refresh_reloads_when_version_changed(self, mock_db):
+        """refresh() should rebuild the maps when skills were added."""
+        _configure_taxonomy(mock_db, skills=[(1, "Python")], aliases=[], version=1)
+        index = SkillLookupIndex(mock_db)
+        index.load()
+        assert index.find_exact("go") is None
+
+        _configure_taxonomy(
+            mock_db,
+            skills=[(1, "Python"), (2, "Go")],
+            aliases=[],
+            version=2
+        )
+
+        assert index.refresh() is True
+        assert index.find_exact("go") == 2
+        assert index.taxonomy_version == 2
+
+    def test_refresh_reloads_renamed_skill_with_same_counts(self, mock_db):
+        """A rename keeps row counts and max IDs; the bumped counter still triggers a reload."""
+        _configure_taxonomy(mock_db, skills=[(1, "Python")], aliases=[("py", 1)], version=1)
+        index = SkillLookupIndex(mock_db)
+        index.load()
+
+        _configure_taxonomy(mock_db, skills=[(1, "Python 3")], aliases=[("py", 1)], version=2)
+
+        assert index.refresh() is True
+        assert index.find_exact("python 3") == 1
+        assert index.find_exact("python") is None
+
+    def test_refresh_without_db_is_noop(self):
+        """An index built from entries has nothing to refresh from."""
+        index = SkillLookupIndex.from_entries(skills=[(1, "Python")])
+
+        assert index.refresh() is False
+        assert index.find_exact("python") == 1
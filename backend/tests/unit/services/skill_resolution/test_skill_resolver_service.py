@@ -15,8 +15,7 @@ from app.services.skill_resolution.skill_resolver_service import (
     ResolutionResult
 )
 from app.services.skill_resolution.embedding_provider import FakeEmbeddingProvider
-from app.models.skill import Skill
-from app.models.skill_alias import SkillAlias
+from app.services.skill_resolution.skill_lookup_index import SkillLookupIndex
 
 
 class TestSkillResolverService:
@@ -33,32 +32,32 @@ class TestSkillResolverService:
         return FakeEmbeddingProvider(dimension=1536, deterministic=True)
     
     @pytest.fixture
-    def resolver_without_embedding(self, mock_db):
+    def lookup_index(self):
+        """Create exact/alias lookup index over a small taxonomy."""
+        return SkillLookupIndex.from_entries(
+            skills=[(123, "Python"), (456, "JavaScript")],
+            aliases=[("js", 789), ("TypeScript", 999)]
+        )
+    
+    @pytest.fixture
+    def resolver_without_embedding(self, mock_db, lookup_index):
         """Create resolver without embedding support."""
-        return SkillResolverService(db=mock_db, enable_embedding=False)
+        return SkillResolverService(db=mock_db, enable_embedding=False, lookup_index=lookup_index)
     
     @pytest.fixture
-    def resolver_with_embedding(self, mock_db, fake_embedding_provider):
+    def resolver_with_embedding(self, mock_db, fake_embedding_provider, lookup_index):
         """Create resolver with embedding support."""
         return SkillResolverService(
             db=mock_db,
             embedding_provider=fake_embedding_provider,
-            enable_embedding=True
+            enable_embedding=True,
+            lookup_index=lookup_index
         )
     
     # ===== Test: Exact Match =====
     
     def test_exact_match_found(self, resolver_without_embedding, mock_db):
         """Should resolve via exact match and NOT call alias or embedding."""
-        # Arrange
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 123
-        mock_skill.skill_name = "Python"
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        mock_db.query.return_value = mock_query
-        
         # Act
         result = resolver_without_embedding.resolve("python")
         
@@ -68,20 +67,11 @@ class TestSkillResolverService:
         assert result.resolution_confidence == 1.0
         assert result.is_resolved() is True
         
-        # Verify exact match query was called
-        mock_db.query.assert_called_once_with(Skill)
+        # Verify the in-memory index served the lookup (no per-row query)
+        mock_db.query.assert_not_called()
     
     def test_exact_match_case_insensitive(self, resolver_without_embedding, mock_db):
         """Exact match should be case-insensitive."""
-        # Arrange
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 456
-        mock_skill.skill_name = "JavaScript"
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        mock_db.query.return_value = mock_query
-        
         # Act
         result = resolver_without_embedding.resolve("javascript")
         
@@ -94,22 +84,6 @@ class TestSkillResolverService:
     
     def test_alias_match_when_exact_fails(self, resolver_without_embedding, mock_db):
         """Should resolve via alias when exact match fails."""
-        # Arrange
-        mock_alias = Mock(spec=SkillAlias)
-        mock_alias.skill_id = 789
-        mock_alias.alias_text = "js"
-        
-        # Setup query mock to return None for Skill, then alias for SkillAlias
-        def query_side_effect(model):
-            mock_query = Mock()
-            if model == Skill:
-                mock_query.filter.return_value.first.return_value = None
-            elif model == SkillAlias:
-                mock_query.filter.return_value.first.return_value = mock_alias
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Act
         result = resolver_without_embedding.resolve("js")
         
@@ -119,25 +93,10 @@ class TestSkillResolverService:
         assert result.resolution_confidence == 1.0
         assert result.is_resolved() is True
         
-        # Verify both queries were called
-        assert mock_db.query.call_count == 2
+        mock_db.query.assert_not_called()
     
     def test_alias_match_case_insensitive(self, resolver_without_embedding, mock_db):
         """Alias match should be case-insensitive."""
-        # Arrange
-        mock_alias = Mock(spec=SkillAlias)
-        mock_alias.skill_id = 999
-        
-        def query_side_effect(model):
-            mock_query = Mock()
-            if model == Skill:
-                mock_query.filter.return_value.first.return_value = None
-            elif model == SkillAlias:
-                mock_query.filter.return_value.first.return_value = mock_alias
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Act
         result = resolver_without_embedding.resolve("typescript")
         
@@ -145,51 +104,39 @@ class TestSkillResolverService:
         assert result.resolved_skill_id == 999
         assert result.resolution_method == "alias"
     
+    def test_lookup_uses_normalize_key_rules(self, resolver_without_embedding):
+        """Hyphens, underscores and repeated spaces should not prevent a match."""
+        resolver_without_embedding.lookup_index = SkillLookupIndex.from_entries(
+            skills=[(321, "Node-JS")],
+            aliases=[("ms_excel", 654)]
+        )
+        
+        assert resolver_without_embedding.resolve("node  js").resolved_skill_id == 321
+        assert resolver_without_embedding.resolve("ms excel").resolved_skill_id == 654
+    
     # ===== Test: Embedding Match - NOT called when exact/alias succeeds =====
     
     def test_embedding_not_called_on_exact_match(self, resolver_with_embedding, mock_db):
         """Embedding provider should NOT be called when exact match succeeds."""
-        # Arrange
-        mock_skill = Mock(spec=Skill)
-        mock_skill.skill_id = 111
-        
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_skill
-        mock_db.query.return_value = mock_query
-        
         # Spy on embedding provider
         with patch.object(resolver_with_embedding.embedding_provider, 'embed') as mock_embed:
             # Act
             result = resolver_with_embedding.resolve("python")
             
             # Assert
-            assert result.resolved_skill_id == 111
+            assert result.resolved_skill_id == 123
             assert result.resolution_method == "exact"
             mock_embed.assert_not_called()
     
     def test_embedding_not_called_on_alias_match(self, resolver_with_embedding, mock_db):
         """Embedding provider should NOT be called when alias match succeeds."""
-        # Arrange
-        mock_alias = Mock(spec=SkillAlias)
-        mock_alias.skill_id = 222
-        
-        def query_side_effect(model):
-            mock_query = Mock()
-            if model == Skill:
-                mock_query.filter.return_value.first.return_value = None
-            elif model == SkillAlias:
-                mock_query.filter.return_value.first.return_value = mock_alias
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Spy on embedding provider
         with patch.object(resolver_with_embedding.embedding_provider, 'embed') as mock_embed:
             # Act
             result = resolver_with_embedding.resolve("js")
             
             # Assert
-            assert result.resolved_skill_id == 222
+            assert result.resolved_skill_id == 789
             assert result.resolution_method == "alias"
             mock_embed.assert_not_called()
     
@@ -198,13 +145,6 @@ class TestSkillResolverService:
     def test_embedding_high_similarity_auto_accept(self, resolver_with_embedding, mock_db):
         """High similarity (>= 0.88) should auto-accept with resolved_skill_id set."""
         # Arrange: No exact or alias match
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Mock embedding repository to return high similarity
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.return_value = [
@@ -225,13 +165,6 @@ class TestSkillResolverService:
     def test_embedding_threshold_exact_088(self, resolver_with_embedding, mock_db):
         """Similarity exactly at 0.88 should auto-accept."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.return_value = [(333, 0.88)]
             
@@ -248,13 +181,6 @@ class TestSkillResolverService:
     def test_embedding_medium_similarity_review(self, resolver_with_embedding, mock_db):
         """Medium similarity (0.80-0.88) should mark for review, NOT auto-resolve."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.return_value = [(444, 0.85)]
             
@@ -270,13 +196,6 @@ class TestSkillResolverService:
     def test_embedding_threshold_exact_080(self, resolver_with_embedding, mock_db):
         """Similarity exactly at 0.80 should mark for review."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.return_value = [(666, 0.80)]
             
@@ -293,13 +212,6 @@ class TestSkillResolverService:
     def test_embedding_low_similarity_unresolved(self, resolver_with_embedding, mock_db):
         """Low similarity (< 0.80) should remain unresolved."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.return_value = [(777, 0.65)]
             
@@ -317,13 +229,6 @@ class TestSkillResolverService:
     def test_unresolved_when_all_layers_fail(self, resolver_without_embedding, mock_db):
         """Should return unresolved when exact and alias both fail."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Act
         result = resolver_without_embedding.resolve("unknown skill")
         
@@ -336,13 +241,6 @@ class TestSkillResolverService:
     def test_unresolved_when_no_embedding_matches(self, resolver_with_embedding, mock_db):
         """Should return unresolved when embedding repo returns empty list."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.return_value = []  # No matches
             
@@ -359,13 +257,6 @@ class TestSkillResolverService:
     def test_embedding_provider_exception_graceful_fallback(self, resolver_with_embedding, mock_db):
         """Should handle embedding provider exceptions gracefully without failing import."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Make embedding provider raise exception
         with patch.object(resolver_with_embedding.embedding_provider, 'embed') as mock_embed:
             mock_embed.side_effect = Exception("API Error")
@@ -381,13 +272,6 @@ class TestSkillResolverService:
     def test_embedding_repo_exception_graceful_fallback(self, resolver_with_embedding, mock_db):
         """Should handle embedding repository exceptions gracefully."""
         # Arrange
-        def query_side_effect(model):
-            mock_query = Mock()
-            mock_query.filter.return_value.first.return_value = None
-            return mock_query
-        
-        mock_db.query.side_effect = query_side_effect
-        
         # Make repository raise exception
         with patch.object(resolver_with_embedding.embedding_repo, 'find_top_k') as mock_find:
             mock_find.side_effect = Exception("Database Error")
@@ -400,6 +284,148 @@ class TestSkillResolverService:
             assert result.resolution_method == "unresolved"
             assert result.resolution_confidence is None
     
+    # ===== Test: Local Pre-filter =====
+    
+    @pytest.fixture
+    def resolver_with_prefilter(self, mock_db, fake_embedding_provider, lookup_index):
+        """Create resolver with a local n-gram pre-filter in front of the paid provider."""
+        from app.services.skill_resolution.local_embedding_provider import LocalNgramEmbeddingProvider
+        return SkillResolverService(
+            db=mock_db,
+            embedding_provider=fake_embedding_provider,
+            lookup_index=lookup_index,
+            prefilter_provider=LocalNgramEmbeddingProvider(dimension=64)
+        )
+    
+    def test_prefilter_accept_skips_paid_provider(self, resolver_with_prefilter):
+        """A pre-filter match above its threshold should resolve without the paid provider."""
+        with patch.object(resolver_with_prefilter.prefilter_repo, 'find_top_k') as mock_prefilter, \
+                patch.object(resolver_with_prefilter.embedding_provider, 'embed') as mock_embed:
+            mock_prefilter.return_value = [(321, 0.97)]
+            
+            result = resolver_with_prefilter.resolve("react.js")
+            
+            assert result.resolved_skill_id == 321
+            assert result.resolution_method == "embedding"
+            assert result.resolution_confidence == 0.97
+            mock_embed.assert_not_called()
+            assert mock_prefilter.call_args.kwargs['model_name'] == "local-char-ngram-2-4-64"
+    
+    def test_prefilter_miss_falls_through_to_paid_provider(self, resolver_with_prefilter):
+        """Below the pre-filter threshold the paid embedding layer decides."""
+        with patch.object(resolver_with_prefilter.prefilter_repo, 'find_top_k') as mock_prefilter, \
+                patch.object(resolver_with_prefilter.embedding_repo, 'find_top_k') as mock_find:
+            mock_prefilter.return_value = [(321, 0.80)]
+            mock_find.return_value = [(555, 0.92)]
+            
+            result = resolver_with_prefilter.resolve("machine learning")
+            
+            assert result.resolved_skill_id == 555
+            mock_find.assert_called_once()
+    
+    # ===== Test: resolve_many =====
+    
+    def test_resolve_many_dedupes_and_batches_embedding_layer(self, resolver_with_embedding):
+        """Exact/alias hits never reach embeddings; leftovers go in one embed_batch + one top-k batch."""
+        provider = resolver_with_embedding.embedding_provider
+        with patch.object(provider, 'embed_batch', wraps=provider.embed_batch) as mock_embed_batch, \
+                patch.object(resolver_with_embedding.embedding_repo, 'find_top_k_batch') as mock_find_batch:
+            mock_find_batch.return_value = [[(555, 0.92)], [(444, 0.85)], [(777, 0.65)]]
+            
+            results = resolver_with_embedding.resolve_many([
+                "python", "js", "machine learning", "python", "deep learning", "quantum computing", "js"
+            ])
+            
+            assert set(results) == {"python", "js", "machine learning", "deep learning", "quantum computing"}
+            assert (results["python"].resolved_skill_id, results["python"].resolution_method) == (123, "exact")
+            assert (results["js"].resolved_skill_id, results["js"].resolution_method) == (789, "alias")
+            assert results["machine learning"] == ResolutionResult(555, "embedding", 0.92)
+            assert results["deep learning"] == ResolutionResult(None, "review", 0.85)
+            assert results["quantum computing"] == ResolutionResult(None, "unresolved", None)
+            mock_embed_batch.assert_called_once_with(["machine learning", "deep learning", "quantum computing"])
+            mock_find_batch.assert_called_once()
+    
+    def test_resolve_many_matches_resolve(self, resolver_with_embedding):
+        """Bulk results should equal one-at-a-time resolve() results."""
+        texts = ["python", "typescript", "machine learning", "deep learning"]
+        top_k = {"machine learning": [(555, 0.92)], "deep learning": [(444, 0.81)]}
+        repo = resolver_with_embedding.embedding_repo
+        provider = resolver_with_embedding.embedding_provider
+        vectors = {tuple(provider.embed(t)): t for t in top_k}
+        with patch.object(repo, 'find_top_k', side_effect=lambda v, k=5, model_name=None: top_k[vectors[tuple(v)]]), \
+                patch.object(repo, 'find_top_k_batch', side_effect=lambda vs, k=5, model_name=None: [top_k[vectors[tuple(v)]] for v in vs]):
+            single = {text: resolver_with_embedding.resolve(text) for text in texts}
+            bulk = resolver_with_embedding.resolve_many(texts)
+        
+        assert bulk == single
+    
+    def test_resolve_many_embedding_failure_falls_back_to_unresolved(self, resolver_with_embedding):
+        """A failing batched embedding call should leave leftovers unresolved, not raise."""
+        with patch.object(resolver_with_embedding.embedding_provider, 'embed_batch', side_effect=Exception("API Error")):
+            results = resolver_with_embedding.resolve_many(["python", "unknown skill"])
+        
+        assert results["python"].resolution_method == "exact"
+        assert results["unknown skill"].resolution_method == "unresolved"
+    
+    def test_resolve_many_records_layer_stats(self, resolver_without_embedding):
+        """Per-layer counts and timings should accumulate in resolve_stats."""
+        resolver_without_embedding.resolve_many(["python", "js", "nothing"])
+        resolver_without_embedding.resolve_many(["javascript"])
+        
+        stats = resolver_without_embedding.resolve_stats
+        assert stats['calls'] == 2
+        assert stats['texts'] == 4
+        assert (stats['exact'], stats['alias'], stats['unresolved']) == (2, 1, 1)
+        assert stats['exact_seconds'] >= 0 and stats['embedding_seconds'] == 0
+    
+    def test_resolve_many_empty(self, resolver_with_embedding):
+        assert resolver_with_embedding.resolve_many([]) == {}
+    
+    # ===== Test: Resolution Memo =====
+    
+    @pytest.fixture
+    def memo(self):
+        """Stub ResolutionMemo with one memoized text."""
+        memo = Mock()
+        memo.lookup.return_value = {"machine learning": (555, "embedding", 0.92)}
+        return memo
+    
+    def test_resolve_many_memo_hits_skip_all_layers(self, resolver_with_embedding, memo):
+        """Memoized texts are answered before exact/alias/embedding; only misses are resolved and stored."""
+        resolver_with_embedding.resolution_memo = memo
+        with patch.object(resolver_with_embedding.embedding_provider, 'embed_batch') as mock_embed_batch:
+            results = resolver_with_embedding.resolve_many(["machine learning", "python"])
+        
+        assert results["machine learning"] == ResolutionResult(555, "embedding", 0.92)
+        assert results["python"].resolution_method == "exact"
+        mock_embed_batch.assert_not_called()
+        memo.store.assert_called_once_with({"python": (123, "exact", 1.0)})
+        assert resolver_with_embedding.resolve_stats['memo'] == 1
+        assert resolver_with_embedding.resolve_stats['exact'] == 1
+    
+    def test_resolve_many_does_not_memoize_failed_embedding_layer(self, resolver_with_embedding, memo):
+        """Unresolved outcomes caused by an embedding failure are transient and must not be memoized."""
+        memo.lookup.return_value = {}
+        resolver_with_embedding.resolution_memo = memo
+        with patch.object(resolver_with_embedding.embedding_provider, 'embed_batch', side_effect=Exception("API Error")):
+            results = resolver_with_embedding.resolve_many(["python", "unknown skill"])
+        
+        assert results["unknown skill"].resolution_method == "unresolved"
+        memo.store.assert_called_once_with({"python": (123, "exact", 1.0)})
+    
+    def test_resolver_key_names_embedding_model(self, mock_db, fake_embedding_provider, lookup_index):
+        """Memo rows of embedding-enabled and exact/alias-only resolvers never mix."""
+        with_embedding = SkillResolverService(
+            db=mock_db, embedding_provider=fake_embedding_provider,
+            lookup_index=lookup_index, use_resolution_memo=True
+        )
+        without_embedding = SkillResolverService(
+            db=mock_db, enable_embedding=False, lookup_index=lookup_index, use_resolution_memo=True
+        )
+        
+        assert with_embedding.resolution_memo.resolver_key == "embedding:fake-1536"
+        assert without_embedding.resolution_memo.resolver_key == "exact-alias"
+    
     # ===== Test: ResolutionResult Helper =====
     
     def test_resolution_result_is_resolved_true(self):
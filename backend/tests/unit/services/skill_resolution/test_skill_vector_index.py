@@ -0,0 +1,279 @@
+"""
+Unit tests for SkillVectorIndex.
+
+Runs against an in-memory SQLite database (no pgvector operators needed).
+"""
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.skill_embedding import SkillEmbedding
+from app.services.skill_resolution.skill_embedding_repository import (
+    SkillEmbeddingRepository,
+    SEARCH_MODE_APPROXIMATE
+)
+from app.services.skill_resolution.skill_vector_index import SkillVectorIndex
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with only the skill_embeddings table."""
+    engine = create_engine("sqlite://")
+    SkillEmbedding.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add(db, skill_id, vector, model_name="test-model", updated_at=T0):
+    db.merge(SkillEmbedding(
+        skill_id=skill_id,
+        model_name=model_name,
+        embedding=vector,
+        embedding_version="v1",
+        updated_at=updated_at
+    ))
+    db.commit()
+
+
+class TestSkillVectorIndex:
+    """Test suite for SkillVectorIndex."""
+
+    def test_search_orders_by_cosine_similarity(self, db):
+        """Should return top-k skills ordered by similarity, on the pgvector 0-1 scale."""
+        _add(db, 1, [1.0, 0.0, 0.0])
+        _add(db, 2, [0.8, 0.6, 0.0])
+        _add(db, 3, [0.0, 1.0, 0.0])
+        _add(db, 4, [-1.0, 0.0, 0.0])
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        matches = index.search([2.0, 0.0, 0.0], k=3)
+
+        assert [skill_id for skill_id, _ in matches] == [1, 2, 3]
+        assert matches[0][1] == pytest.approx(1.0)
+        assert matches[1][1] == pytest.approx(0.9)   # cosine 0.8 → 1 - 0.2/2
+        assert matches[2][1] == pytest.approx(0.5)   # orthogonal
+        assert index.search([1.0, 0.0, 0.0], k=10)[-1] == (4, pytest.approx(0.0))
+
+    def test_search_batch_matches_single_queries(self, db):
+        """Batched queries should give the same results as one-at-a-time queries."""
+        for skill_id, vector in enumerate([[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 0]], start=1):
+            _add(db, skill_id, vector)
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+        queries = [[1, 0.1, 0], [0, 0.2, 1], [1, 1, 0.1]]
+
+        batched = index.search_batch(queries, k=2)
+
+        assert batched == [index.search(q, k=2) for q in queries]
+
+    def test_filters_by_model_name(self, db):
+        """Only embeddings for the index's model should be loaded."""
+        _add(db, 1, [1.0, 0.0], model_name="test-model")
+        _add(db, 2, [1.0, 0.0], model_name="other-model")
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        assert len(index) == 1
+        assert index.search([1.0, 0.0], k=5) == [(1, pytest.approx(1.0))]
+
+    def test_refresh_applies_upserts_incrementally(self, db):
+        """Updated and newly inserted rows should be merged without a full reload."""
+        _add(db, 1, [1.0, 0.0])
+        _add(db, 2, [0.0, 1.0])
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        _add(db, 2, [1.0, 0.0], updated_at=T0 + timedelta(minutes=1))  # changed
+        _add(db, 3, [0.6, 0.8], updated_at=T0 + timedelta(minutes=1))  # new
+
+        index.refresh(db)
+        assert len(index) == 3
+        top = dict(index.search([1.0, 0.0], k=3))
+        assert top[2] == pytest.approx(1.0)
+        assert top[3] == pytest.approx(0.8)
+
+    def test_refresh_reloads_after_delete(self, db):
+        """A row count mismatch should trigger a full reload."""
+        _add(db, 1, [1.0, 0.0])
+        _add(db, 2, [0.0, 1.0])
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        db.query(SkillEmbedding).filter(SkillEmbedding.skill_id == 2).delete()
+        db.commit()
+        index.refresh(db)
+
+        assert [skill_id for skill_id, _ in index.search([0.0, 1.0], k=5)] == [1]
+
+    def test_refresh_reloads_when_delete_and_late_insert_keep_count(self, db):
+        """A deletion hidden by an insert older than the watermark should still trigger a reload."""
+        _add(db, 1, [1.0, 0.0])
+        _add(db, 2, [0.0, 1.0], updated_at=T0 + timedelta(minutes=1))
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        db.query(SkillEmbedding).filter(SkillEmbedding.skill_id == 1).delete()
+        _add(db, 3, [1.0, 0.0], updated_at=T0)  # before the watermark, so not picked up incrementally
+        index.refresh(db)
+
+        assert sorted(int(skill_id) for skill_id in index.skill_ids) == [2, 3]
+
+    def test_empty_index_returns_no_matches(self, db):
+        """Searching an empty index should return an empty list per query."""
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        assert index.search([1.0, 0.0], k=5) == []
+        assert index.search_batch([[1.0, 0.0], [0.0, 1.0]], k=5) == [[], []]
+
+    def test_dimension_mismatch_raises(self, db):
+        """Query vectors of the wrong dimension should be rejected."""
+        _add(db, 1, [1.0, 0.0, 0.0])
+        index = SkillVectorIndex(model_name="test-model")
+        index.load(db)
+
+        with pytest.raises(ValueError, match="dimension"):
+            index.search([1.0, 0.0], k=1)
+
+
+class TestCompactVectorIndex:
+    """Reduced-dimension and float16/int8 storage."""
+
+    @pytest.fixture
+    def random_vectors(self):
+        rng = np.random.default_rng(0)
+        return rng.normal(size=(50, 32)).astype(np.float32)
+
+    def _load(self, db, vectors, **options):
+        for skill_id, vector in enumerate(vectors, start=1):
+            _add(db, skill_id, vector.tolist())
+        index = SkillVectorIndex(model_name="test-model", **options)
+        index.load(db)
+        return index
+
+    @pytest.mark.parametrize("precision", ["float16", "int8"])
+    def test_quantized_ranking_matches_float32(self, db, random_vectors, precision):
+        """Quantized scores should stay within quantization error and keep the top match."""
+        exact = self._load(db, random_vectors)
+        compact = SkillVectorIndex(model_name="test-model", precision=precision)
+        compact.load(db)
+        queries = (random_vectors[:10] + 0.05).tolist()
+
+        for expected, actual in zip(exact.search_batch(queries, k=3), compact.search_batch(queries, k=3)):
+            assert actual[0][0] == expected[0][0]
+            assert actual[0][1] == pytest.approx(expected[0][1], abs=0.01)
+        assert compact.is_compact and not exact.is_compact
+        assert compact.memory_bytes < exact.memory_bytes
+
+    def test_truncated_dimensions_accept_full_width_queries(self, db, random_vectors):
+        """Index keeps the first N components; queries keep the stored width."""
+        index = self._load(db, random_vectors, dimensions=8, precision="int8")
+
+        assert index.dimension == 8
+        assert index.search(random_vectors[3].tolist(), k=1)[0][0] == 4
+        with pytest.raises(ValueError, match="dimension"):
+            index.search(random_vectors[3][:8].tolist(), k=1)
+
+    def test_refresh_merges_into_quantized_matrix(self, db):
+        """Incremental refresh should quantize new rows like the initial load."""
+        _add(db, 1, [1.0, 0.0])
+        index = SkillVectorIndex(model_name="test-model", precision="int8")
+        index.load(db)
+
+        _add(db, 2, [0.0, 1.0], updated_at=T0 + timedelta(minutes=1))
+        index.refresh(db)
+
+        assert index.search([0.0, 1.0], k=1) == [(2, pytest.approx(1.0, abs=0.01))]
+
+    def test_from_vectors_builds_loaded_index(self):
+        """In-memory construction should search like a loaded index and never hit a database."""
+        index = SkillVectorIndex.from_vectors([7, 8], [[1.0, 0.0], [0.0, 1.0]], model_name="test-model")
+
+        index.ensure_fresh(None)
+
+        assert index.is_loaded
+        assert index.search([0.1, 1.0], k=1)[0][0] == 8
+
+    def test_invalid_precision_raises(self):
+        with pytest.raises(ValueError, match="precision"):
+            SkillVectorIndex(precision="int4")
+
+    def test_repository_rescores_compact_candidates(self, db, random_vectors):
+        """Compact-index matches should carry exact full-precision similarities."""
+        exact = self._load(db, random_vectors)
+        repository = SkillEmbeddingRepository(
+            db, vector_index=SkillVectorIndex(model_name="test-model", dimensions=8, precision="int8")
+        )
+        queries = (random_vectors[:5] + 0.05).tolist()
+
+        rescored = repository.find_top_k_batch(queries, k=3, model_name="test-model")
+
+        for expected, actual in zip(exact.search_batch(queries, k=3), rescored):
+            assert actual[0][0] == expected[0][0]
+            assert actual[0][1] == pytest.approx(expected[0][1], abs=1e-5)
+
+
+class TestRepositoryWithVectorIndex:
+    """SkillEmbeddingRepository search served by the in-process index."""
+
+    def test_find_top_k_uses_index_and_loads_lazily(self, db):
+        """find_top_k should load the index on first use and not need pgvector SQL."""
+        _add(db, 1, [1.0, 0.0])
+        _add(db, 2, [0.0, 1.0])
+        index = SkillVectorIndex(model_name="test-model")
+        repository = SkillEmbeddingRepository(db, vector_index=index)
+
+        matches = repository.find_top_k([1.0, 0.1], k=1, model_name="test-model")
+
+        assert index.is_loaded
+        assert matches[0][0] == 1
+
+    def test_approximate_search_mode_goes_to_sql(self, db):
+        """search_mode="approximate" should query pgvector's ANN index, not the in-process index."""
+        _add(db, 1, [1.0, 0.0])
+        index = SkillVectorIndex(model_name="test-model")
+        repository = SkillEmbeddingRepository(db, vector_index=index)
+        db.execute = MagicMock(return_value=[(1, 0.99)])
+
+        matches = repository.find_top_k([1.0, 0.0], k=1, model_name="test-model", search_mode=SEARCH_MODE_APPROXIMATE)
+
+        assert matches == [(1, 0.99)]
+        assert not index.is_loaded
+        assert "ORDER BY embedding <=>" in str(db.execute.call_args.args[0])
+
+    def test_find_most_similar_applies_min_similarity(self, db):
+        """find_most_similar should drop matches below the similarity floor."""
+        _add(db, 1, [1.0, 0.0])
+        _add(db, 2, [0.0, 1.0])
+        repository = SkillEmbeddingRepository(db, vector_index=SkillVectorIndex(model_name="test-model"))
+
+        matches = repository.find_most_similar([1.0, 0.0], model_name="test-model", limit=2, min_similarity=0.8)
+
+        assert matches == [(1, pytest.approx(1.0))]
+
+    def test_upsert_marks_index_stale(self, db):
+        """An upsert through the repository should be visible to the next search."""
+        _add(db, 1, [1.0, 0.0])
+        index = SkillVectorIndex(model_name="test-model")
+        repository = SkillEmbeddingRepository(db, vector_index=index)
+        repository.find_top_k([1.0, 0.0], k=1)
+
+        repository.upsert(2, "test-model", [0.0, 1.0], "v1", updated_at=T0 + timedelta(minutes=5))
+
+        assert repository.find_top_k([0.0, 1.0], k=1)[0][0] == 2
+
+    def test_find_top_k_batch_without_index_falls_back(self, db):
+        """Without an index, batched search should issue one find_top_k per query."""
+        repository = SkillEmbeddingRepository(db)
+        calls = []
+        repository.find_top_k = lambda vector, k=5, model_name=None: calls.append(vector) or []
+
+        assert repository.find_top_k_batch([[1.0], [2.0]], k=3) == [[], []]
+        assert calls == [[1.0], [2.0]]
@@ -0,0 +1 @@
+# Utils Tests
@@ -0,0 +1,46 @@
+"""
+Unit tests for streamed upload storage.
+"""
+import hashlib
+import os
+from io import BytesIO
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import UploadFile
+
+from app.utils.upload_storage import UploadTooLargeError, save_upload_stream
+
+
+def upload(data: bytes) -> UploadFile:
+    return UploadFile(file=BytesIO(data), filename='skills.xlsx')
+
+
+class TestSaveUploadStream:
+    """Test suite for chunked upload writes."""
+
+    @pytest.mark.asyncio
+    async def test_file_is_written_in_chunks_with_running_hash(self):
+        data = os.urandom(10_000)
+        file = upload(data)
+        file.read = AsyncMock(wraps=file.read)
+
+        saved = await save_upload_stream(file, chunk_size=4096)
+
+        try:
+            with open(saved.path, 'rb') as f:
+                assert f.read() == data
+            assert saved.path.endswith('.xlsx')
+            assert (saved.size, saved.sha256) == (10_000, hashlib.sha256(data).hexdigest())
+            assert [call.args for call in file.read.call_args_list] == [(4096,)] * 4
+        finally:
+            os.unlink(saved.path)
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_is_rejected_and_removed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('IMPORT_UPLOAD_DIR', str(tmp_path))
+
+        with pytest.raises(UploadTooLargeError):
+            await save_upload_stream(upload(b'x' * 5000), max_bytes=4000, chunk_size=1024)
+
+        assert list(tmp_path.iterdir()) == []